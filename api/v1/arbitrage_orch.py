@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import json
 import logging
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, ValidationError, model_validator
 
 try:
@@ -16,6 +18,7 @@ except Exception:  # pragma: no cover
 from core.arbitrage.models import ArbitrageConfig
 from core.portfolio.models import Currency
 from core.services.arbitrage_orchestration import (
+    close_quote_stream,
     create_arbitrage_session,
     get_history_window,
     get_opportunity_detail,
@@ -23,6 +26,8 @@ from core.services.arbitrage_orchestration import (
     get_session_history,
     get_top_recommendations,
     ingest_quotes_and_scan,
+    iter_quote_stream_events,
+    push_stream_quotes,
 )
 
 router = APIRouter(prefix="/v1/arbitrage", tags=["arbitrage"])
@@ -67,6 +72,16 @@ class HistoryRequest(BaseModel):
     symbol: Optional[str] = None
 
 
+class StreamQuotesRequest(BaseModel):
+    session_id: UUID
+    quotes: List[QuoteIn]
+    fx_rate_usd_ils: float = 3.5
+
+
+class StreamCloseRequest(BaseModel):
+    session_id: UUID
+
+
 # -------------------------
 # Validation models
 # -------------------------
@@ -164,6 +179,15 @@ class RecommendationOut(BaseModel):
     execution_decision: dict[str, object] | None = None
 
 
+class StreamQuotesResponse(BaseModel):
+    accepted: int
+    quote_validation: QuoteValidationOut | None = None
+
+
+class StreamCloseResponse(BaseModel):
+    scans: int
+
+
 class OpportunityDetailOut(BaseModel):
     opportunity: dict[str, object]
     state: str | None
@@ -301,4 +325,42 @@ def history_window(
     return [OpportunityOut(**opp) for opp in hist]
 
 
+# -------------------------
+# Streaming (SSE)
+# -------------------------
+
+
+async def _sse(events: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[str]:
+    async for event in events:
+        yield f"event: {event['event']}\ndata: {json.dumps(event['data'], default=str)}\n\n"
+
+
+@router.post("/stream/quotes", response_model=StreamQuotesResponse)
+async def stream_quotes(req: StreamQuotesRequest) -> StreamQuotesResponse:
+    pushed = await push_stream_quotes(
+        session_id=req.session_id,
+        quotes_payload=[q.model_dump() for q in req.quotes],
+        fx_rate_usd_ils=req.fx_rate_usd_ils,
+    )
+    return StreamQuotesResponse(
+        accepted=pushed["accepted"],
+        quote_validation=QuoteValidationOut(**pushed["quote_validation"]),
+    )
+
+
+@router.post("/stream/close", response_model=StreamCloseResponse)
+async def stream_close(req: StreamCloseRequest) -> StreamCloseResponse:
+    return StreamCloseResponse(scans=await close_quote_stream(session_id=req.session_id))
+
+
+@router.get("/stream/events")
+async def stream_events(session_id: UUID, replay: bool = False) -> StreamingResponse:
+    """Server-sent opportunity and lifecycle events for the session's background scan."""
+    try:
+        events = iter_quote_stream_events(session_id=session_id, replay=replay)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Session or quote stream not found")
+    return StreamingResponse(_sse(events), media_type="text/event-stream")
+
+
 check_route_collisions(router)
@@ -62,3 +62,7 @@ V2IngestCommand = Union[
     PortfolioPositionUpsertedCommand,
     PortfolioPositionRemovedCommand,
 ]
+
+
+class V2IngestBatchCommand(BaseModel):
+    events: list[V2IngestCommand] = Field(min_length=1)
@@ -4,8 +4,8 @@ from api.v2.service import get_v2_service
 from api.v2.read_models import list_events, get_snapshot_metadata, list_compute_requests
 from api.v2.read_models_opportunities_schemas import LatestOpportunitiesOut
 from api.v2.read_models_schemas import EventsListResponse, SnapshotMetadataResponse, ComputeRequestsListResponse
-from api.v2.schemas import CreateSessionResponse, IngestEventResponse, SnapshotResponse
-from api.v2.commands import V2IngestCommand
+from api.v2.schemas import CreateSessionResponse, IngestEventResponse, IngestEventsBatchResponse, SnapshotResponse
+from api.v2.commands import V2IngestCommand, V2IngestBatchCommand
 from api.v2.validators import validate_quote_payload, validate_compute_payload
 from api.v2.force_raise_hook import should_force_raise_for_tests
 from api.v2.correlation import get_or_create_correlation_id, attach_correlation_id
@@ -34,22 +34,8 @@ def assert_session_exists(session_id: str) -> None:
 
         not_found("session_not_found", "Session not found")
 
-# --- Endpoints ---
-
-@router.post("/sessions", response_model=CreateSessionResponse)
-async def create_session(request: Request, response: Response, cid: str = Depends(correlation_id_dep)):
-    if should_force_raise_for_tests():
-        raise RuntimeError("forced error for tests")
-    svc = get_v2_service()
-    session_id = svc.create_session()
-    log_request("POST", "/api/v2/sessions", session_id, cid, status.HTTP_201_CREATED, 0)
-    response.status_code = status.HTTP_201_CREATED
-    return CreateSessionResponse(session_id=session_id)
-
-@router.post("/sessions/{session_id}/events", response_model=IngestEventResponse, status_code=201)
-async def ingest_event(session_id: str, req: V2IngestCommand, request: Request):
-    cid = getattr(request.state, "correlation_id", None)
-    svc = get_v2_service()
+# --- Helper: Per-command payload validation (shared by single and batch ingest) ---
+def validate_ingest_command(req) -> None:
     if req.type == "QUOTE_INGESTED":
         validate_quote_payload(req.payload)
     elif req.type == "COMPUTE_REQUESTED":
@@ -81,6 +67,24 @@ async def ingest_event(session_id: str, req: V2IngestCommand, request: Request):
         from api.v2.http_errors import bad_request
 
         bad_request("unsupported_command_type", f"unsupported command type: {req.type}")
+
+# --- Endpoints ---
+
+@router.post("/sessions", response_model=CreateSessionResponse)
+async def create_session(request: Request, response: Response, cid: str = Depends(correlation_id_dep)):
+    if should_force_raise_for_tests():
+        raise RuntimeError("forced error for tests")
+    svc = get_v2_service()
+    session_id = svc.create_session()
+    log_request("POST", "/api/v2/sessions", session_id, cid, status.HTTP_201_CREATED, 0)
+    response.status_code = status.HTTP_201_CREATED
+    return CreateSessionResponse(session_id=session_id)
+
+@router.post("/sessions/{session_id}/events", response_model=IngestEventResponse, status_code=201)
+async def ingest_event(session_id: str, req: V2IngestCommand, request: Request):
+    cid = getattr(request.state, "correlation_id", None)
+    svc = get_v2_service()
+    validate_ingest_command(req)
     try:
         state_version, applied = svc.ingest_event(
             session_id=session_id,
@@ -157,6 +161,82 @@ async def ingest_event(session_id: str, req: V2IngestCommand, request: Request):
 
             internal_error()
 
+@router.post("/sessions/{session_id}/events:batch", response_model=IngestEventsBatchResponse, status_code=201)
+async def ingest_events_batch(session_id: str, req: V2IngestBatchCommand, request: Request):
+    """
+    Bulk ingest: every item is validated as on /events, then the batch is written in one
+    transaction. Errors reference the offending item via details["index"]; an event conflict
+    rejects the whole batch with the same 409 envelope as the single-event route.
+    """
+    from api.v2.http_errors import raise_http
+    from core.validation.error_envelope import ErrorEnvelope
+    from core.v2.errors import EventConflictError
+    from core.market_data.errors import MarketSnapshotNotFoundError
+
+    cid = getattr(request.state, "correlation_id", None)
+    svc = get_v2_service()
+    for index, item in enumerate(req.events):
+        try:
+            validate_ingest_command(item)
+        except HTTPException as exc:
+            if isinstance(exc.detail, dict) and isinstance(exc.detail.get("details"), dict):
+                exc.detail["details"] = {**exc.detail["details"], "index": index}
+            raise
+    try:
+        state_version, applied = svc.ingest_events(
+            session_id,
+            [
+                {
+                    "event_id": getattr(item, "event_id", None),
+                    "ts": getattr(item, "ts", None),
+                    "type": item.type,
+                    "payload": item.payload,
+                }
+                for item in req.events
+            ],
+        )
+    except HTTPException:
+        raise
+    except EventConflictError as exc:
+        index = next((i for i, item in enumerate(req.events) if getattr(item, "event_id", None) == exc.event_id), None)
+        env = ErrorEnvelope(
+            category="CONFLICT",
+            code="event_conflict",
+            message="Event conflict",
+            details={
+                "reason": "conflicting event payload for existing event_id",
+                "event_id": exc.event_id,
+                "index": index,
+            },
+        )
+        raise_http(env, status.HTTP_409_CONFLICT)
+    except MarketSnapshotNotFoundError as mne:
+        env = ErrorEnvelope(
+            category="VALIDATION",
+            code="market_snapshot_not_found",
+            message="Market snapshot not found",
+            details={"snapshot_id": getattr(mne, "snapshot_id", None)},
+        )
+        raise_http(env, status.HTTP_404_NOT_FOUND)
+    except ValueError as ve:
+        detail = ve.args[0] if ve.args else None
+        if isinstance(detail, ErrorEnvelope) or (isinstance(detail, dict) and detail.get("category") is not None):
+            raise_http(detail, 400)
+        raise
+    except Exception:
+        from api.v2.service import should_force_raise_for_tests
+        if should_force_raise_for_tests():
+            raise
+        from api.v2.http_errors import internal_error
+
+        internal_error()
+    return IngestEventsBatchResponse(
+        session_id=session_id,
+        state_version=state_version,
+        applied=applied,
+        correlation_id=cid,
+    )
+
 @router.post("/sessions/{session_id}/snapshot", response_model=SnapshotResponse)
 async def create_snapshot(session_id: str, request: Request, response: Response, cid: str = Depends(correlation_id_dep)):
     svc = get_v2_service()
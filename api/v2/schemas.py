@@ -18,6 +18,12 @@ class IngestEventResponse(BaseModel):
     applied: bool
     correlation_id: Optional[str] = None
 
+class IngestEventsBatchResponse(BaseModel):
+    session_id: str
+    state_version: int
+    applied: list[bool]
+    correlation_id: Optional[str] = None
+
 class SnapshotResponse(BaseModel):
     session_id: str
     version: int
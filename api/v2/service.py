@@ -2,6 +2,7 @@
 
 import os
 from core.v2.persistence_config import get_v2_db_path
+from core.v2.sqlite_pool import get_connection_pool
 from api.v2.service_sqlite import V2ServiceSqlite
 
 _FORCE_RAISE_FOR_TESTS = False
@@ -34,11 +35,17 @@ def reset_for_tests() -> None:
             pass
     # Remove and recreate the DB file for a clean slate
     db_path = get_v2_db_path()
+    # Pooled connections must not outlive the file they point at
+    get_connection_pool(db_path).shutdown()
     try:
         if os.path.exists(db_path):
             os.remove(db_path)
     except Exception:
         pass
+    # Cached artifacts are keyed by db path; the file they came from is gone
+    from core.market_data.artifact_store import clear_market_snapshot_cache
+
+    clear_market_snapshot_cache()
 
 __all__ = [
     "v2_service",
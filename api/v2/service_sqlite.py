@@ -2,11 +2,13 @@
 from core.v2.event_store_sqlite import SqliteEventStore
 from core.v2.snapshot_store_sqlite import SqliteSnapshotStore
 from core.v2.session_store_sqlite import SqliteSessionStore
-from core.v2.persistence_config import get_v2_db_path
+from core.v2.persistence_config import get_v2_db_path, get_v2_state_hash_algo
+from core.v2.state_hash import compute_state_hash, extend_state_hash
 from core.v2.orchestrator import V2RuntimeOrchestrator
 from core.v2.snapshot_policy import EveryNSnapshotPolicy
-from core.v2.models import EventType, Snapshot, V2Event, hash_payload
+from core.v2.models import EventType, SessionState, Snapshot, V2Event, hash_payload
 import uuid
+from dataclasses import replace
 from datetime import datetime
 from typing import Any, Tuple
 from core.validation.error_envelope import ErrorEnvelope
@@ -27,10 +29,11 @@ def reset_for_tests():
 
 
 class V2ServiceSqlite:
-    def __init__(self, db_path: str = None):
+    def __init__(self, db_path: str = None, state_hash_algo: str | None = None):
         import logging
         if db_path is None:
             db_path = get_v2_db_path()
+        self.state_hash_algo = state_hash_algo or get_v2_state_hash_algo()
         self.event_store = SqliteEventStore(db_path)
         self.snapshot_store = SqliteSnapshotStore(db_path)
         self.session_store = SqliteSessionStore(db_path)
@@ -39,6 +42,7 @@ class V2ServiceSqlite:
             self.event_store,
             self.snapshot_store,
             self.snapshot_policy,
+            state_hash_algo=self.state_hash_algo,
         )
         self._sessions: set[str] = set()
         self._seen_event_ids: dict[str, set[str]] = {}
@@ -53,6 +57,7 @@ class V2ServiceSqlite:
             self.session_store.close()
         self._sessions.clear()
         self._seen_event_ids.clear()
+        self.orchestrator.clear_cache()
 
     def get_session(self, session_id: str):
         if self.session_store.exists(session_id):
@@ -62,7 +67,7 @@ class V2ServiceSqlite:
     def create_snapshot(self, session_id: str) -> Snapshot:
         self._require_session(session_id)
         snap = self.orchestrator.build_snapshot(session_id)
-        self.snapshot_store.save(snap)
+        self.orchestrator.save_snapshot(snap)
         return snap
 
     def create_session(self) -> str:
@@ -74,12 +79,17 @@ class V2ServiceSqlite:
         return sid
 
     def _require_session(self, session_id: str) -> None:
-        if not self.session_store.exists(session_id):
+        # Sessions are never deleted, so a session seen by this instance needs no lookup
+        if session_id in self._sessions:
+            return
+        if self.session_store.exists(session_id):
+            self._sessions.add(session_id)
+        else:
             from api.v2.http_errors import not_found
 
             not_found("session_not_found", "Session not found")
 
-    def ingest_event(
+    def _prepare_event(
         self,
         session_id: str,
         *,
@@ -87,8 +97,7 @@ class V2ServiceSqlite:
         ts: datetime | None,
         type: EventType,
         payload: dict[str, Any],
-    ) -> Tuple[int, bool]:
-        self._require_session(session_id)
+    ) -> V2Event:
         # Enforce replay-only for SNAPSHOT compute requests: if a compute
         # request references a `market_snapshot_id` it must already be
         # persisted in the artifact store. This prevents any provider
@@ -137,8 +146,6 @@ class V2ServiceSqlite:
                 )
             )
         event_ts = ts
-        seen = self._seen_event_ids.setdefault(session_id, set())
-        pre_exists = eid in seen
         payload_hash = hash_payload(payload)
         event = V2Event(
             event_id=eid,
@@ -148,36 +155,95 @@ class V2ServiceSqlite:
             payload=payload,
             payload_hash=payload_hash,
         )
-        applied = self.event_store.append(event)
-        if not pre_exists:
-            seen.add(eid)
-        state = self.orchestrator.ingest_event(event)
+        return event
+
+    def ingest_event(
+        self,
+        session_id: str,
+        *,
+        event_id: str | None,
+        ts: datetime | None,
+        type: EventType,
+        payload: dict[str, Any],
+    ) -> Tuple[int, bool]:
+        self._require_session(session_id)
+        event = self._prepare_event(session_id, event_id=event_id, ts=ts, type=type, payload=payload)
+        # The orchestrator performs the only store write (after loading the session's cache entry)
+        state, applied = self.orchestrator.append_event(event)
+        self._seen_event_ids.setdefault(session_id, set()).add(event.event_id)
+        return state.version, applied
+
+    def ingest_events(self, session_id: str, items: list[dict[str, Any]]) -> Tuple[int, list[bool]]:
+        """
+        Bulk ingest for one session. Each item carries event_id/ts/type/payload exactly as
+        ingest_event does and is validated the same way before anything is written.
+        Validation failures are re-raised with details["index"] pointing at the item.
+        The batch is appended in a single transaction by the orchestrator and applied once.
+        """
+        self._require_session(session_id)
+        events = []
+        for index, item in enumerate(items):
+            try:
+                events.append(
+                    self._prepare_event(
+                        session_id,
+                        event_id=item.get("event_id"),
+                        ts=item.get("ts"),
+                        type=item["type"],
+                        payload=item["payload"],
+                    )
+                )
+            except ValueError as ve:
+                env = ve.args[0] if ve.args else None
+                if isinstance(env, ErrorEnvelope):
+                    raise ValueError(replace(env, details={**env.details, "index": index})) from ve
+                raise
+        # The orchestrator performs the only store write (after loading the session's cache entry)
+        state, applied = self.orchestrator.append_events(events)
+        self._seen_event_ids.setdefault(session_id, set()).update(e.event_id for e in events)
         return state.version, applied
 
     def get_snapshot(self, session_id: str) -> Snapshot:
         """
         Returns a materialized snapshot view: always includes all applied events up to latest version.
-        Does NOT persist a new snapshot on read.
+        Does NOT persist a new snapshot on read. Served from the orchestrator's session cache
+        (recovered from disk only on a miss) and memoised per state version.
         """
         self._require_session(session_id)
-        state = self.orchestrator.recover(session_id)
-        from core.v2.models import hash_snapshot, Snapshot
+        snap = self.orchestrator.cached_view(
+            session_id, "materialized_snapshot", self._materialize_snapshot, self._extend_materialized_snapshot
+        )
+        return replace(snap, created_at=datetime.utcnow())  # לא רלוונטי לחוזה, רק פורמלי
+
+    def _materialize_snapshot(self, state: SessionState) -> Snapshot:
         data = {}
         # סדר דטרמיניסטי
         for eid in sorted(state.applied.keys()):
             # state.applied: event_id -> version
             # state.data: event_id -> payload
             data[eid] = state.data[eid] if hasattr(state, 'data') and eid in getattr(state, 'data', {}) else None
-        version = state.version
-        state_hash = hash_snapshot(data)
-        from datetime import datetime
-        snap = Snapshot(
-            session_id=session_id,
-            version=version,
-            created_at=datetime.utcnow(),  # לא רלוונטי לחוזה, רק פורמלי
-            state_hash=state_hash,
+        return Snapshot(
+            session_id=state.session_id,
+            version=state.version,
+            created_at=datetime.utcnow(),
+            state_hash=compute_state_hash(data, self.state_hash_algo),
+            data=data,
+        )
+
+    def _extend_materialized_snapshot(self, prev: Snapshot, applied: list) -> Snapshot:
+        new_items = [(ae.event.event_id, None) for ae in applied]
+        data = dict(prev.data)
+        data.update(new_items)
+        # keep the deterministic key order; re-sort only if the new ids do not simply append
+        keys = ([next(reversed(prev.data))] if prev.data else []) + [eid for eid, _ in new_items]
+        if any(a > b for a, b in zip(keys, keys[1:])):
+            data = dict(sorted(data.items()))
+        return Snapshot(
+            session_id=prev.session_id,
+            version=applied[-1].state_version,
+            created_at=datetime.utcnow(),
+            state_hash=extend_state_hash(prev.state_hash, prev.data, new_items, self.state_hash_algo),
             data=data,
         )
-        return snap
 
 # Singleton instance for router import
@@ -25,6 +25,76 @@ def _edge_bps(net_edge: float, basis_price: float) -> float:
     return (net_edge / basis_price) * 10_000
 
 
+def _best_pair_opportunity(
+    symbol: str,
+    best_bid: VenueQuote,
+    best_ask: VenueQuote,
+    cfg: ArbitrageConfig,
+) -> ArbitrageOpportunity | None:
+    """Opportunity for selling at best_bid and buying at best_ask, or None if filtered out."""
+
+    if not cfg.allow_same_venue and best_bid.venue == best_ask.venue:
+        return None
+
+    gross_edge = cast(float, best_bid.bid) - cast(float, best_ask.ask)
+    if gross_edge <= 0:
+        return None
+
+    size_candidates = [s for s in (best_bid.size, best_ask.size) if s is not None and s > 0]
+    size = min(size_candidates) if size_candidates else cfg.default_size
+
+    buy_leg = ArbitrageLeg(
+        action="buy",
+        venue=best_ask.venue,
+        ccy=best_ask.ccy,
+        price=cast(float, best_ask.ask),
+        quantity=size,
+        fees_bps=best_ask.fees_bps,
+    )
+    sell_leg = ArbitrageLeg(
+        action="sell",
+        venue=best_bid.venue,
+        ccy=best_bid.ccy,
+        price=cast(float, best_bid.bid),
+        quantity=size,
+        fees_bps=best_bid.fees_bps,
+    )
+
+    net_edge_per_unit = _net_edge_per_unit(
+        buy_price=buy_leg.price,
+        sell_price=sell_leg.price,
+        buy_fee_bps=buy_leg.fees_bps,
+        sell_fee_bps=sell_leg.fees_bps,
+    )
+    edge_bps = _edge_bps(net_edge_per_unit, buy_leg.price)
+
+    if edge_bps < cfg.min_edge_bps or size < cfg.min_size:
+        return None
+
+    notes: list[str] = []
+    if cfg.max_latency_ms is not None:
+        if best_bid.latency_ms and best_bid.latency_ms > cfg.max_latency_ms:
+            notes.append(
+                f"Latency on {best_bid.venue} exceeds threshold: {best_bid.latency_ms}ms"
+            )
+        if best_ask.latency_ms and best_ask.latency_ms > cfg.max_latency_ms:
+            notes.append(
+                f"Latency on {best_ask.venue} exceeds threshold: {best_ask.latency_ms}ms"
+            )
+
+    return ArbitrageOpportunity(
+        symbol=symbol,
+        buy=buy_leg,
+        sell=sell_leg,
+        ccy=best_ask.ccy,
+        gross_edge=gross_edge,
+        net_edge=net_edge_per_unit,
+        edge_bps=edge_bps,
+        size=size,
+        notes=notes,
+    )
+
+
 def find_cross_venue_opportunities(
     quotes: Iterable[VenueQuote],
     config: ArbitrageConfig | None = None,
@@ -51,68 +121,9 @@ def find_cross_venue_opportunities(
         best_bid = max(symbol_quotes, key=lambda q: cast(float, q.bid))
         best_ask = min(symbol_quotes, key=lambda q: cast(float, q.ask))
 
-        if not cfg.allow_same_venue and best_bid.venue == best_ask.venue:
-            continue
-
-        gross_edge = cast(float, best_bid.bid) - cast(float, best_ask.ask)
-        if gross_edge <= 0:
-            continue
-
-        size_candidates = [s for s in (best_bid.size, best_ask.size) if s is not None and s > 0]
-        size = min(size_candidates) if size_candidates else cfg.default_size
-
-        buy_leg = ArbitrageLeg(
-            action="buy",
-            venue=best_ask.venue,
-            ccy=best_ask.ccy,
-            price=cast(float, best_ask.ask),
-            quantity=size,
-            fees_bps=best_ask.fees_bps,
-        )
-        sell_leg = ArbitrageLeg(
-            action="sell",
-            venue=best_bid.venue,
-            ccy=best_bid.ccy,
-            price=cast(float, best_bid.bid),
-            quantity=size,
-            fees_bps=best_bid.fees_bps,
-        )
-
-        net_edge_per_unit = _net_edge_per_unit(
-            buy_price=buy_leg.price,
-            sell_price=sell_leg.price,
-            buy_fee_bps=buy_leg.fees_bps,
-            sell_fee_bps=sell_leg.fees_bps,
-        )
-        edge_bps = _edge_bps(net_edge_per_unit, buy_leg.price)
-
-        if edge_bps < cfg.min_edge_bps or size < cfg.min_size:
-            continue
-
-        notes: list[str] = []
-        if cfg.max_latency_ms is not None:
-            if best_bid.latency_ms and best_bid.latency_ms > cfg.max_latency_ms:
-                notes.append(
-                    f"Latency on {best_bid.venue} exceeds threshold: {best_bid.latency_ms}ms"
-                )
-            if best_ask.latency_ms and best_ask.latency_ms > cfg.max_latency_ms:
-                notes.append(
-                    f"Latency on {best_ask.venue} exceeds threshold: {best_ask.latency_ms}ms"
-                )
-
-        opportunities.append(
-            ArbitrageOpportunity(
-                symbol=symbol,
-                buy=buy_leg,
-                sell=sell_leg,
-                ccy=best_ask.ccy,
-                gross_edge=gross_edge,
-                net_edge=net_edge_per_unit,
-                edge_bps=edge_bps,
-                size=size,
-                notes=notes,
-            )
-        )
+        opportunity = _best_pair_opportunity(symbol, best_bid, best_ask, cfg)
+        if opportunity is not None:
+            opportunities.append(opportunity)
 
     return opportunities
 
@@ -5,6 +5,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Iterable, Sequence
 
+import numpy as np
+
 from core.arbitrage.models import ArbitrageOpportunity, VenueQuote
 
 
@@ -41,7 +43,10 @@ class ExecutionDecision:
 def _resolve_as_of(opportunity: ArbitrageOpportunity, quotes: Iterable[VenueQuote | object]) -> datetime | None:
     if opportunity.as_of:
         return opportunity.as_of
+    return _resolve_quotes_as_of(quotes)
+
 
+def _resolve_quotes_as_of(quotes: Iterable[VenueQuote | object]) -> datetime | None:
     # Support quote containers that carry their own timestamps
     for q in quotes:
         as_of = getattr(q, "as_of", None)
@@ -140,9 +145,87 @@ def evaluate_execution_readiness(
     )
 
 
+_REASON_ORDER = (
+    ExecutionDecisionReason.EDGE_TOO_SMALL,
+    ExecutionDecisionReason.QUOTE_TOO_OLD,
+    ExecutionDecisionReason.SPREAD_TOO_WIDE,
+    ExecutionDecisionReason.NOTIONAL_TOO_LARGE,
+    ExecutionDecisionReason.PASS,
+)
+
+
+def evaluate_execution_readiness_many(
+    opportunities: Sequence[ArbitrageOpportunity],
+    quotes: Sequence[VenueQuote],
+    constraints: ExecutionConstraints,
+    now: datetime,
+) -> list[ExecutionDecision]:
+    """Batch evaluate_execution_readiness for the opportunities of one snapshot.
+
+    The worst spread and the quotes' as_of are computed once, ages once per distinct
+    as_of, and the checks run as arrays in the scalar order. Each decision equals the
+    one evaluate_execution_readiness returns for that opportunity.
+    """
+
+    n = len(opportunities)
+    if n == 0:
+        return []
+
+    worst_spread_bps = _compute_worst_spread_bps(quotes)
+    quotes_as_of = _resolve_quotes_as_of(quotes)
+    ages: dict[datetime | None, float | None] = {}
+    age_ms: list[float | None] = []
+    for opportunity in opportunities:
+        as_of = opportunity.as_of or quotes_as_of
+        if as_of not in ages:
+            ages[as_of] = None if as_of is None else (now - as_of).total_seconds() * 1000
+        age_ms.append(ages[as_of])
+
+    edge = np.fromiter((o.edge_bps for o in opportunities), dtype=float, count=n)
+    price = np.fromiter((o.buy.price for o in opportunities), dtype=float, count=n)
+    size = np.fromiter((o.size for o in opportunities), dtype=float, count=n)
+    age = np.array([np.nan if a is None else a for a in age_ms], dtype=float)
+    notional = price * size
+
+    no_check = np.zeros(n, dtype=bool)
+    too_old = no_check
+    if constraints.max_quote_age_ms is not None:
+        too_old = np.isnan(age) | (age > constraints.max_quote_age_ms)
+    too_wide = no_check
+    if constraints.max_spread_bps is not None:
+        too_wide = np.full(n, worst_spread_bps is None or worst_spread_bps > constraints.max_spread_bps)
+    too_large = no_check
+    recommended_qty = size
+    if constraints.max_notional is not None:
+        too_large = notional > constraints.max_notional
+        positive = price > 0
+        capped = np.where(positive, constraints.max_notional / np.where(positive, price, 1.0), 0.0)
+        recommended_qty = np.where(too_large, capped, size)
+
+    reason_index = np.select(
+        [edge < constraints.min_edge_bps, too_old, too_wide, too_large],
+        [0, 1, 2, 3],
+        default=4,
+    )
+    return [
+        ExecutionDecision(
+            reason=_REASON_ORDER[r],
+            edge_bps=opportunity.edge_bps,
+            worst_spread_bps=worst_spread_bps,
+            age_ms=a,
+            notional=notional_value,
+            recommended_qty=qty if r == 3 else opportunity.size,
+        )
+        for opportunity, r, a, notional_value, qty in zip(
+            opportunities, reason_index.tolist(), age_ms, notional.tolist(), recommended_qty.tolist()
+        )
+    ]
+
+
 __all__ = [
     "ExecutionDecision",
     "ExecutionDecisionReason",
     "ExecutionConstraints",
     "evaluate_execution_readiness",
+    "evaluate_execution_readiness_many",
 ]
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Iterable, List, Protocol
+from typing import AsyncIterator, Awaitable, Callable, Iterable, List, Protocol
 
 from core.arbitrage.models import VenueQuote
 
@@ -33,3 +34,102 @@ class InMemoryQuoteFeed(QuoteProvider):
 
     def get_quotes(self) -> Iterable[VenueQuote]:
         return list(self.quotes)
+
+
+class AsyncQuoteFeed(Protocol):
+    """Async source of VenueQuote deltas (changed quotes only, not whole snapshots)."""
+
+    def __aiter__(self) -> AsyncIterator[VenueQuote]:
+        """Yield quote deltas until the feed ends."""
+
+
+@dataclass(frozen=True)
+class RecordedQuote:
+    """A quote delta stamped with the time it was observed."""
+
+    as_of: datetime
+    quote: VenueQuote
+
+
+class ReplayQuoteFeed:
+    """Deterministic AsyncQuoteFeed over recorded quotes, in recorded order.
+
+    Records sharing an as_of form one burst. Between bursts the feed yields to the event
+    loop: speed=None does so without sleeping, otherwise the recorded gap divided by speed
+    is slept. clock() returns the as_of of the last emitted record, so a scan loop driven
+    by it stamps scans with recorded rather than wall-clock time. pace, if given, is awaited
+    before every burst after the first (e.g. ArbitrageScanLoop.wait_idle), so a consumer
+    that scans in the background still sees exactly one burst per scan.
+    """
+
+    def __init__(
+        self,
+        records: Iterable[RecordedQuote],
+        speed: float | None = None,
+        pace: Callable[[], Awaitable[object]] | None = None,
+    ) -> None:
+        self.records = list(records)
+        self.speed = speed
+        self.pace = pace
+        self.as_of: datetime | None = None
+
+    @classmethod
+    def from_snapshots(
+        cls,
+        snapshots: Iterable[QuoteSnapshot],
+        speed: float | None = None,
+        pace: Callable[[], Awaitable[object]] | None = None,
+    ) -> "ReplayQuoteFeed":
+        return cls(
+            (RecordedQuote(as_of=snapshot.as_of, quote=quote) for snapshot in snapshots for quote in snapshot.quotes),
+            speed=speed,
+            pace=pace,
+        )
+
+    def clock(self) -> datetime:
+        if self.as_of is None:
+            raise RuntimeError("ReplayQuoteFeed has not emitted a quote yet")
+        return self.as_of
+
+    async def __aiter__(self) -> AsyncIterator[VenueQuote]:
+        for record in self.records:
+            if self.as_of is not None and record.as_of != self.as_of:
+                gap = 0.0
+                if self.speed is not None:
+                    gap = max((record.as_of - self.as_of).total_seconds() / self.speed, 0.0)
+                await asyncio.sleep(gap)
+                if self.pace is not None:
+                    await self.pace()
+            self.as_of = record.as_of
+            yield record.quote
+
+
+class QueueQuoteFeed:
+    """Push-based AsyncQuoteFeed; put() waits while maxsize quotes are unconsumed."""
+
+    _CLOSED = object()
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self._queue: asyncio.Queue[object] = asyncio.Queue(maxsize=maxsize)
+        self.closed = False
+
+    async def put(self, quotes: Iterable[VenueQuote]) -> int:
+        if self.closed:
+            raise RuntimeError("QueueQuoteFeed is closed")
+        count = 0
+        for quote in quotes:
+            await self._queue.put(quote)
+            count += 1
+        return count
+
+    async def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            await self._queue.put(self._CLOSED)
+
+    async def __aiter__(self) -> AsyncIterator[VenueQuote]:
+        while True:
+            item = await self._queue.get()
+            if item is self._CLOSED:
+                return
+            yield item  # type: ignore[misc]
@@ -3,6 +3,10 @@ from __future__ import annotations
 import hashlib
 import math
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Sequence
+
+import numpy as np
 
 
 DEFAULT_PRICE_TICK = 0.01
@@ -26,9 +30,37 @@ def opportunity_id(
     buy_bucket = _price_bucket(buy_price_base, tick)
     sell_bucket = _price_bucket(sell_price_base, tick)
     raw = f"{symbol}|{buy_venue}|{sell_venue}|{base_ccy}|{buy_bucket:.4f}|{sell_bucket:.4f}"
+    return _digest(raw)
+
+
+@lru_cache(maxsize=65_536)
+def _digest(raw: str) -> str:
+    # Opportunities recur scan after scan within the same buckets; hash each key once.
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
 
+def opportunity_ids(
+    symbols: Sequence[str],
+    buy_venues: Sequence[str],
+    sell_venues: Sequence[str],
+    base_ccy: str,
+    buy_prices_base: Sequence[float],
+    sell_prices_base: Sequence[float],
+    tick: float = DEFAULT_PRICE_TICK,
+) -> List[str]:
+    """opportunity_id for parallel sequences, with the price buckets computed as arrays."""
+
+    # + 0.0 turns np.floor's -0.0 into the 0.0 that math.floor gives
+    buy_buckets = (np.floor(np.asarray(buy_prices_base, dtype=float) / tick) * tick + 0.0).tolist()
+    sell_buckets = (np.floor(np.asarray(sell_prices_base, dtype=float) / tick) * tick + 0.0).tolist()
+    return [
+        _digest(f"{symbol}|{buy_venue}|{sell_venue}|{base_ccy}|{buy_bucket:.4f}|{sell_bucket:.4f}")
+        for symbol, buy_venue, sell_venue, buy_bucket, sell_bucket in zip(
+            symbols, buy_venues, sell_venues, buy_buckets, sell_buckets
+        )
+    ]
+
+
 @dataclass(frozen=True)
 class OpportunityIdentity:
     opportunity_id: str
@@ -36,4 +68,4 @@ class OpportunityIdentity:
     sell_bucket: float
 
 
-__all__ = ["opportunity_id", "OpportunityIdentity", "DEFAULT_PRICE_TICK"]
+__all__ = ["opportunity_id", "opportunity_ids", "OpportunityIdentity", "DEFAULT_PRICE_TICK"]
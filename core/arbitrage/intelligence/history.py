@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Deque, Dict
+
+if TYPE_CHECKING:  # pragma: no cover
+    from core.arbitrage.orchestrator import OpportunityRecord
+
+
+@dataclass
+class OpportunityHistoryIndex:
+    """Per-opportunity_id view of a session's opportunities_history.
+
+    Records are appended at ingest and discarded when the session history prunes them,
+    so each deque holds exactly that id's records still in history, oldest first.
+    """
+
+    _records: Dict[str, Deque[OpportunityRecord]] = field(default_factory=dict)
+
+    def append(self, record: OpportunityRecord) -> None:
+        opp_id = record.opportunity.opportunity_id
+        records = self._records.get(opp_id)
+        if records is None:
+            records = self._records[opp_id] = deque()
+        records.append(record)
+
+    def discard(self, record: OpportunityRecord) -> None:
+        opp_id = record.opportunity.opportunity_id
+        records = self._records.get(opp_id)
+        if not records:
+            return
+        if records[0] is record:
+            records.popleft()
+        else:
+            records.remove(record)
+        if not records:
+            del self._records[opp_id]
+
+    def records(self, opportunity_id: str) -> Deque[OpportunityRecord]:
+        return self._records.get(opportunity_id, deque())
+
+    def latest(self, opportunity_id: str) -> OpportunityRecord | None:
+        records = self._records.get(opportunity_id)
+        return records[-1] if records else None
+
+    def __len__(self) -> int:
+        return sum(len(records) for records in self._records.values())
+
+
+__all__ = ["OpportunityHistoryIndex"]
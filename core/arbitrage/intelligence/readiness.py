@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
 
 from core.arbitrage.models import ArbitrageConfig
 
@@ -57,9 +60,32 @@ def evaluate_execution_readiness(
     return ExecutionReadiness(ready=ready, reasons=reasons, constraints=constraints)
 
 
+def evaluate_execution_readiness_many(
+    *,
+    edge_bps: Sequence[float],
+    sizes: Sequence[float],
+    constraints: ExecutionConstraints | None = None,
+) -> list[ExecutionReadiness]:
+    """evaluate_execution_readiness over parallel edge/size sequences, compared as arrays."""
+    constraints = constraints or ExecutionConstraints()
+    edge_low = (np.asarray(edge_bps, dtype=float) < constraints.min_edge_bps).tolist()
+    size_low = (np.asarray(sizes, dtype=float) < constraints.min_size).tolist()
+
+    results: list[ExecutionReadiness] = []
+    for edge_flag, size_flag in zip(edge_low, size_low):
+        reasons: list[str] = []
+        if edge_flag:
+            reasons.append("edge_below_threshold")
+        if size_flag:
+            reasons.append("size_below_threshold")
+        results.append(ExecutionReadiness(ready=not reasons, reasons=reasons, constraints=constraints))
+    return results
+
+
 __all__ = [
     "ExecutionConstraints",
     "ExecutionReadiness",
     "default_execution_constraints",
     "evaluate_execution_readiness",
+    "evaluate_execution_readiness_many",
 ]
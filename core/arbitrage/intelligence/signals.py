@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, Iterable
+from typing import TYPE_CHECKING, Dict, Reversible
 
 from core.arbitrage.intelligence.lifecycle import OpportunityState
 
@@ -20,17 +20,22 @@ def compute_signals(
     opportunity: OpportunityRecord,
     state: OpportunityState,
     now: datetime,
-    history: Iterable[OpportunityRecord],
+    history: Reversible[OpportunityRecord],
 ) -> OpportunitySignals:
     age_seconds = (now - state.first_seen).total_seconds()
     freshness_ms = (now - state.last_seen).total_seconds() * 1000
 
-    # naive stability: compare last two edges if available
-    past_edges = [op.opportunity.edge_bps for op in history if op.opportunity.opportunity_id == state.opportunity_id]
+    # naive stability: compare last two edges if available. Walk history newest-first and
+    # stop at two matches, so a per-opportunity history costs O(1).
+    past_edges: list[float] = []
+    for op in reversed(history):
+        if op.opportunity.opportunity_id == state.opportunity_id:
+            past_edges.append(op.opportunity.edge_bps)
+            if len(past_edges) == 2:
+                break
     stability = 1.0
-    if len(past_edges) >= 2:
-        last = past_edges[-1]
-        prev = past_edges[-2]
+    if len(past_edges) == 2:
+        last, prev = past_edges
         if last != 0:
             stability = 1 - abs(last - prev) / abs(last)
 
@@ -22,6 +22,75 @@ def _edge_bps(net_edge: float, basis_price: float) -> float:
     return (net_edge / basis_price) * 10_000
 
 
+def _pair_opportunity(
+    symbol: str, buy: VenueQuote, sell: VenueQuote, cfg: ArbitrageConfig
+) -> Tuple[Tuple, ArbitrageOpportunity] | None:
+    """(sort_key, opportunity) for buying at buy.ask and selling at sell.bid, or None if infeasible."""
+
+    if not (buy.ask and sell.bid):
+        return None
+    if not cfg.allow_same_venue and buy.venue == sell.venue:
+        return None
+
+    gross_edge = float(sell.bid) - float(buy.ask)
+    if gross_edge <= 0:
+        return None
+
+    size_candidates = [s for s in (buy.size, sell.size) if s is not None and s > 0]
+    size = min(size_candidates) if size_candidates else cfg.default_size
+
+    net_edge_per_unit = _net_edge_per_unit(
+        buy_price=buy.ask,
+        sell_price=sell.bid,
+        buy_fee_bps=buy.fees_bps or 0.0,
+        sell_fee_bps=sell.fees_bps or 0.0,
+    )
+
+    edge_bps_val = _edge_bps(net_edge_per_unit, buy.ask)
+
+    if edge_bps_val < cfg.min_edge_bps or size < cfg.min_size:
+        return None
+
+    buy_leg = ArbitrageLeg(
+        action="buy",
+        venue=buy.venue,
+        ccy=buy.ccy,
+        price=float(buy.ask),
+        quantity=size,
+        fees_bps=buy.fees_bps or 0.0,
+    )
+    sell_leg = ArbitrageLeg(
+        action="sell",
+        venue=sell.venue,
+        ccy=sell.ccy,
+        price=float(sell.bid),
+        quantity=size,
+        fees_bps=sell.fees_bps or 0.0,
+    )
+
+    notes: list[str] = []
+    if cfg.max_latency_ms is not None:
+        if sell.latency_ms and sell.latency_ms > cfg.max_latency_ms:
+            notes.append(f"Latency on {sell.venue} exceeds threshold: {sell.latency_ms}ms")
+        if buy.latency_ms and buy.latency_ms > cfg.max_latency_ms:
+            notes.append(f"Latency on {buy.venue} exceeds threshold: {buy.latency_ms}ms")
+
+    opp = ArbitrageOpportunity(
+        symbol=symbol,
+        buy=buy_leg,
+        sell=sell_leg,
+        ccy=buy.ccy,
+        gross_edge=gross_edge,
+        net_edge=net_edge_per_unit,
+        edge_bps=edge_bps_val,
+        size=size,
+        notes=notes,
+    )
+
+    sort_key = (symbol, buy.venue, sell.venue, float(buy.ask), float(sell.bid))
+    return sort_key, opp
+
+
 def build_opportunity_space(
     quotes: Iterable[VenueQuote], config: ArbitrageConfig | None = None
 ) -> List[ArbitrageOpportunity]:
@@ -67,68 +136,9 @@ def build_opportunity_space(
                     # same quote object; allow same-venue pairs only if config allows
                     if not cfg.allow_same_venue:
                         continue
-                if not (buy.ask and sell.bid):
-                    continue
-                if not cfg.allow_same_venue and buy.venue == sell.venue:
-                    continue
-
-                gross_edge = float(sell.bid) - float(buy.ask)
-                if gross_edge <= 0:
-                    continue
-
-                size_candidates = [s for s in (buy.size, sell.size) if s is not None and s > 0]
-                size = min(size_candidates) if size_candidates else cfg.default_size
-
-                net_edge_per_unit = _net_edge_per_unit(
-                    buy_price=buy.ask,
-                    sell_price=sell.bid,
-                    buy_fee_bps=buy.fees_bps or 0.0,
-                    sell_fee_bps=sell.fees_bps or 0.0,
-                )
-
-                edge_bps_val = _edge_bps(net_edge_per_unit, buy.ask)
-
-                if edge_bps_val < cfg.min_edge_bps or size < cfg.min_size:
-                    continue
-
-                buy_leg = ArbitrageLeg(
-                    action="buy",
-                    venue=buy.venue,
-                    ccy=buy.ccy,
-                    price=float(buy.ask),
-                    quantity=size,
-                    fees_bps=buy.fees_bps or 0.0,
-                )
-                sell_leg = ArbitrageLeg(
-                    action="sell",
-                    venue=sell.venue,
-                    ccy=sell.ccy,
-                    price=float(sell.bid),
-                    quantity=size,
-                    fees_bps=sell.fees_bps or 0.0,
-                )
-
-                notes: list[str] = []
-                if cfg.max_latency_ms is not None:
-                    if sell.latency_ms and sell.latency_ms > cfg.max_latency_ms:
-                        notes.append(f"Latency on {sell.venue} exceeds threshold: {sell.latency_ms}ms")
-                    if buy.latency_ms and buy.latency_ms > cfg.max_latency_ms:
-                        notes.append(f"Latency on {buy.venue} exceeds threshold: {buy.latency_ms}ms")
-
-                opp = ArbitrageOpportunity(
-                    symbol=symbol,
-                    buy=buy_leg,
-                    sell=sell_leg,
-                    ccy=buy.ccy,
-                    gross_edge=gross_edge,
-                    net_edge=net_edge_per_unit,
-                    edge_bps=edge_bps_val,
-                    size=size,
-                    notes=notes,
-                )
-
-                sort_key = (symbol, buy.venue, sell.venue, float(buy.ask), float(sell.bid))
-                candidates.append((sort_key, opp))
+                candidate = _pair_opportunity(symbol, buy, sell, cfg)
+                if candidate is not None:
+                    candidates.append(candidate)
 
     # Stable, deterministic ordering by sort_key
     candidates.sort(key=lambda t: t[0])
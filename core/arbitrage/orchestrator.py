@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import threading
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from itertools import islice
 from typing import Deque, Dict, List
 from uuid import UUID, uuid4
 
@@ -10,12 +12,13 @@ from core.arbitrage.engine import find_cross_venue_opportunities
 from core.arbitrage.execution.gate import (
     ExecutionConstraints as ExecutionGateConstraints,
     ExecutionDecision,
-    evaluate_execution_readiness as evaluate_execution_decision,
+    evaluate_execution_readiness_many as evaluate_execution_decisions,
 )
 from core.arbitrage.feed import QuoteSnapshot
-from core.arbitrage.identity import opportunity_id
+from core.arbitrage.identity import opportunity_ids
 from core.finance.money import Money
 from core.arbitrage.intelligence.events import ArbitrageEvent, ArbitrageEventType
+from core.arbitrage.intelligence.history import OpportunityHistoryIndex
 from core.arbitrage.intelligence.lifecycle import (
     LifecycleState,
     OpportunityState,
@@ -24,13 +27,16 @@ from core.arbitrage.intelligence.lifecycle import (
 )
 from core.arbitrage.intelligence.limits import SessionLimits
 from core.arbitrage.intelligence.readiness import (
+    ExecutionConstraints,
     ExecutionReadiness,
     default_execution_constraints,
     evaluate_execution_readiness,
+    evaluate_execution_readiness_many,
 )
 from core.arbitrage.intelligence.scoring import RankedRecommendation, to_recommendation
 from core.arbitrage.intelligence.signals import compute_signals
-from core.arbitrage.models import ArbitrageConfig, ArbitrageOpportunity
+from core.arbitrage.models import ArbitrageConfig, ArbitrageOpportunity, VenueQuote
+from core.arbitrage.top_of_book import TopOfBookIndex
 from core.fx.converter import FxConverter
 from core.portfolio.models import Currency
 
@@ -121,8 +127,11 @@ class ArbitrageSessionState:
     base_currency: Currency
     config: ArbitrageConfig
     limits: SessionLimits
-    snapshots: List[QuoteSnapshot] = field(default_factory=list)
-    opportunities_history: List[OpportunityRecord] = field(default_factory=list)
+    # Both are time-ordered (ingest order): pruning pops stale entries from the left.
+    snapshots: Deque[QuoteSnapshot] = field(default_factory=deque)
+    opportunities_history: Deque[OpportunityRecord] = field(default_factory=deque)
+    # opportunities_history keyed by opportunity_id; kept in step by ingest and pruning
+    opportunity_index: OpportunityHistoryIndex = field(default_factory=OpportunityHistoryIndex)
     opportunity_state: Dict[str, OpportunityState] = field(default_factory=dict)
     events: Deque[ArbitrageEvent] = field(default_factory=deque)
 
@@ -132,6 +141,16 @@ class ArbitrageSessionState:
 
     last_accessed: datetime = field(default_factory=datetime.utcnow)
 
+    # Latest quote per (symbol, venue), fed by ingest_quote_delta
+    top_of_book: TopOfBookIndex = field(init=False)
+
+    # Sync routes run in a threadpool: every read or write of the windows, index, lifecycle
+    # states and book above happens under this lock (re-entrant, so helpers can nest).
+    lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.top_of_book = TopOfBookIndex(self.config)
+
 
 @dataclass
 class ArbitrageOrchestrator:
@@ -170,7 +189,35 @@ class ArbitrageOrchestrator:
         fx_converter: FxConverter,
     ) -> List[OpportunityRecord]:
         state = self.get_session(session_id)
+        with state.lock:
+            return self._ingest(state, snapshot, fx_converter, opportunities=None)
+
+    def ingest_quote_delta(
+        self,
+        session_id: UUID,
+        as_of: datetime,
+        quotes: List[VenueQuote],
+        fx_converter: FxConverter,
+    ) -> List[OpportunityRecord]:
+        """Apply changed quotes to the session's top-of-book and scan the resulting book.
+
+        Equivalent to ingest_snapshot with a snapshot of the whole book, but best pairs come
+        from the index instead of regrouping every quote. A quote without bid/ask removes
+        that venue. The book only reflects deltas, not quotes passed to ingest_snapshot.
+        """
+        state = self.get_session(session_id)
+        with state.lock:
+            state.top_of_book.apply(quotes)
+            snapshot = QuoteSnapshot(as_of=as_of, quotes=state.top_of_book.quotes())
+            return self._ingest(state, snapshot, fx_converter, opportunities=state.top_of_book.best_opportunities())
 
+    def _ingest(
+        self,
+        state: ArbitrageSessionState,
+        snapshot: QuoteSnapshot,
+        fx_converter: FxConverter,
+        opportunities: List[ArbitrageOpportunity] | None,
+    ) -> List[OpportunityRecord]:
         # Snapshot-level validation (lightweight). Stored on state for later API propagation.
         summary = self._validate_snapshot(snapshot)
         state.last_validation_summary = summary
@@ -179,14 +226,14 @@ class ArbitrageOrchestrator:
         expire_stale_states(state.opportunity_state, now=snapshot.as_of, limits=state.limits)
 
         state.snapshots.append(snapshot)
-        self._prune_snapshots(state)
 
         state.events.append(
             ArbitrageEvent(as_of=snapshot.as_of, event_type=ArbitrageEventType.SNAPSHOT_INGESTED)
         )
         self._prune_events(state)
 
-        opportunities = find_cross_venue_opportunities(quotes=snapshot.quotes, config=state.config)
+        if opportunities is None:
+            opportunities = find_cross_venue_opportunities(quotes=snapshot.quotes, config=state.config)
 
         # “soft” readiness constraints (business rules)
         soft_constraints = default_execution_constraints(state.config)
@@ -199,16 +246,37 @@ class ArbitrageOrchestrator:
 
         enriched: list[OpportunityRecord] = []
 
+        # Batch pass: FX factors once per currency, gate metrics once per snapshot.
         for opp in opportunities:
             opp.as_of = snapshot.as_of
-            opp.opportunity_id = opportunity_id(
-                symbol=opp.symbol,
-                buy_venue=opp.buy.venue,
-                sell_venue=opp.sell.venue,
-                base_ccy=str(state.base_currency),
-                buy_price_base=fx_converter.to_base(Money(amount=float(opp.buy.price), ccy=opp.buy.ccy)).amount,
-                sell_price_base=fx_converter.to_base(Money(amount=float(opp.sell.price), ccy=opp.sell.ccy)).amount,
-            )
+        leg_ccys = [opp.buy.ccy for opp in opportunities] + [opp.sell.ccy for opp in opportunities]
+        leg_prices_base = fx_converter.to_base_many(
+            [float(opp.buy.price) for opp in opportunities] + [float(opp.sell.price) for opp in opportunities],
+            leg_ccys,
+        )
+        n = len(opportunities)
+        ids = opportunity_ids(
+            symbols=[opp.symbol for opp in opportunities],
+            buy_venues=[opp.buy.venue for opp in opportunities],
+            sell_venues=[opp.sell.venue for opp in opportunities],
+            base_ccy=str(state.base_currency),
+            buy_prices_base=leg_prices_base[:n],
+            sell_prices_base=leg_prices_base[n:],
+        )
+        opp_ccys = [opp.ccy for opp in opportunities]
+        edges_per_unit = fx_converter.to_base_many([float(opp.net_edge) for opp in opportunities], opp_ccys)
+        edges_total = fx_converter.to_base_many([float(opp.net_edge * opp.size) for opp in opportunities], opp_ccys)
+        readiness_list = evaluate_execution_readiness_many(
+            edge_bps=[opp.edge_bps for opp in opportunities],
+            sizes=[opp.size for opp in opportunities],
+            constraints=soft_constraints,
+        )
+        decisions = evaluate_execution_decisions(opportunities, snapshot.quotes, gate_constraints, snapshot.as_of)
+
+        for opp, opp_id, edge_per_unit, edge_total, readiness, decision in zip(
+            opportunities, ids, edges_per_unit, edges_total, readiness_list, decisions
+        ):
+            opp.opportunity_id = opp_id
 
             lifecycle = update_lifecycle(
                 existing=state.opportunity_state.get(opp.opportunity_id),
@@ -219,35 +287,18 @@ class ArbitrageOrchestrator:
             lifecycle.opportunity_id = opp.opportunity_id  # type: ignore[attr-defined]
             state.opportunity_state[opp.opportunity_id] = lifecycle
 
-            edge_per_unit_money = fx_converter.to_base(Money(amount=float(opp.net_edge), ccy=opp.ccy))
-            edge_total_money = fx_converter.to_base(Money(amount=float(opp.net_edge * opp.size), ccy=opp.ccy))
-
-            readiness = evaluate_execution_readiness(
-                edge_bps=opp.edge_bps,
-                size=opp.size,
-                constraints=soft_constraints,
-            )
-
-            decision = evaluate_execution_decision(
-                opportunity=opp,
-                quotes=snapshot.quotes,
-                constraints=gate_constraints,
-                now=snapshot.as_of,
-            )
-
             record = OpportunityRecord(
                 as_of=snapshot.as_of,
                 opportunity=opp,
-                edge_per_unit=edge_per_unit_money,
-                edge_total=edge_total_money,
+                edge_per_unit=Money(amount=edge_per_unit, ccy=fx_converter.base_ccy),
+                edge_total=Money(amount=edge_total, ccy=fx_converter.base_ccy),
                 execution_readiness=readiness,
                 execution_decision=decision,
             )
             state.opportunities_history.append(record)
+            state.opportunity_index.append(record)
             enriched.append(record)
 
-            self._prune_history(state)
-
             state.events.append(
                 ArbitrageEvent(
                     as_of=snapshot.as_of,
@@ -257,13 +308,15 @@ class ArbitrageOrchestrator:
             )
 
         self._prune_events(state)
-        self._prune_snapshots(state)
+        self._prune_windows(state)
         expire_stale_states(state.opportunity_state, now=snapshot.as_of, limits=state.limits)
         return enriched
 
     def get_latest_opportunities(self, session_id: UUID, limit: int = 50) -> List[OpportunityRecord]:
         state = self.get_session(session_id)
-        return state.opportunities_history[-limit:]
+        with state.lock:
+            history = state.opportunities_history
+            return list(islice(history, max(len(history) - limit, 0), None))
 
     def get_opportunity_time_series(
         self,
@@ -271,9 +324,10 @@ class ArbitrageOrchestrator:
         symbol: str | None = None,
     ) -> List[OpportunityRecord]:
         state = self.get_session(session_id)
-        if symbol is None:
-            return list(state.opportunities_history)
-        return [opp for opp in state.opportunities_history if opp.opportunity.symbol == symbol]
+        with state.lock:
+            if symbol is None:
+                return list(state.opportunities_history)
+            return [opp for opp in state.opportunities_history if opp.opportunity.symbol == symbol]
 
     def get_recommendations(
         self,
@@ -282,57 +336,97 @@ class ArbitrageOrchestrator:
         symbol: str | None = None,
     ) -> List[RankedRecommendation]:
         state = self.get_session(session_id)
-        now = datetime.utcnow()
-        expire_stale_states(state.opportunity_state, now=now, limits=state.limits)
-
-        history = state.opportunities_history
-        recs: list[RankedRecommendation] = []
+        with state.lock:
+            now = datetime.utcnow()
+            expire_stale_states(state.opportunity_state, now=now, limits=state.limits)
 
-        soft_constraints = default_execution_constraints(state.config)
+            history = state.opportunities_history
+            recs: list[RankedRecommendation] = []
 
-        for record in reversed(history):
-            if symbol and record.opportunity.symbol != symbol:
-                continue
+            soft_constraints = default_execution_constraints(state.config)
 
-            opp_state = state.opportunity_state.get(record.opportunity.opportunity_id)
-            if not opp_state or opp_state.state == LifecycleState.EXPIRED:
-                continue
-
-            signals = compute_signals(
-                opportunity=record,
-                state=opp_state,
-                now=now,
-                history=history,
-            )
+            for record in reversed(history):
+                if symbol and record.opportunity.symbol != symbol:
+                    continue
 
-            readiness = evaluate_execution_readiness(
-                edge_bps=record.opportunity.edge_bps,
-                size=record.opportunity.size,
-                constraints=soft_constraints,
-            )
+                opp_state = state.opportunity_state.get(record.opportunity.opportunity_id)
+                if not opp_state or opp_state.state == LifecycleState.EXPIRED:
+                    continue
 
-            recommendation = to_recommendation(record, signals, rank=0)
-            recommendation.execution_readiness = readiness
-            recommendation.execution_decision = record.execution_decision
-            recs.append(recommendation)
+                recs.append(self._recommend(state, record, opp_state, now, soft_constraints))
 
-            if len(recs) >= limit:
-                break
+                if len(recs) >= limit:
+                    break
 
         ranked = sorted(recs, key=lambda r: r.quality_score, reverse=True)
         for idx, rec in enumerate(ranked, start=1):
             rec.rank = idx
         return ranked
 
-    def prune_idle_sessions(self) -> None:
+    def get_opportunity_recommendation(
+        self,
+        session_id: UUID,
+        opportunity_id: str,
+    ) -> RankedRecommendation | None:
+        """Best-scored recommendation among the records of one opportunity_id.
+
+        Same pick as scanning get_recommendations over the whole history (ties go to the
+        newest record), but only that opportunity's records are scored.
+        """
+        state = self.get_session(session_id)
+        with state.lock:
+            now = datetime.utcnow()
+            expire_stale_states(state.opportunity_state, now=now, limits=state.limits)
+
+            opp_state = state.opportunity_state.get(opportunity_id)
+            if not opp_state or opp_state.state == LifecycleState.EXPIRED:
+                return None
+
+            soft_constraints = default_execution_constraints(state.config)
+            best: RankedRecommendation | None = None
+            for record in reversed(state.opportunity_index.records(opportunity_id)):
+                recommendation = self._recommend(state, record, opp_state, now, soft_constraints)
+                if best is None or recommendation.quality_score > best.quality_score:
+                    best = recommendation
+            return best
+
+    def _recommend(
+        self,
+        state: ArbitrageSessionState,
+        record: OpportunityRecord,
+        opp_state: OpportunityState,
+        now: datetime,
+        soft_constraints: ExecutionConstraints,
+    ) -> RankedRecommendation:
+        signals = compute_signals(
+            opportunity=record,
+            state=opp_state,
+            now=now,
+            history=state.opportunity_index.records(record.opportunity.opportunity_id),
+        )
+
+        readiness = evaluate_execution_readiness(
+            edge_bps=record.opportunity.edge_bps,
+            size=record.opportunity.size,
+            constraints=soft_constraints,
+        )
+
+        recommendation = to_recommendation(record, signals, rank=0)
+        recommendation.execution_readiness = readiness
+        recommendation.execution_decision = record.execution_decision
+        return recommendation
+
+    def prune_idle_sessions(self) -> List[UUID]:
+        """Drop sessions idle for session_idle_expiry_seconds; returns the dropped ids."""
         now = datetime.utcnow()
         to_delete: list[UUID] = []
-        for session_id, state in self.sessions.items():
+        for session_id, state in list(self.sessions.items()):
             idle_seconds = (now - state.last_accessed).total_seconds()
             if idle_seconds >= self.limits.session_idle_expiry_seconds:
                 to_delete.append(session_id)
         for session_id in to_delete:
             del self.sessions[session_id]
+        return to_delete
 
     def _validate_snapshot(self, snapshot: QuoteSnapshot) -> ValidationSummary:
         warnings: list[str] = []
@@ -352,19 +446,24 @@ class ArbitrageOrchestrator:
         )
 
 
-    def _prune_snapshots(self, state: ArbitrageSessionState) -> None:
-        ttl = timedelta(seconds=state.limits.ttl_seconds)
-        now = datetime.utcnow()
-        state.snapshots = [s for s in state.snapshots if now - s.as_of <= ttl]
-        if len(state.snapshots) > state.limits.max_snapshots:
-            state.snapshots = state.snapshots[-state.limits.max_snapshots :]
+    def _prune_windows(self, state: ArbitrageSessionState) -> None:
+        """Drop entries older than the TTL, then enforce max_snapshots; once per ingest.
 
-    def _prune_history(self, state: ArbitrageSessionState) -> None:
-        ttl = timedelta(seconds=state.limits.ttl_seconds)
-        now = datetime.utcnow()
-        state.opportunities_history = [h for h in state.opportunities_history if now - h.as_of <= ttl]
-        if len(state.opportunities_history) > state.limits.max_snapshots:
-            state.opportunities_history = state.opportunities_history[-state.limits.max_snapshots :]
+        Work is proportional to what is dropped, not to the window size. Entries are in
+        ingest order and TTL pruning stops at the first fresh one, so if a client sends an
+        as_of that goes backwards, stale entries can stay behind a fresher one until
+        max_snapshots evicts them. as_of is client-supplied and not required to be monotonic.
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=state.limits.ttl_seconds)
+        max_size = state.limits.max_snapshots
+
+        snapshots = state.snapshots
+        while snapshots and (snapshots[0].as_of < cutoff or len(snapshots) > max_size):
+            snapshots.popleft()
+
+        history = state.opportunities_history
+        while history and (history[0].as_of < cutoff or len(history) > max_size):
+            state.opportunity_index.discard(history.popleft())
 
     def _prune_events(self, state: ArbitrageSessionState) -> None:
         while len(state.events) > state.limits.max_events:
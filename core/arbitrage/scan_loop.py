@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Callable, Deque, Dict, List, Tuple
+from uuid import UUID
+
+from core.arbitrage.feed import AsyncQuoteFeed
+from core.arbitrage.intelligence.lifecycle import LifecycleState
+from core.arbitrage.models import VenueQuote
+from core.arbitrage.orchestrator import ArbitrageOrchestrator
+from core.fx.converter import FxConverter
+
+logger = logging.getLogger(__name__)
+
+
+class CoalescingQuoteBuffer:
+    """Pending quote deltas, latest per (symbol, venue), bounded by distinct keys.
+
+    put() replaces a pending quote for the same key without waiting; a new key waits
+    while max_pending keys are pending, which pushes back on the feed.
+    """
+
+    def __init__(self, max_pending: int = 1024) -> None:
+        if max_pending <= 0:
+            raise ValueError("max_pending must be positive")
+        self.max_pending = max_pending
+        self.coalesced = 0
+        self.closed = False
+        self._pending: Dict[Tuple[str, str], VenueQuote] = {}
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def put(self, quote: VenueQuote) -> None:
+        key = (quote.symbol, quote.venue)
+        while key not in self._pending and len(self._pending) >= self.max_pending:
+            self._space.clear()
+            await self._space.wait()
+        if key in self._pending:
+            self.coalesced += 1
+        self._pending[key] = quote
+        self._ready.set()
+
+    def close(self) -> None:
+        self.closed = True
+        self._ready.set()
+
+    async def wait_ready(self) -> None:
+        await self._ready.wait()
+
+    def drain(self) -> List[VenueQuote]:
+        quotes = list(self._pending.values())
+        self._pending.clear()
+        if not self.closed:
+            self._ready.clear()
+        self._space.set()
+        return quotes
+
+
+class ArbitrageScanLoop:
+    """Background scan of one session fed by an AsyncQuoteFeed.
+
+    Quotes are pumped into a CoalescingQuoteBuffer. Once a delta arrives the loop waits
+    debounce_ms for the rest of the burst, then applies everything pending in one
+    ingest_quote_delta and publishes the results to subscribers as event dicts:
+    - {"event": "opportunity", "data": OpportunityRecord.to_summary()}
+    - {"event": "lifecycle", "data": {"opportunity_id", "state", "seen_count"}} whenever an
+      opportunity appears, changes lifecycle state, or drops out as EXPIRED.
+    A subscriber queue that is full loses its oldest event, so slow readers never stall scans.
+    Scans run in a worker thread (they take the session lock, which sync routes hold too), so
+    the event loop keeps serving while one is in progress; events are published on the loop.
+    A scan (or the feed) that raises stops the loop with {"event": "error", "data": {"error": msg}}.
+    However run() ends, a final {"event": "closed", "data": {"scans": n}} is published.
+    """
+
+    def __init__(
+        self,
+        orchestrator: ArbitrageOrchestrator,
+        session_id: UUID,
+        fx_converter: FxConverter,
+        *,
+        max_pending: int = 1024,
+        debounce_ms: float = 50.0,
+        clock: Callable[[], datetime] = datetime.utcnow,
+        subscriber_queue_size: int = 256,
+    ) -> None:
+        self.orchestrator = orchestrator
+        self.session_id = session_id
+        self.fx_converter = fx_converter
+        self.debounce_ms = debounce_ms
+        self.clock = clock
+        self.subscriber_queue_size = subscriber_queue_size
+        self.buffer = CoalescingQuoteBuffer(max_pending)
+        self.scans = 0
+        self.dropped_events = 0
+        self._stopped = False
+        self._running = False
+        self._scanning = False
+        self._idle = asyncio.Condition()
+        self._subscribers: List[asyncio.Queue[dict[str, object]]] = []
+        self._recent: Deque[dict[str, object]] = deque(maxlen=subscriber_queue_size)
+
+    def subscribe(self, replay: bool = False) -> asyncio.Queue[dict[str, object]]:
+        """New subscriber queue; replay=True pre-fills it with the most recent events."""
+        queue: asyncio.Queue[dict[str, object]] = asyncio.Queue(maxsize=self.subscriber_queue_size)
+        if replay:
+            for event in self._recent:
+                queue.put_nowait(event)
+        self._subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[dict[str, object]]) -> None:
+        if queue in self._subscribers:
+            self._subscribers.remove(queue)
+
+    async def run(self, feed: AsyncQuoteFeed) -> None:
+        """Scan until the feed ends and every pending delta has been scanned, or a scan fails."""
+        pump = asyncio.create_task(self._pump(feed))
+        error: BaseException | None = None
+        self._running = True
+        try:
+            while True:
+                await self.buffer.wait_ready()
+                if self.debounce_ms > 0 and not self.buffer.closed:
+                    await asyncio.sleep(self.debounce_ms / 1000)
+                quotes = self.buffer.drain()
+                if self._stopped:
+                    break
+                if quotes:
+                    self._scanning = True
+                    try:
+                        events = await asyncio.to_thread(self.scan, quotes, self.clock())
+                    except Exception as exc:
+                        logger.exception("arbitrage scan failed for session %s", self.session_id)
+                        error = exc
+                        break
+                    finally:
+                        await self._set_idle()
+                    for event in events:
+                        self._publish(event)
+                elif self.buffer.closed:
+                    break
+        finally:
+            if not pump.done():
+                pump.cancel()
+            await asyncio.wait([pump])
+            if error is None and not pump.cancelled():
+                error = pump.exception()
+            if error is not None:
+                self._publish({"event": "error", "data": {"error": str(error)}})
+            self._publish({"event": "closed", "data": {"scans": self.scans}})
+            self._running = False
+            await self._set_idle()
+
+    async def wait_idle(self) -> None:
+        """Wait until every pending delta has been scanned (or run() has ended)."""
+        async with self._idle:
+            await self._idle.wait_for(lambda: not self._running or not (self._scanning or self.buffer))
+
+    async def _set_idle(self) -> None:
+        async with self._idle:
+            self._scanning = False
+            self._idle.notify_all()
+
+    def stop(self) -> None:
+        """Make run() return without scanning pending deltas (e.g. its session was dropped)."""
+        self._stopped = True
+        self.buffer.close()
+
+    def scan(self, quotes: List[VenueQuote], as_of: datetime) -> List[dict[str, object]]:
+        """Apply quotes to the session as of as_of and return the events to publish.
+
+        Touches only session state (under its lock), never the subscriber queues, so it is safe
+        to call from a worker thread.
+        """
+        state = self.orchestrator.get_session(self.session_id)
+        with state.lock:
+            before = {opp_id: lifecycle.state for opp_id, lifecycle in state.opportunity_state.items()}
+            records = self.orchestrator.ingest_quote_delta(self.session_id, as_of, quotes, self.fx_converter)
+            after = {opp_id: (lifecycle.state, lifecycle.seen_count) for opp_id, lifecycle in state.opportunity_state.items()}
+        self.scans += 1
+
+        events: List[dict[str, object]] = [{"event": "opportunity", "data": record.to_summary()} for record in records]
+        for opp_id, (lifecycle_state, seen_count) in after.items():
+            if before.get(opp_id) != lifecycle_state:
+                events.append(self._lifecycle_event(opp_id, lifecycle_state, seen_count))
+        for opp_id in sorted(before.keys() - after.keys()):
+            events.append(self._lifecycle_event(opp_id, LifecycleState.EXPIRED, None))
+        return events
+
+    async def _pump(self, feed: AsyncQuoteFeed) -> None:
+        try:
+            async for quote in feed:
+                await self.buffer.put(quote)
+        finally:
+            self.buffer.close()
+
+    @staticmethod
+    def _lifecycle_event(opp_id: str, state: LifecycleState, seen_count: int | None) -> dict[str, object]:
+        return {
+            "event": "lifecycle",
+            "data": {"opportunity_id": opp_id, "state": state.value, "seen_count": seen_count},
+        }
+
+    def _publish(self, event: dict[str, object]) -> None:
+        self._recent.append(event)
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+                self.dropped_events += 1
+            queue.put_nowait(event)
+
+
+__all__ = ["ArbitrageScanLoop", "CoalescingQuoteBuffer"]
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
+
+from core.arbitrage.engine import _best_pair_opportunity
+from core.arbitrage.models import ArbitrageConfig, ArbitrageOpportunity, VenueQuote
+from core.arbitrage.opportunity_space.builder import _pair_opportunity
+
+
+@dataclass
+class _SymbolBook:
+    """Latest liquid quote per venue for one symbol, plus bids/asks kept sorted.
+
+    Sort keys are (-bid, seq, venue) and (ask, seq, venue); seq is the venue's insertion
+    number, so ties break in venue insertion order exactly like max()/min() over quotes().
+    """
+
+    quotes: Dict[str, Tuple[int, VenueQuote]] = field(default_factory=dict)
+    bids: List[Tuple[float, int, str]] = field(default_factory=list)
+    asks: List[Tuple[float, int, str]] = field(default_factory=list)
+
+    def unindex(self, venue: str) -> int:
+        seq, quote = self.quotes[venue]
+        del self.bids[bisect_left(self.bids, (-quote.bid, seq, venue))]
+        del self.asks[bisect_left(self.asks, (quote.ask, seq, venue))]
+        return seq
+
+    def put(self, seq: int, quote: VenueQuote) -> None:
+        # Assignment keeps an existing venue's dict position, matching its unchanged seq.
+        self.quotes[quote.venue] = (seq, quote)
+        insort(self.bids, (-quote.bid, seq, quote.venue))
+        insort(self.asks, (quote.ask, seq, quote.venue))
+
+    def quote(self, venue: str) -> VenueQuote:
+        return self.quotes[venue][1]
+
+
+class TopOfBookIndex:
+    """Incrementally maintained book of latest venue quotes, per symbol.
+
+    apply() takes quote deltas: a liquid quote replaces that (symbol, venue) entry, a quote
+    without liquidity removes it. Each update is a binary search plus a list insert on
+    that symbol's bids/asks, so the best pair is read without regrouping the book.
+
+    For the same book, best_opportunities() equals find_cross_venue_opportunities(quotes())
+    and opportunity_space() equals build_opportunity_space(quotes()).
+    """
+
+    def __init__(self, config: ArbitrageConfig | None = None) -> None:
+        self.config = config or ArbitrageConfig()
+        self._books: Dict[str, _SymbolBook] = {}
+        self._next_seq = 0
+
+    def apply(self, quotes: Iterable[VenueQuote]) -> None:
+        for quote in quotes:
+            book = self._books.get(quote.symbol)
+            known = book is not None and quote.venue in book.quotes
+            if known:
+                seq = book.unindex(quote.venue)
+            else:
+                seq = self._next_seq
+                self._next_seq += 1
+
+            if not quote.has_liquidity():
+                if known:
+                    del book.quotes[quote.venue]
+                    if not book.quotes:
+                        del self._books[quote.symbol]
+                continue
+
+            if book is None:
+                book = self._books[quote.symbol] = _SymbolBook()
+            book.put(seq, quote)
+
+    def quotes(self) -> List[VenueQuote]:
+        """The book as a quote list: symbols, then venues, in insertion order."""
+        return [quote for book in self._books.values() for _, quote in book.quotes.values()]
+
+    def __len__(self) -> int:
+        return sum(len(book.quotes) for book in self._books.values())
+
+    def best_opportunities(self) -> List[ArbitrageOpportunity]:
+        opportunities: list[ArbitrageOpportunity] = []
+        for symbol, book in self._books.items():
+            if len(book.quotes) < 2:
+                continue
+            best_bid = book.quote(book.bids[0][2])
+            best_ask = book.quote(book.asks[0][2])
+            opportunity = _best_pair_opportunity(symbol, best_bid, best_ask, self.config)
+            if opportunity is not None:
+                opportunities.append(opportunity)
+        return opportunities
+
+    def opportunity_space(self, limit: int | None = None) -> List[ArbitrageOpportunity]:
+        """Feasible pairs in build_opportunity_space order, truncated to `limit`.
+
+        Only pairs with bid > ask are visited: asks ascending, and for each ask the bids
+        descending until they stop crossing it.
+        """
+        candidates: list[Tuple[Tuple, ArbitrageOpportunity]] = []
+        for symbol in sorted(self._books):
+            book = self._books[symbol]
+            if len(book.quotes) < 2:
+                continue
+            symbol_candidates: list[Tuple[Tuple, ArbitrageOpportunity]] = []
+            for ask, _, buy_venue in book.asks:
+                if -book.bids[0][0] <= ask:
+                    break
+                buy = book.quote(buy_venue)
+                for neg_bid, _, sell_venue in book.bids:
+                    if -neg_bid <= ask:
+                        break
+                    candidate = _pair_opportunity(symbol, buy, book.quote(sell_venue), self.config)
+                    if candidate is not None:
+                        symbol_candidates.append(candidate)
+            symbol_candidates.sort(key=lambda t: t[0])
+            candidates.extend(symbol_candidates)
+            if limit is not None and len(candidates) >= limit:
+                break
+        return [c[1] for c in candidates[:limit]]
+
+
+__all__ = ["TopOfBookIndex"]
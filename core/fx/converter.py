@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from typing import Mapping, Sequence, Dict, Any, cast
+from typing import Mapping, Sequence, Dict, Any, List, Tuple, cast
 
+import numpy as np
+
+from core.contracts.money import normalize_currency
 from core.market_data.types import FxRateQuote
 from core.portfolio.models import Currency
 from core.fx.errors import MissingFxRateError, InvalidFxRateError
@@ -79,28 +82,32 @@ class FxConverter:
         self._rates: Dict[str, float] = dict(rates)
         self._base_ccy = base_ccy
 
-    def convert(self, amount: float, from_ccy: Currency, to_ccy: Currency, *, strict: bool = True) -> float:
+    def _conversion(self, from_ccy: Currency, to_ccy: Currency, strict: bool) -> Tuple[float, bool]:
+        """(rate, inverse): the amount is multiplied by rate, or divided by it when inverse."""
         if from_ccy == to_ccy:
-            return float(amount)
+            return 1.0, False
 
         pair = f"{from_ccy}/{to_ccy}"
         inv = f"{to_ccy}/{from_ccy}"
 
         if pair in self._rates:
-            rate = float(self._rates[pair])
-            return float(amount) * rate
+            return float(self._rates[pair]), False
 
         if inv in self._rates:
             rate = float(self._rates[inv])
             if rate == 0:
                 raise InvalidFxRateError(f"inverse rate for {inv} is zero")
-            return float(amount) / rate
+            return rate, True
 
         if strict:
             raise MissingFxRateError(f"missing fx rate for {from_ccy}->{to_ccy}")
 
         # non-strict: return unconverted amount
-        return float(amount)
+        return 1.0, False
+
+    def convert(self, amount: float, from_ccy: Currency, to_ccy: Currency, *, strict: bool = True) -> float:
+        rate, inverse = self._conversion(from_ccy, to_ccy, strict)
+        return float(amount) / rate if inverse else float(amount) * rate
 
     @property
     def base_ccy(self) -> Currency:
@@ -128,5 +135,24 @@ class FxConverter:
         converted = self.convert(amt, frm, self.base_ccy, strict=strict)
         return Money(amount=converted, ccy=self.base_ccy)
 
+    def to_base_many(
+        self, amounts: Sequence[float], from_ccys: Sequence[Currency | str], *, strict: bool = True
+    ) -> List[float]:
+        """Batch to_base(...).amount for parallel amount/currency sequences.
+
+        The rate is resolved once per distinct currency and applied to that currency's
+        amounts as an array, with the same multiply/divide as convert().
+        """
+        values = np.asarray(amounts, dtype=float)
+        if not np.isfinite(values).all():
+            raise ValueError("to_base_many amounts must be finite floats")
+        converted = values.copy()
+        ccys = np.asarray(from_ccys, dtype=object)
+        for ccy in dict.fromkeys(from_ccys):
+            rate, inverse = self._conversion(normalize_currency(ccy), self.base_ccy, strict)
+            mask = ccys == ccy
+            converted[mask] = values[mask] / rate if inverse else values[mask] * rate
+        return converted.tolist()
+
 
 __all__ = ["FxConverter"]
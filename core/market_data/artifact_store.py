@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import os
+import threading
+from collections import OrderedDict
 from datetime import datetime
 
 from core.market_data.market_snapshot_payload_v0 import MarketSnapshotPayloadV0
@@ -10,11 +13,22 @@ from core.v2.models import V2Event, hash_payload
 from core.v2.errors import EventConflictError
 
 # Use the existing events table as an immutable artifact store.
-# Rationale: the DB schema is sealed; reusing the events table under a
-# dedicated session id avoids schema changes while providing idempotent
-#, immutable storage semantics via the event_store append contract.
+# Reusing the events table under a dedicated session id needs no table of its own and
+# provides idempotent, immutable storage semantics via the event_store append contract.
 ARTIFACT_SESSION_ID = "__market_snapshot_artifacts__"
 
+# Snapshot ids are content hashes, so a validated payload never goes stale: the cache needs no
+# invalidation, only a bound. Keyed by (db path, id) so separate databases stay isolated.
+# Callers get deep copies, so mutating a returned payload never alters the cached entry.
+MARKET_SNAPSHOT_CACHE_SIZE = 256
+_snapshot_cache: "OrderedDict[tuple[str | None, str], MarketSnapshotPayloadV0]" = OrderedDict()
+_snapshot_cache_lock = threading.Lock()
+
+
+def clear_market_snapshot_cache() -> None:
+    with _snapshot_cache_lock:
+        _snapshot_cache.clear()
+
 
 def put_market_snapshot(payload: MarketSnapshotPayloadV0) -> str:
     """Persist a market snapshot payload as an immutable artifact and return its id.
@@ -45,13 +59,28 @@ def put_market_snapshot(payload: MarketSnapshotPayloadV0) -> str:
 def get_market_snapshot(snapshot_id: str) -> MarketSnapshotPayloadV0:
     """Retrieve a previously stored snapshot payload by id.
     Raises MarketSnapshotNotFoundError when not found.
+    Primary-key lookup; validated payloads are memoised (bounded LRU, see MARKET_SNAPSHOT_CACHE_SIZE)
+    and every call returns a private deep copy.
     The API layer will convert this to an ErrorEnvelope/HTTP error as needed.
     """
     event_store = SqliteEventStore()
-    events = event_store.list(ARTIFACT_SESSION_ID)
-    for e in events:
-        if e.event_id == snapshot_id:
-            return MarketSnapshotPayloadV0.model_validate(e.payload)
-    from core.market_data.errors import MarketSnapshotNotFoundError
+    db_path = getattr(event_store, "db_path", None)
+    key = (os.path.abspath(db_path) if db_path else None, snapshot_id)
+    with _snapshot_cache_lock:
+        cached = _snapshot_cache.get(key)
+        if cached is not None:
+            _snapshot_cache.move_to_end(key)
+            return cached.model_copy(deep=True)
+
+    event = event_store.get(ARTIFACT_SESSION_ID, snapshot_id)
+    if event is None:
+        from core.market_data.errors import MarketSnapshotNotFoundError
 
-    raise MarketSnapshotNotFoundError(snapshot_id)
+        raise MarketSnapshotNotFoundError(snapshot_id)
+    payload = MarketSnapshotPayloadV0.model_validate(event.payload)
+    with _snapshot_cache_lock:
+        _snapshot_cache[key] = payload
+        _snapshot_cache.move_to_end(key)
+        while len(_snapshot_cache) > MARKET_SNAPSHOT_CACHE_SIZE:
+            _snapshot_cache.popitem(last=False)
+    return payload.model_copy(deep=True)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import datetime
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional, TypeVar
 
 from core.contracts.model_registry import ModelCapability
 from core.contracts.model_registry import ModelRegistryEntry
@@ -22,6 +24,11 @@ _REFERENCE_DATA_SET_SESSION_ID = "__reference_data_set_repository__"
 _VALUATION_POLICY_SET_SESSION_ID = "__valuation_policy_set_repository__"
 _VALUATION_RUN_SESSION_ID = "__valuation_run_repository__"
 _MODEL_REGISTRY_SESSION_ID = "__model_registry_repository__"
+# Stored objects are immutable and their ids versioned, so decoded objects are cached without
+# invalidation; the bound only caps memory. Misses are not cached (an id may be saved later).
+OBJECT_CACHE_SIZE = 4096
+
+T = TypeVar("T")
 
 
 def _require_id_consistency(expected_id: str, actual_id: str, field_name: str) -> None:
@@ -44,9 +51,81 @@ def _to_datetime(value: str, field_name: str) -> datetime.datetime:
     return parsed
 
 
+def _reference_data_set_from_payload(payload: dict[str, object]) -> ReferenceDataSet:
+    return ReferenceDataSet(
+        calendar_version=str(payload["calendar_version"]),
+        holiday_calendar_refs=tuple(payload["holiday_calendar_refs"]),
+        day_count_convention_refs=tuple(payload["day_count_convention_refs"]),
+        business_day_adjustment_refs=tuple(payload["business_day_adjustment_refs"]),
+        settlement_convention_refs=tuple(payload["settlement_convention_refs"]),
+        fixing_source_refs=tuple(payload["fixing_source_refs"]),
+        exercise_convention_refs=tuple(payload["exercise_convention_refs"]),
+        taxonomy_mapping_refs=tuple(payload["taxonomy_mapping_refs"]),
+        reference_data_version_id=str(payload["reference_data_version_id"]),
+    )
+
+
+def _valuation_policy_set_from_payload(payload: dict[str, object]) -> ValuationPolicySet:
+    return ValuationPolicySet(
+        valuation_policy_id=str(payload["valuation_policy_id"]),
+        model_family=str(payload["model_family"]),
+        pricing_engine_policy=str(payload["pricing_engine_policy"]),
+        numeric_policy_id=str(payload["numeric_policy_id"]),
+        tolerance_policy_id=str(payload["tolerance_policy_id"]),
+        calibration_recipe_id=str(payload["calibration_recipe_id"]),
+        approval_status=str(payload["approval_status"]),
+        policy_version=str(payload["policy_version"]),
+        policy_owner=str(payload["policy_owner"]),
+        created_timestamp=_to_datetime(str(payload["created_timestamp"]), "created_timestamp"),
+    )
+
+
+def _valuation_run_from_payload(payload: dict[str, object]) -> ValuationRun:
+    return ValuationRun(
+        valuation_run_id=str(payload["valuation_run_id"]),
+        portfolio_state_id=str(payload["portfolio_state_id"]),
+        market_snapshot_id=str(payload["market_snapshot_id"]),
+        reference_data_set_id=str(payload["reference_data_set_id"]),
+        valuation_policy_set_id=str(payload["valuation_policy_set_id"]),
+        valuation_context_id=str(payload["valuation_context_id"]),
+        scenario_set_id=str(payload["scenario_set_id"]),
+        software_build_hash=str(payload["software_build_hash"]),
+        run_timestamp=_to_datetime(str(payload["run_timestamp"]), "run_timestamp"),
+        valuation_timestamp=_to_datetime(str(payload["valuation_timestamp"]), "valuation_timestamp"),
+        run_purpose=str(payload["run_purpose"]),
+    )
+
+
+def _model_registry_entry_from_payload(payload: dict[str, object]) -> ModelRegistryEntry:
+    capabilities = tuple(
+        ModelCapability(
+            instrument_family=str(cap["instrument_family"]),
+            exercise_style=str(cap["exercise_style"]),
+            measure=str(cap["measure"]),
+        )
+        for cap in payload["supported_capabilities"]
+    )
+
+    return ModelRegistryEntry(
+        model_id=str(payload["model_id"]),
+        semantic_version=str(payload["semantic_version"]),
+        implementation_version=str(payload["implementation_version"]),
+        validation_status=str(payload["validation_status"]),
+        owner=str(payload["owner"]),
+        approval_date=datetime.date.fromisoformat(str(payload["approval_date"])),
+        benchmark_pack_id=str(payload["benchmark_pack_id"]),
+        known_limitations=tuple(str(item) for item in payload["known_limitations"]),
+        numeric_policy_id=str(payload["numeric_policy_id"]),
+        supported_capabilities=capabilities,
+    )
+
+
 class _SqliteEventBackedRepository:
-    def __init__(self, db_path: str | None = None) -> None:
+    def __init__(self, db_path: str | None = None, cache_size: int = OBJECT_CACHE_SIZE) -> None:
         self._event_store = SqliteEventStore(db_path=db_path)
+        self._cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, str], object] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def _save_payload(self, *, session_id: str, object_id: str, payload: dict[str, object]) -> None:
         _require_non_empty_id(session_id, "session_id")
@@ -64,11 +143,70 @@ class _SqliteEventBackedRepository:
     def _get_payload(self, *, session_id: str, object_id: str) -> Optional[dict[str, object]]:
         _require_non_empty_id(session_id, "session_id")
         _require_non_empty_id(object_id, "object_id")
-        events = self._event_store.list(session_id)
-        for event in events:
-            if event.event_id == object_id:
-                return event.payload
-        return None
+        event = self._event_store.get(session_id, object_id)
+        return event.payload if event is not None else None
+
+    def _cache_get(self, key: tuple[str, str]) -> Optional[object]:
+        with self._cache_lock:
+            value = self._cache.get(key)
+            if value is not None:
+                self._cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, key: tuple[str, str], value: object) -> None:
+        if self._cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def _get_object(
+        self,
+        *,
+        session_id: str,
+        object_id: str,
+        decode: Callable[[dict[str, object]], T],
+    ) -> Optional[T]:
+        """Read-through: decoded objects are served from the cache after the first keyed read."""
+        key = (session_id, object_id)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached  # type: ignore[return-value]
+        payload = self._get_payload(session_id=session_id, object_id=object_id)
+        if payload is None:
+            return None
+        value = decode(payload)
+        self._cache_put(key, value)
+        return value
+
+    def _get_objects(
+        self,
+        *,
+        session_id: str,
+        object_ids: Iterable[str],
+        field_name: str,
+        decode: Callable[[dict[str, object]], T],
+    ) -> dict[str, T]:
+        """Bulk read-through: cache hits first, then one keyed batch read for the misses."""
+        found: dict[str, T] = {}
+        missing: list[str] = []
+        for object_id in object_ids:
+            _require_non_empty_id(object_id, field_name)
+            if object_id in found:
+                continue
+            cached = self._cache_get((session_id, object_id))
+            if cached is not None:
+                found[object_id] = cached  # type: ignore[assignment]
+            else:
+                missing.append(object_id)
+        if missing:
+            for object_id, event in self._event_store.get_many(session_id, missing).items():
+                value = decode(event.payload)
+                self._cache_put((session_id, object_id), value)
+                found[object_id] = value
+        return found
 
 
 class SqliteReferenceDataSetRepository(_SqliteEventBackedRepository, ReferenceDataSetRepository):
@@ -76,22 +214,19 @@ class SqliteReferenceDataSetRepository(_SqliteEventBackedRepository, ReferenceDa
 
     def get_by_id(self, reference_data_set_id: str) -> Optional[ReferenceDataSet]:
         _require_non_empty_id(reference_data_set_id, "reference_data_set_id")
-        payload = self._get_payload(
+        return self._get_object(
             session_id=_REFERENCE_DATA_SET_SESSION_ID,
             object_id=reference_data_set_id,
+            decode=_reference_data_set_from_payload,
         )
-        if payload is None:
-            return None
-        return ReferenceDataSet(
-            calendar_version=str(payload["calendar_version"]),
-            holiday_calendar_refs=tuple(payload["holiday_calendar_refs"]),
-            day_count_convention_refs=tuple(payload["day_count_convention_refs"]),
-            business_day_adjustment_refs=tuple(payload["business_day_adjustment_refs"]),
-            settlement_convention_refs=tuple(payload["settlement_convention_refs"]),
-            fixing_source_refs=tuple(payload["fixing_source_refs"]),
-            exercise_convention_refs=tuple(payload["exercise_convention_refs"]),
-            taxonomy_mapping_refs=tuple(payload["taxonomy_mapping_refs"]),
-            reference_data_version_id=str(payload["reference_data_version_id"]),
+
+    def get_many(self, reference_data_set_ids: Iterable[str]) -> dict[str, ReferenceDataSet]:
+        """Reference data sets by id; ids that are not stored are omitted."""
+        return self._get_objects(
+            session_id=_REFERENCE_DATA_SET_SESSION_ID,
+            object_ids=reference_data_set_ids,
+            field_name="reference_data_set_id",
+            decode=_reference_data_set_from_payload,
         )
 
     def save(self, reference_data_set_id: str, reference_data_set: ReferenceDataSet) -> None:
@@ -124,23 +259,19 @@ class SqliteValuationPolicySetRepository(_SqliteEventBackedRepository, Valuation
 
     def get_by_id(self, valuation_policy_set_id: str) -> Optional[ValuationPolicySet]:
         _require_non_empty_id(valuation_policy_set_id, "valuation_policy_set_id")
-        payload = self._get_payload(
+        return self._get_object(
             session_id=_VALUATION_POLICY_SET_SESSION_ID,
             object_id=valuation_policy_set_id,
+            decode=_valuation_policy_set_from_payload,
         )
-        if payload is None:
-            return None
-        return ValuationPolicySet(
-            valuation_policy_id=str(payload["valuation_policy_id"]),
-            model_family=str(payload["model_family"]),
-            pricing_engine_policy=str(payload["pricing_engine_policy"]),
-            numeric_policy_id=str(payload["numeric_policy_id"]),
-            tolerance_policy_id=str(payload["tolerance_policy_id"]),
-            calibration_recipe_id=str(payload["calibration_recipe_id"]),
-            approval_status=str(payload["approval_status"]),
-            policy_version=str(payload["policy_version"]),
-            policy_owner=str(payload["policy_owner"]),
-            created_timestamp=_to_datetime(str(payload["created_timestamp"]), "created_timestamp"),
+
+    def get_many(self, valuation_policy_set_ids: Iterable[str]) -> dict[str, ValuationPolicySet]:
+        """Valuation policy sets by id; ids that are not stored are omitted."""
+        return self._get_objects(
+            session_id=_VALUATION_POLICY_SET_SESSION_ID,
+            object_ids=valuation_policy_set_ids,
+            field_name="valuation_policy_set_id",
+            decode=_valuation_policy_set_from_payload,
         )
 
     def save(self, valuation_policy_set_id: str, valuation_policy_set: ValuationPolicySet) -> None:
@@ -174,24 +305,19 @@ class SqliteValuationRunRepository(_SqliteEventBackedRepository, ValuationRunRep
 
     def get_by_id(self, valuation_run_id: str) -> Optional[ValuationRun]:
         _require_non_empty_id(valuation_run_id, "valuation_run_id")
-        payload = self._get_payload(
+        return self._get_object(
             session_id=_VALUATION_RUN_SESSION_ID,
             object_id=valuation_run_id,
+            decode=_valuation_run_from_payload,
         )
-        if payload is None:
-            return None
-        return ValuationRun(
-            valuation_run_id=str(payload["valuation_run_id"]),
-            portfolio_state_id=str(payload["portfolio_state_id"]),
-            market_snapshot_id=str(payload["market_snapshot_id"]),
-            reference_data_set_id=str(payload["reference_data_set_id"]),
-            valuation_policy_set_id=str(payload["valuation_policy_set_id"]),
-            valuation_context_id=str(payload["valuation_context_id"]),
-            scenario_set_id=str(payload["scenario_set_id"]),
-            software_build_hash=str(payload["software_build_hash"]),
-            run_timestamp=_to_datetime(str(payload["run_timestamp"]), "run_timestamp"),
-            valuation_timestamp=_to_datetime(str(payload["valuation_timestamp"]), "valuation_timestamp"),
-            run_purpose=str(payload["run_purpose"]),
+
+    def get_many(self, valuation_run_ids: Iterable[str]) -> dict[str, ValuationRun]:
+        """Valuation runs by id; ids that are not stored are omitted."""
+        return self._get_objects(
+            session_id=_VALUATION_RUN_SESSION_ID,
+            object_ids=valuation_run_ids,
+            field_name="valuation_run_id",
+            decode=_valuation_run_from_payload,
         )
 
     def save(self, valuation_run: ValuationRun) -> None:
@@ -220,33 +346,19 @@ class SqliteModelRegistryRepository(_SqliteEventBackedRepository, ModelRegistryR
 
     def get_by_model_id(self, model_id: str) -> Optional[ModelRegistryEntry]:
         _require_non_empty_id(model_id, "model_id")
-        payload = self._get_payload(
+        return self._get_object(
             session_id=_MODEL_REGISTRY_SESSION_ID,
             object_id=model_id,
+            decode=_model_registry_entry_from_payload,
         )
-        if payload is None:
-            return None
 
-        capabilities = tuple(
-            ModelCapability(
-                instrument_family=str(cap["instrument_family"]),
-                exercise_style=str(cap["exercise_style"]),
-                measure=str(cap["measure"]),
-            )
-            for cap in payload["supported_capabilities"]
-        )
-
-        return ModelRegistryEntry(
-            model_id=str(payload["model_id"]),
-            semantic_version=str(payload["semantic_version"]),
-            implementation_version=str(payload["implementation_version"]),
-            validation_status=str(payload["validation_status"]),
-            owner=str(payload["owner"]),
-            approval_date=datetime.date.fromisoformat(str(payload["approval_date"])),
-            benchmark_pack_id=str(payload["benchmark_pack_id"]),
-            known_limitations=tuple(str(item) for item in payload["known_limitations"]),
-            numeric_policy_id=str(payload["numeric_policy_id"]),
-            supported_capabilities=capabilities,
+    def get_many(self, model_ids: Iterable[str]) -> dict[str, ModelRegistryEntry]:
+        """Model registry entries by model_id; ids that are not stored are omitted."""
+        return self._get_objects(
+            session_id=_MODEL_REGISTRY_SESSION_ID,
+            object_ids=model_ids,
+            field_name="model_id",
+            decode=_model_registry_entry_from_payload,
         )
 
     def save(self, model_entry: ModelRegistryEntry) -> None:
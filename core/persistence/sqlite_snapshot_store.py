@@ -36,8 +36,9 @@ class SqliteSnapshotStore:
     def save(self, snapshot: Snapshot) -> None:
         with self._connect() as conn, closing(conn.cursor()) as cur:
             self._ensure_schema(conn)
-            payload_json = json.dumps(snapshot.data, sort_keys=True, separators=(",", ":"))
-            state_hash = hash_snapshot(snapshot.data)
+            data = dict(snapshot.data)  # may be a lazily decoded Mapping
+            payload_json = json.dumps(data, sort_keys=True, separators=(",", ":"))
+            state_hash = hash_snapshot(data)
             created_at = snapshot.created_at.isoformat()
             cur.execute(
                 """
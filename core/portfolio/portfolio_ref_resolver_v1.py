@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+
 from core.portfolio.advisory_payload_artifact_store_v1 import AdvisoryPayloadArtifactNotFoundError
 from core.portfolio.advisory_payload_artifact_store_v1 import get_advisory_payload_artifact_v1
 from core.services.advisory_input_contract_v1 import normalize_advisory_input_v1
@@ -41,7 +43,8 @@ def resolve_portfolio_ref_to_advisory_payload_v1(portfolio_ref: str) -> dict:
         if snapshot is None:
             raise PortfolioResolutionError(f"portfolio_snapshot_not_found:{portfolio_id}")
 
-        payload = snapshot.data if isinstance(snapshot.data, dict) else {}
+        # Binary snapshot encodings load data as a lazy Mapping; the payload contract is a dict.
+        payload = dict(snapshot.data) if isinstance(snapshot.data, Mapping) else {}
         try:
             normalize_advisory_input_v1(payload)
         except Exception as exc:
@@ -2,6 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from decimal import Decimal
+from typing import Callable
+from typing import Sequence
+
+import numpy as np
 
 from core.contracts.option_valuation_result_v2 import OptionValuationResultV2
 from core.contracts.resolved_american_lattice_policy_v1 import ResolvedAmericanLatticePolicyV1
@@ -15,11 +19,22 @@ from core.contracts.valuation_measure_result_v2 import ValuationMeasureMethodKin
 from core.contracts.valuation_measure_result_v2 import ValuationMeasureResultV2
 from core.contracts.valuation_measure_set_v1 import PHASE_C_CANONICAL_VALUATION_MEASURE_ORDER_V1
 from core.contracts.valuation_measure_set_v1 import PHASE_D_MODEL_DIRECT_VALUATION_MEASURE_ORDER_V1
+from core.numeric_policy import DEFAULT_TOLERANCES
+from core.numeric_policy import MetricClass
 from core.numeric_policy import RHO_1PCT_BUMP_V1
 from core.numeric_policy import SPOT_BUMP_RELATIVE_V1
 from core.numeric_policy import VEGA_1VOL_ABS_BUMP_V1
 from core.pricing.crr_american_fx_kernel_v1 import CrrAmericanKernelResultV1
+from core.pricing.crr_american_fx_kernel_v1 import _decimal_from_float
 from core.pricing.crr_american_fx_kernel_v1 import crr_american_fx_kernel_v1
+from core.pricing.crr_american_fx_lattice_v1 import CrrLatticeRowV1
+from core.pricing.crr_american_fx_lattice_v1 import GROUP_CHUNK_ROWS
+from core.pricing.crr_american_fx_lattice_v1 import crr_american_fx_lattice_v1
+from core.pricing.crr_american_fx_lattice_v1 import crr_american_pv_batch_v1
+from core.pricing.crr_american_fx_lattice_v1 import crr_american_spot_greeks_batch_v1
+from core.pricing.crr_american_fx_lattice_v1 import crr_lattice_row_arrays_v1
+from core.pricing.crr_american_fx_lattice_v1 import crr_lattice_row_v1
+from core.pricing.crr_american_fx_lattice_v1 import kernel_result_from_float_v1
 
 
 ENGINE_NAME_V1 = "american_crr_fx_engine"
@@ -41,6 +56,23 @@ THETA_MEASURE_POLICY_ID_V1 = "phase_d.measure_policy.numerical.theta_1d_calendar
 RHO_DOMESTIC_MEASURE_POLICY_ID_V1 = "phase_d.measure_policy.numerical.rho_domestic_1pct.v1"
 RHO_FOREIGN_MEASURE_POLICY_ID_V1 = "phase_d.measure_policy.numerical.rho_foreign_1pct.v1"
 
+# Lattice backends: the frozen Decimal-rounding reference kernel (default) or the float-native
+# NumPy lattice (parity-checked against the reference within DEFAULT_TOLERANCES).
+LATTICE_BACKEND_REFERENCE_V1 = "decimal_reference_kernel"
+LATTICE_BACKEND_FLOAT_V1 = "float64_numpy_lattice"
+LATTICE_BACKENDS_V1 = (LATTICE_BACKEND_REFERENCE_V1, LATTICE_BACKEND_FLOAT_V1)
+
+# Greeks modes for value_with_theta_rolled_inputs_boundary:
+# - bump_and_reprice (default, frozen): one full tree per bump, seven per trade.
+# - lattice_single_pass: delta/gamma read off time slices 1 and 2 of the base tree; vega, rho and
+#   the theta roll priced as extra rows of the same vectorised float64 induction. Falls back to
+#   spot bumps (in that same induction) when the base has no stochastic lattice or step_count < 2.
+GREEKS_MODE_BUMP_REPRICE_V1 = "bump_and_reprice"
+GREEKS_MODE_LATTICE_V1 = "lattice_single_pass"
+GREEKS_MODES_V1 = (GREEKS_MODE_BUMP_REPRICE_V1, GREEKS_MODE_LATTICE_V1)
+LATTICE_DELTA_MEASURE_POLICY_ID_V1 = "phase_d.measure_policy.lattice.delta_spot_non_premium_adjusted.v1"
+LATTICE_GAMMA_MEASURE_POLICY_ID_V1 = "phase_d.measure_policy.lattice.gamma_spot.v1"
+
 
 def _require_non_empty_string(value: str, field_name: str) -> str:
     if not isinstance(value, str) or not value.strip():
@@ -70,9 +102,19 @@ def _extract_kernel_inputs_v1(
     )
 
 
+def _kernel_for_lattice_backend_v1(lattice_backend: str) -> Callable[..., CrrAmericanKernelResultV1]:
+    # resolved at call time so the module-level kernels stay patchable
+    if lattice_backend == LATTICE_BACKEND_REFERENCE_V1:
+        return crr_american_fx_kernel_v1
+    if lattice_backend == LATTICE_BACKEND_FLOAT_V1:
+        return crr_american_fx_lattice_v1
+    raise ValueError(f"lattice_backend must be one of {LATTICE_BACKENDS_V1}")
+
+
 def _present_value_from_inputs_v1(
     resolved_inputs: ResolvedFxOptionValuationInputsV1,
     resolved_lattice_policy: ResolvedAmericanLatticePolicyV1,
+    kernel: Callable[..., CrrAmericanKernelResultV1] | None = None,
 ) -> Decimal:
     (
         option_type,
@@ -85,7 +127,7 @@ def _present_value_from_inputs_v1(
         step_count,
     ) = _extract_kernel_inputs_v1(resolved_inputs, resolved_lattice_policy)
 
-    kernel_result = crr_american_fx_kernel_v1(
+    kernel_result = (kernel or crr_american_fx_kernel_v1)(
         option_type=option_type,
         spot=spot,
         strike=strike,
@@ -106,6 +148,7 @@ def _kernel_result_with_overrides_v1(
     domestic_rate: Decimal | None = None,
     foreign_rate: Decimal | None = None,
     volatility: Decimal | None = None,
+    kernel: Callable[..., CrrAmericanKernelResultV1] | None = None,
 ) -> CrrAmericanKernelResultV1:
     (
         option_type,
@@ -118,7 +161,7 @@ def _kernel_result_with_overrides_v1(
         step_count,
     ) = _extract_kernel_inputs_v1(resolved_inputs, resolved_lattice_policy)
 
-    return crr_american_fx_kernel_v1(
+    return (kernel or crr_american_fx_kernel_v1)(
         option_type=option_type,
         spot=input_spot if spot is None else spot,
         strike=strike,
@@ -177,6 +220,7 @@ def _map_full_measures_v1(
     rho_foreign: Decimal,
     bump_policy_id: str,
     tolerance_policy_id: str,
+    delta_gamma_from_lattice: bool = False,
 ) -> tuple[ValuationMeasureResultV2, ...]:
     value_by_measure = {
         ValuationMeasureNameV1.PRESENT_VALUE: kernel_result.present_value,
@@ -195,6 +239,11 @@ def _map_full_measures_v1(
         ValuationMeasureNameV1.INTRINSIC_VALUE: INTRINSIC_VALUE_MEASURE_POLICY_ID_V1,
         ValuationMeasureNameV1.TIME_VALUE: TIME_VALUE_MEASURE_POLICY_ID_V1,
     }
+    if delta_gamma_from_lattice:
+        model_direct_policy_id_by_measure[ValuationMeasureNameV1.DELTA_SPOT_NON_PREMIUM_ADJUSTED] = (
+            LATTICE_DELTA_MEASURE_POLICY_ID_V1
+        )
+        model_direct_policy_id_by_measure[ValuationMeasureNameV1.GAMMA_SPOT] = LATTICE_GAMMA_MEASURE_POLICY_ID_V1
 
     numerical_policy_id_by_measure = {
         ValuationMeasureNameV1.DELTA_SPOT_NON_PREMIUM_ADJUSTED: DELTA_MEASURE_POLICY_ID_V1,
@@ -239,6 +288,114 @@ def _spot_bump_abs_from_spot_v1(spot: Decimal) -> Decimal:
     return bump_abs
 
 
+def _lattice_row_with_overrides_v1(
+    resolved_inputs: ResolvedFxOptionValuationInputsV1,
+    resolved_lattice_policy: ResolvedAmericanLatticePolicyV1,
+    *,
+    spot: Decimal | None = None,
+    domestic_rate: Decimal | None = None,
+    foreign_rate: Decimal | None = None,
+    volatility: Decimal | None = None,
+) -> CrrLatticeRowV1:
+    (
+        option_type,
+        input_spot,
+        strike,
+        input_domestic_rate,
+        input_foreign_rate,
+        input_volatility,
+        time_to_expiry_years,
+        _,
+    ) = _extract_kernel_inputs_v1(resolved_inputs, resolved_lattice_policy)
+
+    return crr_lattice_row_v1(
+        option_type=option_type,
+        spot=input_spot if spot is None else spot,
+        strike=strike,
+        domestic_rate=input_domestic_rate if domestic_rate is None else domestic_rate,
+        foreign_rate=input_foreign_rate if foreign_rate is None else foreign_rate,
+        volatility=input_volatility if volatility is None else volatility,
+        time_to_expiry_years=time_to_expiry_years,
+    )
+
+
+@dataclass(frozen=True)
+class _LatticeGreeksV1:
+    kernel_result: CrrAmericanKernelResultV1
+    delta: Decimal
+    gamma: Decimal
+    vega: Decimal
+    theta: Decimal
+    rho_domestic: Decimal
+    rho_foreign: Decimal
+    delta_gamma_from_lattice: bool
+
+
+def _lattice_greeks_v1(
+    resolved_inputs: ResolvedFxOptionValuationInputsV1,
+    resolved_lattice_policy: ResolvedAmericanLatticePolicyV1,
+    theta_rolled_resolved_inputs: ResolvedFxOptionValuationInputsV1,
+) -> _LatticeGreeksV1:
+    scalars = resolved_inputs.resolved_kernel_scalars
+    step_count = resolved_lattice_policy.step_count
+
+    base = _lattice_row_with_overrides_v1(resolved_inputs, resolved_lattice_policy)
+    rows = [
+        base,
+        _lattice_row_with_overrides_v1(
+            resolved_inputs, resolved_lattice_policy, volatility=scalars.volatility + VEGA_1VOL_ABS_BUMP_V1
+        ),
+        _lattice_row_with_overrides_v1(
+            resolved_inputs, resolved_lattice_policy, domestic_rate=scalars.domestic_rate + RHO_1PCT_BUMP_V1
+        ),
+        _lattice_row_with_overrides_v1(
+            resolved_inputs, resolved_lattice_policy, foreign_rate=scalars.foreign_rate + RHO_1PCT_BUMP_V1
+        ),
+    ]
+    # The theta roll reuses the base lattice outright when the rolled inputs reduce to the same
+    # kernel row; otherwise it is one more row of the same induction.
+    rolled = _lattice_row_with_overrides_v1(theta_rolled_resolved_inputs, resolved_lattice_policy)
+    rolled_position = 0 if rolled == base else len(rows)
+    if rolled_position:
+        rows.append(rolled)
+
+    delta_gamma_from_lattice = not base.expired and base.vol > 0.0 and step_count >= 2
+    if not delta_gamma_from_lattice:
+        spot = resolved_inputs.spot.spot
+        spot_bump_abs = _spot_bump_abs_from_spot_v1(spot)
+        rows.append(_lattice_row_with_overrides_v1(resolved_inputs, resolved_lattice_policy, spot=spot + spot_bump_abs))
+        rows.append(_lattice_row_with_overrides_v1(resolved_inputs, resolved_lattice_policy, spot=spot - spot_bump_abs))
+
+    try:
+        pv, delta, gamma = crr_american_spot_greeks_batch_v1(*crr_lattice_row_arrays_v1(rows), step_count)
+    except ValueError as exc:
+        # per-trade call: keep the reference kernel's messages (no batch index)
+        raise ValueError(str(exc).split(" (index ", 1)[0]) from None
+
+    results = [kernel_result_from_float_v1(float(value), row) for value, row in zip(pv, rows)]
+    pv_base = results[0].present_value
+
+    if delta_gamma_from_lattice:
+        delta_value = _decimal_from_float(float(delta[0]), "delta")
+        gamma_value = _decimal_from_float(float(gamma[0]), "gamma")
+    else:
+        pv_spot_up = results[-2].present_value
+        pv_spot_down = results[-1].present_value
+        delta_value = (pv_spot_up - pv_spot_down) / (Decimal("2") * spot_bump_abs)
+        gamma_value = (pv_spot_up - (Decimal("2") * pv_base) + pv_spot_down) / (spot_bump_abs * spot_bump_abs)
+
+    return _LatticeGreeksV1(
+        kernel_result=results[0],
+        delta=delta_value,
+        gamma=gamma_value,
+        vega=results[1].present_value - pv_base,
+        theta=results[rolled_position].present_value - pv_base,
+        rho_domestic=results[2].present_value - pv_base,
+        rho_foreign=results[3].present_value - pv_base,
+        delta_gamma_from_lattice=delta_gamma_from_lattice,
+    )
+
+
 @dataclass(frozen=True)
 class AmericanCrrFxEngineV1:
     """Narrow governed PR-D1.4 wrapper from resolved inputs and lattice policy to OptionValuationResultV2."""
@@ -247,12 +404,14 @@ class AmericanCrrFxEngineV1:
     engine_version: str = ENGINE_VERSION_V1
     model_name: str = MODEL_NAME_V1
     model_version: str = MODEL_VERSION_V1
+    lattice_backend: str = LATTICE_BACKEND_REFERENCE_V1
+    greeks_mode: str = GREEKS_MODE_BUMP_REPRICE_V1
 
-    def value(
+    def _require_boundary_inputs_v1(
         self,
         resolved_inputs: ResolvedFxOptionValuationInputsV1,
         resolved_lattice_policy: ResolvedAmericanLatticePolicyV1,
-    ) -> OptionValuationResultV2:
+    ) -> None:
         if not isinstance(resolved_inputs, ResolvedFxOptionValuationInputsV1):
             raise ValueError("AmericanCrrFxEngineV1 requires ResolvedFxOptionValuationInputsV1")
         if not isinstance(resolved_lattice_policy, ResolvedAmericanLatticePolicyV1):
@@ -260,6 +419,43 @@ class AmericanCrrFxEngineV1:
 
         _require_non_empty_string(resolved_inputs.resolved_basis_hash, "resolved_basis_hash")
 
+    def _result_v1(
+        self,
+        resolved_inputs: ResolvedFxOptionValuationInputsV1,
+        resolved_lattice_policy: ResolvedAmericanLatticePolicyV1,
+        valuation_measures: tuple[ValuationMeasureResultV2, ...],
+        theta_rolled_inputs_boundary: ThetaRolledFxInputsBoundaryV1 | None = None,
+    ) -> OptionValuationResultV2:
+        theta_lineage = {}
+        if theta_rolled_inputs_boundary is not None:
+            theta_lineage = {
+                "theta_roll_boundary_contract_name": THETA_ROLLED_INPUT_BOUNDARY_CONTRACT_NAME_V1,
+                "theta_roll_boundary_contract_version": THETA_ROLLED_INPUT_BOUNDARY_CONTRACT_VERSION_V1,
+                "theta_roll_boundary_reference": theta_rolled_inputs_boundary_reference_v1(theta_rolled_inputs_boundary),
+            }
+        return OptionValuationResultV2(
+            engine_name=_require_non_empty_string(self.engine_name, "engine_name"),
+            engine_version=_require_non_empty_string(self.engine_version, "engine_version"),
+            model_name=_require_non_empty_string(self.model_name, "model_name"),
+            model_version=_require_non_empty_string(self.model_version, "model_version"),
+            resolved_input_contract_name=RESOLVED_INPUT_CONTRACT_NAME_V1,
+            resolved_input_contract_version=RESOLVED_INPUT_CONTRACT_VERSION_V1,
+            resolved_input_reference=resolved_inputs.resolved_basis_hash,
+            resolved_lattice_policy_contract_name=RESOLVED_LATTICE_POLICY_CONTRACT_NAME_V1,
+            resolved_lattice_policy_contract_version=RESOLVED_LATTICE_POLICY_CONTRACT_VERSION_V1,
+            resolved_lattice_policy_reference=_resolved_lattice_policy_reference_v1(resolved_lattice_policy),
+            valuation_measures=valuation_measures,
+            **theta_lineage,
+        )
+
+    def value(
+        self,
+        resolved_inputs: ResolvedFxOptionValuationInputsV1,
+        resolved_lattice_policy: ResolvedAmericanLatticePolicyV1,
+    ) -> OptionValuationResultV2:
+        self._require_boundary_inputs_v1(resolved_inputs, resolved_lattice_policy)
+        kernel = _kernel_for_lattice_backend_v1(self.lattice_backend)
+
         (
             option_type,
             spot,
@@ -271,7 +467,7 @@ class AmericanCrrFxEngineV1:
             step_count,
         ) = _extract_kernel_inputs_v1(resolved_inputs, resolved_lattice_policy)
 
-        kernel_result = crr_american_fx_kernel_v1(
+        kernel_result = kernel(
             option_type=option_type,
             spot=spot,
             strike=strike,
@@ -282,18 +478,58 @@ class AmericanCrrFxEngineV1:
             step_count=step_count,
         )
 
-        return OptionValuationResultV2(
-            engine_name=_require_non_empty_string(self.engine_name, "engine_name"),
-            engine_version=_require_non_empty_string(self.engine_version, "engine_version"),
-            model_name=_require_non_empty_string(self.model_name, "model_name"),
-            model_version=_require_non_empty_string(self.model_version, "model_version"),
-            resolved_input_contract_name=RESOLVED_INPUT_CONTRACT_NAME_V1,
-            resolved_input_contract_version=RESOLVED_INPUT_CONTRACT_VERSION_V1,
-            resolved_input_reference=resolved_inputs.resolved_basis_hash,
-            resolved_lattice_policy_contract_name=RESOLVED_LATTICE_POLICY_CONTRACT_NAME_V1,
-            resolved_lattice_policy_contract_version=RESOLVED_LATTICE_POLICY_CONTRACT_VERSION_V1,
-            resolved_lattice_policy_reference=_resolved_lattice_policy_reference_v1(resolved_lattice_policy),
-            valuation_measures=_map_model_direct_measures_v1(kernel_result),
+        return self._result_v1(
+            resolved_inputs,
+            resolved_lattice_policy,
+            _map_model_direct_measures_v1(kernel_result),
+        )
+
+    def value_many(
+        self,
+        resolved_inputs: Sequence[ResolvedFxOptionValuationInputsV1],
+        resolved_lattice_policy: ResolvedAmericanLatticePolicyV1 | Sequence[ResolvedAmericanLatticePolicyV1],
+    ) -> tuple[OptionValuationResultV2, ...]:
+        """Bulk value(); results in input order and identical to [value(x) for x in inputs].
+
+        On LATTICE_BACKEND_FLOAT_V1 trades are grouped only by step_count, the one input that
+        fixes the lattice shape; spot, rates, vol and time vary per row, so a book with per-strike
+        vols or mixed expiries still runs one (trades x nodes) induction per GROUP_CHUNK_ROWS
+        trades. The reference backend prices trade by trade with the Decimal kernel.
+        """
+        items = list(resolved_inputs)
+        if isinstance(resolved_lattice_policy, ResolvedAmericanLatticePolicyV1):
+            policies = [resolved_lattice_policy] * len(items)
+        else:
+            policies = list(resolved_lattice_policy)
+            if len(policies) != len(items):
+                raise ValueError("resolved_lattice_policy length must match resolved_inputs")
+        if not items:
+            return ()
+        if self.lattice_backend != LATTICE_BACKEND_FLOAT_V1:
+            return tuple(self.value(item, policy) for item, policy in zip(items, policies))
+
+        rows: list[CrrLatticeRowV1] = []
+        groups: dict[int, list[int]] = {}
+        for position, (item, policy) in enumerate(zip(items, policies)):
+            self._require_boundary_inputs_v1(item, policy)
+            rows.append(_lattice_row_with_overrides_v1(item, policy))
+            groups.setdefault(policy.step_count, []).append(position)
+
+        present_values = np.empty(len(items), dtype=np.float64)
+        for step_count, positions in groups.items():
+            for start in range(0, len(positions), GROUP_CHUNK_ROWS):
+                chunk = positions[start:start + GROUP_CHUNK_ROWS]
+                present_values[chunk] = crr_american_pv_batch_v1(
+                    *crr_lattice_row_arrays_v1([rows[i] for i in chunk]), step_count
+                )
+
+        return tuple(
+            self._result_v1(
+                item,
+                policy,
+                _map_model_direct_measures_v1(kernel_result_from_float_v1(float(present_values[i]), rows[i])),
+            )
+            for i, (item, policy) in enumerate(zip(items, policies))
         )
 
     def value_with_theta_rolled_inputs_boundary(
@@ -308,7 +544,17 @@ class AmericanCrrFxEngineV1:
         if theta_rolled_inputs_boundary.current_resolved_inputs != resolved_inputs:
             raise ValueError("theta_rolled_inputs_boundary.current_resolved_inputs must equal resolved_inputs")
 
+        if self.greeks_mode == GREEKS_MODE_LATTICE_V1:
+            return self._value_with_lattice_greeks_v1(
+                resolved_inputs,
+                resolved_lattice_policy,
+                theta_rolled_inputs_boundary,
+            )
+        if self.greeks_mode != GREEKS_MODE_BUMP_REPRICE_V1:
+            raise ValueError(f"greeks_mode must be one of {GREEKS_MODES_V1}")
+
         model_direct_result = self.value(resolved_inputs, resolved_lattice_policy)
+        kernel = _kernel_for_lattice_backend_v1(self.lattice_backend)
 
         spot = resolved_inputs.spot.spot
         spot_bump_abs = _spot_bump_abs_from_spot_v1(spot)
@@ -319,11 +565,13 @@ class AmericanCrrFxEngineV1:
             resolved_inputs,
             resolved_lattice_policy,
             spot=spot + spot_bump_abs,
+            kernel=kernel,
         ).present_value
         pv_spot_down = _kernel_result_with_overrides_v1(
             resolved_inputs,
             resolved_lattice_policy,
             spot=spot - spot_bump_abs,
+            kernel=kernel,
         ).present_value
 
         delta = (pv_spot_up - pv_spot_down) / (Decimal("2") * spot_bump_abs)
@@ -333,6 +581,7 @@ class AmericanCrrFxEngineV1:
             resolved_inputs,
             resolved_lattice_policy,
             volatility=resolved_inputs.resolved_kernel_scalars.volatility + VEGA_1VOL_ABS_BUMP_V1,
+            kernel=kernel,
         ).present_value
         vega = pv_vol_up - pv_base
 
@@ -340,6 +589,7 @@ class AmericanCrrFxEngineV1:
             resolved_inputs,
             resolved_lattice_policy,
             domestic_rate=resolved_inputs.resolved_kernel_scalars.domestic_rate + RHO_1PCT_BUMP_V1,
+            kernel=kernel,
         ).present_value
         rho_domestic = pv_rd_up - pv_base
 
@@ -347,12 +597,14 @@ class AmericanCrrFxEngineV1:
             resolved_inputs,
             resolved_lattice_policy,
             foreign_rate=resolved_inputs.resolved_kernel_scalars.foreign_rate + RHO_1PCT_BUMP_V1,
+            kernel=kernel,
         ).present_value
         rho_foreign = pv_rf_up - pv_base
 
         pv_rolled = _present_value_from_inputs_v1(
             theta_rolled_inputs_boundary.theta_rolled_resolved_inputs,
             resolved_lattice_policy,
+            kernel=kernel,
         )
         theta = pv_rolled - pv_base
 
@@ -372,31 +624,149 @@ class AmericanCrrFxEngineV1:
             tolerance_policy_id=resolved_lattice_policy.tolerance_policy_id,
         )
 
-        return OptionValuationResultV2(
-            engine_name=model_direct_result.engine_name,
-            engine_version=model_direct_result.engine_version,
-            model_name=model_direct_result.model_name,
-            model_version=model_direct_result.model_version,
-            resolved_input_contract_name=model_direct_result.resolved_input_contract_name,
-            resolved_input_contract_version=model_direct_result.resolved_input_contract_version,
-            resolved_input_reference=model_direct_result.resolved_input_reference,
-            resolved_lattice_policy_contract_name=model_direct_result.resolved_lattice_policy_contract_name,
-            resolved_lattice_policy_contract_version=model_direct_result.resolved_lattice_policy_contract_version,
-            resolved_lattice_policy_reference=model_direct_result.resolved_lattice_policy_reference,
-            theta_roll_boundary_contract_name=THETA_ROLLED_INPUT_BOUNDARY_CONTRACT_NAME_V1,
-            theta_roll_boundary_contract_version=THETA_ROLLED_INPUT_BOUNDARY_CONTRACT_VERSION_V1,
-            theta_roll_boundary_reference=theta_rolled_inputs_boundary_reference_v1(theta_rolled_inputs_boundary),
-            valuation_measures=full_measures,
+        return self._result_v1(
+            resolved_inputs,
+            resolved_lattice_policy,
+            full_measures,
+            theta_rolled_inputs_boundary,
         )
 
+    def _value_with_lattice_greeks_v1(
+        self,
+        resolved_inputs: ResolvedFxOptionValuationInputsV1,
+        resolved_lattice_policy: ResolvedAmericanLatticePolicyV1,
+        theta_rolled_inputs_boundary: ThetaRolledFxInputsBoundaryV1,
+    ) -> OptionValuationResultV2:
+        self._require_boundary_inputs_v1(resolved_inputs, resolved_lattice_policy)
+
+        greeks = _lattice_greeks_v1(
+            resolved_inputs,
+            resolved_lattice_policy,
+            theta_rolled_inputs_boundary.theta_rolled_resolved_inputs,
+        )
+        full_measures = _map_full_measures_v1(
+            kernel_result=greeks.kernel_result,
+            delta=greeks.delta,
+            gamma=greeks.gamma,
+            vega=greeks.vega,
+            theta=greeks.theta,
+            rho_domestic=greeks.rho_domestic,
+            rho_foreign=greeks.rho_foreign,
+            bump_policy_id=resolved_lattice_policy.bump_policy_id,
+            tolerance_policy_id=resolved_lattice_policy.tolerance_policy_id,
+            delta_gamma_from_lattice=greeks.delta_gamma_from_lattice,
+        )
+        return self._result_v1(
+            resolved_inputs,
+            resolved_lattice_policy,
+            full_measures,
+            theta_rolled_inputs_boundary,
+        )
+
+
+_METRIC_CLASS_BY_MEASURE_V1 = {
+    ValuationMeasureNameV1.PRESENT_VALUE: MetricClass.PRICE,
+    ValuationMeasureNameV1.INTRINSIC_VALUE: MetricClass.PRICE,
+    ValuationMeasureNameV1.TIME_VALUE: MetricClass.PRICE,
+    ValuationMeasureNameV1.DELTA_SPOT_NON_PREMIUM_ADJUSTED: MetricClass.DELTA,
+    ValuationMeasureNameV1.GAMMA_SPOT: MetricClass.GAMMA,
+    ValuationMeasureNameV1.VEGA_1VOL_ABS: MetricClass.VEGA,
+    ValuationMeasureNameV1.THETA_1D_CALENDAR: MetricClass.THETA,
+    ValuationMeasureNameV1.RHO_DOMESTIC_1PCT: MetricClass.RHO,
+    ValuationMeasureNameV1.RHO_FOREIGN_1PCT: MetricClass.RHO,
+}
+
+
+@dataclass(frozen=True)
+class GreeksDivergenceRowV1:
+    measure_name: ValuationMeasureNameV1
+    bump_reprice_value: Decimal
+    lattice_value: Decimal
+    abs_diff: Decimal
+    tolerance: Decimal
+    within_tolerance: bool
+
+
+@dataclass(frozen=True)
+class GreeksDivergenceReportV1:
+    """Side-by-side bump-and-reprice vs lattice_single_pass measures for one trade."""
+
+    resolved_input_reference: str
+    step_count: int
+    delta_gamma_from_lattice: bool
+    rows: tuple[GreeksDivergenceRowV1, ...]
+
+    @property
+    def max_abs_diff(self) -> Decimal:
+        return max(row.abs_diff for row in self.rows)
+
+    @property
+    def diverging_measures(self) -> tuple[ValuationMeasureNameV1, ...]:
+        return tuple(row.measure_name for row in self.rows if not row.within_tolerance)
+
+
+def american_crr_greeks_divergence_report_v1(
+    resolved_inputs: ResolvedFxOptionValuationInputsV1,
+    resolved_lattice_policy: ResolvedAmericanLatticePolicyV1,
+    theta_rolled_inputs_boundary: ThetaRolledFxInputsBoundaryV1,
+    *,
+    lattice_backend: str = LATTICE_BACKEND_REFERENCE_V1,
+) -> GreeksDivergenceReportV1:
+    """Price both greeks modes; tolerance per measure is DEFAULT_TOLERANCES abs + rel * |bump value|."""
+    bump_result = AmericanCrrFxEngineV1(lattice_backend=lattice_backend).value_with_theta_rolled_inputs_boundary(
+        resolved_inputs, resolved_lattice_policy, theta_rolled_inputs_boundary
+    )
+    lattice_result = AmericanCrrFxEngineV1(greeks_mode=GREEKS_MODE_LATTICE_V1).value_with_theta_rolled_inputs_boundary(
+        resolved_inputs, resolved_lattice_policy, theta_rolled_inputs_boundary
+    )
+
+    rows = []
+    for bump_measure, lattice_measure in zip(bump_result.valuation_measures, lattice_result.valuation_measures):
+        tolerance_policy = DEFAULT_TOLERANCES[_METRIC_CLASS_BY_MEASURE_V1[bump_measure.measure_name]]
+        tolerance = Decimal(str(tolerance_policy.abs or 0.0)) + Decimal(str(tolerance_policy.rel or 0.0)) * abs(
+            bump_measure.value
+        )
+        abs_diff = abs(lattice_measure.value - bump_measure.value)
+        rows.append(
+            GreeksDivergenceRowV1(
+                measure_name=bump_measure.measure_name,
+                bump_reprice_value=bump_measure.value,
+                lattice_value=lattice_measure.value,
+                abs_diff=abs_diff,
+                tolerance=tolerance,
+                within_tolerance=abs_diff <= tolerance,
+            )
+        )
+
+    delta_measure = lattice_result.valuation_measures[
+        PHASE_C_CANONICAL_VALUATION_MEASURE_ORDER_V1.index(ValuationMeasureNameV1.DELTA_SPOT_NON_PREMIUM_ADJUSTED)
+    ]
+    return GreeksDivergenceReportV1(
+        resolved_input_reference=resolved_inputs.resolved_basis_hash,
+        step_count=resolved_lattice_policy.step_count,
+        delta_gamma_from_lattice=delta_measure.method_kind == ValuationMeasureMethodKindV2.MODEL_DIRECT,
+        rows=tuple(rows),
+    )
+
 
 __all__ = [
     "AmericanCrrFxEngineV1",
+    "american_crr_greeks_divergence_report_v1",
     "ENGINE_NAME_V1",
     "ENGINE_VERSION_V1",
     "DELTA_MEASURE_POLICY_ID_V1",
     "GAMMA_MEASURE_POLICY_ID_V1",
+    "GREEKS_MODE_BUMP_REPRICE_V1",
+    "GREEKS_MODE_LATTICE_V1",
+    "GREEKS_MODES_V1",
+    "GreeksDivergenceReportV1",
+    "GreeksDivergenceRowV1",
     "INTRINSIC_VALUE_MEASURE_POLICY_ID_V1",
+    "LATTICE_BACKEND_FLOAT_V1",
+    "LATTICE_BACKEND_REFERENCE_V1",
+    "LATTICE_BACKENDS_V1",
+    "LATTICE_DELTA_MEASURE_POLICY_ID_V1",
+    "LATTICE_GAMMA_MEASURE_POLICY_ID_V1",
     "MODEL_NAME_V1",
     "MODEL_VERSION_V1",
     "PRESENT_VALUE_MEASURE_POLICY_ID_V1",
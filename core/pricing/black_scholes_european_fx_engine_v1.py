@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Sequence
 
 from core.contracts.option_pricing_engine_boundary_v1 import ensure_pure_option_pricing_input_v1
 from core.contracts.option_valuation_result_v1 import OptionValuationResultV1
 from core.contracts.resolved_option_valuation_inputs_v1 import ResolvedFxOptionValuationInputsV1
+from core.pricing.black_scholes_fx_batch_kernel_v1 import batch_measure_results_v1
+from core.pricing.black_scholes_fx_batch_kernel_v1 import black_scholes_fx_measures_batch_v1
+from core.pricing.black_scholes_fx_kernel_v1 import _require_finite_decimal
 from core.pricing.black_scholes_fx_kernel_v1 import black_scholes_fx_measures_v1
 
 
@@ -49,12 +53,28 @@ class BlackScholesEuropeanFxEngineV1:
     model_name: str = MODEL_NAME_V1
     model_version: str = MODEL_VERSION_V1
 
-    def value(self, resolved_inputs: ResolvedFxOptionValuationInputsV1) -> OptionValuationResultV1:
+    def _engine_input(self, resolved_inputs: ResolvedFxOptionValuationInputsV1) -> ResolvedFxOptionValuationInputsV1:
         engine_input = ensure_pure_option_pricing_input_v1(resolved_inputs)
         if not isinstance(engine_input, ResolvedFxOptionValuationInputsV1):
             raise ValueError("BlackScholesEuropeanFxEngineV1 requires ResolvedFxOptionValuationInputsV1")
 
         _require_non_empty_string(engine_input.resolved_basis_hash, "resolved_basis_hash")
+        return engine_input
+
+    def _result(self, engine_input: ResolvedFxOptionValuationInputsV1, valuation_measures) -> OptionValuationResultV1:
+        return OptionValuationResultV1(
+            engine_name=_require_non_empty_string(self.engine_name, "engine_name"),
+            engine_version=_require_non_empty_string(self.engine_version, "engine_version"),
+            model_name=_require_non_empty_string(self.model_name, "model_name"),
+            model_version=_require_non_empty_string(self.model_version, "model_version"),
+            resolved_input_contract_name=RESOLVED_INPUT_CONTRACT_NAME_V1,
+            resolved_input_contract_version=RESOLVED_INPUT_CONTRACT_VERSION_V1,
+            resolved_input_reference=engine_input.resolved_basis_hash,
+            valuation_measures=valuation_measures,
+        )
+
+    def value(self, resolved_inputs: ResolvedFxOptionValuationInputsV1) -> OptionValuationResultV1:
+        engine_input = self._engine_input(resolved_inputs)
 
         (
             option_type,
@@ -76,15 +96,39 @@ class BlackScholesEuropeanFxEngineV1:
             time_to_expiry_years=time_to_expiry_years,
         )
 
-        return OptionValuationResultV1(
-            engine_name=_require_non_empty_string(self.engine_name, "engine_name"),
-            engine_version=_require_non_empty_string(self.engine_version, "engine_version"),
-            model_name=_require_non_empty_string(self.model_name, "model_name"),
-            model_version=_require_non_empty_string(self.model_version, "model_version"),
-            resolved_input_contract_name=RESOLVED_INPUT_CONTRACT_NAME_V1,
-            resolved_input_contract_version=RESOLVED_INPUT_CONTRACT_VERSION_V1,
-            resolved_input_reference=engine_input.resolved_basis_hash,
-            valuation_measures=valuation_measures,
+        return self._result(engine_input, valuation_measures)
+
+    def value_many(
+        self, resolved_inputs: Sequence[ResolvedFxOptionValuationInputsV1]
+    ) -> tuple[OptionValuationResultV1, ...]:
+        """Bulk value(): all trades priced in one vectorised kernel pass, results in input order.
+
+        Parity with value() is within DEFAULT_TOLERANCES (see black_scholes_fx_batch_kernel_v1).
+        """
+        engine_inputs = [self._engine_input(item) for item in resolved_inputs]
+        if not engine_inputs:
+            return ()
+        kernel_inputs = [_extract_kernel_inputs_v1(item) for item in engine_inputs]
+        names = ("spot", "strike", "domestic_rate", "foreign_rate", "volatility", "time_to_expiry_years")
+        columns = {name: [] for name in names}
+        for row in kernel_inputs:
+            for name, value in zip(names, row[1:]):
+                columns[name].append(float(_require_finite_decimal(value, name)))
+
+        batch = black_scholes_fx_measures_batch_v1(option_type=[row[0] for row in kernel_inputs], **columns)
+        return tuple(
+            self._result(
+                engine_input,
+                batch_measure_results_v1(
+                    batch,
+                    i,
+                    option_type=row[0],
+                    spot=row[1],
+                    strike=row[2],
+                    time_to_expiry_years=row[6],
+                ),
+            )
+            for i, (engine_input, row) in enumerate(zip(engine_inputs, kernel_inputs))
         )
 
 
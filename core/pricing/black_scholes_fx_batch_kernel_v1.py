@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+import math
+from typing import Sequence, Union
+
+import numpy as np
+
+from core.contracts.valuation_measure_name_v1 import ValuationMeasureNameV1
+from core.contracts.valuation_measure_result_v1 import ValuationMeasureResultV1
+from core.contracts.valuation_measure_set_v1 import PHASE_C_CANONICAL_VALUATION_MEASURE_ORDER_V1
+from core.numeric_policy import TIME_EPSILON_YEARS_V1
+from core.numeric_policy import VOL_EPSILON_ABS_V1
+from core.pricing.black_scholes_fx_kernel_v1 import RHO_1PCT_BUMP_V1
+from core.pricing.black_scholes_fx_kernel_v1 import THETA_1D_CALENDAR_YEAR_FRACTION_V1
+from core.pricing.black_scholes_fx_kernel_v1 import VEGA_1VOL_ABS_BUMP_V1
+from core.pricing.black_scholes_fx_kernel_v1 import _intrinsic_value_spot_v1
+from core.pricing.black_scholes_fx_kernel_v1 import _require_option_type
+
+
+# Determinism contract (frozen):
+# - float64 throughout; every output element depends only on that element's inputs, so results
+#   are independent of batch size, order and composition (no reductions across trades).
+# - numpy has no erf: math.erf is mapped elementwise, so N(x) is bit-identical to the scalar kernel.
+#   exp/log/sqrt are numpy's and may differ from libm in the last ulp; parity with the scalar
+#   SSOT kernel is therefore tolerance-checked against DEFAULT_TOLERANCES, not bit-exact.
+# - Measures follow black_scholes_fx_measures_v1: analytic delta/gamma, bump-and-reprice
+#   vega/theta/rho with the same governed bumps; Decimal conversion only at the output boundary.
+BATCH_DETERMINISM_POLICY_V1 = "float64_elementwise_numpy_math_erf_cdf"
+NORMAL_CDF_POLICY_BATCH_V1 = "math.erf_ufunc_standard_normal_cdf"
+
+_TIME_EPS = float(TIME_EPSILON_YEARS_V1)
+_VOL_EPS = float(VOL_EPSILON_ABS_V1)
+_VEGA_BUMP = float(VEGA_1VOL_ABS_BUMP_V1)
+_RHO_BUMP = float(RHO_1PCT_BUMP_V1)
+_THETA_DT = float(THETA_1D_CALENDAR_YEAR_FRACTION_V1)
+_SQRT2 = math.sqrt(2.0)
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+
+_erf_ufunc = np.frompyfunc(math.erf, 1, 1)
+
+ArrayLike = Union[Sequence[float], np.ndarray, float]
+
+
+def normal_cdf_batch_v1(x: np.ndarray) -> np.ndarray:
+    x = np.asarray(x, dtype=np.float64)
+    return 0.5 * (1.0 + _erf_ufunc(x / _SQRT2).astype(np.float64))
+
+
+def normal_pdf_batch_v1(x: np.ndarray) -> np.ndarray:
+    x = np.asarray(x, dtype=np.float64)
+    return np.exp(-(x * x) / 2.0) / _SQRT_2PI
+
+
+def option_type_mask_v1(option_type: Union[str, Sequence[str]], size: int) -> np.ndarray:
+    """Boolean is_call mask from one option type or one per element."""
+    if isinstance(option_type, str):
+        return np.full(size, _require_option_type(option_type) == "call", dtype=bool)
+    types = [_require_option_type(t) for t in option_type]
+    if len(types) != size:
+        raise ValueError("option_type length must match the batch size")
+    return np.fromiter((t == "call" for t in types), dtype=bool, count=size)
+
+
+def _as_batch(value: ArrayLike, field_name: str, size: int | None) -> np.ndarray:
+    arr = np.asarray(value, dtype=np.float64)
+    if arr.ndim > 1:
+        raise ValueError(f"{field_name} must be a scalar or 1-D array")
+    if size is not None:
+        arr = np.broadcast_to(arr, (size,))
+    bad = ~np.isfinite(arr)
+    if bad.any():
+        raise ValueError(f"{field_name} must be finite (index {int(np.argmax(bad))})")
+    return arr
+
+
+def _require_positive(arr: np.ndarray, field_name: str) -> None:
+    bad = arr <= 0.0
+    if bad.any():
+        raise ValueError(f"{field_name} must be > 0 (index {int(np.argmax(bad))})")
+
+
+def _require_non_negative(arr: np.ndarray, field_name: str) -> None:
+    bad = arr < 0.0
+    if bad.any():
+        raise ValueError(f"{field_name} must be >= 0 (index {int(np.argmax(bad))})")
+
+
+def garman_kohlhagen_pv_batch_v1(
+    is_call: np.ndarray,
+    spot: np.ndarray,
+    strike: np.ndarray,
+    rate_d: np.ndarray,
+    rate_f: np.ndarray,
+    vol: np.ndarray,
+    t: np.ndarray,
+) -> np.ndarray:
+    """Per-unit GK present value, vectorised _present_value_v1 (same branch policy per element).
+
+    is_call is a bool mask; all other arguments are float64 arrays of one shape.
+    """
+    t_zero = t <= _TIME_EPS
+    vol_zero = ~t_zero & (vol <= _VOL_EPS)
+    regular = ~(t_zero | vol_zero)
+
+    discount_domestic = np.exp(-rate_d * t)
+    discount_foreign = np.exp(-rate_f * t)
+
+    sqrt_t = np.sqrt(t)
+    denom = np.where(regular, vol * sqrt_t, 1.0)
+    d1 = np.where(regular, (np.log(spot / strike) + (rate_d - rate_f + 0.5 * vol * vol) * t) / denom, 0.0)
+    d2 = d1 - vol * sqrt_t
+    n_d1 = normal_cdf_batch_v1(np.where(is_call, d1, -d1))
+    n_d2 = normal_cdf_batch_v1(np.where(is_call, d2, -d2))
+    gk = np.where(
+        is_call,
+        spot * discount_foreign * n_d1 - strike * discount_domestic * n_d2,
+        strike * discount_domestic * n_d2 - spot * discount_foreign * n_d1,
+    )
+
+    forward = spot * np.exp((rate_d - rate_f) * t)
+    forward_intrinsic = discount_domestic * np.where(
+        is_call, np.maximum(forward - strike, 0.0), np.maximum(strike - forward, 0.0)
+    )
+    spot_intrinsic = np.where(is_call, np.maximum(spot - strike, 0.0), np.maximum(strike - spot, 0.0))
+    return np.where(t_zero, spot_intrinsic, np.where(vol_zero, forward_intrinsic, gk))
+
+
+def _delta_gamma_batch(
+    is_call: np.ndarray,
+    spot: np.ndarray,
+    strike: np.ndarray,
+    rate_d: np.ndarray,
+    rate_f: np.ndarray,
+    vol: np.ndarray,
+    t: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorised _delta_gamma_v1."""
+    degenerate = (t <= _TIME_EPS) | (vol <= _VOL_EPS)
+    discount_foreign = np.exp(-rate_f * t)
+
+    sqrt_t = np.sqrt(t)
+    denom = np.where(degenerate, 1.0, vol * sqrt_t)
+    d1 = np.where(degenerate, 0.0, (np.log(spot / strike) + (rate_d - rate_f + 0.5 * vol * vol) * t) / denom)
+    n_d1 = normal_cdf_batch_v1(d1)
+    delta = np.where(is_call, discount_foreign * n_d1, discount_foreign * (n_d1 - 1.0))
+    gamma = np.where(degenerate, 0.0, discount_foreign * normal_pdf_batch_v1(d1) / (spot * denom))
+
+    forward = spot * np.exp((rate_d - rate_f) * t)
+    itm = np.where(is_call, forward > strike, forward < strike)
+    atm = forward == strike
+    sign = np.where(is_call, 1.0, -1.0)
+    degenerate_delta = sign * discount_foreign * np.where(itm, 1.0, np.where(atm, 0.5, 0.0))
+    return np.where(degenerate, degenerate_delta, delta), gamma
+
+
+@dataclass(frozen=True)
+class BlackScholesFxBatchMeasuresV1:
+    """Float64 measure arrays for N trades; index i follows the i-th input element."""
+
+    present_value: np.ndarray
+    intrinsic_value: np.ndarray
+    time_value: np.ndarray
+    delta_spot_non_premium_adjusted: np.ndarray
+    gamma_spot: np.ndarray
+    vega_1vol_abs: np.ndarray
+    theta_1d_calendar: np.ndarray
+    rho_domestic_1pct: np.ndarray
+    rho_foreign_1pct: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.present_value.shape[0])
+
+    def as_dict(self) -> dict[ValuationMeasureNameV1, np.ndarray]:
+        return {
+            ValuationMeasureNameV1.PRESENT_VALUE: self.present_value,
+            ValuationMeasureNameV1.INTRINSIC_VALUE: self.intrinsic_value,
+            ValuationMeasureNameV1.TIME_VALUE: self.time_value,
+            ValuationMeasureNameV1.DELTA_SPOT_NON_PREMIUM_ADJUSTED: self.delta_spot_non_premium_adjusted,
+            ValuationMeasureNameV1.GAMMA_SPOT: self.gamma_spot,
+            ValuationMeasureNameV1.VEGA_1VOL_ABS: self.vega_1vol_abs,
+            ValuationMeasureNameV1.THETA_1D_CALENDAR: self.theta_1d_calendar,
+            ValuationMeasureNameV1.RHO_DOMESTIC_1PCT: self.rho_domestic_1pct,
+            ValuationMeasureNameV1.RHO_FOREIGN_1PCT: self.rho_foreign_1pct,
+        }
+
+
+def black_scholes_fx_measures_batch_v1(
+    *,
+    option_type: Union[str, Sequence[str]],
+    spot: ArrayLike,
+    strike: ArrayLike,
+    domestic_rate: ArrayLike,
+    foreign_rate: ArrayLike,
+    volatility: ArrayLike,
+    time_to_expiry_years: ArrayLike,
+) -> BlackScholesFxBatchMeasuresV1:
+    """Batched black_scholes_fx_measures_v1 over 1-D float arrays (scalars broadcast).
+
+    All nine Phase C measures come out of one vectorised pass: the base and the four bumped
+    present values (vol, theta, rd, rf) are priced together as a single stacked array.
+    """
+
+    sizes = {
+        np.size(v)
+        for v in (spot, strike, domestic_rate, foreign_rate, volatility, time_to_expiry_years)
+        if np.ndim(v) == 1
+    }
+    if not isinstance(option_type, str):
+        sizes.add(len(option_type))
+    if len(sizes) > 1:
+        raise ValueError("batch inputs must share one length")
+    size = sizes.pop() if sizes else 1
+
+    s = _as_batch(spot, "spot", size)
+    k = _as_batch(strike, "strike", size)
+    rd = _as_batch(domestic_rate, "domestic_rate", size)
+    rf = _as_batch(foreign_rate, "foreign_rate", size)
+    vol = _as_batch(volatility, "volatility", size)
+    t = _as_batch(time_to_expiry_years, "time_to_expiry_years", size)
+    _require_positive(s, "spot")
+    _require_positive(k, "strike")
+    _require_non_negative(vol, "volatility")
+    _require_non_negative(t, "time_to_expiry_years")
+    is_call = option_type_mask_v1(option_type, size)
+
+    # rows: base, vol up, t + 1d, rd up, rf up
+    stacked = garman_kohlhagen_pv_batch_v1(
+        np.tile(is_call, 5),
+        np.tile(s, 5),
+        np.tile(k, 5),
+        np.concatenate([rd, rd, rd, rd + _RHO_BUMP, rd]),
+        np.concatenate([rf, rf, rf, rf, rf + _RHO_BUMP]),
+        np.concatenate([vol, vol + _VEGA_BUMP, vol, vol, vol]),
+        np.concatenate([t, t, t + _THETA_DT, t, t]),
+    ).reshape(5, size)
+    present_value = stacked[0]
+    intrinsic_value = np.where(is_call, np.maximum(s - k, 0.0), np.maximum(k - s, 0.0))
+    delta, gamma = _delta_gamma_batch(is_call, s, k, rd, rf, vol, t)
+
+    return BlackScholesFxBatchMeasuresV1(
+        present_value=present_value,
+        intrinsic_value=intrinsic_value,
+        time_value=present_value - intrinsic_value,
+        delta_spot_non_premium_adjusted=delta,
+        gamma_spot=gamma,
+        vega_1vol_abs=stacked[1] - present_value,
+        theta_1d_calendar=stacked[2] - present_value,
+        rho_domestic_1pct=stacked[3] - present_value,
+        rho_foreign_1pct=stacked[4] - present_value,
+    )
+
+
+def _decimal_from_float(value: float, field_name: str) -> Decimal:
+    if not math.isfinite(value):
+        raise ValueError(f"{field_name} must be finite")
+    return Decimal(str(value))
+
+
+def batch_measure_results_v1(
+    batch: BlackScholesFxBatchMeasuresV1,
+    index: int,
+    *,
+    option_type: str,
+    spot: Decimal,
+    strike: Decimal,
+    time_to_expiry_years: Decimal,
+) -> tuple[ValuationMeasureResultV1, ...]:
+    """Decimal output boundary for trade `index`, in the Phase C canonical measure order.
+
+    intrinsic_value (and present_value at expiry) are exact Decimal, as in the scalar kernel.
+    """
+
+    option = _require_option_type(option_type)
+    intrinsic = _intrinsic_value_spot_v1(option_type=option, spot=spot, strike=strike)
+    if time_to_expiry_years <= TIME_EPSILON_YEARS_V1:
+        present_value = intrinsic
+    else:
+        present_value = _decimal_from_float(float(batch.present_value[index]), "present_value")
+    values = {
+        ValuationMeasureNameV1.PRESENT_VALUE: present_value,
+        ValuationMeasureNameV1.INTRINSIC_VALUE: intrinsic,
+        ValuationMeasureNameV1.TIME_VALUE: present_value - intrinsic,
+    }
+    for name, arr in batch.as_dict().items():
+        if name not in values:
+            values[name] = _decimal_from_float(float(arr[index]), name.value)
+    return tuple(
+        ValuationMeasureResultV1(measure_name=measure_name, value=values[measure_name])
+        for measure_name in PHASE_C_CANONICAL_VALUATION_MEASURE_ORDER_V1
+    )
+
+
+__all__ = [
+    "BATCH_DETERMINISM_POLICY_V1",
+    "BlackScholesFxBatchMeasuresV1",
+    "NORMAL_CDF_POLICY_BATCH_V1",
+    "batch_measure_results_v1",
+    "black_scholes_fx_measures_batch_v1",
+    "garman_kohlhagen_pv_batch_v1",
+    "normal_cdf_batch_v1",
+    "normal_pdf_batch_v1",
+    "option_type_mask_v1",
+]
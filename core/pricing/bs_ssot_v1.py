@@ -2,9 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import math
+from typing import Sequence, Union
+
+import numpy as np
 
 from core.numeric_policy import DEFAULT_TOLERANCES
 from core.numeric_policy import MetricClass
+from core.pricing.black_scholes_fx_batch_kernel_v1 import garman_kohlhagen_pv_batch_v1
+from core.pricing.black_scholes_fx_batch_kernel_v1 import option_type_mask_v1
 from core.pricing.bs import bs_price
 
 
@@ -96,8 +101,83 @@ def price_european_option_bs_v1(
     return BSEuropeanPriceV1(price_per_unit=price_per_unit, pv_domestic=pv_domestic)
 
 
+@dataclass(frozen=True)
+class BSEuropeanBatchPriceV1:
+    price_per_unit: np.ndarray
+    pv_domestic: np.ndarray
+
+
+def _batch_field(value, field_name: str, size: int) -> np.ndarray:
+    arr = np.broadcast_to(np.asarray(value, dtype=np.float64), (size,))
+    bad = ~np.isfinite(arr)
+    if bad.any():
+        raise ValueError(f"{field_name} must be finite (index {int(np.argmax(bad))})")
+    return arr
+
+
+def price_european_options_bs_batch_v1(
+    *,
+    spot,
+    strike,
+    domestic_df,
+    foreign_df,
+    vol,
+    ttm_years,
+    option_type: Union[str, Sequence[str]],
+    notional,
+    time_fraction_policy_id: str,
+) -> BSEuropeanBatchPriceV1:
+    """Vectorised price_european_option_bs_v1 over 1-D arrays (scalars broadcast).
+
+    Same validation and near-zero floors as the scalar entrypoint, applied per element; see
+    core.pricing.black_scholes_fx_batch_kernel_v1 for the determinism contract.
+    """
+    if time_fraction_policy_id != TIME_FRACTION_POLICY_ACT_365F:
+        raise ValueError(
+            f"time_fraction_policy_id must be {TIME_FRACTION_POLICY_ACT_365F}"
+        )
+
+    lengths = {np.size(v) for v in (spot, strike, domestic_df, foreign_df, vol, ttm_years, notional) if np.ndim(v) == 1}
+    if not isinstance(option_type, str):
+        lengths.add(len(option_type))
+    if len(lengths) > 1:
+        raise ValueError("batch inputs must share one length")
+    size = lengths.pop() if lengths else 1
+
+    s = _batch_field(spot, "spot", size)
+    k = _batch_field(strike, "strike", size)
+    df_d = _batch_field(domestic_df, "domestic_df", size)
+    df_f = _batch_field(foreign_df, "foreign_df", size)
+    n = _batch_field(notional, "notional", size)
+    for arr, field_name in ((s, "spot"), (k, "strike"), (df_d, "domestic_df"), (df_f, "foreign_df"), (n, "notional")):
+        bad = arr <= 0.0
+        if bad.any():
+            raise ValueError(f"{field_name} must be finite and > 0 (index {int(np.argmax(bad))})")
+
+    time_floor = _tol_abs(MetricClass.TIME)
+    vol_floor = _tol_abs(MetricClass.VOL)
+    ttm = _batch_field(ttm_years, "ttm_years", size)
+    sigma_raw = _batch_field(vol, "vol", size)
+    if (ttm < -time_floor).any():
+        raise ValueError("ttm_years must be >= 0")
+    if (sigma_raw < -vol_floor).any():
+        raise ValueError("vol must be >= 0")
+    t = np.where(np.abs(ttm) <= time_floor, 0.0, ttm)
+    sigma = np.where(np.abs(sigma_raw) <= vol_floor, 0.0, sigma_raw)
+    is_call = option_type_mask_v1(option_type, size)
+
+    t_safe = np.where(t == 0.0, 1.0, t)
+    rate = np.where(t == 0.0, 0.0, -np.log(df_d) / t_safe)
+    div = np.where(t == 0.0, 0.0, -np.log(df_f) / t_safe)
+
+    price_per_unit = garman_kohlhagen_pv_batch_v1(is_call, s, k, rate, div, sigma, t)
+    return BSEuropeanBatchPriceV1(price_per_unit=price_per_unit, pv_domestic=price_per_unit * n)
+
+
 __all__ = [
+    "BSEuropeanBatchPriceV1",
     "BSEuropeanPriceV1",
     "TIME_FRACTION_POLICY_ACT_365F",
     "price_european_option_bs_v1",
+    "price_european_options_bs_batch_v1",
 ]
@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+import math
+from typing import Sequence
+
+import numpy as np
+
+from core.numeric_policy import EXERCISE_EPSILON_ABS_V1
+from core.numeric_policy import TIME_EPSILON_YEARS_V1
+from core.numeric_policy import VOL_EPSILON_ABS_V1
+from core.pricing.crr_american_fx_kernel_v1 import CrrAmericanKernelResultV1
+from core.pricing.crr_american_fx_kernel_v1 import _decimal_from_float
+from core.pricing.crr_american_fx_kernel_v1 import _float_from_decimal
+from core.pricing.crr_american_fx_kernel_v1 import _intrinsic_value_spot_v1
+from core.pricing.crr_american_fx_kernel_v1 import _require_finite_decimal
+from core.pricing.crr_american_fx_kernel_v1 import _require_option_type
+
+
+# Numeric policy (frozen):
+# - Same CRR parameterisation, branch order and tie-to-continuation exercise rule as
+#   crr_american_fx_kernel_v1, evaluated in float64 end to end.
+# - Node spots come from precomputed u**k / d**k rows (spot * u**i * d**(j-i), same association
+#   as the reference kernel); each time slice is one vectorised row operation.
+# - Decimal appears only at the output boundary. The reference kernel rounds every node through
+#   Decimal(str(float)), so parity is tolerance-checked (DEFAULT_TOLERANCES), not bit-exact.
+LATTICE_NUMERIC_POLICY_V1 = "float64_numpy_row_induction_decimal_output_boundary"
+
+# Trades per crr_american_pv_batch_v1 call in AmericanCrrFxEngineV1.value_many
+# (~256 x 200 steps of float64 fits in L2).
+GROUP_CHUNK_ROWS = 256
+
+_TIME_EPS = float(TIME_EPSILON_YEARS_V1)
+_VOL_EPS = float(VOL_EPSILON_ABS_V1)
+_EXERCISE_EPS = float(EXERCISE_EPSILON_ABS_V1)
+
+
+def _require_step_count(step_count: int) -> int:
+    if isinstance(step_count, bool) or not isinstance(step_count, int) or step_count <= 0:
+        raise ValueError("step_count must be a positive integer")
+    return step_count
+
+
+def _exercise_rows(sign: np.ndarray, spot: np.ndarray, strike: np.ndarray) -> np.ndarray:
+    # sign is +1 for calls, -1 for puts: max(sign * (S - K), 0)
+    return np.maximum(sign * (spot - strike), 0.0)
+
+
+def _american_step(exercise: np.ndarray, continuation: np.ndarray) -> np.ndarray:
+    return np.where(exercise > continuation + _EXERCISE_EPS, exercise, continuation)
+
+
+def _lattice_slices(
+    sign: np.ndarray,
+    spot: np.ndarray,
+    strike: np.ndarray,
+    rate_d: np.ndarray,
+    rate_f: np.ndarray,
+    vol: np.ndarray,
+    t: np.ndarray,
+    step_count: int,
+    capture_through: int = 0,
+    index: np.ndarray | None = None,
+) -> list[np.ndarray]:
+    """Backward induction over (trades x nodes); returns value slices for steps 0..capture_through.
+
+    Arguments are float64 arrays already routed to the stochastic branch: either all of shape (m,),
+    or sign/strike of shape (m,) with the market inputs of shape (1,) so one spot lattice, discount
+    and probability serve every row. index maps rows back to the caller's batch for error messages.
+    """
+    dt = t / float(step_count)
+    if not np.all(np.isfinite(dt)) or np.any(dt <= 0.0):
+        raise ValueError("degenerate CRR parameterization")
+
+    u = np.exp(vol * np.sqrt(dt))
+    d = 1.0 / u
+    if np.any(u == d):
+        raise ValueError("degenerate CRR parameterization")
+    p = (np.exp((rate_d - rate_f) * dt) - d) / (u - d)
+    bad = (p < 0.0) | (p > 1.0)
+    if bad.any():
+        if index is None:
+            raise ValueError("invalid CRR risk-neutral probability")
+        raise ValueError(f"invalid CRR risk-neutral probability (index {int(index[int(np.argmax(bad))])})")
+
+    discount = np.exp(-rate_d * dt)[:, None]
+    p = p[:, None]
+    q = 1.0 - p
+    sign = sign[:, None]
+    strike = strike[:, None]
+
+    powers = np.arange(step_count + 1, dtype=np.float64)
+    spot_up = spot[:, None] * (u[:, None] ** powers)
+    down = d[:, None] ** powers
+
+    def exercise(j: int) -> np.ndarray:
+        return _exercise_rows(sign, spot_up[:, : j + 1] * down[:, j::-1], strike)
+
+    values = exercise(step_count)
+    captured: list[np.ndarray] = [values] if capture_through >= step_count else []
+    for j in range(step_count - 1, -1, -1):
+        continuation = discount * (p * values[:, 1:] + q * values[:, :-1])
+        values = _american_step(exercise(j), continuation)
+        if j <= capture_through:
+            captured.append(values)
+    captured.reverse()
+    return captured
+
+
+def _deterministic_values(
+    sign: np.ndarray,
+    spot: np.ndarray,
+    strike: np.ndarray,
+    rate_d: np.ndarray,
+    rate_f: np.ndarray,
+    t: np.ndarray,
+    step_count: int,
+) -> np.ndarray:
+    """Zero-vol branch: single forward path with early exercise, no vol flooring."""
+    dt = t / float(step_count)
+    if not np.all(np.isfinite(dt)) or np.any(dt <= 0.0):
+        raise ValueError("degenerate CRR parameterization")
+    discount = np.exp(-rate_d * dt)
+    growth = (rate_d - rate_f) * dt
+    values = _exercise_rows(sign, spot * np.exp(growth * float(step_count)), strike)
+    for j in range(step_count - 1, -1, -1):
+        values = _american_step(_exercise_rows(sign, spot * np.exp(growth * float(j)), strike), discount * values)
+    return values
+
+
+def _route_batch(
+    is_call: np.ndarray,
+    spot: np.ndarray,
+    strike: np.ndarray,
+    rate_d: np.ndarray,
+    rate_f: np.ndarray,
+    vol: np.ndarray,
+    t: np.ndarray,
+    step_count: int,
+    capture_through: int,
+) -> tuple[np.ndarray, np.ndarray, list[np.ndarray]]:
+    """pv per row, plus the stochastic-lattice row indices and their captured early slices."""
+    _require_step_count(step_count)
+    sign = np.where(is_call, 1.0, -1.0)
+    pv = _exercise_rows(sign, spot, strike)
+
+    live = t > _TIME_EPS
+    deterministic = live & (vol <= _VOL_EPS)
+    lattice = np.flatnonzero(live & ~deterministic)
+    if deterministic.any():
+        idx = np.flatnonzero(deterministic)
+        pv[idx] = _deterministic_values(
+            sign[idx], spot[idx], strike[idx], rate_d[idx], rate_f[idx], t[idx], step_count
+        )
+    slices: list[np.ndarray] = []
+    if lattice.size:
+        idx = lattice
+        slices = _lattice_slices(
+            sign[idx], spot[idx], strike[idx], rate_d[idx], rate_f[idx], vol[idx], t[idx], step_count,
+            capture_through=capture_through, index=idx,
+        )
+        pv[idx] = slices[0][:, 0]
+    return pv, lattice, slices
+
+
+def crr_american_pv_batch_v1(
+    is_call: np.ndarray,
+    spot: np.ndarray,
+    strike: np.ndarray,
+    rate_d: np.ndarray,
+    rate_f: np.ndarray,
+    vol: np.ndarray,
+    t: np.ndarray,
+    step_count: int,
+) -> np.ndarray:
+    """Per-unit CRR American present value for a batch sharing one step_count.
+
+    is_call is a bool mask; all other arguments are float64 arrays of one shape (m,).
+    Branch policy per element follows crr_american_fx_kernel_v1.
+    """
+    return _route_batch(is_call, spot, strike, rate_d, rate_f, vol, t, step_count, 0)[0]
+
+
+def crr_american_spot_greeks_batch_v1(
+    is_call: np.ndarray,
+    spot: np.ndarray,
+    strike: np.ndarray,
+    rate_d: np.ndarray,
+    rate_f: np.ndarray,
+    vol: np.ndarray,
+    t: np.ndarray,
+    step_count: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(pv, delta, gamma) from one induction: delta and gamma are read off time slices 1 and 2.
+
+    delta = (V_u - V_d) / (S_u - S_d); gamma is the difference of the two slice-2 deltas over
+    half the slice-2 spot range. Both are NaN for rows without a stochastic lattice (near-zero
+    time or vol) and when step_count < 2.
+    """
+    pv, lattice, slices = _route_batch(is_call, spot, strike, rate_d, rate_f, vol, t, step_count, 2)
+    delta = np.full(pv.shape, np.nan)
+    gamma = np.full(pv.shape, np.nan)
+    if lattice.size and step_count >= 2:
+        # node spots of slices 1 and 2, same u/d expressions as _lattice_slices
+        u = np.exp(vol[lattice] * np.sqrt(t[lattice] / float(step_count)))
+        d = 1.0 / u
+        s = spot[lattice]
+        s_d, s_u = s * d, s * u
+        s_dd, s_ud, s_uu = s * (d * d), s * u * d, s * (u * u)
+        v1, v2 = slices[1], slices[2]
+        delta[lattice] = (v1[:, 1] - v1[:, 0]) / (s_u - s_d)
+        delta_up = (v2[:, 2] - v2[:, 1]) / (s_uu - s_ud)
+        delta_down = (v2[:, 1] - v2[:, 0]) / (s_ud - s_dd)
+        gamma[lattice] = (delta_up - delta_down) / (0.5 * (s_uu - s_dd))
+    return pv, delta, gamma
+
+
+@dataclass(frozen=True)
+class CrrLatticeRowV1:
+    """One validated trade/scenario: exact Decimal intrinsic plus branch-routed float64 inputs."""
+
+    is_call: bool
+    intrinsic_value: Decimal
+    spot: float
+    strike: float
+    rate_d: float
+    rate_f: float
+    vol: float
+    t: float
+
+    @property
+    def expired(self) -> bool:
+        return self.t == 0.0
+
+
+def crr_lattice_row_v1(
+    *,
+    option_type: str,
+    spot: Decimal,
+    strike: Decimal,
+    domestic_rate: Decimal,
+    foreign_rate: Decimal,
+    volatility: Decimal,
+    time_to_expiry_years: Decimal,
+) -> CrrLatticeRowV1:
+    """Validate like crr_american_fx_kernel_v1 once, in Decimal; float inputs for the batch core.
+
+    The near-zero time and vol branches are decided in Decimal like the reference kernel; such
+    rows carry 0.0 so the float core routes them the same way.
+    """
+    option = _require_option_type(option_type)
+
+    spot_value = _require_finite_decimal(spot, "spot")
+    strike_value = _require_finite_decimal(strike, "strike")
+    domestic_rate_value = _require_finite_decimal(domestic_rate, "domestic_rate")
+    foreign_rate_value = _require_finite_decimal(foreign_rate, "foreign_rate")
+    volatility_value = _require_finite_decimal(volatility, "volatility")
+    time_value = _require_finite_decimal(time_to_expiry_years, "time_to_expiry_years")
+
+    if spot_value <= 0:
+        raise ValueError("spot must be > 0")
+    if strike_value <= 0:
+        raise ValueError("strike must be > 0")
+    if volatility_value < 0:
+        raise ValueError("volatility must be >= 0")
+    if time_value < 0:
+        raise ValueError("time_to_expiry_years must be >= 0")
+
+    return CrrLatticeRowV1(
+        is_call=option == "call",
+        intrinsic_value=_intrinsic_value_spot_v1(option_type=option, spot=spot_value, strike=strike_value),
+        spot=_float_from_decimal(spot_value, "spot"),
+        strike=_float_from_decimal(strike_value, "strike"),
+        rate_d=_float_from_decimal(domestic_rate_value, "domestic_rate"),
+        rate_f=_float_from_decimal(foreign_rate_value, "foreign_rate"),
+        vol=0.0 if volatility_value <= VOL_EPSILON_ABS_V1 else _float_from_decimal(volatility_value, "volatility"),
+        t=0.0 if time_value <= TIME_EPSILON_YEARS_V1 else _float_from_decimal(time_value, "time_to_expiry_years"),
+    )
+
+
+def crr_lattice_row_arrays_v1(rows: Sequence[CrrLatticeRowV1]) -> tuple[np.ndarray, ...]:
+    """(is_call, spot, strike, rate_d, rate_f, vol, t) columns for the batch functions."""
+    return (
+        np.fromiter((r.is_call for r in rows), dtype=bool, count=len(rows)),
+        np.fromiter((r.spot for r in rows), dtype=np.float64, count=len(rows)),
+        np.fromiter((r.strike for r in rows), dtype=np.float64, count=len(rows)),
+        np.fromiter((r.rate_d for r in rows), dtype=np.float64, count=len(rows)),
+        np.fromiter((r.rate_f for r in rows), dtype=np.float64, count=len(rows)),
+        np.fromiter((r.vol for r in rows), dtype=np.float64, count=len(rows)),
+        np.fromiter((r.t for r in rows), dtype=np.float64, count=len(rows)),
+    )
+
+
+def present_value_to_decimal_v1(pv: float, intrinsic_value: Decimal) -> Decimal:
+    """Output boundary: exact intrinsic when the lattice lands on it (immediate exercise)."""
+    if pv == float(intrinsic_value):
+        return intrinsic_value
+    return _decimal_from_float(float(pv), "present_value")
+
+
+def kernel_result_from_float_v1(pv: float, row: CrrLatticeRowV1) -> CrrAmericanKernelResultV1:
+    if row.expired:
+        return CrrAmericanKernelResultV1(
+            present_value=row.intrinsic_value,
+            intrinsic_value=row.intrinsic_value,
+            time_value=Decimal("0"),
+        )
+    if not math.isfinite(pv):
+        raise ValueError("present_value must be finite")
+    present_value = present_value_to_decimal_v1(pv, row.intrinsic_value)
+    return CrrAmericanKernelResultV1(
+        present_value=present_value,
+        intrinsic_value=row.intrinsic_value,
+        time_value=present_value - row.intrinsic_value,
+    )
+
+
+def crr_american_fx_lattice_v1(
+    *,
+    option_type: str,
+    spot: Decimal,
+    strike: Decimal,
+    domestic_rate: Decimal,
+    foreign_rate: Decimal,
+    volatility: Decimal,
+    time_to_expiry_years: Decimal,
+    step_count: int,
+) -> CrrAmericanKernelResultV1:
+    """Float-native drop-in for crr_american_fx_kernel_v1 (same inputs, validation and result type)."""
+
+    row = crr_lattice_row_v1(
+        option_type=option_type,
+        spot=spot,
+        strike=strike,
+        domestic_rate=domestic_rate,
+        foreign_rate=foreign_rate,
+        volatility=volatility,
+        time_to_expiry_years=time_to_expiry_years,
+    )
+    _require_step_count(step_count)
+    if row.expired:
+        return kernel_result_from_float_v1(0.0, row)
+
+    try:
+        pv = crr_american_pv_batch_v1(*crr_lattice_row_arrays_v1([row]), step_count)[0]
+    except ValueError as exc:
+        # single-trade call: keep the reference kernel's messages (no batch index)
+        raise ValueError(str(exc).split(" (index ", 1)[0]) from None
+    return kernel_result_from_float_v1(pv, row)
+
+
+__all__ = [
+    "CrrLatticeRowV1",
+    "GROUP_CHUNK_ROWS",
+    "LATTICE_NUMERIC_POLICY_V1",
+    "crr_american_fx_lattice_v1",
+    "crr_american_pv_batch_v1",
+    "crr_american_spot_greeks_batch_v1",
+    "crr_lattice_row_arrays_v1",
+    "crr_lattice_row_v1",
+    "kernel_result_from_float_v1",
+    "present_value_to_decimal_v1",
+]
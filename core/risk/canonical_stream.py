@@ -0,0 +1,96 @@
+"""Streaming canonical JSON for hash-locked risk artifacts.
+
+Emits exactly the bytes of
+    json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+without materialising the whole document:
+- dicts are walked key by key in sorted order;
+- lists and tuples are complete values and are encoded in one json.dumps call;
+- any other iterable (generator, iterator) is a lazily produced JSON array whose
+  items are encoded one at a time, so only one item is alive at once.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from functools import partial
+from typing import Any, BinaryIO, Iterator, Optional
+
+
+DEFAULT_FLUSH_CHARS: int = 1 << 16
+
+_dumps = partial(json.dumps, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def iter_canonical_json(obj: Any) -> Iterator[str]:
+    if isinstance(obj, dict):
+        yield "{"
+        for i, key in enumerate(sorted(obj)):
+            if i:
+                yield ","
+            yield _dumps(key)
+            yield ":"
+            yield from iter_canonical_json(obj[key])
+        yield "}"
+    elif isinstance(obj, (list, tuple, str, bytes, int, float, bool)) or obj is None:
+        yield _dumps(obj)
+    else:
+        yield "["
+        for i, item in enumerate(obj):
+            if i:
+                yield ","
+            yield from iter_canonical_json(item)
+        yield "]"
+
+
+class CanonicalJsonSink:
+    """SHA-256 of streamed canonical JSON, optionally teed to a binary file."""
+
+    def __init__(self, out: Optional[BinaryIO] = None, *, flush_chars: int = DEFAULT_FLUSH_CHARS) -> None:
+        self._hasher = hashlib.sha256()
+        self._out = out
+        self._flush_chars = flush_chars
+        self._buffer: list[str] = []
+        self._buffered = 0
+
+    def write(self, chunk: str) -> None:
+        self._buffer.append(chunk)
+        self._buffered += len(chunk)
+        if self._buffered >= self._flush_chars:
+            self.flush()
+
+    def write_json(self, obj: Any) -> None:
+        for chunk in iter_canonical_json(obj):
+            self.write(chunk)
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        data = "".join(self._buffer).encode("utf-8")
+        self._buffer.clear()
+        self._buffered = 0
+        self._hasher.update(data)
+        if self._out is not None:
+            self._out.write(data)
+
+    def hexdigest(self, suffix: str = "") -> str:
+        """Digest of everything written so far plus `suffix`; the suffix is not written out."""
+        self.flush()
+        if not suffix:
+            return self._hasher.hexdigest()
+        hasher = self._hasher.copy()
+        hasher.update(suffix.encode("utf-8"))
+        return hasher.hexdigest()
+
+
+def canonical_sha256_stream(obj: Any, out: Optional[BinaryIO] = None) -> str:
+    sink = CanonicalJsonSink(out)
+    sink.write_json(obj)
+    return sink.hexdigest()
+
+
+__all__ = [
+    "CanonicalJsonSink",
+    "DEFAULT_FLUSH_CHARS",
+    "canonical_sha256_stream",
+    "iter_canonical_json",
+]
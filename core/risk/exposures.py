@@ -13,6 +13,7 @@ from typing import Any
 
 from core.risk.risk_request import RiskValidationError
 from core.risk.scenario_grid import ScenarioGrid
+from core.risk.scenario_grid import ScenarioKey
 from core.risk.scenario_set import ScenarioSet
 from core.risk.scenario_spec import ScenarioSpec
 from core.validation.error_taxonomy import make_error
@@ -149,16 +150,11 @@ def compute_exposures_v1(
 
     scenario_grid = ScenarioGrid.from_scenario_set(scenario_set)
 
-    plus_id = None
-    minus_id = None
-    for key, sid in zip(scenario_grid.scenarios, scenario_grid.scenario_ids):
-        if key.df_domestic_shock == Decimal("0") and key.df_foreign_shock == Decimal("0"):
-            if key.spot_shock == h:
-                plus_id = sid
-            elif key.spot_shock == -h:
-                minus_id = sid
-
-    if plus_id is None or minus_id is None:
+    zero = Decimal("0")
+    try:
+        plus_index = scenario_grid.index_of(ScenarioKey(spot_shock=h, df_domestic_shock=zero, df_foreign_shock=zero))
+        minus_index = scenario_grid.index_of(ScenarioKey(spot_shock=-h, df_domestic_shock=zero, df_foreign_shock=zero))
+    except KeyError:
         _reject(
             "VALIDATION_ERROR",
             {
@@ -166,6 +162,8 @@ def compute_exposures_v1(
                 "reason": "missing required +/-h scenarios with df shocks == 0",
             },
         )
+    plus_id = scenario_grid.scenario_id_at(plus_index)
+    minus_id = scenario_grid.scenario_id_at(minus_index)
 
     results_raw = risk_artifact.get("outputs", {}).get("results")
     if not isinstance(results_raw, list) or not results_raw:
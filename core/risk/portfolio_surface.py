@@ -2,15 +2,17 @@
 
 Derived strictly from frozen G9.4 RiskArtifact.
 No repricing, no VaR/ES, no strategy logic.
+
+Only inputs, outputs.aggregates and sha256 are read, so the results-free artifact
+returned by stream_risk_artifact_v1 is accepted as well.
 """
 from __future__ import annotations
 
-import hashlib
-import json
 from decimal import Decimal
 from decimal import InvalidOperation
 from typing import Any
 
+from core.risk.canonical_stream import canonical_sha256_stream
 from core.risk.risk_request import RiskValidationError
 from core.validation.error_taxonomy import make_error
 
@@ -45,8 +47,7 @@ def _to_decimal(value: Any, field: str) -> Decimal:
 
 def _canonical_sha256_excluding_sha(artifact: dict[str, Any]) -> str:
     payload = {k: v for k, v in artifact.items() if k != "sha256"}
-    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return canonical_sha256_stream(payload)
 
 
 def compute_portfolio_surface_v1(risk_artifact: dict) -> dict[str, Any]:
@@ -6,14 +6,25 @@ Pure structural repricing harness:
 
 No pricing math is reimplemented here. Repricing calls the F8 SSOT forward
 entrypoint through an explicit seam callable.
+
+Instruments are independent: executor="thread"/"process" reprices chunks of
+request.instrument_ids on a pool and merges cubes back in request order.
+The process executor requires a picklable price_forward (module-level function).
+cube_path="vectorised" prices each instrument's scenario cube in one NumPy pass
+(see SCENARIO_CUBE_PATHS).
 """
 from __future__ import annotations
 
 import datetime
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Callable, Mapping
 
+import numpy as np
+
 from core.contracts.option_contract_v1 import OptionContractV1
 from core.market_data.df_lookup_v0 import DfLookupError
 from core.market_data.df_lookup_v0 import get_pair_dfs_v0
@@ -25,6 +36,7 @@ from core.pricing.fx import types as fx_types
 from core.pricing.fx.valuation_context import ValuationContext
 from core.pricing.bs_ssot_v1 import TIME_FRACTION_POLICY_ACT_365F
 from core.pricing.bs_ssot_v1 import price_european_option_bs_v1
+from core.pricing.bs_ssot_v1 import price_european_options_bs_batch_v1
 from core.risk.risk_request import RiskRequest
 from core.risk.risk_request import RiskValidationError
 from core.risk.scenario_grid import ScenarioGrid
@@ -36,6 +48,21 @@ from core.validation.error_taxonomy import make_error
 
 SUPPORTED_SCHEMA_VERSION: int = 1
 
+# Instrument-level executors. Every instrument is repriced by the same code path whichever
+# executor runs it, so results (and downstream artifact hashes) are identical to serial.
+RISK_EXECUTOR_SERIAL: str = "serial"
+RISK_EXECUTOR_THREAD: str = "thread"
+RISK_EXECUTOR_PROCESS: str = "process"
+RISK_EXECUTORS: tuple[str, ...] = (RISK_EXECUTOR_SERIAL, RISK_EXECUTOR_THREAD, RISK_EXECUTOR_PROCESS)
+_CHUNKS_PER_WORKER: int = 4
+
+# Scenario repricing paths. "vectorised" prices an instrument's whole scenario cube in one
+# NumPy expression: forwards stay bit-identical to "per_scenario"; European options go through
+# the batch BS SSOT and match within DEFAULT_TOLERANCES (numpy exp/log, last-ulp differences).
+SCENARIO_CUBE_PER_SCENARIO: str = "per_scenario"
+SCENARIO_CUBE_VECTORISED: str = "vectorised"
+SCENARIO_CUBE_PATHS: tuple[str, ...] = (SCENARIO_CUBE_PER_SCENARIO, SCENARIO_CUBE_VECTORISED)
+
 
 PriceForwardCallable = Callable[
     [fx_types.FXForwardContract, ValuationContext, fx_types.FxMarketSnapshot],
@@ -64,7 +91,8 @@ def _to_decimal(value: float) -> Decimal:
     return Decimal(str(value))
 
 
-def _compute_ttm_years_act_365f(*, as_of_ts: datetime.datetime, expiry: datetime.datetime) -> float:
+def compute_ttm_years_act_365f(*, as_of_ts: datetime.datetime, expiry: datetime.datetime) -> float:
+    """ACT/365F year fraction from as_of_ts to expiry; both timezone-aware, expiry not before as_of_ts."""
     if as_of_ts.tzinfo is None:
         _reject(
             "VALIDATION_ERROR",
@@ -196,100 +224,170 @@ class RiskResult:
     results: tuple[InstrumentRiskCube, ...]
 
 
-def reprice_fx_forward_risk(
-    request: RiskRequest,
+@dataclass(frozen=True)
+class _ScenarioCubeAxesV1:
+    """ScenarioGrid shock axes and per-scenario axis positions, resolved once per run."""
+
+    spot_axis: tuple[Decimal, ...]
+    df_domestic_axis: tuple[Decimal, ...]
+    df_foreign_axis: tuple[Decimal, ...]
+    spot_index: np.ndarray
+    df_domestic_index: np.ndarray
+    df_foreign_index: np.ndarray
+    factors_positive: bool
+
+    @classmethod
+    def from_grid(cls, scenario_grid: ScenarioGrid) -> _ScenarioCubeAxesV1:
+        axes = (scenario_grid.spot_axis, scenario_grid.df_domestic_axis, scenario_grid.df_foreign_axis)
+        # Axes are ascending: the first level of each is its smallest shock.
+        factors_positive = all(Decimal("1") + axis[0] > 0 for axis in axes if axis)
+        return cls(*axes, *scenario_grid.axis_indices, factors_positive)
+
+
+def _shocked_column(base: Decimal, axis: tuple[Decimal, ...], index: np.ndarray) -> np.ndarray:
+    # Same Decimal shock arithmetic as the per-scenario path, once per axis level.
+    levels = np.array([float(base * (Decimal("1") + shock)) for shock in axis], dtype=np.float64)
+    return levels[index]
+
+
+def _forward_cube_pvs(
+    contract: fx_types.FXForwardContract,
     base_snapshot: fx_types.FxMarketSnapshot,
+    axes: _ScenarioCubeAxesV1,
+) -> list[float]:
+    spot = _shocked_column(_to_decimal(base_snapshot.spot_rate), axes.spot_axis, axes.spot_index)
+    df_d = _shocked_column(_to_decimal(base_snapshot.df_domestic), axes.df_domestic_axis, axes.df_domestic_index)
+    df_f = _shocked_column(_to_decimal(base_snapshot.df_foreign), axes.df_foreign_axis, axes.df_foreign_index)
+    # forward_mtm.price_fx_forward formula (B), term for term: every cell is bit-identical
+    # to pricing the shocked snapshot through the scalar SSOT.
+    forward_market = spot * df_f / df_d
+    pv = contract.notional * df_d * (forward_market - contract.forward_rate)
+    if contract.direction == "pay_foreign_receive_domestic":
+        pv = -pv
+    return pv.tolist()
+
+
+def _option_cube_pvs(
+    contract: OptionContractV1,
+    base_spot: Decimal,
+    base_df_dom: float,
+    base_df_for: float,
+    option_vol: float,
+    ttm_years: float,
+    axes: _ScenarioCubeAxesV1,
+) -> list[float]:
+    priced = price_european_options_bs_batch_v1(
+        spot=_shocked_column(base_spot, axes.spot_axis, axes.spot_index),
+        strike=float(contract.strike),
+        domestic_df=_shocked_column(Decimal(str(base_df_dom)), axes.df_domestic_axis, axes.df_domestic_index),
+        foreign_df=_shocked_column(Decimal(str(base_df_for)), axes.df_foreign_axis, axes.df_foreign_index),
+        vol=float(option_vol),
+        ttm_years=ttm_years,
+        option_type=contract.option_type,
+        notional=float(contract.notional),
+        time_fraction_policy_id=contract.time_fraction_policy_id,
+    )
+    return priced.pv_domestic.tolist()
+
+
+def _cube_scenario_pvs(
+    instrument_id: str,
     scenario_grid: ScenarioGrid,
-    contracts_by_instrument_id: Mapping[str, object],
-    *,
-    price_forward: PriceForwardCallable | None = None,
-    market_snapshot_payload: MarketSnapshotPayloadV0 | None = None,
-    schema_version: int = SUPPORTED_SCHEMA_VERSION,
-) -> RiskResult:
-    if schema_version is None:
-        _reject("MISSING_SCHEMA_VERSION", {"field": "schema_version"})
-    if schema_version != SUPPORTED_SCHEMA_VERSION:
-        _reject(
-            "UNSUPPORTED_SCHEMA_VERSION",
-            {
-                "given": str(schema_version),
-                "supported": str(SUPPORTED_SCHEMA_VERSION),
-            },
+    pvs: list[float],
+    currency: str,
+    metric_class: str,
+) -> list[InstrumentScenarioPV]:
+    return [
+        InstrumentScenarioPV(
+            instrument_id=instrument_id,
+            scenario_id=scenario_id,
+            pv_domestic=_to_decimal(pv),
+            currency=currency,
+            metric_class=metric_class,
         )
+        for scenario_id, pv in zip(scenario_grid.scenario_ids, pvs)
+    ]
 
-    expected_set_id = ScenarioSet.from_spec(request.scenario_spec).scenario_set_id
-    if scenario_grid.scenario_set_id != expected_set_id:
+
+def _reprice_instrument(
+    instrument_id: str,
+    contract: object | None,
+    request: RiskRequest,
+    base_snapshot: fx_types.FxMarketSnapshot,
+    scenario_grid: ScenarioGrid,
+    run_price_forward: PriceForwardCallable,
+    market_snapshot_payload: MarketSnapshotPayloadV0 | None,
+    cube_axes: _ScenarioCubeAxesV1 | None,
+) -> InstrumentRiskCube:
+    if contract is None:
         _reject(
             "VALIDATION_ERROR",
             {
-                "field": "scenario_set_id",
-                "reason": "scenario_grid.scenario_set_id must match request.scenario_spec",
+                "field": "contracts_by_instrument_id",
+                "reason": f"missing contract for instrument_id={instrument_id}",
             },
         )
 
-    run_price_forward = price_forward or _default_price_forward
+    scenario_pvs: list[InstrumentScenarioPV] = []
 
-    cubes: list[InstrumentRiskCube] = []
-    for instrument_id in request.instrument_ids:
-        contract = contracts_by_instrument_id.get(instrument_id)
-        if contract is None:
+    if isinstance(contract, fx_types.FXForwardContract):
+        if base_snapshot.df_domestic is None or base_snapshot.df_foreign is None:
             _reject(
                 "VALIDATION_ERROR",
                 {
-                    "field": "contracts_by_instrument_id",
-                    "reason": f"missing contract for instrument_id={instrument_id}",
+                    "field": "base_snapshot.df",
+                    "reason": "df_domestic and df_foreign are required",
+                },
+            )
+        if base_snapshot.df_domestic <= 0:
+            _reject(
+                "VALIDATION_ERROR",
+                {
+                    "field": "base_snapshot.df_domestic",
+                    "reason": "must be > 0",
+                },
+            )
+        if base_snapshot.df_foreign <= 0:
+            _reject(
+                "VALIDATION_ERROR",
+                {
+                    "field": "base_snapshot.df_foreign",
+                    "reason": "must be > 0",
                 },
             )
 
-        scenario_pvs: list[InstrumentScenarioPV] = []
-
-        if isinstance(contract, fx_types.FXForwardContract):
-            if base_snapshot.df_domestic is None or base_snapshot.df_foreign is None:
-                _reject(
-                    "VALIDATION_ERROR",
-                    {
-                        "field": "base_snapshot.df",
-                        "reason": "df_domestic and df_foreign are required",
-                    },
-                )
-            if base_snapshot.df_domestic <= 0:
-                _reject(
-                    "VALIDATION_ERROR",
-                    {
-                        "field": "base_snapshot.df_domestic",
-                        "reason": "must be > 0",
-                    },
-                )
-            if base_snapshot.df_foreign <= 0:
-                _reject(
-                    "VALIDATION_ERROR",
-                    {
-                        "field": "base_snapshot.df_foreign",
-                        "reason": "must be > 0",
-                    },
-                )
-
-            base_result = run_price_forward(contract, request.valuation_context, base_snapshot)
-            if base_result.currency != request.valuation_context.domestic_currency:
-                _reject(
-                    "VALIDATION_ERROR",
-                    {
-                        "field": "currency",
-                        "reason": "pricing currency must equal valuation_context.domestic_currency",
-                    },
-                )
-            if base_result.metric_class is None:
-                _reject(
-                    "VALIDATION_ERROR",
-                    {
-                        "field": "metric_class",
-                        "reason": "metric_class must be explicit",
-                    },
-                )
-            base_pv = _to_decimal(base_result.pv)
-            out_currency = base_result.currency
-            out_metric = base_result.metric_class.value
-
+        base_result = run_price_forward(contract, request.valuation_context, base_snapshot)
+        if base_result.currency != request.valuation_context.domestic_currency:
+            _reject(
+                "VALIDATION_ERROR",
+                {
+                    "field": "currency",
+                    "reason": "pricing currency must equal valuation_context.domestic_currency",
+                },
+            )
+        if base_result.metric_class is None:
+            _reject(
+                "VALIDATION_ERROR",
+                {
+                    "field": "metric_class",
+                    "reason": "metric_class must be explicit",
+                },
+            )
+        base_pv = _to_decimal(base_result.pv)
+        out_currency = base_result.currency
+        out_metric = base_result.metric_class.value
+
+        # The vectorised cube covers the default SSOT pricer only; injected pricers and
+        # rejected shocks take the per-scenario path.
+        if cube_axes is not None and cube_axes.factors_positive and run_price_forward is _default_price_forward:
+            scenario_pvs = _cube_scenario_pvs(
+                instrument_id,
+                scenario_grid,
+                _forward_cube_pvs(contract, base_snapshot, cube_axes),
+                out_currency,
+                out_metric,
+            )
+        else:
             for scenario_key, scenario_id in zip(scenario_grid.scenarios, scenario_grid.scenario_ids):
                 shocked_snapshot = _apply_shock_snapshot(base_snapshot, scenario_key)
                 priced = run_price_forward(contract, request.valuation_context, shocked_snapshot)
@@ -321,99 +419,108 @@ def reprice_fx_forward_risk(
                     )
                 )
 
-        elif isinstance(contract, OptionContractV1):
-            if market_snapshot_payload is None:
-                _reject(
-                    "VALIDATION_ERROR",
-                    {
-                        "field": "market_snapshot_payload",
-                        "reason": "required when pricing OptionContractV1",
-                    },
-                )
-
-            if contract.time_fraction_policy_id != TIME_FRACTION_POLICY_ACT_365F:
-                _reject(
-                    "VALIDATION_ERROR",
-                    {
-                        "field": "time_fraction_policy_id",
-                        "reason": f"must be {TIME_FRACTION_POLICY_ACT_365F}",
-                    },
-                )
-
-            if contract.domestic_ccy != request.valuation_context.domestic_currency:
-                _reject(
-                    "VALIDATION_ERROR",
-                    {
-                        "field": "domestic_ccy",
-                        "reason": "must equal valuation_context.domestic_currency",
-                    },
-                )
+    elif isinstance(contract, OptionContractV1):
+        if market_snapshot_payload is None:
+            _reject(
+                "VALIDATION_ERROR",
+                {
+                    "field": "market_snapshot_payload",
+                    "reason": "required when pricing OptionContractV1",
+                },
+            )
 
-            if contract.underlying not in market_snapshot_payload.spots.prices:
-                _reject(
-                    "VALIDATION_ERROR",
-                    {
-                        "field": "spots.prices",
-                        "reason": f"missing spot for underlying={contract.underlying}",
-                    },
-                )
+        if contract.time_fraction_policy_id != TIME_FRACTION_POLICY_ACT_365F:
+            _reject(
+                "VALIDATION_ERROR",
+                {
+                    "field": "time_fraction_policy_id",
+                    "reason": f"must be {TIME_FRACTION_POLICY_ACT_365F}",
+                },
+            )
 
-            base_spot_dec = Decimal(str(market_snapshot_payload.spots.prices[contract.underlying]))
-            ttm_years = _compute_ttm_years_act_365f(
-                as_of_ts=request.valuation_context.as_of_ts,
-                expiry=contract.expiry,
+        if contract.domestic_ccy != request.valuation_context.domestic_currency:
+            _reject(
+                "VALIDATION_ERROR",
+                {
+                    "field": "domestic_ccy",
+                    "reason": "must equal valuation_context.domestic_currency",
+                },
             )
 
-            try:
-                base_df_dom, base_df_for = get_pair_dfs_v0(
-                    market_snapshot_payload,
-                    domestic_ccy=contract.domestic_ccy,
-                    foreign_ccy=contract.foreign_ccy,
-                    ttm_years=ttm_years,
-                )
-            except DfLookupError as exc:
-                _reject(
-                    "VALIDATION_ERROR",
-                    {
-                        "field": "df_lookup",
-                        "reason": str(exc),
-                    },
-                )
+        if contract.underlying not in market_snapshot_payload.spots.prices:
+            _reject(
+                "VALIDATION_ERROR",
+                {
+                    "field": "spots.prices",
+                    "reason": f"missing spot for underlying={contract.underlying}",
+                },
+            )
 
-            try:
-                option_vol = get_vol(
-                    market_snapshot_payload,
-                    VolKey(
-                        underlying=contract.underlying,
-                        expiry_t=ttm_years,
-                        strike=float(contract.strike),
-                        option_type=contract.option_type,
-                    ),
-                )
-            except VolLookupError as exc:
-                _reject(
-                    "VALIDATION_ERROR",
-                    {
-                        "field": "vol_lookup",
-                        "reason": str(exc),
-                    },
-                )
+        base_spot_dec = Decimal(str(market_snapshot_payload.spots.prices[contract.underlying]))
+        ttm_years = compute_ttm_years_act_365f(
+            as_of_ts=request.valuation_context.as_of_ts,
+            expiry=contract.expiry,
+        )
 
-            base_priced = price_european_option_bs_v1(
-                spot=float(base_spot_dec),
-                strike=float(contract.strike),
-                domestic_df=base_df_dom,
-                foreign_df=base_df_for,
-                vol=float(option_vol),
+        try:
+            base_df_dom, base_df_for = get_pair_dfs_v0(
+                market_snapshot_payload,
+                domestic_ccy=contract.domestic_ccy,
+                foreign_ccy=contract.foreign_ccy,
                 ttm_years=ttm_years,
-                option_type=contract.option_type,
-                notional=float(contract.notional),
-                time_fraction_policy_id=contract.time_fraction_policy_id,
             )
-            base_pv = _to_decimal(base_priced.pv_domestic)
-            out_currency = request.valuation_context.domestic_currency
-            out_metric = "PRICE"
+        except DfLookupError as exc:
+            _reject(
+                "VALIDATION_ERROR",
+                {
+                    "field": "df_lookup",
+                    "reason": str(exc),
+                },
+            )
 
+        try:
+            option_vol = get_vol(
+                market_snapshot_payload,
+                VolKey(
+                    underlying=contract.underlying,
+                    expiry_t=ttm_years,
+                    strike=float(contract.strike),
+                    option_type=contract.option_type,
+                ),
+            )
+        except VolLookupError as exc:
+            _reject(
+                "VALIDATION_ERROR",
+                {
+                    "field": "vol_lookup",
+                    "reason": str(exc),
+                },
+            )
+
+        base_priced = price_european_option_bs_v1(
+            spot=float(base_spot_dec),
+            strike=float(contract.strike),
+            domestic_df=base_df_dom,
+            foreign_df=base_df_for,
+            vol=float(option_vol),
+            ttm_years=ttm_years,
+            option_type=contract.option_type,
+            notional=float(contract.notional),
+            time_fraction_policy_id=contract.time_fraction_policy_id,
+        )
+        base_pv = _to_decimal(base_priced.pv_domestic)
+        out_currency = request.valuation_context.domestic_currency
+        out_metric = "PRICE"
+
+        if cube_axes is not None and cube_axes.factors_positive:
+            scenario_pvs = _cube_scenario_pvs(
+                instrument_id,
+                scenario_grid,
+                _option_cube_pvs(contract, base_spot_dec, base_df_dom, base_df_for, option_vol, ttm_years, cube_axes),
+                out_currency,
+                out_metric,
+            )
+        else:
             for scenario_key, scenario_id in zip(scenario_grid.scenarios, scenario_grid.scenario_ids):
                 spot_factor = Decimal("1") + scenario_key.spot_shock
                 dom_factor = Decimal("1") + scenario_key.df_domestic_shock
@@ -469,37 +576,147 @@ def reprice_fx_forward_risk(
                     )
                 )
 
-        else:
-            _reject(
-                "VALIDATION_ERROR",
-                {
-                    "field": "contracts_by_instrument_id",
-                    "reason": f"unsupported contract type for instrument_id={instrument_id}",
-                },
-            )
+    else:
+        _reject(
+            "VALIDATION_ERROR",
+            {
+                "field": "contracts_by_instrument_id",
+                "reason": f"unsupported contract type for instrument_id={instrument_id}",
+            },
+        )
 
-        if len(scenario_pvs) != len(scenario_grid.scenarios):
-            _reject(
-                "VALIDATION_ERROR",
-                {
-                    "field": "scenario_pvs",
-                    "reason": "scenario_pvs length must equal scenario grid length",
-                },
-            )
+    if len(scenario_pvs) != len(scenario_grid.scenarios):
+        _reject(
+            "VALIDATION_ERROR",
+            {
+                "field": "scenario_pvs",
+                "reason": "scenario_pvs length must equal scenario grid length",
+            },
+        )
 
-        cubes.append(
-            InstrumentRiskCube(
-                instrument_id=instrument_id,
-                base_pv=base_pv,
-                scenario_pvs=tuple(scenario_pvs),
-            )
+    return InstrumentRiskCube(
+        instrument_id=instrument_id,
+        base_pv=base_pv,
+        scenario_pvs=tuple(scenario_pvs),
+    )
+
+
+def _reprice_chunk(
+    instrument_ids: tuple[str, ...],
+    contracts: tuple[object | None, ...],
+    request: RiskRequest,
+    base_snapshot: fx_types.FxMarketSnapshot,
+    scenario_grid: ScenarioGrid,
+    run_price_forward: PriceForwardCallable,
+    market_snapshot_payload: MarketSnapshotPayloadV0 | None,
+    cube_axes: _ScenarioCubeAxesV1 | None,
+) -> tuple[InstrumentRiskCube, ...]:
+    return tuple(
+        _reprice_instrument(
+            instrument_id,
+            contract,
+            request,
+            base_snapshot,
+            scenario_grid,
+            run_price_forward,
+            market_snapshot_payload,
+            cube_axes,
+        )
+        for instrument_id, contract in zip(instrument_ids, contracts)
+    )
+
+
+def _require_positive_int(field: str, value: int | None) -> None:
+    if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value <= 0):
+        _reject("VALIDATION_ERROR", {"field": field, "reason": "must be a positive int"})
+
+
+def _chunk_bounds(count: int, workers: int, chunk_size: int | None) -> list[tuple[int, int]]:
+    # Several chunks per worker so one slow instrument does not idle the rest of the pool.
+    size = chunk_size or max(1, -(-count // (workers * _CHUNKS_PER_WORKER)))
+    return [(start, min(start + size, count)) for start in range(0, count, size)]
+
+
+def reprice_fx_forward_risk(
+    request: RiskRequest,
+    base_snapshot: fx_types.FxMarketSnapshot,
+    scenario_grid: ScenarioGrid,
+    contracts_by_instrument_id: Mapping[str, object],
+    *,
+    price_forward: PriceForwardCallable | None = None,
+    market_snapshot_payload: MarketSnapshotPayloadV0 | None = None,
+    schema_version: int = SUPPORTED_SCHEMA_VERSION,
+    executor: str = RISK_EXECUTOR_SERIAL,
+    max_workers: int | None = None,
+    chunk_size: int | None = None,
+    cube_path: str = SCENARIO_CUBE_PER_SCENARIO,
+) -> RiskResult:
+    if schema_version is None:
+        _reject("MISSING_SCHEMA_VERSION", {"field": "schema_version"})
+    if schema_version != SUPPORTED_SCHEMA_VERSION:
+        _reject(
+            "UNSUPPORTED_SCHEMA_VERSION",
+            {
+                "given": str(schema_version),
+                "supported": str(SUPPORTED_SCHEMA_VERSION),
+            },
+        )
+
+    expected_set_id = ScenarioSet.from_spec(request.scenario_spec).scenario_set_id
+    if scenario_grid.scenario_set_id != expected_set_id:
+        _reject(
+            "VALIDATION_ERROR",
+            {
+                "field": "scenario_set_id",
+                "reason": "scenario_grid.scenario_set_id must match request.scenario_spec",
+            },
+        )
+
+    if executor not in RISK_EXECUTORS:
+        _reject(
+            "VALIDATION_ERROR",
+            {
+                "field": "executor",
+                "reason": f"must be one of {RISK_EXECUTORS}",
+            },
+        )
+    if cube_path not in SCENARIO_CUBE_PATHS:
+        _reject(
+            "VALIDATION_ERROR",
+            {
+                "field": "cube_path",
+                "reason": f"must be one of {SCENARIO_CUBE_PATHS}",
+            },
         )
+    _require_positive_int("max_workers", max_workers)
+    _require_positive_int("chunk_size", chunk_size)
+
+    run_price_forward = price_forward or _default_price_forward
+    instrument_ids = tuple(request.instrument_ids)
+    contracts = tuple(contracts_by_instrument_id.get(instrument_id) for instrument_id in instrument_ids)
+    cube_axes = _ScenarioCubeAxesV1.from_grid(scenario_grid) if cube_path == SCENARIO_CUBE_VECTORISED else None
+    shared = (request, base_snapshot, scenario_grid, run_price_forward, market_snapshot_payload, cube_axes)
+
+    workers = max_workers or os.cpu_count() or 1
+    bounds = _chunk_bounds(len(instrument_ids), workers, chunk_size)
+    if executor == RISK_EXECUTOR_SERIAL or len(bounds) <= 1:
+        cubes = _reprice_chunk(instrument_ids, contracts, *shared)
+    else:
+        pool_cls = ThreadPoolExecutor if executor == RISK_EXECUTOR_THREAD else ProcessPoolExecutor
+        with pool_cls(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_reprice_chunk, instrument_ids[start:stop], contracts[start:stop], *shared)
+                for start, stop in bounds
+            ]
+            # Collected in submission order: request.instrument_ids order, and the first
+            # rejection raised is the one a serial run would have raised.
+            cubes = tuple(cube for future in futures for cube in future.result())
 
     return RiskResult(
         schema_version=schema_version,
         market_snapshot_id=request.market_snapshot_id,
         scenario_set_id=scenario_grid.scenario_set_id,
-        results=tuple(cubes),
+        results=cubes,
     )
 
 
@@ -507,7 +724,15 @@ __all__ = [
     "InstrumentRiskCube",
     "InstrumentScenarioPV",
     "PriceForwardCallable",
+    "RISK_EXECUTORS",
+    "RISK_EXECUTOR_PROCESS",
+    "RISK_EXECUTOR_SERIAL",
+    "RISK_EXECUTOR_THREAD",
     "RiskResult",
+    "SCENARIO_CUBE_PATHS",
+    "SCENARIO_CUBE_PER_SCENARIO",
+    "SCENARIO_CUBE_VECTORISED",
     "SUPPORTED_SCHEMA_VERSION",
+    "compute_ttm_years_act_365f",
     "reprice_fx_forward_risk",
 ]
@@ -2,14 +2,20 @@
 
 Packages a RiskResult into a canonical, content-addressed artifact.
 No repricing semantics are changed here.
+
+stream_risk_artifact_v1 produces the same bytes and sha256 incrementally, with
+memory bounded by one instrument's entry instead of the whole document.
 """
 from __future__ import annotations
 
 import hashlib
 import json
 from decimal import Decimal
-from typing import Any
+from typing import Any, BinaryIO, Iterable
 
+from core.risk.canonical_stream import CanonicalJsonSink
+from core.risk.canonical_stream import iter_canonical_json
+from core.risk.reprice_harness import InstrumentRiskCube
 from core.risk.reprice_harness import RiskResult
 from core.risk.risk_request import RiskRequest
 from core.risk.risk_request import RiskValidationError
@@ -39,11 +45,11 @@ def _decimal_str(value: Decimal) -> str:
     return str(value)
 
 
-def build_risk_artifact_v1(
+def _validated_totals(
     risk_request: RiskRequest,
     scenario_grid: ScenarioGrid,
     risk_result: RiskResult,
-) -> dict[str, Any]:
+) -> tuple[Decimal, list[Decimal]]:
     if risk_result.market_snapshot_id != risk_request.market_snapshot_id:
         _reject(
             "VALIDATION_ERROR",
@@ -75,7 +81,6 @@ def build_risk_artifact_v1(
     scenario_totals = [Decimal("0") for _ in scenario_ids]
     base_total = Decimal("0")
 
-    output_results: list[dict[str, Any]] = []
     for cube in risk_result.results:
         if len(cube.scenario_pvs) != len(scenario_ids):
             _reject(
@@ -109,7 +114,6 @@ def build_risk_artifact_v1(
                 },
             )
 
-        scenario_entries: list[dict[str, str]] = []
         for idx, (expected_id, scenario_item) in enumerate(zip(scenario_ids, cube.scenario_pvs)):
             if scenario_item.scenario_id != expected_id:
                 _reject(
@@ -137,26 +141,51 @@ def build_risk_artifact_v1(
                 )
 
             scenario_totals[idx] += scenario_item.pv_domestic
-            scenario_entries.append(
-                {
-                    "scenario_id": scenario_item.scenario_id,
-                    "pv_domestic": _decimal_str(scenario_item.pv_domestic),
-                }
-            )
 
-        output_results.append(
+    return base_total, scenario_totals
+
+
+def _result_entry(cube: InstrumentRiskCube) -> dict[str, Any]:
+    return {
+        "instrument_id": cube.instrument_id,
+        "base": {
+            "pv_domestic": _decimal_str(cube.base_pv),
+            "currency": cube.scenario_pvs[0].currency,
+            "metric_class": cube.scenario_pvs[0].metric_class,
+        },
+        "scenarios": [
             {
-                "instrument_id": cube.instrument_id,
-                "base": {
-                    "pv_domestic": _decimal_str(cube.base_pv),
-                    "currency": base_currency,
-                    "metric_class": base_metric_class,
-                },
-                "scenarios": scenario_entries,
+                "scenario_id": scenario_item.scenario_id,
+                "pv_domestic": _decimal_str(scenario_item.pv_domestic),
             }
-        )
+            for scenario_item in cube.scenario_pvs
+        ],
+    }
+
 
-    artifact: dict[str, Any] = {
+def _artifact_body(
+    risk_request: RiskRequest,
+    scenario_grid: ScenarioGrid,
+    results: Iterable[dict[str, Any]] | None,
+    base_total: Decimal,
+    scenario_totals: list[Decimal],
+) -> dict[str, Any]:
+    outputs: dict[str, Any] = {
+        "aggregates": {
+            "base_total_pv_domestic": _decimal_str(base_total),
+            "scenario_total_pv_domestic": [
+                {
+                    "scenario_id": scenario_id,
+                    "pv_domestic": _decimal_str(total),
+                }
+                for scenario_id, total in zip(scenario_grid.scenario_ids, scenario_totals)
+            ],
+        },
+    }
+    if results is not None:
+        outputs["results"] = results
+
+    return {
         "schema": {
             "name": SCHEMA_NAME,
             "version": SCHEMA_VERSION,
@@ -181,19 +210,7 @@ def build_risk_artifact_v1(
                 "df_foreign_shocks": [str(v) for v in risk_request.scenario_spec.df_foreign_shocks],
             },
         },
-        "outputs": {
-            "results": output_results,
-            "aggregates": {
-                "base_total_pv_domestic": _decimal_str(base_total),
-                "scenario_total_pv_domestic": [
-                    {
-                        "scenario_id": scenario_id,
-                        "pv_domestic": _decimal_str(total),
-                    }
-                    for scenario_id, total in zip(scenario_ids, scenario_totals)
-                ],
-            },
-        },
+        "outputs": outputs,
         "hashing": {
             "canonicalization": HASH_CANONICALIZATION,
             "decimal_encoding": HASH_DECIMAL_ENCODING,
@@ -201,10 +218,53 @@ def build_risk_artifact_v1(
         },
     }
 
+
+def build_risk_artifact_v1(
+    risk_request: RiskRequest,
+    scenario_grid: ScenarioGrid,
+    risk_result: RiskResult,
+) -> dict[str, Any]:
+    base_total, scenario_totals = _validated_totals(risk_request, scenario_grid, risk_result)
+    results = [_result_entry(cube) for cube in risk_result.results]
+    artifact = _artifact_body(risk_request, scenario_grid, results, base_total, scenario_totals)
     artifact["sha256"] = _canonical_sha256(artifact)
     return artifact
 
 
+def stream_risk_artifact_v1(
+    risk_request: RiskRequest,
+    scenario_grid: ScenarioGrid,
+    risk_result: RiskResult,
+    out: BinaryIO | None = None,
+) -> dict[str, Any]:
+    """Hash (and optionally write) the canonical artifact one instrument at a time.
+
+    `out` receives the UTF-8 bytes of json.dumps(build_risk_artifact_v1(...), canonical),
+    sha256 included. Returns the artifact without outputs.results: the same sha256,
+    inputs and aggregates, which is all compute_portfolio_surface_v1 reads.
+    Validation runs in full before the first byte is written.
+    """
+    base_total, scenario_totals = _validated_totals(risk_request, scenario_grid, risk_result)
+    results = (_result_entry(cube) for cube in risk_result.results)
+    body = _artifact_body(risk_request, scenario_grid, results, base_total, scenario_totals)
+
+    # "sha256" sorts last among the top-level keys, so the hashed document is the written
+    # document up to its closing brace: hold that brace back, then append the digest.
+    sink = CanonicalJsonSink(out)
+    pending = None
+    for chunk in iter_canonical_json(body):
+        if pending is not None:
+            sink.write(pending)
+        pending = chunk
+    sha256 = sink.hexdigest(suffix=pending)
+    sink.write(f',"sha256":"{sha256}"}}')
+    sink.flush()
+
+    del body["outputs"]["results"]
+    body["sha256"] = sha256
+    return body
+
+
 __all__ = [
     "ENGINE_NAME",
     "ENGINE_VERSION",
@@ -214,4 +274,5 @@ __all__ = [
     "SCHEMA_NAME",
     "SCHEMA_VERSION",
     "build_risk_artifact_v1",
+    "stream_risk_artifact_v1",
 ]
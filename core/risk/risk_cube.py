@@ -0,0 +1,243 @@
+"""Columnar risk cube: one float64 matrix per RiskResult.
+
+RiskResult stores one frozen InstrumentScenarioPV per (instrument, scenario) cell,
+repeating ids, currency and metric class in every cell. RiskCube keeps the same
+content as shared axes plus a (n_instruments, n_scenarios) float64 matrix:
+- instrument_ids / scenario_ids are the row / column axes, in RiskResult order;
+- currency and metric_class are per instrument (the artifact requires them constant
+  across an instrument's scenarios);
+- PVs are float64. Harness PVs are Decimal(str(float)), so conversion is lossless;
+  from_risk_result rejects any PV that would not round-trip to the same Decimal string.
+
+Totals and slices are NumPy reductions over the matrix (float64 sums, not the Decimal
+sums of build_risk_artifact_v1). Convert back with to_risk_result for hash-locked artifacts.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import cached_property
+from typing import Iterable
+
+import numpy as np
+
+from core.risk.reprice_harness import InstrumentRiskCube
+from core.risk.reprice_harness import InstrumentScenarioPV
+from core.risk.reprice_harness import RiskResult
+from core.risk.risk_request import RiskValidationError
+from core.validation.error_taxonomy import make_error
+
+
+def _reject(code: str, details: dict[str, str]) -> None:
+    raise RiskValidationError(make_error(code, details))
+
+
+def _lossless_float(value: Decimal, field: str) -> float:
+    as_float = float(value)
+    if str(Decimal(str(as_float))) != str(value):
+        _reject(
+            "VALIDATION_ERROR",
+            {
+                "field": field,
+                "reason": f"{value} does not round-trip through float64",
+            },
+        )
+    return as_float
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+@dataclass(frozen=True, eq=False)
+class RiskCube:
+    schema_version: int
+    market_snapshot_id: str
+    scenario_set_id: str
+    instrument_ids: tuple[str, ...]
+    scenario_ids: tuple[str, ...]
+    currencies: tuple[str, ...]
+    metric_classes: tuple[str, ...]
+    base_pv: np.ndarray
+    scenario_pv: np.ndarray
+
+    def __post_init__(self) -> None:
+        n_instruments = len(self.instrument_ids)
+        if len(self.currencies) != n_instruments or len(self.metric_classes) != n_instruments:
+            _reject(
+                "VALIDATION_ERROR",
+                {
+                    "field": "currencies",
+                    "reason": "currencies and metric_classes must align with instrument_ids",
+                },
+            )
+        if self.base_pv.shape != (n_instruments,) or self.scenario_pv.shape != (n_instruments, len(self.scenario_ids)):
+            _reject(
+                "VALIDATION_ERROR",
+                {
+                    "field": "scenario_pv",
+                    "reason": "matrix shape must be (len(instrument_ids), len(scenario_ids))",
+                },
+            )
+        if len(set(self.instrument_ids)) != n_instruments or len(set(self.scenario_ids)) != len(self.scenario_ids):
+            _reject(
+                "VALIDATION_ERROR",
+                {
+                    "field": "instrument_ids",
+                    "reason": "instrument_ids and scenario_ids must be unique",
+                },
+            )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RiskCube):
+            return NotImplemented
+        return (
+            self.schema_version == other.schema_version
+            and self.market_snapshot_id == other.market_snapshot_id
+            and self.scenario_set_id == other.scenario_set_id
+            and self.instrument_ids == other.instrument_ids
+            and self.scenario_ids == other.scenario_ids
+            and self.currencies == other.currencies
+            and self.metric_classes == other.metric_classes
+            and np.array_equal(self.base_pv, other.base_pv)
+            and np.array_equal(self.scenario_pv, other.scenario_pv)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.scenario_pv.shape
+
+    @cached_property
+    def _instrument_index(self) -> dict[str, int]:
+        return {instrument_id: i for i, instrument_id in enumerate(self.instrument_ids)}
+
+    @cached_property
+    def _scenario_index(self) -> dict[str, int]:
+        return {scenario_id: j for j, scenario_id in enumerate(self.scenario_ids)}
+
+    def instrument_row(self, instrument_id: str) -> np.ndarray:
+        return self.scenario_pv[self._instrument_index[instrument_id]]
+
+    def scenario_column(self, scenario_id: str) -> np.ndarray:
+        return self.scenario_pv[:, self._scenario_index[scenario_id]]
+
+    def select_instruments(self, instrument_ids: Iterable[str]) -> RiskCube:
+        rows = [self._instrument_index[instrument_id] for instrument_id in instrument_ids]
+        return RiskCube(
+            schema_version=self.schema_version,
+            market_snapshot_id=self.market_snapshot_id,
+            scenario_set_id=self.scenario_set_id,
+            instrument_ids=tuple(self.instrument_ids[i] for i in rows),
+            scenario_ids=self.scenario_ids,
+            currencies=tuple(self.currencies[i] for i in rows),
+            metric_classes=tuple(self.metric_classes[i] for i in rows),
+            base_pv=_frozen(self.base_pv[rows]),
+            scenario_pv=_frozen(self.scenario_pv[rows]),
+        )
+
+    def select_scenarios(self, scenario_ids: Iterable[str]) -> RiskCube:
+        columns = [self._scenario_index[scenario_id] for scenario_id in scenario_ids]
+        return RiskCube(
+            schema_version=self.schema_version,
+            market_snapshot_id=self.market_snapshot_id,
+            scenario_set_id=self.scenario_set_id,
+            instrument_ids=self.instrument_ids,
+            scenario_ids=tuple(self.scenario_ids[j] for j in columns),
+            currencies=self.currencies,
+            metric_classes=self.metric_classes,
+            base_pv=self.base_pv,
+            scenario_pv=_frozen(self.scenario_pv[:, columns]),
+        )
+
+    def base_total(self) -> float:
+        return float(self.base_pv.sum())
+
+    def scenario_totals(self) -> np.ndarray:
+        """Portfolio PV per scenario, in scenario_ids order."""
+        return self.scenario_pv.sum(axis=0)
+
+    def pnl_vs_base(self) -> np.ndarray:
+        """Per-cell scenario PV minus the instrument's base PV."""
+        return self.scenario_pv - self.base_pv[:, None]
+
+    @classmethod
+    def from_risk_result(cls, risk_result: RiskResult) -> RiskCube:
+        cubes = risk_result.results
+        scenario_ids = tuple(pv.scenario_id for pv in cubes[0].scenario_pvs) if cubes else ()
+        currencies: list[str] = []
+        metric_classes: list[str] = []
+        base_pv = np.empty(len(cubes), dtype=np.float64)
+        scenario_pv = np.empty((len(cubes), len(scenario_ids)), dtype=np.float64)
+
+        for i, cube in enumerate(cubes):
+            if not cube.scenario_pvs:
+                _reject("VALIDATION_ERROR", {"field": "scenario_pvs", "reason": "scenario_pvs cannot be empty"})
+            if tuple(pv.scenario_id for pv in cube.scenario_pvs) != scenario_ids:
+                _reject(
+                    "VALIDATION_ERROR",
+                    {
+                        "field": "scenario_id",
+                        "reason": "every instrument must share one scenario_id ordering",
+                    },
+                )
+            first = cube.scenario_pvs[0]
+            if any(pv.currency != first.currency or pv.metric_class != first.metric_class for pv in cube.scenario_pvs):
+                _reject(
+                    "VALIDATION_ERROR",
+                    {
+                        "field": "currency",
+                        "reason": "currency and metric_class must be constant per instrument",
+                    },
+                )
+            currencies.append(first.currency)
+            metric_classes.append(first.metric_class)
+            base_pv[i] = _lossless_float(cube.base_pv, "base_pv")
+            scenario_pv[i] = [_lossless_float(pv.pv_domestic, "pv_domestic") for pv in cube.scenario_pvs]
+
+        return cls(
+            schema_version=risk_result.schema_version,
+            market_snapshot_id=risk_result.market_snapshot_id,
+            scenario_set_id=risk_result.scenario_set_id,
+            instrument_ids=tuple(cube.instrument_id for cube in cubes),
+            scenario_ids=scenario_ids,
+            currencies=tuple(currencies),
+            metric_classes=tuple(metric_classes),
+            base_pv=_frozen(base_pv),
+            scenario_pv=_frozen(scenario_pv),
+        )
+
+    def to_risk_result(self) -> RiskResult:
+        return RiskResult(
+            schema_version=self.schema_version,
+            market_snapshot_id=self.market_snapshot_id,
+            scenario_set_id=self.scenario_set_id,
+            results=tuple(
+                InstrumentRiskCube(
+                    instrument_id=instrument_id,
+                    base_pv=Decimal(str(base)),
+                    scenario_pvs=tuple(
+                        InstrumentScenarioPV(
+                            instrument_id=instrument_id,
+                            scenario_id=scenario_id,
+                            pv_domestic=Decimal(str(pv)),
+                            currency=currency,
+                            metric_class=metric_class,
+                        )
+                        for scenario_id, pv in zip(self.scenario_ids, row)
+                    ),
+                )
+                for instrument_id, currency, metric_class, base, row in zip(
+                    self.instrument_ids,
+                    self.currencies,
+                    self.metric_classes,
+                    self.base_pv.tolist(),
+                    self.scenario_pv.tolist(),
+                )
+            ),
+        )
+
+
+__all__ = ["RiskCube"]
@@ -37,6 +37,10 @@ class RiskValidationError(ValueError):
         super().__init__(envelope.message)
         self.envelope = envelope
 
+    def __reduce__(self):
+        # Rebuild from the envelope so the error survives a process-pool round trip.
+        return (type(self), (self.envelope,))
+
 
 def _reject(code: str, details: dict[str, str], strict: bool) -> None:
     envelope = make_error(code, {k: str(v) for k, v in details.items()})  # type: ignore[arg-type]
@@ -3,6 +3,10 @@
 Expands a ScenarioSet spec into a full Cartesian scenario grid over:
   spot_shocks × df_domestic_shocks × df_foreign_shocks
 
+The grid keeps only the three sorted axes; ScenarioKeys and scenario ids are
+derived on first use, and from_scenario_set returns one cached grid per
+scenario_set_id.
+
 This module is structural-only: no repricing/valuation semantics.
 """
 from __future__ import annotations
@@ -11,6 +15,9 @@ import hashlib
 import json
 from dataclasses import dataclass
 from decimal import Decimal
+from functools import cached_property
+
+import numpy as np
 
 from core.risk.risk_request import RiskValidationError
 from core.risk.scenario_set import ScenarioSet
@@ -19,6 +26,7 @@ from core.validation.error_taxonomy import make_error
 
 SUPPORTED_SCHEMA_VERSION: int = 1
 CANONICALIZATION_RULE: str = "json.sort_keys=True,separators=(',',':'),ensure_ascii=False"
+SCENARIO_GRID_CACHE_MAX_SIZE: int = 64
 
 
 def _reject(code: str, details: dict[str, str]) -> None:
@@ -43,13 +51,33 @@ def _scenario_id_from_key(scenario_set_id: str, key: ScenarioKey) -> str:
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
 
+def _require_axis(field: str, axis: tuple[Decimal, ...]) -> None:
+    if any(not isinstance(v, Decimal) for v in axis) or any(a >= b for a, b in zip(axis, axis[1:])):
+        _reject(
+            "VALIDATION_ERROR",
+            {
+                "field": field,
+                "reason": "must be a strictly ascending tuple of Decimal",
+            },
+        )
+
+
 @dataclass(frozen=True)
 class ScenarioGrid:
+    """Cartesian grid stored as its three sorted shock axes (struct-of-arrays).
+
+    Scenario i is (spot_axis[a], df_domestic_axis[b], df_foreign_axis[c]) with
+    i = (a * len(df_domestic_axis) + b) * len(df_foreign_axis) + c, which is the
+    lexicographic ScenarioKey order. `scenarios` and `scenario_ids` are materialised
+    lazily, once per grid, and grids are shared process-wide through from_scenario_set.
+    """
+
     schema_version: int
     scenario_set_id: str
     canonicalization: str
-    scenarios: tuple[ScenarioKey, ...]
-    scenario_ids: tuple[str, ...]
+    spot_axis: tuple[Decimal, ...]
+    df_domestic_axis: tuple[Decimal, ...]
+    df_foreign_axis: tuple[Decimal, ...]
 
     def __post_init__(self) -> None:
         if self.schema_version is None:
@@ -72,22 +100,79 @@ class ScenarioGrid:
                     "reason": "must match frozen canonicalization rule",
                 },
             )
-        if len(self.scenarios) != len(self.scenario_ids):
-            _reject(
-                "VALIDATION_ERROR",
-                {
-                    "field": "scenario_ids",
-                    "reason": "length must equal scenarios length",
-                },
-            )
-        if len(set(self.scenario_ids)) != len(self.scenario_ids):
-            _reject(
-                "VALIDATION_ERROR",
-                {
-                    "field": "scenario_ids",
-                    "reason": "scenario_ids must be unique",
-                },
-            )
+        # Strictly ascending axes make every ScenarioKey, and therefore every scenario_id, unique.
+        _require_axis("spot_axis", self.spot_axis)
+        _require_axis("df_domestic_axis", self.df_domestic_axis)
+        _require_axis("df_foreign_axis", self.df_foreign_axis)
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return (len(self.spot_axis), len(self.df_domestic_axis), len(self.df_foreign_axis))
+
+    def __len__(self) -> int:
+        n_spot, n_dfd, n_dff = self.shape
+        return n_spot * n_dfd * n_dff
+
+    @cached_property
+    def axis_indices(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Per-scenario (spot, df_domestic, df_foreign) axis positions, in grid order."""
+        spot_idx, dfd_idx, dff_idx = (idx.reshape(-1) for idx in np.indices(self.shape, dtype=np.intp))
+        for idx in (spot_idx, dfd_idx, dff_idx):
+            idx.setflags(write=False)
+        return spot_idx, dfd_idx, dff_idx
+
+    @cached_property
+    def scenarios(self) -> tuple[ScenarioKey, ...]:
+        return tuple(
+            ScenarioKey(spot_shock=spot, df_domestic_shock=df_domestic, df_foreign_shock=df_foreign)
+            for spot in self.spot_axis
+            for df_domestic in self.df_domestic_axis
+            for df_foreign in self.df_foreign_axis
+        )
+
+    @cached_property
+    def scenario_ids(self) -> tuple[str, ...]:
+        # Bulk form of _scenario_id_from_key: each axis level is JSON-encoded once.
+        set_id = json.dumps(self.scenario_set_id, ensure_ascii=False)
+        spot = [json.dumps(str(v), ensure_ascii=False) for v in self.spot_axis]
+        dfd = [json.dumps(str(v), ensure_ascii=False) for v in self.df_domestic_axis]
+        dff = [json.dumps(str(v), ensure_ascii=False) for v in self.df_foreign_axis]
+        return tuple(
+            hashlib.sha256(
+                (
+                    f'{{"df_domestic_shock":{d},"df_foreign_shock":{f},'
+                    f'"scenario_set_id":{set_id},"spot_shock":{s}}}'
+                ).encode("utf-8")
+            ).hexdigest()
+            for s in spot
+            for d in dfd
+            for f in dff
+        )
+
+    def index_of(self, key: ScenarioKey) -> int:
+        """Grid position of key; KeyError when the key is not on the grid."""
+        try:
+            a = self.spot_axis.index(key.spot_shock)
+            b = self.df_domestic_axis.index(key.df_domestic_shock)
+            c = self.df_foreign_axis.index(key.df_foreign_shock)
+        except ValueError:
+            raise KeyError(key) from None
+        return (a * len(self.df_domestic_axis) + b) * len(self.df_foreign_axis) + c
+
+    def scenario_id_at(self, index: int) -> str:
+        """scenario_id of one grid position, without materialising the whole id tuple."""
+        ids = self.__dict__.get("scenario_ids")
+        if ids is not None:
+            return ids[index]
+        n_spot, n_dfd, n_dff = self.shape
+        a, rest = divmod(range(len(self))[index], n_dfd * n_dff)
+        b, c = divmod(rest, n_dff)
+        key = ScenarioKey(
+            spot_shock=self.spot_axis[a],
+            df_domestic_shock=self.df_domestic_axis[b],
+            df_foreign_shock=self.df_foreign_axis[c],
+        )
+        return _scenario_id_from_key(self.scenario_set_id, key)
 
     @classmethod
     def from_scenario_set(
@@ -96,51 +181,40 @@ class ScenarioGrid:
         *,
         schema_version: int = SUPPORTED_SCHEMA_VERSION,
     ) -> ScenarioGrid:
-        spec = scenario_set.spec
-
-        scenarios = [
-            ScenarioKey(
-                spot_shock=spot,
-                df_domestic_shock=df_domestic,
-                df_foreign_shock=df_foreign,
-            )
-            for spot in spec.spot_shocks
-            for df_domestic in spec.df_domestic_shocks
-            for df_foreign in spec.df_foreign_shocks
-        ]
-
-        ordered_scenarios = tuple(sorted(scenarios))
-        ordered_ids = tuple(
-            _scenario_id_from_key(scenario_set.scenario_set_id, key)
-            for key in ordered_scenarios
-        )
+        # scenario_set_id content-addresses the spec, so one grid per id is shared process-wide.
+        cache_key = (scenario_set.scenario_set_id, schema_version)
+        cached = _GRID_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
 
-        expected_count = (
-            len(spec.spot_shocks)
-            * len(spec.df_domestic_shocks)
-            * len(spec.df_foreign_shocks)
-        )
-        if len(ordered_scenarios) != expected_count:
-            _reject(
-                "VALIDATION_ERROR",
-                {
-                    "field": "scenarios",
-                    "reason": "scenario count must equal Cartesian product size",
-                },
-            )
-
-        return cls(
+        spec = scenario_set.spec
+        grid = cls(
             schema_version=schema_version,
             scenario_set_id=scenario_set.scenario_set_id,
             canonicalization=CANONICALIZATION_RULE,
-            scenarios=ordered_scenarios,
-            scenario_ids=ordered_ids,
+            spot_axis=tuple(sorted(spec.spot_shocks)),
+            df_domestic_axis=tuple(sorted(spec.df_domestic_shocks)),
+            df_foreign_axis=tuple(sorted(spec.df_foreign_shocks)),
         )
+        if len(_GRID_CACHE) >= SCENARIO_GRID_CACHE_MAX_SIZE:
+            # FIFO eviction, as in core.scenario.cache.InMemoryScenarioCache
+            _GRID_CACHE.pop(next(iter(_GRID_CACHE)), None)
+        _GRID_CACHE[cache_key] = grid
+        return grid
+
+
+_GRID_CACHE: dict[tuple[str, int], ScenarioGrid] = {}
+
+
+def clear_scenario_grid_cache() -> None:
+    _GRID_CACHE.clear()
 
 
 __all__ = [
     "CANONICALIZATION_RULE",
+    "SCENARIO_GRID_CACHE_MAX_SIZE",
     "ScenarioGrid",
     "ScenarioKey",
     "SUPPORTED_SCHEMA_VERSION",
+    "clear_scenario_grid_cache",
 ]
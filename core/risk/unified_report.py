@@ -2,7 +2,7 @@ from __future__ import annotations
 from datetime import datetime
 from core.risk.unified_report_types import UnifiedPortfolioRiskReport
 from core.scenarios.risk_report import build_risk_scenario_report
-from core.risk.var_historical import calc_historical_var, calc_cvar_expected_shortfall
+from core.risk.var_historical import calc_historical_var_cvar
 from core.risk.var_types import VarResult
 from core.risk.semantics import RiskContext, default_risk_context
 
@@ -31,8 +31,9 @@ def build_unified_portfolio_risk_report(
         risk_context=ctx,
     )
     pnl_series = [r.delta_pv_abs for r in scenario_report.results]
-    var_value = calc_historical_var(pnl_series=pnl_series, confidence=ctx.confidence)
-    cvar_value = calc_cvar_expected_shortfall(pnl_series=pnl_series, confidence=ctx.confidence)
+    var_values, cvar_values = calc_historical_var_cvar(pnl=pnl_series, confidences=(ctx.confidence,))
+    var_value = float(var_values[0])
+    cvar_value = float(cvar_values[0])
     var_result = VarResult(
         method="historical",
         confidence=ctx.confidence,
@@ -1,9 +1,59 @@
 from __future__ import annotations
 import math
 from typing import Sequence, Optional
+import numpy as np
 from core.risk.var_types import VarResult
 from core.portfolio.models import Currency
 
+def nearest_rank_index(n: int, confidence: float) -> int:
+    """0-based position of the VaR observation among n ascending P&L values (nearest rank)."""
+    if not (0.5 < confidence < 1.0):
+        raise ValueError(f"confidence must be in (0.5, 1.0), got {confidence}")
+    alpha = 1.0 - confidence
+    return max(0, min(n - 1, math.ceil(alpha * n) - 1))
+
+def calc_historical_var_cvar(
+    *,
+    pnl: Sequence[float] | np.ndarray,
+    confidences: Sequence[float],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Historical VaR and CVaR for several confidence levels in one selection pass.
+    pnl: one P&L series of shape (n,), or a matrix (m, n) with one series per row
+    (portfolio, desk); n >= 20 observations per series.
+    Returns (var, cvar), each of shape (len(confidences),) or (m, len(confidences)),
+    as positive loss numbers (>=0).
+    Same nearest-rank rule and tail set as calc_historical_var / calc_cvar_expected_shortfall,
+    but np.partition places only the needed order statistics instead of sorting every series.
+    """
+    values = np.asarray(pnl, dtype=np.float64)
+    if values.ndim not in (1, 2):
+        raise ValueError(f"pnl must be 1-D or 2-D, got {values.ndim}-D")
+    n = values.shape[-1]
+    if n < 20:
+        raise ValueError(f"pnl_series must have at least 20 observations, got {n}")
+    if not np.isfinite(values).all():
+        raise ValueError("pnl_series must be finite")
+    ks = np.array([nearest_rank_index(n, confidence) for confidence in confidences], dtype=np.intp)
+    if ks.size == 0:
+        raise ValueError("confidences must be non-empty")
+
+    rows = values.reshape(-1, n)
+    # Every requested rank lands in its sorted position and each prefix [:k+1] holds
+    # exactly the k+1 smallest observations, so one cumulative sum serves all levels.
+    partitioned = np.partition(rows, np.unique(ks), axis=-1)
+    q = partitioned[:, ks]
+    prefix_sums = np.cumsum(partitioned[:, : ks.max() + 1], axis=-1)[:, ks]
+    # The tail is every observation <= q: the k+1 smallest plus any ties with q beyond rank k.
+    tail_counts = (rows[:, None, :] <= q[:, :, None]).sum(axis=-1)
+    tail_means = (prefix_sums + q * (tail_counts - (ks + 1))) / tail_counts
+
+    var = np.maximum(-q, 0.0)
+    cvar = np.maximum(-tail_means, 0.0)
+    if values.ndim == 1:
+        return var[0], cvar[0]
+    return var, cvar
+
 def calc_historical_var(*, pnl_series: Sequence[float], confidence: float) -> float:
     """
     Computes Historical VaR using the nearest-rank quantile method.
@@ -12,17 +62,8 @@ def calc_historical_var(*, pnl_series: Sequence[float], confidence: float) -> fl
     Returns: VaR as a positive loss number (>=0).
     Quantile method: nearest-rank (sorted, index = ceil(alpha * n) - 1, clamp to [0, n-1])
     """
-    n = len(pnl_series)
-    if n < 20:
-        raise ValueError(f"pnl_series must have at least 20 observations, got {n}")
-    if not (0.5 < confidence < 1.0):
-        raise ValueError(f"confidence must be in (0.5, 1.0), got {confidence}")
-    alpha = 1.0 - confidence
-    sorted_pnl = sorted(pnl_series)
-    idx = max(0, min(n - 1, math.ceil(alpha * n) - 1))
-    q = sorted_pnl[idx]
-    var = max(0.0, -q)
-    return float(var)
+    var, _ = calc_historical_var_cvar(pnl=pnl_series, confidences=(confidence,))
+    return float(var[0])
 
 def build_historical_var_result(
     *,
@@ -46,12 +87,6 @@ def build_historical_var_result(
         notes=notes or {},
     )
 
-def _nearest_rank_quantile(pnl_series: Sequence[float], alpha: float) -> float:
-    n = len(pnl_series)
-    sorted_pnl = sorted(pnl_series)
-    idx = max(0, min(n - 1, math.ceil(alpha * n) - 1))
-    return sorted_pnl[idx]
-
 def calc_cvar_expected_shortfall(*, pnl_series: Sequence[float], confidence: float) -> float:
     """
     Computes CVaR/Expected Shortfall using the same nearest-rank quantile rule as calc_historical_var.
@@ -59,19 +94,8 @@ def calc_cvar_expected_shortfall(*, pnl_series: Sequence[float], confidence: flo
     Definition: mean loss conditional on being in the worst (1-confidence) tail.
     Tail set: all pnl <= q_alpha (including q_alpha itself).
     """
-    n = len(pnl_series)
-    if n < 20:
-        raise ValueError(f"pnl_series must have at least 20 observations, got {n}")
-    if not (0.5 < confidence < 1.0):
-        raise ValueError(f"confidence must be in (0.5, 1.0), got {confidence}")
-    alpha = 1.0 - confidence
-    q_alpha = _nearest_rank_quantile(pnl_series, alpha)
-    tail = [x for x in pnl_series if x <= q_alpha]
-    if not tail:
-        tail = [q_alpha]  # fallback, should not happen with nearest-rank
-    tail_mean = sum(tail) / len(tail)
-    cvar = max(0.0, -tail_mean)
-    return float(cvar)
+    _, cvar = calc_historical_var_cvar(pnl=pnl_series, confidences=(confidence,))
+    return float(cvar[0])
 
 def build_historical_var_and_cvar_result(
     *,
@@ -84,14 +108,13 @@ def build_historical_var_and_cvar_result(
     """
     Helper to produce a VarResult for historical VaR and CVaR/ES.
     """
-    var = calc_historical_var(pnl_series=pnl_series, confidence=confidence)
-    cvar = calc_cvar_expected_shortfall(pnl_series=pnl_series, confidence=confidence)
+    var, cvar = calc_historical_var_cvar(pnl=pnl_series, confidences=(confidence,))
     return VarResult(
         method="historical",
         confidence=confidence,
         horizon_days=horizon_days,
         currency=currency,
-        var=var,
-        cvar=cvar,
+        var=float(var[0]),
+        cvar=float(cvar[0]),
         notes=notes or {},
     )
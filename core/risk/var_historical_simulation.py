@@ -0,0 +1,404 @@
+"""Full-revaluation historical-simulation VaR over a window of market snapshots.
+
+The window is a sequence of MarketSnapshotPayloadV0, oldest first; its last snapshot is the
+base market. Scenario j replays the move from snapshot j to snapshot j+1 as relative shocks
+on the base market, in the ScenarioKey shock model:
+- spot: fx_rates.quotes["<BASE>/<QUOTE>"] for FX forwards, spots.prices[underlying] for options;
+- discount factors: per currency, the curve DF at a reference tenor (df_tenor_days, ACT/365,
+  exact tenor as in get_pair_dfs_v0); its relative move shocks every DF in that currency.
+  The base DFs themselves are read at each instrument's own tenor (forward_date or expiry).
+Volatility stays at its base level.
+
+Each risk factor's relative moves are resolved once per run and each forward pair's shocked
+markets are built once, then shared by every instrument that loads on them. Base PVs go
+through the scalar SSOT entrypoints; scenario PVs through the vectorised seams the harness
+uses (forward_mtm formula (B) over an (instruments, scenarios) matrix, batch BS SSOT).
+
+VaR/ES use the nearest-rank rule of core.risk.var_historical. Component contributions are each
+instrument's loss in the VaR scenario (the lowest-index scenario at the portfolio quantile) and
+its mean loss over the ES tail, so they sum to the unfloored portfolio figures. Marginal
+contributions are components per unit notional (Euler allocation: P&L is linear in notional).
+"""
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import math
+from dataclasses import dataclass
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from core.contracts.option_contract_v1 import OptionContractV1
+from core.market_data.df_lookup_v0 import DfLookupError
+from core.market_data.df_lookup_v0 import get_pair_dfs_v0
+from core.market_data.identity import market_snapshot_id
+from core.market_data.market_snapshot_payload_v0 import MarketSnapshotPayloadV0
+from core.market_data.market_snapshot_payload_v0 import VolLookupError
+from core.market_data.market_snapshot_payload_v0 import get_vol
+from core.pricing.bs_ssot_v1 import TIME_FRACTION_POLICY_ACT_365F
+from core.pricing.bs_ssot_v1 import price_european_option_bs_v1
+from core.pricing.bs_ssot_v1 import price_european_options_bs_batch_v1
+from core.pricing.fx import forward_mtm
+from core.pricing.fx import types as fx_types
+from core.pricing.fx.valuation_context import ValuationContext
+from core.risk.reprice_harness import compute_ttm_years_act_365f
+from core.risk.risk_cube import RiskCube
+from core.risk.risk_request import RiskValidationError
+from core.risk.var_historical import nearest_rank_index
+from core.risk.var_historical import calc_historical_var_cvar
+from core.vol.types import VolKey
+from core.validation.error_taxonomy import make_error
+
+
+SUPPORTED_SCHEMA_VERSION: int = 1
+DEFAULT_DF_TENOR_DAYS: int = 365
+DEFAULT_CONFIDENCES: tuple[float, ...] = (0.95, 0.99)
+# 20 day-over-day scenarios: the historical VaR minimum.
+MIN_WINDOW_SNAPSHOTS: int = 21
+
+_FACTOR_FX = "fx"
+_FACTOR_SPOT = "spot"
+_FACTOR_DF = "df"
+
+
+def _reject(code: str, details: dict[str, str]) -> None:
+    raise RiskValidationError(make_error(code, details))
+
+
+@dataclass(frozen=True, eq=False)
+class HistoricalSimulationVarV1:
+    """Arrays are indexed (confidence, instrument) in confidences x cube.instrument_ids order."""
+
+    schema_version: int
+    market_snapshot_ids: tuple[str, ...]
+    df_tenor_days: int
+    confidences: tuple[float, ...]
+    cube: RiskCube
+    portfolio_pnl: np.ndarray
+    var: np.ndarray
+    es: np.ndarray
+    var_scenario_ids: tuple[str, ...]
+    component_var: np.ndarray
+    component_es: np.ndarray
+    marginal_var: np.ndarray
+    marginal_es: np.ndarray
+
+
+class _FactorHistory:
+    """Risk-factor levels over the window, resolved lazily and memoised for one run."""
+
+    def __init__(self, market_snapshots: Sequence[MarketSnapshotPayloadV0], df_ttm_years: float) -> None:
+        self._market_snapshots = market_snapshots
+        self._df_ttm_years = df_ttm_years
+        self._levels: dict[tuple[str, str], np.ndarray] = {}
+
+    def _level(self, kind: str, name: str, day: int) -> float:
+        payload = self._market_snapshots[day]
+        if kind == _FACTOR_DF:
+            field = f"market_snapshots[{day}].curves.curves[{name}]"
+            try:
+                value = get_pair_dfs_v0(payload, domestic_ccy=name, foreign_ccy=name, ttm_years=self._df_ttm_years)[0]
+            except DfLookupError as exc:
+                _reject("VALIDATION_ERROR", {"field": field, "reason": str(exc)})
+        elif kind == _FACTOR_FX:
+            field = f"market_snapshots[{day}].fx_rates.quotes[{name}]"
+            value = payload.fx_rates.quotes.get(name)
+        else:
+            field = f"market_snapshots[{day}].spots.prices[{name}]"
+            value = payload.spots.prices.get(name)
+        if value is None:
+            _reject("VALIDATION_ERROR", {"field": field, "reason": "missing"})
+        level = float(value)
+        if not math.isfinite(level) or level <= 0.0:
+            _reject("VALIDATION_ERROR", {"field": field, "reason": "must be finite and > 0"})
+        return level
+
+    def levels(self, kind: str, name: str) -> np.ndarray:
+        key = (kind, name)
+        levels = self._levels.get(key)
+        if levels is None:
+            levels = np.array([self._level(kind, name, day) for day in range(len(self._market_snapshots))])
+            self._levels[key] = levels
+        return levels
+
+    def base(self, kind: str, name: str) -> float:
+        return float(self.levels(kind, name)[-1])
+
+    def growth(self, kind: str, name: str) -> np.ndarray:
+        """1 + relative move per scenario: level[j+1] / level[j]."""
+        levels = self.levels(kind, name)
+        return levels[1:] / levels[:-1]
+
+
+def _forward_pv_matrix(
+    notional: np.ndarray,
+    forward_rate: np.ndarray,
+    pay_foreign: np.ndarray,
+    spot: np.ndarray,
+    df_d: np.ndarray,
+    df_f: np.ndarray,
+) -> np.ndarray:
+    # forward_mtm.price_fx_forward formula (B), term for term, over (instruments, scenarios).
+    forward_market = spot * df_f / df_d
+    pv = notional[:, None] * df_d * (forward_market - forward_rate[:, None])
+    return np.where(pay_foreign[:, None], -pv, pv)
+
+
+def _forward_ttm_years(as_of_ts: datetime.datetime, forward_date: datetime.date) -> float:
+    # Whole calendar days, ACT/365, so the tenor maps exactly onto a curve's "<n>D" point.
+    days = (forward_date - as_of_ts.date()).days
+    if days < 0:
+        _reject("VALIDATION_ERROR", {"field": "forward_date", "reason": "must be >= valuation_context.as_of_ts"})
+    return days / 365.0
+
+
+def _price_forwards(
+    instrument_ids: list[str],
+    contracts: list[fx_types.FXForwardContract],
+    valuation_context: ValuationContext,
+    base_payload: MarketSnapshotPayloadV0,
+    factors: _FactorHistory,
+    n_scenarios: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    base_pv = np.empty(len(contracts))
+    scenario_pv = np.empty((len(contracts), n_scenarios))
+    rows_by_pair: dict[tuple[str, str], list[int]] = {}
+    for row, contract in enumerate(contracts):
+        rows_by_pair.setdefault((contract.base_currency, contract.quote_currency), []).append(row)
+
+    for (base_ccy, quote_ccy), rows in rows_by_pair.items():
+        pair = f"{base_ccy}/{quote_ccy}"
+        spot = factors.base(_FACTOR_FX, pair)
+        base_df_d = np.empty(len(rows))
+        base_df_f = np.empty(len(rows))
+        base_snapshots: dict[datetime.date, fx_types.FxMarketSnapshot] = {}
+        for i, row in enumerate(rows):
+            forward_date = contracts[row].forward_date
+            base_snapshot = base_snapshots.get(forward_date)
+            if base_snapshot is None:
+                try:
+                    df_domestic, df_foreign = get_pair_dfs_v0(
+                        base_payload,
+                        domestic_ccy=quote_ccy,
+                        foreign_ccy=base_ccy,
+                        ttm_years=_forward_ttm_years(valuation_context.as_of_ts, forward_date),
+                    )
+                except DfLookupError as exc:
+                    _reject("VALIDATION_ERROR", {"field": "df_lookup", "reason": str(exc)})
+                base_snapshot = fx_types.FxMarketSnapshot(
+                    as_of_ts=valuation_context.as_of_ts,
+                    spot_rate=spot,
+                    df_domestic=df_domestic,
+                    df_foreign=df_foreign,
+                    domestic_currency=valuation_context.domestic_currency,
+                )
+                base_snapshots[forward_date] = base_snapshot
+            base_df_d[i] = base_snapshot.df_domestic
+            base_df_f[i] = base_snapshot.df_foreign
+            priced = forward_mtm.price_fx_forward_ctx(
+                context=valuation_context,
+                contract=contracts[row],
+                market_snapshot=base_snapshot,
+            )
+            if priced.currency != valuation_context.domestic_currency:
+                _reject(
+                    "VALIDATION_ERROR",
+                    {
+                        "field": "currency",
+                        "reason": f"pricing currency must equal valuation_context.domestic_currency ({instrument_ids[row]})",
+                    },
+                )
+            base_pv[row] = priced.pv
+
+        # One set of scenario moves per pair, shared by every forward on it; each forward's DFs
+        # move from its own base tenor by the reference-tenor growth of its currency.
+        group = [contracts[row] for row in rows]
+        scenario_pv[rows] = _forward_pv_matrix(
+            np.array([contract.notional for contract in group]),
+            np.array([contract.forward_rate for contract in group]),
+            np.array([contract.direction == "pay_foreign_receive_domestic" for contract in group]),
+            spot * factors.growth(_FACTOR_FX, pair),
+            base_df_d[:, None] * factors.growth(_FACTOR_DF, quote_ccy),
+            base_df_f[:, None] * factors.growth(_FACTOR_DF, base_ccy),
+        )
+    return base_pv, scenario_pv
+
+
+def _price_option(
+    contract: OptionContractV1,
+    valuation_context: ValuationContext,
+    base_payload: MarketSnapshotPayloadV0,
+    factors: _FactorHistory,
+) -> tuple[float, np.ndarray]:
+    if contract.time_fraction_policy_id != TIME_FRACTION_POLICY_ACT_365F:
+        _reject(
+            "VALIDATION_ERROR",
+            {"field": "time_fraction_policy_id", "reason": f"must be {TIME_FRACTION_POLICY_ACT_365F}"},
+        )
+    if contract.domestic_ccy != valuation_context.domestic_currency:
+        _reject(
+            "VALIDATION_ERROR",
+            {"field": "domestic_ccy", "reason": "must equal valuation_context.domestic_currency"},
+        )
+
+    ttm_years = compute_ttm_years_act_365f(as_of_ts=valuation_context.as_of_ts, expiry=contract.expiry)
+    try:
+        base_df_dom, base_df_for = get_pair_dfs_v0(
+            base_payload,
+            domestic_ccy=contract.domestic_ccy,
+            foreign_ccy=contract.foreign_ccy,
+            ttm_years=ttm_years,
+        )
+    except DfLookupError as exc:
+        _reject("VALIDATION_ERROR", {"field": "df_lookup", "reason": str(exc)})
+    try:
+        vol = get_vol(
+            base_payload,
+            VolKey(
+                underlying=contract.underlying,
+                expiry_t=ttm_years,
+                strike=float(contract.strike),
+                option_type=contract.option_type,
+            ),
+        )
+    except VolLookupError as exc:
+        _reject("VALIDATION_ERROR", {"field": "vol_lookup", "reason": str(exc)})
+
+    base_spot = factors.base(_FACTOR_SPOT, contract.underlying)
+    terms = {
+        "strike": float(contract.strike),
+        "vol": float(vol),
+        "ttm_years": ttm_years,
+        "option_type": contract.option_type,
+        "notional": float(contract.notional),
+        "time_fraction_policy_id": contract.time_fraction_policy_id,
+    }
+    base = price_european_option_bs_v1(spot=base_spot, domestic_df=base_df_dom, foreign_df=base_df_for, **terms)
+    scenarios = price_european_options_bs_batch_v1(
+        spot=base_spot * factors.growth(_FACTOR_SPOT, contract.underlying),
+        domestic_df=base_df_dom * factors.growth(_FACTOR_DF, contract.domestic_ccy),
+        foreign_df=base_df_for * factors.growth(_FACTOR_DF, contract.foreign_ccy),
+        **terms,
+    )
+    return base.pv_domestic, scenarios.pv_domestic
+
+
+def _scenario_set_id(snapshot_ids: tuple[str, ...], df_tenor_days: int) -> str:
+    material = json.dumps(
+        {"market_snapshot_ids": list(snapshot_ids), "df_tenor_days": df_tenor_days},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return "hs_" + hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def run_historical_simulation_var_v1(
+    *,
+    valuation_context: ValuationContext,
+    market_snapshots: Sequence[MarketSnapshotPayloadV0],
+    contracts_by_instrument_id: Mapping[str, object],
+    confidences: Sequence[float] = DEFAULT_CONFIDENCES,
+    df_tenor_days: int = DEFAULT_DF_TENOR_DAYS,
+) -> HistoricalSimulationVarV1:
+    if len(market_snapshots) < MIN_WINDOW_SNAPSHOTS:
+        _reject(
+            "VALIDATION_ERROR",
+            {"field": "market_snapshots", "reason": f"at least {MIN_WINDOW_SNAPSHOTS} snapshots required"},
+        )
+    if not contracts_by_instrument_id:
+        _reject("VALIDATION_ERROR", {"field": "contracts_by_instrument_id", "reason": "cannot be empty"})
+    if isinstance(df_tenor_days, bool) or not isinstance(df_tenor_days, int) or df_tenor_days <= 0:
+        _reject("VALIDATION_ERROR", {"field": "df_tenor_days", "reason": "must be a positive int"})
+
+    factors = _FactorHistory(market_snapshots, df_tenor_days / 365.0)
+    instrument_ids = sorted(contracts_by_instrument_id)
+    n_scenarios = len(market_snapshots) - 1
+    base_pv = np.empty(len(instrument_ids))
+    scenario_pv = np.empty((len(instrument_ids), n_scenarios))
+    notionals = np.empty(len(instrument_ids))
+
+    forward_rows: list[int] = []
+    for row, instrument_id in enumerate(instrument_ids):
+        contract = contracts_by_instrument_id[instrument_id]
+        if isinstance(contract, fx_types.FXForwardContract):
+            forward_rows.append(row)
+            notionals[row] = contract.notional
+        elif isinstance(contract, OptionContractV1):
+            base_pv[row], scenario_pv[row] = _price_option(contract, valuation_context, market_snapshots[-1], factors)
+            notionals[row] = float(contract.notional)
+        else:
+            _reject(
+                "VALIDATION_ERROR",
+                {
+                    "field": "contracts_by_instrument_id",
+                    "reason": f"unsupported contract type for instrument_id={instrument_id}",
+                },
+            )
+        # Marginal contributions are per unit notional
+        if not notionals[row] > 0.0:
+            _reject(
+                "VALIDATION_ERROR",
+                {"field": f"contracts_by_instrument_id[{instrument_id}].notional", "reason": "must be > 0"},
+            )
+    if forward_rows:
+        base_pv[forward_rows], scenario_pv[forward_rows] = _price_forwards(
+            [instrument_ids[row] for row in forward_rows],
+            [contracts_by_instrument_id[instrument_ids[row]] for row in forward_rows],
+            valuation_context,
+            market_snapshots[-1],
+            factors,
+            n_scenarios,
+        )
+
+    snapshot_ids = tuple(market_snapshot_id(payload) for payload in market_snapshots)
+    base_pv.setflags(write=False)
+    scenario_pv.setflags(write=False)
+    cube = RiskCube(
+        schema_version=SUPPORTED_SCHEMA_VERSION,
+        market_snapshot_id=snapshot_ids[-1],
+        scenario_set_id=_scenario_set_id(snapshot_ids, df_tenor_days),
+        instrument_ids=tuple(instrument_ids),
+        scenario_ids=tuple(f"hs_{day:04d}_{snapshot_ids[day]}" for day in range(1, len(snapshot_ids))),
+        currencies=(valuation_context.domestic_currency,) * len(instrument_ids),
+        metric_classes=("PRICE",) * len(instrument_ids),
+        base_pv=base_pv,
+        scenario_pv=scenario_pv,
+    )
+
+    pnl = cube.pnl_vs_base()
+    portfolio_pnl = pnl.sum(axis=0)
+    confidences = tuple(float(confidence) for confidence in confidences)
+    var, es = calc_historical_var_cvar(pnl=portfolio_pnl, confidences=confidences)
+
+    ks = [nearest_rank_index(n_scenarios, confidence) for confidence in confidences]
+    quantiles = np.partition(portfolio_pnl, np.unique(ks))[ks]
+    var_scenarios = [int(np.flatnonzero(portfolio_pnl == q)[0]) for q in quantiles]
+    component_var = -pnl[:, var_scenarios].T
+    component_es = np.stack([-pnl[:, portfolio_pnl <= q].mean(axis=1) for q in quantiles])
+
+    return HistoricalSimulationVarV1(
+        schema_version=SUPPORTED_SCHEMA_VERSION,
+        market_snapshot_ids=snapshot_ids,
+        df_tenor_days=df_tenor_days,
+        confidences=confidences,
+        cube=cube,
+        portfolio_pnl=portfolio_pnl,
+        var=var,
+        es=es,
+        var_scenario_ids=tuple(cube.scenario_ids[j] for j in var_scenarios),
+        component_var=component_var,
+        component_es=component_es,
+        marginal_var=component_var / notionals,
+        marginal_es=component_es / notionals,
+    )
+
+
+__all__ = [
+    "DEFAULT_CONFIDENCES",
+    "DEFAULT_DF_TENOR_DAYS",
+    "HistoricalSimulationVarV1",
+    "MIN_WINDOW_SNAPSHOTS",
+    "run_historical_simulation_var_v1",
+]
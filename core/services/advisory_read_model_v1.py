@@ -34,11 +34,12 @@ def _current_hedge_ratio(normalized_input: AdvisoryInputNormalizedV1) -> float:
     return float(hedged_notional / total_notional)
 
 
-def _pricing_ready_contracts(
+def pricing_ready_contracts_v1(
     *,
     contracts_raw: dict[str, FXForwardContract],
     base_snapshot: FxMarketSnapshot,
 ) -> dict[str, FXForwardContract]:
+    """Re-strike contracts_raw at the base snapshot's forward rate (spot * df_foreign / df_domestic)."""
     if base_snapshot.df_domestic is None or base_snapshot.df_foreign is None:
         raise ValueError("base_snapshot must include df_domestic and df_foreign")
 
@@ -57,25 +58,19 @@ def _pricing_ready_contracts(
     return out
 
 
-def run_treasury_advisory_v1(
-    payload: dict,
+def risk_request_from_payload_v1(
     *,
+    risk_request_payload: dict,
     base_snapshot: FxMarketSnapshot,
     scenario_spec: ScenarioSpec,
-    target_worst_loss_domestic: float,
-) -> AdvisoryDecisionV1:
-    normalized_input = normalize_advisory_input_v1(payload)
-    contracts_raw, risk_request_payload = build_risk_request_from_advisory_v1(normalized_input)
-    contracts = _pricing_ready_contracts(contracts_raw=contracts_raw, base_snapshot=base_snapshot)
-
-    scenario_grid = ScenarioGrid.from_scenario_set(ScenarioSet.from_spec(scenario_spec))
-
+) -> RiskRequest:
+    """Strict RiskRequest for a build_risk_request_from_advisory_v1 payload, valued as of base_snapshot."""
     valuation_context = ValuationContext(
         as_of_ts=base_snapshot.as_of_ts,
         domestic_currency=risk_request_payload["valuation_context"]["domestic_currency"],
         strict_mode=True,
     )
-    risk_request = RiskRequest(
+    return RiskRequest(
         schema_version=1,
         valuation_context=valuation_context,
         market_snapshot_id=risk_request_payload["snapshot_id"],
@@ -84,6 +79,25 @@ def run_treasury_advisory_v1(
         strict=True,
     )
 
+
+def run_treasury_advisory_v1(
+    payload: dict,
+    *,
+    base_snapshot: FxMarketSnapshot,
+    scenario_spec: ScenarioSpec,
+    target_worst_loss_domestic: float,
+) -> AdvisoryDecisionV1:
+    normalized_input = normalize_advisory_input_v1(payload)
+    contracts_raw, risk_request_payload = build_risk_request_from_advisory_v1(normalized_input)
+    contracts = pricing_ready_contracts_v1(contracts_raw=contracts_raw, base_snapshot=base_snapshot)
+
+    scenario_grid = ScenarioGrid.from_scenario_set(ScenarioSet.from_spec(scenario_spec))
+    risk_request = risk_request_from_payload_v1(
+        risk_request_payload=risk_request_payload,
+        base_snapshot=base_snapshot,
+        scenario_spec=scenario_spec,
+    )
+
     risk_result = reprice_fx_forward_risk(
         request=risk_request,
         base_snapshot=base_snapshot,
@@ -127,4 +141,8 @@ def run_treasury_advisory_v1(
     )
 
 
-__all__ = ["run_treasury_advisory_v1"]
+__all__ = [
+    "pricing_ready_contracts_v1",
+    "risk_request_from_payload_v1",
+    "run_treasury_advisory_v1",
+]
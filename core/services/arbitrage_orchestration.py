@@ -1,22 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List
 from uuid import UUID
 
 from pydantic import BaseModel, field_validator
 
-from core.arbitrage.feed import QuoteSnapshot
+from core.arbitrage.feed import QueueQuoteFeed, QuoteSnapshot
 from core.arbitrage.intelligence.lifecycle import OpportunityState
 from core.arbitrage.models import ArbitrageConfig, VenueQuote
 from core.arbitrage.orchestrator import ArbitrageOrchestrator
+from core.arbitrage.scan_loop import ArbitrageScanLoop
 from core.fx.converter import FxConverter
 from core.fx.provider import FxRateProvider
-from core.market_data import validate_quotes_payload
+from core.market_data import ValidationResult, validate_quotes_payload
 from core.portfolio.models import Currency
 
 _orchestrator = ArbitrageOrchestrator()
 
+DEFAULT_FX_RATE_USD_ILS = 3.5
+
 
 class QuotePayload(BaseModel):
     """Strict schema for validating incoming quote payloads.
@@ -296,27 +301,20 @@ def get_opportunity_detail(
     session_id: UUID, opportunity_id: str
 ) -> Dict[str, Any] | None:
     state = _orchestrator.get_session(session_id)
-    history = [r for r in state.opportunities_history if r.opportunity.opportunity_id == opportunity_id]
-    if not history:
+    latest = state.opportunity_index.latest(opportunity_id)
+    if latest is None:
         return None
 
-    latest = history[-1]
     opp_state = state.opportunity_state.get(opportunity_id)
 
     signals: dict[str, float] = {}
     reasons: list[Any] = []
 
     if opp_state:
-        recs = _orchestrator.get_recommendations(
-            session_id=session_id,
-            limit=len(state.opportunities_history),
-            symbol=None,
-        )
-        for rec in recs:
-            if rec.opportunity_id == opportunity_id:
-                signals = rec.signals or {}
-                reasons = rec.reasons or []
-                break
+        rec = _orchestrator.get_opportunity_recommendation(session_id=session_id, opportunity_id=opportunity_id)
+        if rec is not None:
+            signals = rec.signals or {}
+            reasons = rec.reasons or []
 
     return {
         "opportunity": latest.to_summary(),
@@ -336,17 +334,18 @@ def get_history_window(
     session_id: UUID, symbol: str | None = None, limit: int = 200
 ) -> List[Dict[str, Any]]:
     state = _orchestrator.get_session(session_id)
-    history = state.opportunities_history
-    filtered = [h for h in history if symbol is None or h.opportunity.symbol == symbol]
-    return [
-        _attach_execution_readiness(
-            h.to_summary(),
-            state.opportunity_state.get(h.opportunity.opportunity_id),
-            readiness=h.execution_readiness,
-            decision=h.execution_decision,
-        )
-        for h in filtered[-limit:]
-    ]
+    with state.lock:
+        history = state.opportunities_history
+        filtered = [h for h in history if symbol is None or h.opportunity.symbol == symbol]
+        return [
+            _attach_execution_readiness(
+                h.to_summary(),
+                state.opportunity_state.get(h.opportunity.opportunity_id),
+                readiness=h.execution_readiness,
+                decision=h.execution_decision,
+            )
+            for h in filtered[-limit:]
+        ]
 
 
 def list_sessions() -> List[Dict[str, Any]]:
@@ -366,26 +365,22 @@ def get_readiness_states(
 ) -> List[Dict[str, Any]]:
     state = _orchestrator.get_session(session_id)
 
-    symbol_by_opportunity: dict[str, str] = {}
-    for record in state.opportunities_history:
-        symbol_by_opportunity[record.opportunity.opportunity_id] = record.opportunity.symbol
-
-    readiness_by_opportunity: dict[str, Any | None] = {}
-    decision_by_opportunity: dict[str, Any | None] = {}
-    for record in state.opportunities_history:
-        readiness_by_opportunity[record.opportunity.opportunity_id] = record.execution_readiness
-        decision_by_opportunity[record.opportunity.opportunity_id] = record.execution_decision
+    with state.lock:
+        entries = [
+            (opp_id, lifecycle, state.opportunity_index.latest(opp_id))
+            for opp_id, lifecycle in state.opportunity_state.items()
+        ]
 
     readiness: list[Dict[str, Any]] = []
-    for opp_id, lifecycle in state.opportunity_state.items():
-        opp_symbol = symbol_by_opportunity.get(opp_id)
+    for opp_id, lifecycle, latest in entries:
+        opp_symbol = latest.opportunity.symbol if latest else None
         if symbol and opp_symbol != symbol:
             continue
 
         readiness_payload = _serialize_execution_readiness(
             lifecycle,
-            readiness=readiness_by_opportunity.get(opp_id),
-            decision=decision_by_opportunity.get(opp_id),
+            readiness=latest.execution_readiness if latest else None,
+            decision=latest.execution_decision if latest else None,
         )
         readiness.append(
             {
@@ -396,3 +391,148 @@ def get_readiness_states(
         )
 
     return readiness
+
+
+# -------------------------
+# Streaming quote deltas
+# -------------------------
+
+
+@dataclass
+class _QuoteStream:
+    scan_loop: ArbitrageScanLoop
+    feed: QueueQuoteFeed
+    task: asyncio.Task
+
+
+_quote_streams: Dict[UUID, _QuoteStream] = {}
+
+
+def _fx_converter(session_id: UUID, fx_rate_usd_ils: float) -> FxConverter:
+    session = _orchestrator.get_session(session_id)
+    return FxConverter(provider=FxRateProvider.from_usd_ils(fx_rate_usd_ils), base_ccy=session.base_currency)
+
+
+def _open_quote_stream(session_id: UUID, fx_rate_usd_ils: float | None = None) -> _QuoteStream:
+    """Running stream for the session, started on the current event loop if needed."""
+    stream = _quote_streams.get(session_id)
+    if stream is not None and not stream.task.done():
+        if fx_rate_usd_ils is not None:
+            stream.scan_loop.fx_converter = _fx_converter(session_id, fx_rate_usd_ils)
+        return stream
+
+    scan_loop = ArbitrageScanLoop(
+        _orchestrator,
+        session_id,
+        _fx_converter(session_id, fx_rate_usd_ils or DEFAULT_FX_RATE_USD_ILS),
+    )
+    feed = QueueQuoteFeed()
+    stream = _QuoteStream(
+        scan_loop=scan_loop,
+        feed=feed,
+        task=asyncio.get_running_loop().create_task(scan_loop.run(feed)),
+    )
+    _quote_streams[session_id] = stream
+    return stream
+
+
+# A delta with neither bid nor ask removes its venue, so those two errors alone are fine.
+_REMOVAL_DELTA_ERRORS = {"bid is missing", "ask is missing"}
+
+
+def _validate_stream_quotes(quotes_payload: List[Dict[str, Any]]) -> List[ValidationResult]:
+    results = validate_quotes_payload(quotes_payload)
+    for i, (payload, result) in enumerate(zip(quotes_payload, results)):
+        removal = payload.get("bid") is None and payload.get("ask") is None
+        if removal and not result.is_valid and set(result.errors) <= _REMOVAL_DELTA_ERRORS:
+            results[i] = ValidationResult(
+                is_valid=True, errors=[], warnings=result.warnings, normalized=result.normalized
+            )
+    return results
+
+
+async def push_stream_quotes(
+    session_id: UUID,
+    quotes_payload: List[Dict[str, Any]],
+    fx_rate_usd_ils: float = DEFAULT_FX_RATE_USD_ILS,
+) -> Dict[str, Any]:
+    """Queue quote deltas for the session's background scan; waits while the feed is full.
+
+    Quotes are validated like a non-strict scan: invalid ones are dropped and reported in
+    quote_validation. A quote without bid/ask removes that venue from the top-of-book.
+    """
+    session = _orchestrator.get_session(session_id)
+    validation_results = _validate_stream_quotes(quotes_payload)
+    quotes = [
+        VenueQuote(
+            venue=q.get("venue"),
+            symbol=q.get("symbol"),
+            ccy=q.get("ccy", session.base_currency),
+            bid=q.get("bid"),
+            ask=q.get("ask"),
+            size=q.get("size"),
+            fees_bps=q.get("fees_bps") or 0.0,
+            latency_ms=q.get("latency_ms"),
+        )
+        for q in (result.normalized for result in validation_results if result.is_valid)
+    ]
+    stream = _open_quote_stream(session_id, fx_rate_usd_ils)
+    return {
+        "accepted": await stream.feed.put(quotes),
+        "quote_validation": _summarize_validations(validation_results),
+    }
+
+
+async def close_quote_stream(session_id: UUID) -> int:
+    """End the session's stream after pending deltas are scanned; returns the scan count."""
+    stream = _quote_streams.get(session_id)
+    if stream is None:
+        return 0
+    await _shutdown_quote_stream(stream, drain=True)
+    return stream.scan_loop.scans
+
+
+async def _shutdown_quote_stream(stream: _QuoteStream, drain: bool) -> None:
+    # A loop that already stopped (e.g. after a scan error) no longer consumes the feed.
+    if not stream.task.done():
+        if drain:
+            await stream.feed.close()
+        else:
+            stream.scan_loop.stop()
+    await asyncio.wait([stream.task])
+
+
+async def prune_idle_sessions() -> List[UUID]:
+    """Drop idle sessions and stop their quote streams; returns the dropped ids."""
+    pruned = _orchestrator.prune_idle_sessions()
+    for session_id in pruned:
+        stream = _quote_streams.pop(session_id, None)
+        if stream is not None:
+            await _shutdown_quote_stream(stream, drain=False)
+    return pruned
+
+
+def iter_quote_stream_events(session_id: UUID, replay: bool = False) -> AsyncIterator[Dict[str, Any]]:
+    """Events published by the session's scan loop, ending after its "closed" event.
+
+    Subscribes immediately; raises KeyError for an unknown session or one whose stream was
+    never started (streams are started by push_stream_quotes, never by readers).
+    replay=True (implied once the stream has finished) starts with the most recent events.
+    """
+    _orchestrator.get_session(session_id)
+    stream = _quote_streams.get(session_id)
+    if stream is None:
+        raise KeyError(f"no quote stream for session {session_id}")
+    queue = stream.scan_loop.subscribe(replay=replay or stream.task.done())
+
+    async def _events() -> AsyncIterator[Dict[str, Any]]:
+        try:
+            while True:
+                event = await queue.get()
+                yield event
+                if event["event"] == "closed":
+                    return
+        finally:
+            stream.scan_loop.unsubscribe(queue)
+
+    return _events()
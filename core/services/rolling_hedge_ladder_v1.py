@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from dataclasses import fields
 from dataclasses import is_dataclass
+from dataclasses import replace
 import datetime
 from decimal import Decimal
 from decimal import InvalidOperation
@@ -11,14 +12,27 @@ from typing import Literal
 
 from core.numeric_policy import DEFAULT_TOLERANCES
 from core.numeric_policy import MetricClass
-from core.services.advisory_output_contract_v1 import AdvisoryDecisionV1
+from core.risk.exposures import compute_exposures_v1
+from core.risk.portfolio_surface import compute_portfolio_surface_v1
+from core.risk.reprice_harness import SCENARIO_CUBE_VECTORISED
+from core.risk.reprice_harness import RiskResult
+from core.risk.reprice_harness import reprice_fx_forward_risk
+from core.risk.risk_artifact import build_risk_artifact_v1
+from core.risk.scenario_grid import ScenarioGrid
+from core.risk.scenario_set import ScenarioSet
+from core.services.advisory_input_contract_v1 import AdvisoryExposureRowV1
+from core.services.advisory_input_contract_v1 import normalize_advisory_input_v1
+from core.services.advisory_read_model_v1 import pricing_ready_contracts_v1
+from core.services.advisory_read_model_v1 import risk_request_from_payload_v1
 from core.services.advisory_read_model_v1 import run_treasury_advisory_v1
+from core.services.exposure_adapter_v1 import build_risk_request_from_advisory_v1
 from core.services.hedge_policy_constraints_v1 import HedgePolicyV1
 from core.services.hedge_policy_constraints_v1 import PolicyApplicationResultV1
 from core.services.hedge_policy_constraints_v1 import apply_hedge_policy_v1
 from core.services.hedge_recommendation_v1 import HedgeRecommendationV1
 from core.services.hedge_recommendation_v1 import recommend_hedge_ratio_v1
 from core.services.scenario_risk_summary_v1 import ScenarioRiskSummaryV1
+from core.services.scenario_risk_summary_v1 import summarize_scenario_risk_v1
 
 
 @dataclass(frozen=True)
@@ -188,6 +202,98 @@ def _bucket_payload(payload: dict[str, Any], exposures: list[dict[str, Any]]) ->
     }
 
 
+def _per_bucket_risk_summaries(
+    payload: dict[str, Any],
+    bucket_exposures: list[list[dict[str, Any]]],
+    *,
+    base_snapshot,
+    scenario_spec,
+    target_worst_loss_domestic: float,
+) -> list[ScenarioRiskSummaryV1]:
+    return [
+        run_treasury_advisory_v1(
+            _bucket_payload(payload, exposures),
+            base_snapshot=base_snapshot,
+            scenario_spec=scenario_spec,
+            target_worst_loss_domestic=target_worst_loss_domestic,
+        ).risk_summary
+        for exposures in bucket_exposures
+    ]
+
+
+def _shared_risk_summaries(
+    payload: dict[str, Any],
+    bucket_keys: list[tuple[str, int]],
+    bucket_exposures: list[list[dict[str, Any]]],
+    *,
+    as_of: datetime.date,
+    buckets_days: tuple[int, ...],
+    base_snapshot,
+    scenario_spec,
+) -> list[ScenarioRiskSummaryV1] | None:
+    """Price every exposure once, then summarise each bucket from its rows of the RiskResult.
+
+    Instrument ids depend only on the exposure row, so a bucket's slice of the book result
+    equals the result of repricing that bucket alone; the book is one vectorised scenario
+    cube, bit-identical to per-scenario forward pricing. Returns None when the book spans
+    several quote currencies: each bucket then carries its own domestic currency and the
+    caller falls back to one advisory run per bucket.
+    """
+    book_rows = [row for exposures in bucket_exposures for row in exposures]
+    normalized = normalize_advisory_input_v1(_bucket_payload(payload, book_rows))
+    contracts_raw, book_request_payload = build_risk_request_from_advisory_v1(normalized)
+    if len({contract.quote_currency for contract in contracts_raw.values()}) > 1:
+        return None
+
+    scenario_grid = ScenarioGrid.from_scenario_set(ScenarioSet.from_spec(scenario_spec))
+    book_request = risk_request_from_payload_v1(
+        risk_request_payload=book_request_payload,
+        base_snapshot=base_snapshot,
+        scenario_spec=scenario_spec,
+    )
+    book_result = reprice_fx_forward_risk(
+        request=book_request,
+        base_snapshot=base_snapshot,
+        scenario_grid=scenario_grid,
+        contracts_by_instrument_id=pricing_ready_contracts_v1(contracts_raw=contracts_raw, base_snapshot=base_snapshot),
+        cube_path=SCENARIO_CUBE_VECTORISED,
+    )
+
+    rows_by_bucket: dict[tuple[str, int], list[AdvisoryExposureRowV1]] = {key: [] for key in bucket_keys}
+    for row in normalized.exposures:
+        rows_by_bucket[_assign_bucket((row.maturity_date - as_of).days, buckets_days)].append(row)
+
+    cubes_by_instrument_id = {cube.instrument_id: cube for cube in book_result.results}
+    summaries: list[ScenarioRiskSummaryV1] = []
+    for key in bucket_keys:
+        _, bucket_request_payload = build_risk_request_from_advisory_v1(
+            replace(normalized, exposures=tuple(rows_by_bucket[key]))
+        )
+        bucket_request = risk_request_from_payload_v1(
+            risk_request_payload=bucket_request_payload,
+            base_snapshot=base_snapshot,
+            scenario_spec=scenario_spec,
+        )
+        bucket_result = RiskResult(
+            schema_version=book_result.schema_version,
+            market_snapshot_id=book_result.market_snapshot_id,
+            scenario_set_id=book_result.scenario_set_id,
+            results=tuple(cubes_by_instrument_id[instrument_id] for instrument_id in bucket_request.instrument_ids),
+        )
+        risk_artifact = build_risk_artifact_v1(bucket_request, scenario_grid, bucket_result)
+        if not summaries:
+            # Exposures v1 only rejects on the spec, the spot and the artifact shape, all shared
+            # across buckets: one check keeps the rejections of the per-bucket advisory runs.
+            compute_exposures_v1(risk_artifact=risk_artifact, base_spot=Decimal(str(base_snapshot.spot_rate)))
+        summaries.append(
+            summarize_scenario_risk_v1(
+                risk_artifact=risk_artifact,
+                portfolio_surface_artifact=compute_portfolio_surface_v1(risk_artifact),
+            )
+        )
+    return summaries
+
+
 def compute_rolling_hedge_ladder_v1(
     payload: dict,
     *,
@@ -227,26 +333,37 @@ def compute_rolling_hedge_ladder_v1(
     for key in ordered_bucket_keys:
         buckets_map[key] = sorted(buckets_map[key], key=_exposure_sort_key)
 
-    pre_bucket_decisions: list[AdvisoryDecisionV1] = []
     bucket_current_ratios: list[float] = []
     bucket_unhedged_losses: list[Decimal] = []
 
     tiny = _tiny_guard()
     total_target = Decimal(str(config.target_worst_loss_total_domestic))
-    for key in ordered_bucket_keys:
-        exposures = buckets_map[key]
-        decision = run_treasury_advisory_v1(
-            _bucket_payload(payload, exposures),
+    bucket_exposures = [buckets_map[key] for key in ordered_bucket_keys]
+    bucket_risk_summaries = None
+    if ordered_bucket_keys:
+        bucket_risk_summaries = _shared_risk_summaries(
+            payload,
+            ordered_bucket_keys,
+            bucket_exposures,
+            as_of=as_of,
+            buckets_days=config.buckets_days,
+            base_snapshot=base_snapshot,
+            scenario_spec=scenario_spec,
+        )
+    if bucket_risk_summaries is None:
+        bucket_risk_summaries = _per_bucket_risk_summaries(
+            payload,
+            bucket_exposures,
             base_snapshot=base_snapshot,
             scenario_spec=scenario_spec,
             target_worst_loss_domestic=float(total_target),
         )
-        pre_bucket_decisions.append(decision)
 
+    for exposures, risk_summary in zip(bucket_exposures, bucket_risk_summaries):
         current_ratio = _weighted_current_hedge_ratio(exposures)
         bucket_current_ratios.append(current_ratio)
 
-        current_worst_loss = Decimal(str(abs(decision.risk_summary.worst_loss_domestic)))
+        current_worst_loss = Decimal(str(abs(risk_summary.worst_loss_domestic)))
         unhedged_fraction = max(Decimal("1") - Decimal(str(current_ratio)), tiny)
         bucket_unhedged_losses.append(current_worst_loss / unhedged_fraction)
 
@@ -269,9 +386,9 @@ def compute_rolling_hedge_ladder_v1(
         label, day_max = key
         exposures = buckets_map[key]
         target_for_bucket = float(bucket_targets[idx])
-        pre_decision = pre_bucket_decisions[idx]
+        risk_summary = bucket_risk_summaries[idx]
         current_ratio = bucket_current_ratios[idx]
-        current_worst_loss = abs(float(pre_decision.risk_summary.worst_loss_domestic))
+        current_worst_loss = abs(float(risk_summary.worst_loss_domestic))
 
         if current_worst_loss <= float(tiny):
             hedge_recommendation = HedgeRecommendationV1(
@@ -284,7 +401,7 @@ def compute_rolling_hedge_ladder_v1(
             )
         else:
             hedge_recommendation = recommend_hedge_ratio_v1(
-                pre_decision.risk_summary,
+                risk_summary,
                 current_hedge_ratio=current_ratio,
                 target_worst_loss_domestic=target_for_bucket,
             )
@@ -316,7 +433,7 @@ def compute_rolling_hedge_ladder_v1(
                 bucket_day_max=day_max,
                 exposures_count=len(exposures),
                 current_hedge_ratio_effective=current_ratio,
-                risk_summary=pre_decision.risk_summary,
+                risk_summary=risk_summary,
                 hedge_recommendation=hedge_recommendation,
                 policy_result=policy_result,
                 recommended_forward_notional=recommended_notional,
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Protocol, List, Dict
+from typing import Protocol, Iterable, List, Dict, Optional
 from core.v2.models import V2Event
 from core.v2.event_ordering import stable_sort_events
 from collections import defaultdict
@@ -9,36 +9,62 @@ class EventStore(Protocol):
         ...
     def append(self, event: V2Event) -> None:
         ...
+    def append_many(self, events: List[V2Event]) -> List[bool]:
+        ...
     def list(self, session_id: str) -> List[V2Event]:
         ...
+    def get(self, session_id: str, event_id: str) -> Optional[V2Event]:
+        ...
+    def get_many(self, session_id: str, event_ids: Iterable[str]) -> Dict[str, V2Event]:
+        ...
 
 class InMemoryEventStore:
     def list_after_version(self, session_id: str, after_version: int) -> List[V2Event]:
-        """החזר את כל האירועים עם applied_version > after_version (לפי event_id ייחודי, דטרמיניסטי)."""
-        events = self.list(session_id)
-        events = stable_sort_events(events)
-        seen = set()
-        applied_version = 0
-        tail = []
-        for e in events:
-            if e.event_id in seen:
-                continue
-            seen.add(e.event_id)
-            applied_version += 1
-            if applied_version > after_version:
-                tail.append(e)
-        return tail
+        """החזר את כל האירועים עם applied_version > after_version, בסדר דטרמיניסטי (ts, event_id).
+        applied_version ניתן לפי סדר ה-append (כמו ב-SqliteEventStore), ולכן אירוע שמגיע מאוחר
+        עם ts מוקדם עדיין שייך לזנב."""
+        applied = self._applied.get(session_id, [])
+        return stable_sort_events(applied[max(after_version, 0):])
     """
     In-memory append-only event store. No deduplication at store level.
     Events are stored per session, ordered deterministically by (ts, event_id).
+    Each new event_id gets the next applied_version in append order (a duplicate consumes
+    none), matching SqliteEventStore.
     """
     def __init__(self) -> None:
         self._events: Dict[str, List[V2Event]] = defaultdict(list)
+        # First stored event per event_id, in append order: applied_version == index + 1
+        self._applied: Dict[str, List[V2Event]] = defaultdict(list)
+        self._applied_ids: Dict[str, set[str]] = defaultdict(set)
 
     def append(self, event: V2Event) -> None:
         self._events[event.session_id].append(event)
+        applied_ids = self._applied_ids[event.session_id]
+        if event.event_id not in applied_ids:
+            applied_ids.add(event.event_id)
+            self._applied[event.session_id].append(event)
+
+    def append_many(self, events: List[V2Event]) -> List[bool]:
+        for e in events:
+            self.append(e)
+        return [True] * len(events)
 
     def list(self, session_id: str) -> List[V2Event]:
         events = self._events.get(session_id, [])
         # Deterministic ordering: (ts, event_id)
         return sorted(events, key=lambda e: (e.ts, e.event_id))
+
+    def get(self, session_id: str, event_id: str) -> Optional[V2Event]:
+        # First stored event wins, matching the SQLite primary key
+        for e in self._events.get(session_id, []):
+            if e.event_id == event_id:
+                return e
+        return None
+
+    def get_many(self, session_id: str, event_ids: Iterable[str]) -> Dict[str, V2Event]:
+        wanted = set(event_ids)
+        found: Dict[str, V2Event] = {}
+        for e in self._events.get(session_id, []):
+            if e.event_id in wanted and e.event_id not in found:
+                found[e.event_id] = e
+        return found
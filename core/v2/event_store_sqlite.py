@@ -4,57 +4,67 @@ import json
 from datetime import datetime
 from contextlib import closing
 from core.v2.models import V2Event
-from core.v2.persistence_config import get_v2_db_path, ensure_var_dir_exists
+from core.v2.persistence_config import get_v2_db_path
 from core.v2.errors import EventConflictError
+from core.v2.sqlite_pool import get_connection_pool
+
+# applied_version is assigned inside the INSERT (single statement => atomic under the write lock);
+# a duplicate event_id fails on the primary key and never consumes a version.
+_INSERT_EVENT_SQL = """
+    INSERT INTO events (
+        session_id, event_id, ts, type, payload_json, payload_hash, inserted_at, applied_version
+    ) VALUES (
+        ?, ?, ?, ?, ?, ?, ?,
+        (SELECT COALESCE(MAX(applied_version), 0) + 1 FROM events WHERE session_id = ?)
+    )
+"""
+_SELECT_EXISTING_SQL = "SELECT type, payload_hash FROM events WHERE session_id = ? AND event_id = ?"
+# SQLite's default host-parameter limit is 999; keep the IN (...) lookups well under it.
+_EXISTING_LOOKUP_CHUNK = 500
+_LIST_EVENTS_SQL = (
+    "SELECT event_id, ts, type, payload_json, payload_hash FROM events WHERE session_id = ? ORDER BY ts, event_id"
+)
+# Primary-key point lookup
+_GET_EVENT_SQL = (
+    "SELECT event_id, ts, type, payload_json, payload_hash FROM events WHERE session_id = ? AND event_id = ?"
+)
+# Range scan on idx_events_session_applied_version; only the tail is sorted.
+_LIST_EVENTS_AFTER_VERSION_SQL = (
+    "SELECT event_id, ts, type, payload_json, payload_hash FROM events "
+    "WHERE session_id = ? AND applied_version > ? ORDER BY ts, event_id"
+)
+# Paged tail: a page is the contiguous applied_version range (after_version, after_version + limit]
+_LIST_EVENTS_AFTER_VERSION_PAGE_SQL = (
+    "SELECT event_id, ts, type, payload_json, payload_hash FROM events "
+    "WHERE session_id = ? AND applied_version > ? ORDER BY applied_version LIMIT ?"
+)
 
 class SqliteEventStore:
     def list_after_version(self, session_id: str, after_version: int):
         """
-        Institutional-grade: מחזיר את כל האירועים עבור session_id עם applied_version > after_version, בסדר דטרמיניסטי (ts, event_id).
-        לא מסתמך על אינדקס/אורך הרשימה, אלא על מונה applied_version דטרמיניסטי (כמו InMemoryEventStore והחוזה).
+        מחזיר את כל האירועים עבור session_id עם applied_version > after_version, בסדר דטרמיניסטי (ts, event_id).
+        applied_version נשמר בטבלה בזמן append, כך שקריאת זנב היא range query יחיד על האינדקס.
         """
-        events = self.list(session_id)
-        from core.v2.event_ordering import stable_sort_events
-        events = stable_sort_events(events)
-        seen = set()
-        applied_version = 0
-        tail = []
-        for e in events:
-            if e.event_id in seen:
-                continue
-            seen.add(e.event_id)
-            applied_version += 1
-            if applied_version > after_version:
-                tail.append(e)
-        return tail
+        return self.list(session_id, after_version=after_version)
+
     def __init__(self, db_path: str = None):
         if db_path is None:
             db_path = get_v2_db_path()
         self.db_path = db_path
+        self._pool = get_connection_pool(db_path)
 
     def _connect(self):
-        from core.v2.sqlite_schema import run_migrations
-        ensure_var_dir_exists(self.db_path)
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        conn.execute("PRAGMA foreign_keys=ON")
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA synchronous=NORMAL")
-        run_migrations(conn)
-        return conn
+        return self._pool.acquire()
 
     def close(self):
-        pass  # No-op: no long-lived connection
+        self._pool.close()
 
     def append(self, event: V2Event) -> bool:
         now = datetime.utcnow().isoformat()
-        with closing(self._connect()) as conn, closing(conn.cursor()) as cur:
+        with self._pool.connection() as conn, closing(conn.cursor()) as cur:
             try:
                 cur.execute(
-                    """
-                    INSERT INTO events (
-                        session_id, event_id, ts, type, payload_json, payload_hash, inserted_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
+                    _INSERT_EVENT_SQL,
                     (
                         event.session_id,
                         event.event_id,
@@ -63,15 +73,13 @@ class SqliteEventStore:
                         json.dumps(event.payload, separators=(",", ":"), sort_keys=True, ensure_ascii=False),
                         event.payload_hash,
                         now,
+                        event.session_id,
                     ),
                 )
                 conn.commit()
                 return True
             except sqlite3.IntegrityError:
-                cur.execute(
-                    "SELECT type, payload_hash FROM events WHERE session_id = ? AND event_id = ?",
-                    (event.session_id, event.event_id),
-                )
+                cur.execute(_SELECT_EXISTING_SQL, (event.session_id, event.event_id))
                 row = cur.fetchone()
                 if row is None:
                     raise
@@ -89,21 +97,120 @@ class SqliteEventStore:
                     incoming_hash,
                 )
 
+    def append_many(self, events: list[V2Event]) -> list[bool]:
+        """
+        Batch variant of append(): one write transaction, one executemany.
+        Returns a per-event applied flag with append() semantics (False for an identical
+        duplicate, including duplicates within the batch). If any event conflicts with a stored
+        or earlier in-batch event, EventConflictError is raised for the first such event and
+        nothing from the batch is written.
+        """
+        if not events:
+            return []
+        now = datetime.utcnow().isoformat()
+        with self._pool.connection() as conn, closing(conn.cursor()) as cur:
+            # Take the write lock up front so the conflict check and the insert see the same state
+            cur.execute("BEGIN IMMEDIATE")
+            known: dict[tuple[str, str], tuple[str, str]] = {}
+            by_session: dict[str, list[str]] = {}
+            for e in events:
+                by_session.setdefault(e.session_id, []).append(e.event_id)
+            for session_id, event_ids in by_session.items():
+                unique_ids = list(dict.fromkeys(event_ids))
+                for i in range(0, len(unique_ids), _EXISTING_LOOKUP_CHUNK):
+                    chunk = unique_ids[i:i + _EXISTING_LOOKUP_CHUNK]
+                    cur.execute(
+                        "SELECT event_id, type, payload_hash FROM events "
+                        f"WHERE session_id = ? AND event_id IN ({','.join('?' * len(chunk))})",
+                        [session_id, *chunk],
+                    )
+                    for event_id, existing_type, existing_hash in cur.fetchall():
+                        known[(session_id, event_id)] = (existing_type, existing_hash)
+
+            applied: list[bool] = []
+            rows = []
+            for e in events:
+                key = (e.session_id, e.event_id)
+                existing = known.get(key)
+                if existing is not None:
+                    existing_type, existing_hash = existing
+                    if existing_hash == e.payload_hash and existing_type == e.type:
+                        applied.append(False)
+                        continue
+                    raise EventConflictError(
+                        e.session_id,
+                        e.event_id,
+                        existing_type,
+                        e.type,
+                        existing_hash,
+                        e.payload_hash,
+                    )
+                known[key] = (e.type, e.payload_hash)
+                applied.append(True)
+                rows.append((
+                    e.session_id,
+                    e.event_id,
+                    e.ts.isoformat(),
+                    e.type,
+                    json.dumps(e.payload, separators=(",", ":"), sort_keys=True, ensure_ascii=False),
+                    e.payload_hash,
+                    now,
+                    e.session_id,
+                ))
+            if rows:
+                cur.executemany(_INSERT_EVENT_SQL, rows)
+            conn.commit()
+            return applied
+
     def list(self, session_id: str, after_version: int | None = None, limit: int | None = None):
-        with closing(self._connect()) as conn, closing(conn.cursor()) as cur:
-            q = "SELECT event_id, ts, type, payload_json, payload_hash FROM events WHERE session_id = ? ORDER BY ts, event_id"
-            params = [session_id]
-            # after_version/limit not implemented for now (API compatibility)
+        """
+        Events ordered by (ts, event_id). With both after_version and limit the result is a page in
+        append (applied_version) order instead, so the next page starts at after_version + len(page).
+        """
+        with self._pool.connection() as conn, closing(conn.cursor()) as cur:
+            if after_version is not None and limit is not None:
+                q, params = _LIST_EVENTS_AFTER_VERSION_PAGE_SQL, [session_id, after_version, limit]
+            elif after_version is not None:
+                q, params = _LIST_EVENTS_AFTER_VERSION_SQL, [session_id, after_version]
+            else:
+                q, params = _LIST_EVENTS_SQL, [session_id]
+                if limit is not None:
+                    q += " LIMIT ?"
+                    params.append(limit)
             cur.execute(q, params)
-            rows = cur.fetchall()
-            events = []
-            for event_id, ts, type_, payload_json, payload_hash in rows:
-                events.append(V2Event(
-                    event_id=event_id,
-                    session_id=session_id,
-                    ts=datetime.fromisoformat(ts),
-                    type=type_,
-                    payload=json.loads(payload_json),
-                    payload_hash=payload_hash,
-                ))
-            return events
+            return [_row_to_event(session_id, row) for row in cur.fetchall()]
+
+    def get(self, session_id: str, event_id: str) -> V2Event | None:
+        """Single event by primary key (session_id, event_id), or None."""
+        with self._pool.connection() as conn, closing(conn.cursor()) as cur:
+            cur.execute(_GET_EVENT_SQL, (session_id, event_id))
+            row = cur.fetchone()
+            return _row_to_event(session_id, row) if row is not None else None
+
+    def get_many(self, session_id: str, event_ids) -> dict[str, V2Event]:
+        """Events by primary key, keyed by event_id; ids that are not stored are omitted."""
+        unique_ids = list(dict.fromkeys(event_ids))
+        found: dict[str, V2Event] = {}
+        with self._pool.connection() as conn, closing(conn.cursor()) as cur:
+            for i in range(0, len(unique_ids), _EXISTING_LOOKUP_CHUNK):
+                chunk = unique_ids[i:i + _EXISTING_LOOKUP_CHUNK]
+                cur.execute(
+                    "SELECT event_id, ts, type, payload_json, payload_hash FROM events "
+                    f"WHERE session_id = ? AND event_id IN ({','.join('?' * len(chunk))})",
+                    [session_id, *chunk],
+                )
+                for row in cur.fetchall():
+                    found[row[0]] = _row_to_event(session_id, row)
+        return found
+
+
+def _row_to_event(session_id: str, row) -> V2Event:
+    event_id, ts, type_, payload_json, payload_hash = row
+    return V2Event(
+        event_id=event_id,
+        session_id=session_id,
+        ts=datetime.fromisoformat(ts),
+        type=type_,
+        payload=json.loads(payload_json),
+        payload_hash=payload_hash,
+    )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Any, Dict, Literal
+from typing import Any, Dict, Literal, Mapping
 from datetime import datetime
 import json
 import hashlib
@@ -42,7 +42,8 @@ class Snapshot:
     version: int
     created_at: datetime
     state_hash: str
-    data: Dict[str, Any]
+    # A dict, or a read-only LazySnapshotData Mapping when loaded from a binary encoding
+    data: Mapping[str, Any]
 
 # --- Canonical hashing utilities ---
 def canonical_json(obj: Any) -> str:
@@ -1,15 +1,21 @@
 
 from __future__ import annotations
-from core.v2.models import V2Event, SessionState, Snapshot, hash_snapshot, AppliedEvent
+from core.v2.models import V2Event, SessionState, Snapshot, AppliedEvent
 from core.v2.event_store import EventStore
 from core.v2.snapshot_store import SnapshotStore
 from core.v2.snapshot_policy import SnapshotPolicy
 from core.v2.event_ordering import stable_sort_events
+from core.v2.snapshot_codec import merge_snapshot_data
+from core.v2.state_hash import STATE_HASH_V1, compute_state_hash, extend_state_hash
+from core.v2.session_cache import DEFAULT_MAX_CACHED_SESSIONS, SessionCacheEntry, SessionStateCache
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional, TypeVar
 import logging
 import time
 
+T = TypeVar("T")
+
+
 class V2RuntimeOrchestrator:
     """
     Orchestrates event ingestion and snapshot building for a session.
@@ -65,7 +71,7 @@ class V2RuntimeOrchestrator:
                 data[e.event_id] = e.payload
                 seen.add(e.event_id)
                 version += 1
-        state_hash = hash_snapshot(data)
+        state_hash = compute_state_hash(data, self.state_hash_algo)
         now = datetime.utcnow()
         return Snapshot(
             session_id=session_id,
@@ -75,17 +81,22 @@ class V2RuntimeOrchestrator:
             data=data,
         )
 
-    def _build_snapshot_delta(self, session_id: str, base: Snapshot) -> Snapshot:
-        tail_events = self.store.list_after_version(session_id, base.version)
-        data = self._replay_events_into_data(base.data, tail_events)
+    def _build_snapshot_delta(self, session_id: str, base: Snapshot, tail_events: Optional[list[V2Event]] = None) -> Snapshot:
+        if tail_events is None:
+            tail_events = self.store.list_after_version(session_id, base.version)
+        new_items = []
+        seen = set()
         # version = base.version + unique new event_ids in tail
-        seen = set(base.data.keys())
         version = base.version
         for e in stable_sort_events(tail_events):
-            if e.event_id not in seen:
+            if e.event_id not in base.data and e.event_id not in seen:
                 seen.add(e.event_id)
+                new_items.append((e.event_id, e.payload))
                 version += 1
-        state_hash = hash_snapshot(data)
+        # Encoded (lazy) bases stay encoded: only the tail payloads are held decoded
+        data = merge_snapshot_data(base.data, new_items)
+        # v2 state hashes re-hash only the chunks the tail touches; v1 recomputes in full
+        state_hash = extend_state_hash(base.state_hash, base.data, new_items, self.state_hash_algo)
         now = datetime.utcnow()
         return Snapshot(
             session_id=session_id,
@@ -94,17 +105,34 @@ class V2RuntimeOrchestrator:
             state_hash=state_hash,
             data=data,
         )
-    def __init__(self, store: EventStore, snapshot_store: Optional[SnapshotStore] = None, snapshot_policy: Optional[SnapshotPolicy] = None):
+    def __init__(
+        self,
+        store: EventStore,
+        snapshot_store: Optional[SnapshotStore] = None,
+        snapshot_policy: Optional[SnapshotPolicy] = None,
+        max_cached_sessions: int = DEFAULT_MAX_CACHED_SESSIONS,
+        state_hash_algo: str = STATE_HASH_V1,
+    ):
         self.store = store
         self.snapshot_store = snapshot_store
         self.snapshot_policy = snapshot_policy
-        self._session_states: dict[str, SessionState] = {}
-        self._applied_log: dict[str, list[AppliedEvent]] = {}
+        self.state_hash_algo = state_hash_algo
+        self._cache = SessionStateCache(max_cached_sessions)
+
+    # Read-only views kept for instrumentation/tests; the cache is the source of truth.
+    @property
+    def _session_states(self) -> dict[str, SessionState]:
+        return {e.session_id: e.state for e in self._cache}
+
+    @property
+    def _applied_log(self) -> dict[str, list[AppliedEvent]]:
+        return {e.session_id: e.applied_log for e in self._cache}
 
     def recover(self, session_id: str) -> SessionState:
         """
         Load latest snapshot and replay only tail events for session_id.
         Guarantees deterministic state after crash/restart.
+        Always reads from disk and replaces the cached entry for session_id.
         """
         base = None
         if self.snapshot_store is not None:
@@ -112,52 +140,78 @@ class V2RuntimeOrchestrator:
         if base is not None:
             # Load tail events after snapshot.version
             tail_events = self.store.list_after_version(session_id, base.version)
-            data = dict(base.data)
             seen = set(base.data.keys())
             version = base.version
             applied = dict((eid, i+1) for i, eid in enumerate(sorted(seen)))
-            applied_log = []
-            for e in sorted(tail_events, key=lambda e: (e.ts, e.event_id)):
-                if e.event_id not in seen:
-                    data[e.event_id] = e.payload
-                    version += 1
-                    applied[e.event_id] = version
-                    applied_log.append(AppliedEvent(event=e, state_version=version, applied_at=e.ts))
-            state = SessionState(session_id=session_id, version=version, applied=applied)
-            self._session_states[session_id] = state
-            self._applied_log[session_id] = applied_log
-            return state
         else:
             # No snapshot: replay all events
-            events = self.store.list(session_id)
-            data = {}
+            tail_events = self.store.list(session_id)
             seen = set()
             version = 0
             applied = {}
-            applied_log = []
-            for e in sorted(events, key=lambda e: (e.ts, e.event_id)):
-                if e.event_id not in seen:
-                    data[e.event_id] = e.payload
-                    version += 1
-                    applied[e.event_id] = version
-                    applied_log.append(AppliedEvent(event=e, state_version=version, applied_at=e.ts))
-            state = SessionState(session_id=session_id, version=version, applied=applied)
-            self._session_states[session_id] = state
-            self._applied_log[session_id] = applied_log
-            return state
+        applied_log = []
+        for e in sorted(tail_events, key=lambda e: (e.ts, e.event_id)):
+            if e.event_id not in seen:
+                seen.add(e.event_id)
+                version += 1
+                applied[e.event_id] = version
+                applied_log.append(AppliedEvent(event=e, state_version=version, applied_at=e.ts))
+        entry = SessionCacheEntry(
+            session_id=session_id,
+            version=version,
+            applied=applied,
+            applied_log=applied_log,
+            last_snapshot_version=base.version if base is not None else None,
+        )
+        self._cache.put(entry)
+        return entry.state
+
+    def _entry(self, session_id: str) -> SessionCacheEntry:
+        """Cached entry for session_id; disk (recover) is only hit on a cache miss."""
+        entry = self._cache.get(session_id)
+        if entry is None:
+            self.recover(session_id)
+            entry = self._cache.get(session_id)
+        return entry
+
+    def get_state(self, session_id: str) -> SessionState:
+        return self._entry(session_id).state
+
+    def cached_view(
+        self,
+        session_id: str,
+        name: str,
+        build: Callable[[SessionState], T],
+        extend: Optional[Callable[[T, list[AppliedEvent]], T]] = None,
+    ) -> T:
+        """
+        Memoise a value derived from the session state. When the version moves the value is
+        rebuilt, or, if extend is given, advanced from the previous value with the newly applied events.
+        """
+        return self._entry(session_id).view(name, build, extend)
+
+    def clear_cache(self) -> None:
+        self._cache = SessionStateCache(self._cache.max_sessions)
+
+    def save_snapshot(self, snapshot: Snapshot) -> None:
+        """Persist a snapshot and keep the cached cadence anchor in sync (write-through)."""
+        if self.snapshot_store is None:
+            raise ValueError("save_snapshot requires a snapshot_store")
+        self.snapshot_store.save(snapshot)
+        entry = self._cache.get(snapshot.session_id)
+        if entry is not None and (entry.last_snapshot_version is None or snapshot.version > entry.last_snapshot_version):
+            entry.last_snapshot_version = snapshot.version
 
     def ingest_event(self, event: V2Event) -> SessionState:
-        state = self._session_states.get(event.session_id)
-        applied_log = self._applied_log.setdefault(event.session_id, [])
-        if state is None:
-            state = SessionState(session_id=event.session_id, version=0, applied={})
-        snapshot_store = self.snapshot_store
-        snapshot_policy = self.snapshot_policy
-        last_snapshot_version = None
-        if snapshot_store is not None:
-            last_snapshot = snapshot_store.latest(event.session_id)
-            if last_snapshot is not None:
-                last_snapshot_version = last_snapshot.version
+        return self.append_event(event)[0]
+
+    def append_event(self, event: V2Event) -> tuple[SessionState, bool]:
+        """
+        ingest_event that also reports whether the event was applied (a new event_id).
+        As with append_events, the caller must leave the store write to this method.
+        """
+        entry = self._entry(event.session_id)
+        last_snapshot_version = entry.last_snapshot_version
         # Always attempt to persist the incoming event to the EventStore so
         # conflict detection at the store layer is exercised and any
         # EventConflictError is propagated out of core unchanged.
@@ -165,31 +219,75 @@ class V2RuntimeOrchestrator:
         # (returning False) and raise EventConflictError for differing payloads.
         self.store.append(event)
 
-        if event.event_id not in state.applied:
-            new_applied = dict(state.applied)
-            new_version = state.version + 1
-            new_applied[event.event_id] = new_version
-            state = SessionState(session_id=event.session_id, version=new_version, applied=new_applied)
-            applied_event = AppliedEvent(event=event, state_version=new_version, applied_at=event.ts)
-            applied_log.append(applied_event)
-            self._session_states[event.session_id] = state
+        is_new = event.event_id not in entry.applied
+        if is_new:
+            new_version = entry.version + 1
+            entry.apply(event.event_id, AppliedEvent(event=event, state_version=new_version, applied_at=event.ts))
             # Snapshot cadence policy integration
-            if snapshot_store is not None and snapshot_policy is not None:
-                should_snap, target_version = snapshot_policy.should_snapshot(
+            if self.snapshot_store is not None and self.snapshot_policy is not None:
+                should_snap, target_version = self.snapshot_policy.should_snapshot(
                     event.session_id,
                     last_snapshot_version,
                     new_version,
                 )
                 if should_snap and target_version == new_version:
                     # Build and persist snapshot at this version
-                    snap = self.build_snapshot(event.session_id)
-                    # build_snapshot will persist if policy allows, but we want to guarantee it here
-                    snapshot_store.save(snap)
-            return state
+                    self.save_snapshot(self.build_snapshot(event.session_id))
+        # Idempotent: a duplicate event_id does not increment version
+        return entry.state, is_new
+
+    def ingest_events(self, events: list[V2Event]) -> SessionState:
+        """
+        Batch variant of ingest_event for a single session.
+        - All events are persisted with one store.append_many call (one transaction for SQLite);
+          an EventConflictError aborts the whole batch before any state change.
+        - State is advanced in batch order with the same first-application rule as ingest_event.
+        - The snapshot policy is evaluated once for the batch: if any cadence point was reached,
+          a single snapshot is built at the final version.
+        """
+        return self.append_events(events)[0]
+
+    def append_events(self, events: list[V2Event]) -> tuple[SessionState, list[bool]]:
+        """
+        ingest_events that also reports, per item, whether it was applied (a new event_id).
+        Callers must not write the batch to the store themselves: the cache entry has to be
+        loaded before the write, otherwise a cold recover() already counts the batch and the
+        snapshot cadence is skipped.
+        """
+        if not events:
+            raise ValueError("ingest_events requires at least one event")
+        session_id = events[0].session_id
+        if any(e.session_id != session_id for e in events):
+            raise ValueError("ingest_events batch must target a single session")
+        entry = self._entry(session_id)
+        last_snapshot_version = entry.last_snapshot_version
+
+        append_many = getattr(self.store, "append_many", None)
+        if append_many is not None:
+            append_many(events)
         else:
-            # Idempotent: do not append duplicate event, do not increment version
-            self._session_states[event.session_id] = state
-            return state
+            for e in events:
+                self.store.append(e)
+
+        start_version = entry.version
+        flags = []
+        for e in events:
+            is_new = e.event_id not in entry.applied
+            if is_new:
+                entry.apply(e.event_id, AppliedEvent(event=e, state_version=entry.version + 1, applied_at=e.ts))
+            flags.append(is_new)
+        if entry.version == start_version:
+            return entry.state, flags
+
+        if self.snapshot_store is not None and self.snapshot_policy is not None:
+            # Policies are pure cadence arithmetic; only the (single) snapshot build does I/O.
+            due = any(
+                self.snapshot_policy.should_snapshot(session_id, last_snapshot_version, v)[0]
+                for v in range(start_version + 1, entry.version + 1)
+            )
+            if due:
+                self.save_snapshot(self.build_snapshot(session_id))
+        return entry.state, flags
 
     def build_snapshot(self, session_id: str) -> Snapshot:
         # Always use EventStore + SnapshotStore, never _applied_log/_session_states for correctness
@@ -202,18 +300,14 @@ class V2RuntimeOrchestrator:
         if self.snapshot_store is not None:
             base = self.snapshot_store.latest(session_id)
         if base is not None:
-            all_events = self.store.list(session_id)
-            if all_events:
-                max_seq = len({e.event_id for e in all_events})
-                if base.version == max_seq:
-                    return base
-                if base.version > max_seq:
-                    raise ValueError(f"Snapshot version {base.version} > latest event version {max_seq}")
+            # Tail read only: an empty tail means the snapshot is already current.
+            tail_events = self.store.list_after_version(session_id, base.version)
+            if not tail_events:
+                return base
             mode = "delta"
             base_version = base.version
-            tail_events = self.store.list_after_version(session_id, base.version)
             tail_len = len(tail_events)
-            snap = self._build_snapshot_delta(session_id, base)
+            snap = self._build_snapshot_delta(session_id, base, tail_events)
         else:
             snap = self._build_snapshot_full(session_id)
         elapsed_ms = (time.perf_counter() - t0) * 1000
@@ -9,6 +9,14 @@ def get_v2_db_path():
         return "/tmp/demobot_v2_tests.sqlite"
     return "var/demobot_v2.sqlite"
 
+def get_v2_state_hash_algo():
+    # "v1" (canonical JSON sha256, default) or "v2" (incremental hash tree keyed by event_id); see core.v2.state_hash
+    return os.getenv("DEMOBOT_V2_STATE_HASH_ALGO", "v1")
+
+def get_v2_snapshot_encoding():
+    # "json" (default), "chunked" or "chunked-zlib"; see core.v2.snapshot_codec
+    return os.getenv("DEMOBOT_V2_SNAPSHOT_ENCODING", "json")
+
 def ensure_var_dir_exists(path: str) -> None:
     var_dir = os.path.dirname(path)
     if var_dir and not os.path.exists(var_dir):
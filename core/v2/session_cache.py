@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional
+
+from core.v2.models import AppliedEvent, SessionState
+
+DEFAULT_MAX_CACHED_SESSIONS = 1024
+
+
+@dataclass
+class SessionCacheEntry:
+    """
+    Live, write-through state for one session.
+    - applied is mutated in place (O(1) per new event); SessionState objects handed out share it,
+      so treat SessionState.applied as read-only and valid as of SessionState.version.
+    - views memoises values derived from the state, each stamped with the version it was computed
+      at; a stale value is rebuilt, or advanced with just the newly applied events when the view
+      supports it.
+    """
+
+    session_id: str
+    version: int
+    applied: dict[str, int]
+    applied_log: list[AppliedEvent]
+    last_snapshot_version: Optional[int] = None
+    views: dict[str, tuple[int, Any]] = field(default_factory=dict)
+    _state: Optional[SessionState] = None
+
+    @property
+    def state(self) -> SessionState:
+        if self._state is None or self._state.version != self.version:
+            self._state = SessionState(session_id=self.session_id, version=self.version, applied=self.applied)
+        return self._state
+
+    def apply(self, event_id: str, applied_event: AppliedEvent) -> None:
+        self.version = applied_event.state_version
+        self.applied[event_id] = self.version
+        self.applied_log.append(applied_event)
+
+    def view(
+        self,
+        name: str,
+        build: Callable[[SessionState], Any],
+        extend: Optional[Callable[[Any, list[AppliedEvent]], Any]] = None,
+    ) -> Any:
+        cached = self.views.get(name)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+        missing = self.version - cached[0] if cached is not None else None
+        # applied_log ends with the contiguous run of versions applied since the cached value
+        if extend is not None and missing is not None and 0 < missing <= len(self.applied_log):
+            value = extend(cached[1], self.applied_log[-missing:])
+        else:
+            value = build(self.state)
+        self.views[name] = (self.version, value)
+        return value
+
+
+class SessionStateCache:
+    """LRU of SessionCacheEntry across sessions (bounded by max_sessions)."""
+
+    def __init__(self, max_sessions: int = DEFAULT_MAX_CACHED_SESSIONS) -> None:
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be >= 1")
+        self.max_sessions = max_sessions
+        self._entries: OrderedDict[str, SessionCacheEntry] = OrderedDict()
+
+    def get(self, session_id: str) -> Optional[SessionCacheEntry]:
+        entry = self._entries.get(session_id)
+        if entry is not None:
+            self._entries.move_to_end(session_id)
+        return entry
+
+    def put(self, entry: SessionCacheEntry) -> None:
+        self._entries[entry.session_id] = entry
+        self._entries.move_to_end(entry.session_id)
+        while len(self._entries) > self.max_sessions:
+            self._entries.popitem(last=False)
+
+    def pop(self, session_id: str) -> Optional[SessionCacheEntry]:
+        return self._entries.pop(session_id, None)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[SessionCacheEntry]:
+        return iter(list(self._entries.values()))
@@ -1,6 +1,6 @@
-import sqlite3
 from datetime import datetime
-from core.v2.persistence_config import get_v2_db_path, ensure_var_dir_exists
+from core.v2.persistence_config import get_v2_db_path
+from core.v2.sqlite_pool import get_connection_pool
 
 
 from contextlib import closing
@@ -10,19 +10,13 @@ class SqliteSessionStore:
         if db_path is None:
             db_path = get_v2_db_path()
         self.db_path = db_path
+        self._pool = get_connection_pool(db_path)
 
     def _connect(self):
-        from core.v2.sqlite_schema import run_migrations
-        ensure_var_dir_exists(self.db_path)
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        conn.execute("PRAGMA foreign_keys=ON")
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA synchronous=NORMAL")
-        run_migrations(conn)
-        return conn
+        return self._pool.acquire()
 
     def create(self, session_id: str, created_at: datetime) -> None:
-        with closing(self._connect()) as conn, closing(conn.cursor()) as cur:
+        with self._pool.connection() as conn, closing(conn.cursor()) as cur:
             cur.execute(
                 """
                 INSERT INTO sessions (session_id, created_at)
@@ -34,7 +28,7 @@ class SqliteSessionStore:
             conn.commit()
 
     def exists(self, session_id: str) -> bool:
-        with closing(self._connect()) as conn, closing(conn.cursor()) as cur:
+        with self._pool.connection() as conn, closing(conn.cursor()) as cur:
             cur.execute(
                 "SELECT 1 FROM sessions WHERE session_id = ? LIMIT 1",
                 (session_id,)
@@ -42,7 +36,7 @@ class SqliteSessionStore:
             return cur.fetchone() is not None
 
     def get(self, session_id: str):
-        with closing(self._connect()) as conn, closing(conn.cursor()) as cur:
+        with self._pool.connection() as conn, closing(conn.cursor()) as cur:
             cur.execute(
                 "SELECT session_id, created_at FROM sessions WHERE session_id = ?",
                 (session_id,)
@@ -53,4 +47,4 @@ class SqliteSessionStore:
             return {"session_id": row[0], "created_at": row[1]}
 
     def close(self):
-        pass  # No-op: no long-lived connection
+        self._pool.close()
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Mapping
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+from core.v2.models import canonical_json
+
+# Snapshot data encodings for the SQLite snapshot store.
+# - json:         canonical JSON text in snapshots.data_json (legacy default).
+# - chunked:      binary blob; key list + fixed-width entry index + chunks of per-entry canonical JSON.
+# - chunked-zlib: same layout with every chunk zlib-compressed.
+# Every entry is stored as canonical_json(payload), so the canonical JSON of the whole snapshot
+# (the input of the v1 state hash) can be reassembled byte-for-byte without decoding payloads.
+SNAPSHOT_ENCODING_JSON = "json"
+SNAPSHOT_ENCODING_CHUNKED = "chunked"
+SNAPSHOT_ENCODING_CHUNKED_ZLIB = "chunked-zlib"
+SNAPSHOT_ENCODINGS = (SNAPSHOT_ENCODING_JSON, SNAPSHOT_ENCODING_CHUNKED, SNAPSHOT_ENCODING_CHUNKED_ZLIB)
+
+CHUNK_ENTRIES = 256
+
+_MAGIC = b"V2SC"
+_FORMAT_VERSION = 1
+_CODEC_RAW = 0
+_CODEC_ZLIB = 1
+# magic, format version, codec, n_entries, n_chunks, keys_len
+_HEADER = struct.Struct("<4sBBIII")
+_U32 = 4
+
+
+def require_snapshot_encoding(encoding: str) -> None:
+    if encoding not in SNAPSHOT_ENCODINGS:
+        raise ValueError(f"unknown snapshot encoding {encoding!r}; expected one of {SNAPSHOT_ENCODINGS}")
+
+
+def _u32_view(buf: memoryview) -> Any:
+    # Zero-copy on little-endian hosts; the on-disk layout is little-endian either way.
+    if sys.byteorder == "little":
+        return buf.cast("I")
+    values = array("I", buf.tobytes())
+    values.byteswap()
+    return values
+
+
+class _EncodedEntries:
+    """Parsed view over one encoded blob; chunks are inflated on first access and kept."""
+
+    __slots__ = ("blob", "keys", "positions", "_index", "_chunk_bounds", "_codec", "_chunks")
+
+    def __init__(self, blob: bytes) -> None:
+        view = memoryview(blob)
+        if len(view) < _HEADER.size:
+            raise ValueError("snapshot blob is truncated")
+        magic, fmt, codec, n_entries, n_chunks, keys_len = _HEADER.unpack_from(view, 0)
+        if magic != _MAGIC or fmt != _FORMAT_VERSION or codec not in (_CODEC_RAW, _CODEC_ZLIB):
+            raise ValueError("not a v2 snapshot blob")
+        pos = _HEADER.size
+        keys = json.loads(bytes(view[pos:pos + keys_len]).decode("utf-8")) if keys_len else []
+        pos += keys_len
+        index_len = n_entries * 3 * _U32
+        table_len = n_chunks * _U32
+        if len(keys) != n_entries or len(view) < pos + index_len + table_len:
+            raise ValueError("snapshot blob is truncated")
+        self._index = _u32_view(view[pos:pos + index_len])
+        pos += index_len
+        lengths = _u32_view(view[pos:pos + table_len])
+        pos += table_len
+        bounds = []
+        for n in lengths:
+            bounds.append((pos, pos + n))
+            pos += n
+        if pos != len(view):
+            raise ValueError("snapshot blob is truncated")
+        self.blob = view
+        self.keys: list[str] = keys
+        self.positions = {k: i for i, k in enumerate(keys)}
+        self._chunk_bounds = bounds
+        self._codec = codec
+        self._chunks: dict[int, Any] = {}
+
+    def _chunk(self, chunk_no: int) -> Any:
+        chunk = self._chunks.get(chunk_no)
+        if chunk is None:
+            start, end = self._chunk_bounds[chunk_no]
+            if self._codec == _CODEC_ZLIB:
+                chunk = memoryview(zlib.decompress(self.blob[start:end]))
+            else:
+                chunk = self.blob[start:end]
+            self._chunks[chunk_no] = chunk
+        return chunk
+
+    def raw(self, position: int) -> memoryview:
+        i = position * 3
+        chunk_no, offset, length = self._index[i], self._index[i + 1], self._index[i + 2]
+        return self._chunk(chunk_no)[offset:offset + length]
+
+
+class LazySnapshotData(Mapping):
+    """
+    Read-only event_id -> payload mapping over an encoded snapshot blob.
+    - Loading parses only the key list and the entry index; payloads are decoded on access.
+    - with_entries() layers new entries on top without touching the encoded ones, so a delta
+      snapshot can be built, hashed (v1) and re-encoded without decoding its base.
+    """
+
+    __slots__ = ("_entries", "_overlay", "_decoded")
+
+    def __init__(self, blob: bytes, *, _entries: Optional[_EncodedEntries] = None, _overlay: Optional[dict] = None) -> None:
+        self._entries = _entries if _entries is not None else _EncodedEntries(blob)
+        self._overlay: dict[str, Any] = _overlay or {}
+        self._decoded: dict[str, Any] = {}
+
+    def __getitem__(self, event_id: str) -> Any:
+        if event_id in self._overlay:
+            return self._overlay[event_id]
+        if event_id in self._decoded:
+            return self._decoded[event_id]
+        position = self._entries.positions[event_id]
+        value = json.loads(bytes(self._entries.raw(position)).decode("utf-8"))
+        self._decoded[event_id] = value
+        return value
+
+    def __contains__(self, event_id: object) -> bool:
+        return event_id in self._overlay or event_id in self._entries.positions
+
+    def __iter__(self) -> Iterator[str]:
+        if not self._overlay:
+            return iter(self._entries.keys)
+        return iter(self._sorted_keys())
+
+    def __len__(self) -> int:
+        extra = sum(1 for k in self._overlay if k not in self._entries.positions)
+        return len(self._entries.keys) + extra
+
+    def __repr__(self) -> str:
+        return f"LazySnapshotData(entries={len(self)})"
+
+    def _sorted_keys(self) -> list[str]:
+        extra = [k for k in self._overlay if k not in self._entries.positions]
+        return sorted(self._entries.keys + extra) if extra else list(self._entries.keys)
+
+    def raw_entry(self, event_id: str) -> bytes:
+        """canonical_json(payload) as UTF-8, copied straight from the blob when not overridden."""
+        if event_id in self._overlay:
+            return canonical_json(self._overlay[event_id]).encode("utf-8")
+        return bytes(self._entries.raw(self._entries.positions[event_id]))
+
+    def with_entries(self, items: Iterable[Tuple[str, Any]]) -> "LazySnapshotData":
+        overlay = dict(self._overlay)
+        overlay.update(items)
+        return LazySnapshotData(b"", _entries=self._entries, _overlay=overlay)
+
+    def canonical_json_bytes(self) -> bytes:
+        """Byte-identical to canonical_json(dict(self)).encode('utf-8')."""
+        parts = [
+            json.dumps(k, ensure_ascii=False).encode("utf-8") + b":" + self.raw_entry(k)
+            for k in self._sorted_keys()
+        ]
+        return b"{" + b",".join(parts) + b"}"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {k: self[k] for k in self._sorted_keys()}
+
+
+def merge_snapshot_data(base: Mapping[str, Any], items: Iterable[Tuple[str, Any]]) -> Mapping[str, Any]:
+    """base plus items; lazily-decoded bases stay lazy, plain mappings are copied."""
+    if isinstance(base, LazySnapshotData):
+        return base.with_entries(items)
+    data = dict(base)
+    data.update(items)
+    return data
+
+
+def canonical_snapshot_json(data: Mapping[str, Any]) -> str:
+    if isinstance(data, LazySnapshotData):
+        return data.canonical_json_bytes().decode("utf-8")
+    return canonical_json(dict(data))
+
+
+def encode_snapshot_data(data: Mapping[str, Any], encoding: str) -> bytes:
+    """Encode data for a binary encoding (see SNAPSHOT_ENCODINGS)."""
+    require_snapshot_encoding(encoding)
+    if encoding == SNAPSHOT_ENCODING_JSON:
+        raise ValueError("json snapshots are stored as text; use canonical_snapshot_json")
+    codec = _CODEC_ZLIB if encoding == SNAPSHOT_ENCODING_CHUNKED_ZLIB else _CODEC_RAW
+    if isinstance(data, LazySnapshotData):
+        keys = data._sorted_keys()
+        raw_entry = data.raw_entry
+    else:
+        keys = sorted(data)
+        raw_entry = lambda k: canonical_json(data[k]).encode("utf-8")  # noqa: E731
+
+    index = array("I")
+    chunks: list[bytes] = []
+    for start in range(0, len(keys), CHUNK_ENTRIES):
+        parts = []
+        offset = 0
+        for k in keys[start:start + CHUNK_ENTRIES]:
+            raw = raw_entry(k)
+            index.extend((len(chunks), offset, len(raw)))
+            parts.append(raw)
+            offset += len(raw)
+        chunk = b"".join(parts)
+        chunks.append(zlib.compress(chunk) if codec == _CODEC_ZLIB else chunk)
+    lengths = array("I", (len(c) for c in chunks))
+    if sys.byteorder != "little":
+        index.byteswap()
+        lengths.byteswap()
+    keys_blob = json.dumps(keys, ensure_ascii=False, separators=(",", ":")).encode("utf-8") if keys else b""
+    header = _HEADER.pack(_MAGIC, _FORMAT_VERSION, codec, len(keys), len(chunks), len(keys_blob))
+    return b"".join([header, keys_blob, index.tobytes(), lengths.tobytes(), *chunks])
+
+
+def decode_snapshot_data(blob: bytes) -> LazySnapshotData:
+    return LazySnapshotData(blob)
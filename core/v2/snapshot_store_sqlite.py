@@ -1,11 +1,18 @@
 
 import json
-import sqlite3
 from datetime import datetime
 from contextlib import closing
 
 from core.v2.models import Snapshot
-from core.v2.persistence_config import ensure_var_dir_exists, get_v2_db_path
+from core.v2.persistence_config import get_v2_db_path, get_v2_snapshot_encoding
+from core.v2.snapshot_codec import (
+    SNAPSHOT_ENCODING_JSON,
+    canonical_snapshot_json,
+    decode_snapshot_data,
+    encode_snapshot_data,
+    require_snapshot_encoding,
+)
+from core.v2.sqlite_pool import get_connection_pool
 
 
 class SqliteSnapshotStore:
@@ -17,33 +24,34 @@ class SqliteSnapshotStore:
     - Orchestrator expects snapshot_store.save(snapshot)
     - Service expects snapshot_store.latest(session_id)
     We implement both as aliases to the canonical methods (put/get_latest).
+    - encoding selects how new snapshots store data (see core.v2.snapshot_codec); rows are
+      decoded by their own data_encoding, so encodings can be mixed within one database.
+      Binary encodings load lazily: only the event_id index is parsed until a payload is read.
     """
 
 
     from contextlib import closing
 
     def close(self):
-        pass  # No-op: no long-lived connection
+        self._pool.close()
 
 
-    def __init__(self, db_path: str | None = None) -> None:
+    def __init__(self, db_path: str | None = None, encoding: str | None = None) -> None:
         import logging
         if db_path is None:
             db_path = get_v2_db_path()
+        if encoding is None:
+            encoding = get_v2_snapshot_encoding()
+        require_snapshot_encoding(encoding)
         self.db_path = db_path
+        self.encoding = encoding
+        self._pool = get_connection_pool(db_path)
         logging.getLogger("core.v2.snapshot_store_sqlite").debug(
             f"SqliteSnapshotStore: db_path={db_path}"
         )
 
     def _connect(self):
-        from core.v2.sqlite_schema import run_migrations
-        ensure_var_dir_exists(self.db_path)
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        conn.execute("PRAGMA foreign_keys=ON")
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA synchronous=NORMAL")
-        run_migrations(conn)
-        return conn
+        return self._pool.acquire()
 
     # -------- Compatibility aliases --------
 
@@ -61,26 +69,27 @@ class SqliteSnapshotStore:
     def put(self, snapshot: Snapshot) -> None:
         import logging
         logger = logging.getLogger("core.v2.snapshot_store_sqlite")
-        with closing(self._connect()) as conn, closing(conn.cursor()) as cur:
+        with self._pool.connection() as conn, closing(conn.cursor()) as cur:
             try:
+                if self.encoding == SNAPSHOT_ENCODING_JSON:
+                    data_json, data_blob = canonical_snapshot_json(snapshot.data), None
+                else:
+                    data_json, data_blob = "", encode_snapshot_data(snapshot.data, self.encoding)
                 cur.execute(
                     """
                     INSERT INTO snapshots (
-                        session_id, version, state_hash, data_json, created_at
-                    ) VALUES (?, ?, ?, ?, ?)
+                        session_id, version, state_hash, data_json, created_at, data_encoding, data_blob
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
                     ON CONFLICT(session_id, version) DO NOTHING
                     """,
                     (
                         snapshot.session_id,
                         snapshot.version,
                         snapshot.state_hash,
-                        json.dumps(
-                            snapshot.data,
-                            separators=(",", ":"),
-                            sort_keys=True,
-                            ensure_ascii=False,
-                        ),
+                        data_json,
                         snapshot.created_at.isoformat(),
+                        self.encoding,
+                        data_blob,
                     ),
                 )
                 conn.commit()
@@ -100,10 +109,10 @@ class SqliteSnapshotStore:
 
 
     def get_latest(self, session_id: str) -> Snapshot | None:
-        with closing(self._connect()) as conn, closing(conn.cursor()) as cur:
+        with self._pool.connection() as conn, closing(conn.cursor()) as cur:
             cur.execute(
                 """
-                SELECT version, state_hash, data_json, created_at
+                SELECT version, state_hash, data_json, created_at, data_encoding, data_blob
                 FROM snapshots
                 WHERE session_id = ?
                 ORDER BY version DESC
@@ -114,21 +123,14 @@ class SqliteSnapshotStore:
             row = cur.fetchone()
             if not row:
                 return None
-            version, state_hash, data_json, created_at = row
-            return Snapshot(
-                session_id=session_id,
-                version=version,
-                state_hash=state_hash,
-                data=json.loads(data_json),
-                created_at=datetime.fromisoformat(created_at),
-            )
+            return self._row_to_snapshot(session_id, row)
 
 
     def get_at_or_before(self, session_id: str, version: int) -> Snapshot | None:
-        with closing(self._connect()) as conn, closing(conn.cursor()) as cur:
+        with self._pool.connection() as conn, closing(conn.cursor()) as cur:
             cur.execute(
                 """
-                SELECT version, state_hash, data_json, created_at
+                SELECT version, state_hash, data_json, created_at, data_encoding, data_blob
                 FROM snapshots
                 WHERE session_id = ? AND version <= ?
                 ORDER BY version DESC
@@ -139,11 +141,19 @@ class SqliteSnapshotStore:
             row = cur.fetchone()
             if not row:
                 return None
-            ver, state_hash, data_json, created_at = row
-            return Snapshot(
-                session_id=session_id,
-                version=ver,
-                state_hash=state_hash,
-                data=json.loads(data_json),
-                created_at=datetime.fromisoformat(created_at),
-            )
+            return self._row_to_snapshot(session_id, row)
+
+    @staticmethod
+    def _row_to_snapshot(session_id: str, row) -> Snapshot:
+        version, state_hash, data_json, created_at, data_encoding, data_blob = row
+        if data_encoding == SNAPSHOT_ENCODING_JSON:
+            data = json.loads(data_json)
+        else:
+            data = decode_snapshot_data(data_blob)
+        return Snapshot(
+            session_id=session_id,
+            version=version,
+            state_hash=state_hash,
+            data=data,
+            created_at=datetime.fromisoformat(created_at),
+        )
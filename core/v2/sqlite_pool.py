@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+from core.v2.persistence_config import ensure_var_dir_exists
+
+# sqlite3 keeps an LRU cache of compiled statements per connection, keyed by SQL text.
+# Long-lived connections plus module-level SQL constants in the stores give us
+# prepared-statement reuse for free; this only widens the cache a little.
+STATEMENT_CACHE_SIZE = 256
+
+
+def _file_identity(path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+class SqliteConnectionPool:
+    """
+    Per-db-path pool of long-lived SQLite connections, one per thread.
+
+    - PRAGMAs are applied once per connection, migrations once per database file per process.
+    - If the file is removed or replaced underneath us, the thread reconnects (and re-migrates).
+    - close() releases only the calling thread's connection, so it is safe while other
+      threads keep working; they reconnect lazily if they ever hit a closed pool.
+    - shutdown() closes every thread's connection, including ones still in use, and evicts
+      the pool from the process registry. Only call it when nothing else touches the db.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._connections: list[sqlite3.Connection] = []
+        self._migrated = False
+
+    def _open(self) -> sqlite3.Connection:
+        from core.v2.sqlite_schema import run_migrations
+
+        ensure_var_dir_exists(self.db_path)
+        # Inode numbers get recycled, so a missing file is the only reliable "fresh db" signal.
+        fresh = _file_identity(self.db_path) is None
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock:
+            if fresh or not self._migrated:
+                run_migrations(conn)
+                self._migrated = True
+            self._connections.append(conn)
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """Return this thread's connection, (re)opening it if needed."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            if (
+                self._local.generation == self._generation
+                and self._local.identity == _file_identity(self.db_path)
+            ):
+                return conn
+            self._discard(conn)
+        conn = self._open()
+        self._local.conn = conn
+        self._local.generation = self._generation
+        self._local.identity = _file_identity(self.db_path)
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow this thread's connection. Any transaction left open on exit (error or
+        missing commit) is rolled back, matching the old connect-per-call semantics.
+        """
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        self._local.conn = None
+
+    def close(self) -> None:
+        """Close the calling thread's connection; other threads' connections stay open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._discard(conn)
+
+    def shutdown(self) -> None:
+        """Close every connection handed out and drop this pool from get_connection_pool()."""
+        with self._lock:
+            conns, self._connections = self._connections, []
+            self._generation += 1
+        for conn in conns:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local.conn = None
+        _evict_pool(self)
+
+
+_POOLS: dict[str, SqliteConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_connection_pool(db_path: str) -> SqliteConnectionPool:
+    """Process-wide pool for db_path (shared by all v2 stores pointing at the same file)."""
+    key = os.path.abspath(db_path)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = SqliteConnectionPool(db_path)
+            _POOLS[key] = pool
+        return pool
+
+
+def _evict_pool(pool: SqliteConnectionPool) -> None:
+    key = os.path.abspath(pool.db_path)
+    with _POOLS_LOCK:
+        if _POOLS.get(key) is pool:
+            del _POOLS[key]
+
+
+def close_all_pools() -> None:
+    """Shut down every registered pool (process shutdown / test teardown only)."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+    for pool in pools:
+        pool.shutdown()
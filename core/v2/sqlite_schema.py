@@ -1,8 +1,10 @@
 import sqlite3
 
 
-# === Schema sealed after v1; future changes must not modify schema ===
-LATEST_SCHEMA_VERSION = 1
+# === Schema sealed after v1; future changes must be additive and upgrade in place ===
+# v2: events.applied_version (per-session, assigned at append) + covering index for tail reads
+# v3: snapshots.data_encoding + snapshots.data_blob (binary snapshot encodings, see core.v2.snapshot_codec)
+LATEST_SCHEMA_VERSION = 3
 
 def run_migrations(conn: sqlite3.Connection) -> None:
     """
@@ -27,9 +29,15 @@ def run_migrations(conn: sqlite3.Connection) -> None:
     else:
         cur.execute("SELECT version FROM schema_version")
         version = cur.fetchone()[0]
-        if version != LATEST_SCHEMA_VERSION:
-            # For now, only support v1
-            raise RuntimeError(f"DB schema version {version} != expected {LATEST_SCHEMA_VERSION}")
+        if version > LATEST_SCHEMA_VERSION:
+            raise RuntimeError(f"DB schema version {version} > supported {LATEST_SCHEMA_VERSION}")
+        if version < LATEST_SCHEMA_VERSION:
+            # Upgrades are additive and performed by ensure_schema below
+            from datetime import datetime
+            cur.execute(
+                "UPDATE schema_version SET version = ?, updated_at = ?",
+                (LATEST_SCHEMA_VERSION, datetime.utcnow().isoformat()),
+            )
     # Ensure all other tables exist (idempotent)
     ensure_schema(conn)
     conn.commit()
@@ -76,10 +84,12 @@ def ensure_schema(conn: sqlite3.Connection) -> None:
             payload_json TEXT NOT NULL,
             payload_hash TEXT NOT NULL,
             inserted_at TEXT NOT NULL,
+            applied_version INTEGER,
             PRIMARY KEY (session_id, event_id)
         )
     """)
     cur.execute("CREATE INDEX IF NOT EXISTS idx_events_session_ts ON events(session_id, ts)")
+    _ensure_event_applied_version(cur)
 
     cur.execute("""
         CREATE TABLE IF NOT EXISTS sessions (
@@ -95,8 +105,65 @@ def ensure_schema(conn: sqlite3.Connection) -> None:
             state_hash TEXT NOT NULL,
             data_json TEXT NOT NULL,
             created_at TEXT NOT NULL,
+            data_encoding TEXT NOT NULL DEFAULT 'json',
+            data_blob BLOB,
             PRIMARY KEY (session_id, version)
         )
     """)
     cur.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_session_version ON snapshots(session_id, version)")
+    _ensure_snapshot_encoding_columns(cur)
     conn.commit()
+
+
+def _ensure_event_applied_version(cur: sqlite3.Cursor) -> None:
+    """
+    v1 -> v2 upgrade: add events.applied_version and backfill it per session in the
+    (ts, event_id) order that list_after_version used to derive on every read.
+    """
+    cur.execute("PRAGMA table_info(events)")
+    columns = {row[1] for row in cur.fetchall()}
+    if "applied_version" not in columns:
+        cur.execute("ALTER TABLE events ADD COLUMN applied_version INTEGER")
+    cur.execute("SELECT 1 FROM events WHERE applied_version IS NULL LIMIT 1")
+    if cur.fetchone() is not None:
+        cur.execute("""
+            CREATE TEMP TABLE _event_version_backfill (
+                session_id TEXT NOT NULL,
+                event_id TEXT NOT NULL,
+                applied_version INTEGER NOT NULL,
+                PRIMARY KEY (session_id, event_id)
+            ) WITHOUT ROWID
+        """)
+        cur.execute("""
+            INSERT INTO _event_version_backfill (session_id, event_id, applied_version)
+            SELECT e.session_id, e.event_id,
+                   COALESCE(m.max_version, 0)
+                   + ROW_NUMBER() OVER (PARTITION BY e.session_id ORDER BY e.ts, e.event_id)
+            FROM events e
+            LEFT JOIN (
+                SELECT session_id, MAX(applied_version) AS max_version FROM events GROUP BY session_id
+            ) m ON m.session_id = e.session_id
+            WHERE e.applied_version IS NULL
+        """)
+        cur.execute("""
+            UPDATE events SET applied_version = (
+                SELECT b.applied_version FROM _event_version_backfill b
+                WHERE b.session_id = events.session_id AND b.event_id = events.event_id
+            )
+            WHERE applied_version IS NULL
+        """)
+        cur.execute("DROP TABLE _event_version_backfill")
+    cur.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_events_session_applied_version "
+        "ON events(session_id, applied_version)"
+    )
+
+
+def _ensure_snapshot_encoding_columns(cur: sqlite3.Cursor) -> None:
+    """v2 -> v3 upgrade: existing rows are canonical JSON in data_json (data_encoding='json')."""
+    cur.execute("PRAGMA table_info(snapshots)")
+    columns = {row[1] for row in cur.fetchall()}
+    if "data_encoding" not in columns:
+        cur.execute("ALTER TABLE snapshots ADD COLUMN data_encoding TEXT NOT NULL DEFAULT 'json'")
+    if "data_blob" not in columns:
+        cur.execute("ALTER TABLE snapshots ADD COLUMN data_blob BLOB")
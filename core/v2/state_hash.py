@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from core.v2.models import canonical_json, hash_snapshot, sha256_hex
+from core.v2.snapshot_codec import LazySnapshotData, merge_snapshot_data
+
+# Versioned snapshot state-hash algorithms.
+# - v1: sha256 over canonical JSON of the whole data dict (hash_snapshot). Authoritative default.
+# - v2: two-level hash tree keyed by event_id. Entries are sorted by event_id and cut into chunks
+#       at content-defined boundaries (an event_id whose own hash selects it as a cut point), so a
+#       chunk only depends on the ids it holds. leaf = sha256(canonical_json([event_id, payload])),
+#       chunk = sha256 over its leaves, root = sha256 over the chunk digests. Adding a tail re-hashes
+#       only the chunks the new ids fall into. Digests carry a prefix so a stored state_hash
+#       identifies its algorithm.
+STATE_HASH_V1 = "v1"
+STATE_HASH_V2 = "v2"
+STATE_HASH_ALGOS = (STATE_HASH_V1, STATE_HASH_V2)
+
+_V2_PREFIX = "merkle2:"
+# Expected entries per chunk; boundaries come from the event_id alone, never from positions
+CHUNK_TARGET = 64
+# Domain separation between the tree levels
+_LEAF, _CHUNK, _ROOT = b"\x00", b"\x01", b"\x02"
+# Trees of recently produced digests, so extending a snapshot does not rebuild its base tree
+_RECENT_TREES_MAX = 16
+
+# A chunk: sorted event_ids, their leaf digests (same order) and the chunk digest
+_Chunk = Tuple[Tuple[str, ...], Tuple[bytes, ...], bytes]
+
+
+def _leaf(event_id: str, payload: Any) -> bytes:
+    return hashlib.sha256(_LEAF + canonical_json([event_id, payload]).encode("utf-8")).digest()
+
+
+def _raw_leaf(event_id: str, raw_payload: bytes) -> bytes:
+    # canonical_json([event_id, payload]) assembled from the payload's stored canonical bytes
+    doc = b"[" + canonical_json(event_id).encode("utf-8") + b"," + raw_payload + b"]"
+    return hashlib.sha256(_LEAF + doc).digest()
+
+
+def _is_cut(event_id: str) -> bool:
+    return int.from_bytes(hashlib.sha256(event_id.encode("utf-8")).digest()[:4], "big") % CHUNK_TARGET == 0
+
+
+def _chunks_of(entries: List[Tuple[str, bytes]]) -> List[_Chunk]:
+    """Split (event_id, leaf) pairs, sorted by event_id, into chunks ending at cut ids."""
+    chunks: List[_Chunk] = []
+    start = 0
+    for i, (event_id, _) in enumerate(entries):
+        if _is_cut(event_id) or i == len(entries) - 1:
+            part = entries[start:i + 1]
+            ids = tuple(eid for eid, _ in part)
+            leaves = tuple(leaf for _, leaf in part)
+            chunks.append((ids, leaves, hashlib.sha256(_CHUNK + b"".join(leaves)).digest()))
+            start = i + 1
+    return chunks
+
+
+class IncrementalStateHasher:
+    """
+    Running v2 tree. add/update/remove re-hash only the chunks holding the touched event_ids;
+    copy() is O(number of chunks) since chunks are immutable and shared.
+    """
+
+    __slots__ = ("_chunks", "_lasts")
+
+    def __init__(self, items: Iterable[Tuple[str, Any]] = ()) -> None:
+        self._chunks: List[_Chunk] = []
+        self._lasts: List[str] = []
+        self.update(items)
+
+    @classmethod
+    def from_data(cls, data: Mapping[str, Any]) -> "IncrementalStateHasher":
+        if isinstance(data, LazySnapshotData):
+            # Encoded snapshots keep canonical payload bytes: hash them without decoding
+            entries = [(eid, _raw_leaf(eid, data.raw_entry(eid))) for eid in sorted(data)]
+        else:
+            entries = [(eid, _leaf(eid, data[eid])) for eid in sorted(data)]
+        hasher = cls()
+        hasher._set_chunks(_chunks_of(entries))
+        return hasher
+
+    def _set_chunks(self, chunks: List[_Chunk]) -> None:
+        self._chunks = chunks
+        self._lasts = [c[0][-1] for c in chunks]
+
+    def _chunk_index(self, event_id: str) -> int:
+        i = bisect_left(self._lasts, event_id)
+        if i == len(self._chunks) and self._chunks and not _is_cut(self._lasts[-1]):
+            return i - 1  # past every id: joins the still-open last chunk
+        return i
+
+    def _apply(self, changes: Dict[str, Optional[bytes]]) -> None:
+        """Set (leaf) or drop (None) event_ids, rebuilding only the affected chunks."""
+        touched: Dict[int, Dict[str, Optional[bytes]]] = {}
+        for event_id, leaf in changes.items():
+            touched.setdefault(self._chunk_index(event_id), {})[event_id] = leaf
+        for i in sorted(touched, reverse=True):
+            stop = i + 1
+            entries = dict(zip(*self._chunks[i][:2])) if i < len(self._chunks) else {}
+            for event_id, leaf in touched[i].items():
+                if leaf is not None:
+                    entries[event_id] = leaf
+                elif entries.pop(event_id, None) is not None and event_id == self._lasts[i] and stop < len(self._chunks):
+                    # the chunk lost its cut id, so it merges with the next one
+                    entries.update(zip(*self._chunks[stop][:2]))
+                    stop += 1
+            chunks = _chunks_of(sorted(entries.items()))
+            self._chunks[i:stop] = chunks
+            self._lasts[i:stop] = [c[0][-1] for c in chunks]
+
+    def add(self, event_id: str, payload: Any) -> None:
+        self._apply({event_id: _leaf(event_id, payload)})
+
+    def remove(self, event_id: str, payload: Any = None) -> None:
+        self._apply({event_id: None})
+
+    def update(self, items: Iterable[Tuple[str, Any]]) -> None:
+        changes: Dict[str, Optional[bytes]] = {eid: _leaf(eid, payload) for eid, payload in items}
+        if changes:
+            self._apply(changes)
+
+    def copy(self) -> "IncrementalStateHasher":
+        hasher = IncrementalStateHasher()
+        hasher._chunks = list(self._chunks)
+        hasher._lasts = list(self._lasts)
+        return hasher
+
+    def hexdigest(self) -> str:
+        root = hashlib.sha256(_ROOT + b"".join(c[2] for c in self._chunks)).hexdigest()
+        return f"{_V2_PREFIX}{root}"
+
+
+_recent_trees: "OrderedDict[str, IncrementalStateHasher]" = OrderedDict()
+_recent_trees_lock = threading.Lock()
+
+
+def _remember(hasher: IncrementalStateHasher) -> str:
+    digest = hasher.hexdigest()
+    with _recent_trees_lock:
+        _recent_trees[digest] = hasher
+        _recent_trees.move_to_end(digest)
+        while len(_recent_trees) > _RECENT_TREES_MAX:
+            _recent_trees.popitem(last=False)
+    return digest
+
+
+def _recent_tree(state_hash: str) -> Optional[IncrementalStateHasher]:
+    with _recent_trees_lock:
+        hasher = _recent_trees.get(state_hash)
+        if hasher is not None:
+            _recent_trees.move_to_end(state_hash)
+        return hasher
+
+
+def is_v2_state_hash(state_hash: str) -> bool:
+    return isinstance(state_hash, str) and state_hash.startswith(_V2_PREFIX)
+
+
+def state_hash_algo_of(state_hash: str) -> str:
+    return STATE_HASH_V2 if is_v2_state_hash(state_hash) else STATE_HASH_V1
+
+
+def _require_algo(algo: str) -> None:
+    if algo not in STATE_HASH_ALGOS:
+        raise ValueError(f"unknown state hash algorithm {algo!r}; expected one of {STATE_HASH_ALGOS}")
+
+
+def compute_state_hash(data: Mapping[str, Any], algo: str = STATE_HASH_V1) -> str:
+    _require_algo(algo)
+    if algo == STATE_HASH_V2:
+        return _remember(IncrementalStateHasher.from_data(data))
+    if isinstance(data, LazySnapshotData):
+        return sha256_hex(data.canonical_json_bytes())
+    return hash_snapshot(dict(data))
+
+
+def extend_state_hash(
+    base_hash: str,
+    base_data: Mapping[str, Any],
+    new_items: Iterable[Tuple[str, Any]],
+    algo: str = STATE_HASH_V1,
+) -> str:
+    """
+    State hash of base_data plus new_items (event_ids not already in base_data).
+    v2 over a v2 base re-hashes only the chunks the new ids fall into; the base tree comes from
+    the digests this process produced recently, or is rebuilt from base_data once.
+    Otherwise (v1, or a v2 request over a v1 base) the hash is recomputed in full.
+    """
+    _require_algo(algo)
+    new_items = list(new_items)
+    if algo == STATE_HASH_V2 and is_v2_state_hash(base_hash):
+        base = _recent_tree(base_hash) or IncrementalStateHasher.from_data(base_data)
+        hasher = base.copy()
+        hasher.update(new_items)
+        return _remember(hasher)
+    return compute_state_hash(merge_snapshot_data(base_data, new_items), algo)
+
+
+def verify_state_hash(data: Mapping[str, Any], state_hash: str) -> bool:
+    """Recompute state_hash from data with the algorithm the digest declares."""
+    return compute_state_hash(data, state_hash_algo_of(state_hash)) == state_hash
@@ -0,0 +1,65 @@
+"""Scaling benchmark: arbitrage scan latency versus session history depth.
+
+Usage: python scripts/bench_arbitrage_scan.py [n_symbols] [timed_scans]
+For each history depth (max_snapshots) the session is filled to capacity first, then
+ingest_snapshot, get_recommendations (/top) and get_opportunity_recommendation are timed.
+"""
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.arbitrage.feed import QuoteSnapshot
+from core.arbitrage.intelligence.limits import SessionLimits
+from core.arbitrage.models import ArbitrageConfig, VenueQuote
+from core.arbitrage.orchestrator import ArbitrageOrchestrator
+from core.fx.converter import FxConverter
+from core.fx.provider import FxRateProvider
+
+
+def _snapshot(as_of: datetime, i: int, n_symbols: int) -> QuoteSnapshot:
+    quotes = []
+    for k in range(n_symbols):
+        bump = ((i * 7 + k) % 5) * 0.01
+        quotes.append(VenueQuote(venue="A", symbol=f"S{k:03d}", bid=100.5, ask=100.0, ccy="USD"))
+        quotes.append(VenueQuote(venue="B", symbol=f"S{k:03d}", bid=101.0 + bump, ask=100.9, ccy="USD"))
+    return QuoteSnapshot(as_of=as_of, quotes=quotes)
+
+
+def run(n_symbols: int, timed_scans: int, depth: int) -> None:
+    orchestrator = ArbitrageOrchestrator(limits=SessionLimits(ttl_seconds=3600, max_snapshots=depth))
+    state = orchestrator.create_session(base_currency="USD", config=ArbitrageConfig(min_edge_bps=0.0, default_size=1.0))
+    fx_converter = FxConverter(provider=FxRateProvider.from_usd_ils(3.5), base_ccy="USD")
+    start = datetime.utcnow() - timedelta(minutes=30)
+    fill_scans = depth // n_symbols + 1
+
+    for i in range(fill_scans):
+        orchestrator.ingest_snapshot(state.session_id, _snapshot(start + timedelta(milliseconds=i), i, n_symbols), fx_converter)
+
+    t0 = time.perf_counter()
+    for i in range(fill_scans, fill_scans + timed_scans):
+        orchestrator.ingest_snapshot(state.session_id, _snapshot(start + timedelta(milliseconds=i), i, n_symbols), fx_converter)
+    scan_ms = (time.perf_counter() - t0) * 1000 / timed_scans
+
+    t0 = time.perf_counter()
+    for _ in range(timed_scans):
+        top = orchestrator.get_recommendations(state.session_id, limit=10)
+    top_ms = (time.perf_counter() - t0) * 1000 / timed_scans
+
+    t0 = time.perf_counter()
+    for _ in range(timed_scans):
+        orchestrator.get_opportunity_recommendation(state.session_id, top[0].opportunity_id)
+    detail_ms = (time.perf_counter() - t0) * 1000 / timed_scans
+
+    assert len(state.opportunities_history) == depth
+    print(f"depth {depth:>7}: scan {scan_ms:8.3f}ms  top {top_ms:8.3f}ms  detail {detail_ms:8.3f}ms")
+
+
+if __name__ == "__main__":
+    n_symbols = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    timed_scans = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    print(f"{n_symbols} symbols per snapshot, {timed_scans} timed calls per depth")
+    for depth in (500, 5_000, 50_000):
+        run(n_symbols, timed_scans, depth)
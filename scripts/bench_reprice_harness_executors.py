@@ -0,0 +1,83 @@
+"""Scaling benchmark: reprice_fx_forward_risk wall time per executor and worker count.
+
+Usage: python scripts/bench_reprice_harness_executors.py [n_instruments] [shocks_per_axis] [max_workers] [cube_path]
+cube_path is "per_scenario" (default) or "vectorised".
+Every parallel run is checked against the serial RiskResult before its timing is reported.
+"""
+import datetime
+import os
+import sys
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.pricing.fx import types as fx_types
+from core.pricing.fx.valuation_context import ValuationContext
+from core.risk.reprice_harness import RISK_EXECUTOR_PROCESS
+from core.risk.reprice_harness import RISK_EXECUTOR_SERIAL
+from core.risk.reprice_harness import RISK_EXECUTOR_THREAD
+from core.risk.reprice_harness import SCENARIO_CUBE_PER_SCENARIO
+from core.risk.reprice_harness import reprice_fx_forward_risk
+from core.risk.risk_request import RiskRequest
+from core.risk.scenario_grid import ScenarioGrid
+from core.risk.scenario_set import ScenarioSet
+from core.risk.scenario_spec import ScenarioSpec
+
+
+def _inputs(n_instruments: int, shocks_per_axis: int):
+    as_of = datetime.datetime(2026, 3, 2, 12, 0, 0, tzinfo=datetime.timezone.utc)
+    context = ValuationContext(as_of_ts=as_of, domestic_currency="ILS", strict_mode=True)
+    shocks = tuple(Decimal(i - shocks_per_axis // 2) / Decimal(100) for i in range(shocks_per_axis))
+    spec = ScenarioSpec(schema_version=1, spot_shocks=shocks, df_domestic_shocks=shocks, df_foreign_shocks=shocks)
+    contracts = {
+        f"fwd_{i:05d}": fx_types.FXForwardContract(
+            base_currency="USD",
+            quote_currency="ILS",
+            notional=1_000_000.0,
+            forward_date=datetime.date(2026, 4, 2) + datetime.timedelta(days=i % 360),
+            forward_rate=3.50 + (i % 40) * 0.005,
+            direction="receive_foreign_pay_domestic",
+        )
+        for i in range(n_instruments)
+    }
+    request = RiskRequest(
+        schema_version=1,
+        valuation_context=context,
+        market_snapshot_id="bench-snap",
+        instrument_ids=tuple(contracts),
+        scenario_spec=spec,
+        strict=True,
+    )
+    snapshot = fx_types.FxMarketSnapshot(as_of_ts=as_of, spot_rate=3.64, df_domestic=0.995, df_foreign=0.9982)
+    grid = ScenarioGrid.from_scenario_set(ScenarioSet.from_spec(spec))
+    return request, snapshot, grid, contracts
+
+
+def run(n_instruments: int, shocks_per_axis: int, max_workers: int, cube_path: str = SCENARIO_CUBE_PER_SCENARIO) -> None:
+    request, snapshot, grid, contracts = _inputs(n_instruments, shocks_per_axis)
+    cells = n_instruments * (len(grid.scenarios) + 1)
+    t0 = time.perf_counter()
+    serial = reprice_fx_forward_risk(request, snapshot, grid, contracts, executor=RISK_EXECUTOR_SERIAL, cube_path=cube_path)
+    base = time.perf_counter() - t0
+    print(f"{n_instruments} instruments x {len(grid.scenarios)} scenarios = {cells} cells, {os.cpu_count()} cpus, {cube_path}")
+    print(f"serial: {base:.2f}s")
+    for executor in (RISK_EXECUTOR_THREAD, RISK_EXECUTOR_PROCESS):
+        workers = 1
+        while workers <= max_workers:
+            t0 = time.perf_counter()
+            result = reprice_fx_forward_risk(
+                request, snapshot, grid, contracts, executor=executor, max_workers=workers, cube_path=cube_path
+            )
+            elapsed = time.perf_counter() - t0
+            assert result == serial, f"{executor} x{workers} diverged from serial"
+            print(f"{executor} x{workers}: {elapsed:.2f}s (speedup {base / elapsed:.2f}x)")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    n_instruments = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    shocks_per_axis = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    max_workers = int(sys.argv[3]) if len(sys.argv) > 3 else (os.cpu_count() or 1)
+    cube_path = sys.argv[4] if len(sys.argv) > 4 else SCENARIO_CUBE_PER_SCENARIO
+    run(n_instruments, shocks_per_axis, max_workers, cube_path)
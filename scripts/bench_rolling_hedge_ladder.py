@@ -0,0 +1,91 @@
+"""Benchmark: rolling hedge ladder with shared book pricing vs one advisory run per bucket.
+
+Usage: python scripts/bench_rolling_hedge_ladder.py [n_exposures] [df_shocks_per_axis]
+Spot shocks stay at -5%/0/+5% (exposures v1 needs exactly one symmetric pair).
+Buckets are widened from 1 to 64 over a fixed book; each shared-pricing ladder is checked
+against the per-bucket ladder before its timing is reported.
+"""
+import datetime
+import os
+import sys
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core.services.rolling_hedge_ladder_v1 as ladder_module
+from core.pricing.fx.types import FxMarketSnapshot
+from core.risk.scenario_spec import ScenarioSpec
+from core.services.rolling_hedge_ladder_v1 import RollingHedgeLadderConfigV1
+from core.services.rolling_hedge_ladder_v1 import compute_rolling_hedge_ladder_v1
+
+AS_OF = datetime.date(2026, 3, 5)
+HORIZON_DAYS = 720
+
+
+def _payload(n_exposures: int) -> dict:
+    return {
+        "contract_version": "v1",
+        "company_id": "bench-ladder",
+        "snapshot_id": "bench-snap",
+        "scenario_template_id": "bench-grid",
+        "exposures": [
+            {
+                "currency_pair": "USD/ILS",
+                "direction": "receivable" if i % 3 else "payable",
+                "notional": str(250000 + 5000 * (i % 97)),
+                "maturity_date": (AS_OF + datetime.timedelta(days=1 + i * HORIZON_DAYS // n_exposures)).isoformat(),
+                "hedge_ratio": f"0.{1 + i % 9}",
+            }
+            for i in range(n_exposures)
+        ],
+    }
+
+
+def run(n_exposures: int, df_shocks_per_axis: int) -> None:
+    payload = _payload(n_exposures)
+    base_snapshot = FxMarketSnapshot(
+        as_of_ts=datetime.datetime(2026, 3, 5, 12, 0, 0, tzinfo=datetime.timezone.utc),
+        spot_rate=3.70,
+        df_domestic=0.997,
+        df_foreign=0.996,
+        domestic_currency="ILS",
+    )
+    df_shocks = tuple(Decimal(i - df_shocks_per_axis // 2) / Decimal(100) for i in range(df_shocks_per_axis))
+    spot_shocks = (Decimal("-0.05"), Decimal("0"), Decimal("0.05"))
+    spec = ScenarioSpec(schema_version=1, spot_shocks=spot_shocks, df_domestic_shocks=df_shocks, df_foreign_shocks=df_shocks)
+    shared_risk_summaries = ladder_module._shared_risk_summaries
+    print(f"{n_exposures} exposures x {3 * df_shocks_per_axis ** 2} scenarios")
+    for n_buckets in (1, 4, 16, 64):
+        step = HORIZON_DAYS // n_buckets
+        config = RollingHedgeLadderConfigV1(
+            buckets_days=tuple(step * (k + 1) for k in range(n_buckets)),
+            roll_frequency_days=30,
+            target_worst_loss_total_domestic=500000.0,
+            as_of_date=AS_OF.isoformat(),
+        )
+        kwargs = {"base_snapshot": base_snapshot, "scenario_spec": spec, "config": config}
+
+        t0 = time.perf_counter()
+        shared = compute_rolling_hedge_ladder_v1(payload, **kwargs)
+        shared_elapsed = time.perf_counter() - t0
+
+        ladder_module._shared_risk_summaries = lambda *args, **kw: None
+        try:
+            t0 = time.perf_counter()
+            per_bucket = compute_rolling_hedge_ladder_v1(payload, **kwargs)
+            per_bucket_elapsed = time.perf_counter() - t0
+        finally:
+            ladder_module._shared_risk_summaries = shared_risk_summaries
+
+        assert shared.to_dict() == per_bucket.to_dict(), f"{n_buckets} buckets diverged"
+        print(
+            f"{len(shared.buckets)} buckets: per-bucket {per_bucket_elapsed:.2f}s, "
+            f"shared {shared_elapsed:.2f}s (speedup {per_bucket_elapsed / shared_elapsed:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    n_exposures = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    df_shocks_per_axis = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    run(n_exposures, df_shocks_per_axis)
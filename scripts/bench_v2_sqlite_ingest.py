@@ -0,0 +1,53 @@
+"""Micro-benchmark: V2ServiceSqlite ingest throughput (events/sec) on a temp SQLite db.
+
+Usage: python scripts/bench_v2_sqlite_ingest.py [n_events] [n_sessions] [batch_size]
+batch_size > 1 uses ingest_events (one transaction per batch) instead of ingest_event.
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.v2.service_sqlite import V2ServiceSqlite
+
+
+def _item(i: int, base_ts: datetime) -> dict:
+    return {
+        "event_id": f"q{i}",
+        "ts": base_ts + timedelta(milliseconds=i),
+        "type": "QUOTE_INGESTED",
+        "payload": {"symbol": "EURUSD", "bid": 1.1 + i * 1e-6, "ask": 1.1002 + i * 1e-6},
+    }
+
+
+def run(n_events: int, n_sessions: int, batch_size: int = 1) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        svc = V2ServiceSqlite(os.path.join(tmp, "bench.sqlite"))
+        sids = [svc.create_session() for _ in range(n_sessions)]
+        base_ts = datetime(2025, 1, 1, 9, 30, 0)
+        t0 = time.perf_counter()
+        if batch_size <= 1:
+            for i in range(n_events):
+                svc.ingest_event(sids[i % n_sessions], **_item(i, base_ts))
+        else:
+            per_session = {sid: [] for sid in sids}
+            for i in range(n_events):
+                per_session[sids[i % n_sessions]].append(_item(i, base_ts))
+            for sid, items in per_session.items():
+                for j in range(0, len(items), batch_size):
+                    svc.ingest_events(sid, items[j:j + batch_size])
+        elapsed = time.perf_counter() - t0
+        svc.close()
+    return n_events / elapsed
+
+
+if __name__ == "__main__":
+    n_events = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    n_sessions = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    batch_size = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+    rate = run(n_events, n_sessions, batch_size)
+    mode = "ingest_event" if batch_size <= 1 else f"ingest_events(batch={batch_size})"
+    print(f"{mode}: {n_events} events / {n_sessions} sessions -> {rate:,.0f} events/sec")
@@ -0,0 +1,114 @@
+"""Scaling benchmark: full-revaluation historical-simulation VaR over a snapshot window.
+
+Usage: python scripts/bench_var_historical_simulation.py [n_trades] [n_snapshots]
+The book is 80% FX forwards over two pairs and 20% European options on one index.
+Option expiries sit on the curve pillars because DF lookup does not interpolate.
+"""
+import datetime
+import os
+import sys
+import time
+from decimal import Decimal
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.contracts.option_contract_v1 import OptionContractV1
+from core.market_data.market_snapshot_payload_v0 import Curve
+from core.market_data.market_snapshot_payload_v0 import FxRates
+from core.market_data.market_snapshot_payload_v0 import InterestRateCurves
+from core.market_data.market_snapshot_payload_v0 import MarketConventions
+from core.market_data.market_snapshot_payload_v0 import MarketSnapshotPayloadV0
+from core.market_data.market_snapshot_payload_v0 import SpotPrices
+from core.market_data.market_snapshot_payload_v0 import VolSurface
+from core.market_data.market_snapshot_payload_v0 import VolSurfaces
+from core.pricing.fx import types as fx_types
+from core.pricing.fx.valuation_context import ValuationContext
+from core.risk.var_historical_simulation import run_historical_simulation_var_v1
+
+
+_PILLAR_DAYS = (91, 182, 273, 365)
+
+
+def _window(n_snapshots: int) -> list[MarketSnapshotPayloadV0]:
+    rng = np.random.default_rng(7)
+    usdils = 3.70 * np.cumprod(1.0 + rng.normal(0.0, 0.006, n_snapshots))
+    eurils = 4.02 * np.cumprod(1.0 + rng.normal(0.0, 0.005, n_snapshots))
+    ta35 = 2100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, n_snapshots))
+    rates = {
+        "ILS": 0.045 + np.cumsum(rng.normal(0.0, 0.0004, n_snapshots)),
+        "USD": 0.043 + np.cumsum(rng.normal(0.0, 0.0004, n_snapshots)),
+        "EUR": 0.025 + np.cumsum(rng.normal(0.0, 0.0003, n_snapshots)),
+    }
+    return [
+        MarketSnapshotPayloadV0(
+            fx_rates=FxRates(base_ccy="ILS", quotes={"USD/ILS": float(usdils[d]), "EUR/ILS": float(eurils[d])}),
+            spots=SpotPrices(prices={"TA35": float(ta35[d])}, currency={"TA35": "ILS"}),
+            curves=InterestRateCurves(
+                curves={
+                    ccy: Curve(
+                        day_count="ACT/365",
+                        compounding="continuous",
+                        zero_rates={f"{days}D": float(r[d]) for days in _PILLAR_DAYS},
+                    )
+                    for ccy, r in rates.items()
+                }
+            ),
+            vols=VolSurfaces(surfaces={"TA35": VolSurface(type="flat", data={"vol": 0.18})}),
+            conventions=MarketConventions(calendar="NONE", day_count_default="ACT/365", spot_lag=2),
+        )
+        for d in range(n_snapshots)
+    ]
+
+
+def _book(n_trades: int, as_of: datetime.datetime) -> dict[str, object]:
+    book: dict[str, object] = {}
+    for i in range(n_trades):
+        if i % 5 == 4:
+            book[f"opt_{i:05d}"] = OptionContractV1(
+                instrument_id=f"opt_{i:05d}",
+                underlying="TA35",
+                option_type="call" if i % 2 else "put",
+                strike=Decimal(1900 + (i % 40) * 10),
+                expiry=as_of + datetime.timedelta(days=_PILLAR_DAYS[i % len(_PILLAR_DAYS)]),
+                notional=Decimal("50"),
+                domestic_ccy="ILS",
+                foreign_ccy="ILS",
+                time_fraction_policy_id="ACT_365F",
+                contract_version="v1",
+            )
+        else:
+            base = "USD" if i % 2 else "EUR"
+            book[f"fwd_{i:05d}"] = fx_types.FXForwardContract(
+                base_currency=base,
+                quote_currency="ILS",
+                notional=1_000_000.0,
+                forward_date=datetime.date(2026, 2, 1) + datetime.timedelta(days=i % 360),
+                forward_rate=(3.60 if base == "USD" else 3.95) + (i % 40) * 0.005,
+                direction="receive_foreign_pay_domestic" if i % 3 else "pay_foreign_receive_domestic",
+            )
+    return book
+
+
+def run(n_trades: int, n_snapshots: int) -> None:
+    as_of = datetime.datetime(2026, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+    context = ValuationContext(as_of_ts=as_of, domestic_currency="ILS", strict_mode=True)
+    window = _window(n_snapshots)
+    book = _book(n_trades, as_of)
+    t0 = time.perf_counter()
+    result = run_historical_simulation_var_v1(
+        valuation_context=context, market_snapshots=window, contracts_by_instrument_id=book
+    )
+    elapsed = time.perf_counter() - t0
+    n_instruments, n_scenarios = result.cube.shape
+    print(f"{n_instruments} trades x {n_scenarios} scenarios = {n_instruments * (n_scenarios + 1)} cells")
+    for confidence, var, es in zip(result.confidences, result.var.tolist(), result.es.tolist()):
+        print(f"  {confidence}: VaR {var:,.0f}  ES {es:,.0f}")
+    print(f"elapsed: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    n_trades = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    n_snapshots = int(sys.argv[2]) if len(sys.argv) > 2 else 501
+    run(n_trades, n_snapshots)
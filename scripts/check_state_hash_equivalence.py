@@ -0,0 +1,112 @@
+"""Cross-check the v1 and v2 snapshot state-hash algorithms against a v2 SQLite db.
+
+For every session (or the ones given) this replays the event log and checks that:
+- the incremental v2 digest, extended tail-by-tail, equals the v2 digest computed from scratch;
+- every stored snapshot's state_hash verifies under the algorithm its digest declares.
+It prints the v1 and v2 hashes side by side. The exit code is 1 if any check fails.
+
+Usage: python -m scripts.check_state_hash_equivalence [--db PATH] [--chunk N] [session_id ...]
+"""
+from __future__ import annotations
+
+import argparse
+import sqlite3
+from dataclasses import dataclass, field
+
+from core.v2.event_ordering import stable_sort_events
+from core.v2.event_store_sqlite import SqliteEventStore
+from core.v2.persistence_config import get_v2_db_path
+from core.v2.snapshot_store_sqlite import SqliteSnapshotStore
+from core.v2.state_hash import (
+    STATE_HASH_V1,
+    STATE_HASH_V2,
+    compute_state_hash,
+    extend_state_hash,
+    state_hash_algo_of,
+    verify_state_hash,
+)
+
+
+@dataclass
+class SessionHashReport:
+    session_id: str
+    n_events: int
+    v1: str
+    v2: str
+    v2_incremental: str
+    bad_snapshots: list[int] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.v2 == self.v2_incremental and not self.bad_snapshots
+
+
+def check_session(
+    event_store: SqliteEventStore,
+    snapshot_store: SqliteSnapshotStore,
+    db_path: str,
+    session_id: str,
+    chunk: int = 50,
+) -> SessionHashReport:
+    data: dict = {}
+    for e in stable_sort_events(event_store.list(session_id)):
+        data.setdefault(e.event_id, e.payload)
+    items = list(data.items())
+
+    running = compute_state_hash({}, STATE_HASH_V2)
+    base: dict = {}
+    for i in range(0, len(items), max(1, chunk)):
+        tail = items[i:i + chunk]
+        running = extend_state_hash(running, base, tail, STATE_HASH_V2)
+        base.update(tail)
+
+    report = SessionHashReport(
+        session_id=session_id,
+        n_events=len(items),
+        v1=compute_state_hash(data, STATE_HASH_V1),
+        v2=compute_state_hash(data, STATE_HASH_V2),
+        v2_incremental=running,
+    )
+    with sqlite3.connect(db_path) as conn:
+        versions = [
+            row[0]
+            for row in conn.execute("SELECT version FROM snapshots WHERE session_id = ? ORDER BY version", (session_id,))
+        ]
+    for version in versions:
+        snap = snapshot_store.get_at_or_before(session_id, version)
+        if snap is not None and not verify_state_hash(snap.data, snap.state_hash):
+            report.bad_snapshots.append(version)
+    return report
+
+
+def _all_sessions(db_path: str) -> list[str]:
+    with sqlite3.connect(db_path) as conn:
+        return [row[0] for row in conn.execute("SELECT DISTINCT session_id FROM events ORDER BY session_id")]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m scripts.check_state_hash_equivalence")
+    parser.add_argument("--db", default=None, help="SQLite path (default: persistence_config)")
+    parser.add_argument("--chunk", type=int, default=50, help="tail size for the incremental v2 replay")
+    parser.add_argument("session_ids", nargs="*")
+    args = parser.parse_args(argv)
+
+    db_path = args.db or get_v2_db_path()
+    event_store = SqliteEventStore(db_path)
+    snapshot_store = SqliteSnapshotStore(db_path)
+    failed = 0
+    for session_id in args.session_ids or _all_sessions(db_path):
+        r = check_session(event_store, snapshot_store, db_path, session_id, args.chunk)
+        status = "OK" if r.ok else "MISMATCH"
+        print(f"{status} {r.session_id} events={r.n_events} v1={r.v1} v2={r.v2}")
+        if r.v2 != r.v2_incremental:
+            print(f"  incremental v2 digest differs: {r.v2_incremental}")
+        for version in r.bad_snapshots:
+            snap = snapshot_store.get_at_or_before(session_id, version)
+            print(f"  snapshot v{version} ({state_hash_algo_of(snap.state_hash)}) does not verify")
+        failed += 0 if r.ok else 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
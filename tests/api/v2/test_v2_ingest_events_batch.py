@@ -0,0 +1,133 @@
+import pytest
+from fastapi.testclient import TestClient
+from api.main import app
+from api.v2.service import reset_for_tests
+
+client = TestClient(app, raise_server_exceptions=True)
+
+TS = "2025-01-01T09:30:00+00:00"
+
+
+@pytest.fixture(autouse=True)
+def reset_service():
+    reset_for_tests()
+
+
+def create_session():
+    resp = client.post("/api/v2/sessions")
+    assert resp.status_code == 201
+    return resp.json()["session_id"]
+
+
+def quote(event_id, v):
+    return {"event_id": event_id, "ts": TS, "type": "QUOTE_INGESTED", "payload": {"symbol": "EURUSD", "v": v}}
+
+
+def test_batch_ingest_applies_all_events():
+    sid = create_session()
+    events = [quote(f"q{i}", i) for i in range(5)] + [
+        {
+            "event_id": "pos-1",
+            "ts": TS,
+            "type": "PORTFOLIO_POSITION_UPSERTED",
+            "payload": {"position": {"id": "p1", "qty": 1}},
+        }
+    ]
+    resp = client.post(f"/api/v2/sessions/{sid}/events:batch", json={"events": events})
+    assert resp.status_code == 201
+    body = resp.json()
+    assert body["state_version"] == 6
+    assert body["applied"] == [True] * 6
+
+    snap = client.get(f"/api/v2/sessions/{sid}/snapshot").json()
+    assert snap["version"] == 6
+    assert set(snap["data"]) == {"q0", "q1", "q2", "q3", "q4", "pos-1"}
+
+
+def test_batch_matches_single_event_ingest():
+    sid_single = create_session()
+    for i in range(4):
+        assert client.post(f"/api/v2/sessions/{sid_single}/events", json=quote(f"q{i}", i)).status_code == 201
+    sid_batch = create_session()
+    resp = client.post(
+        f"/api/v2/sessions/{sid_batch}/events:batch", json={"events": [quote(f"q{i}", i) for i in range(4)]}
+    )
+    assert resp.status_code == 201
+    single = client.get(f"/api/v2/sessions/{sid_single}/snapshot").json()
+    batch = client.get(f"/api/v2/sessions/{sid_batch}/snapshot").json()
+    assert (single["version"], single["state_hash"]) == (batch["version"], batch["state_hash"])
+
+
+def test_batch_identical_duplicates_are_not_applied():
+    sid = create_session()
+    assert client.post(f"/api/v2/sessions/{sid}/events", json=quote("q0", 0)).status_code == 201
+    resp = client.post(
+        f"/api/v2/sessions/{sid}/events:batch",
+        json={"events": [quote("q0", 0), quote("q1", 1), quote("q1", 1)]},
+    )
+    assert resp.status_code == 201
+    assert resp.json()["applied"] == [False, True, False]
+    assert resp.json()["state_version"] == 2
+
+
+def test_batch_conflict_is_409_and_writes_nothing():
+    sid = create_session()
+    assert client.post(f"/api/v2/sessions/{sid}/events", json=quote("q0", 0)).status_code == 201
+    resp = client.post(
+        f"/api/v2/sessions/{sid}/events:batch",
+        json={"events": [quote("q1", 1), quote("q0", 99)]},
+    )
+    assert resp.status_code == 409
+    detail = resp.json()["detail"]
+    assert detail["code"] == "event_conflict"
+    assert detail["category"] == "CONFLICT"
+    assert detail["details"]["reason"] == "conflicting event payload for existing event_id"
+    assert detail["details"]["event_id"] == "q0"
+    assert detail["details"]["index"] == 1
+
+    events = client.get(f"/api/v2/sessions/{sid}/events").json()
+    assert [item["event_id"] for item in events["items"]] == ["q0"]
+
+
+def test_batch_validation_error_reports_item_index():
+    sid = create_session()
+    bad = {"event_id": "q1", "ts": TS, "type": "QUOTE_INGESTED", "payload": {}}
+    resp = client.post(f"/api/v2/sessions/{sid}/events:batch", json={"events": [quote("q0", 0), bad]})
+    assert resp.status_code == 400
+    assert resp.json()["detail"]["details"]["index"] == 1
+
+
+def test_batch_missing_ts_reports_item_index():
+    sid = create_session()
+    no_ts = {"event_id": "q1", "type": "QUOTE_INGESTED", "payload": {"v": 1}}
+    resp = client.post(f"/api/v2/sessions/{sid}/events:batch", json={"events": [quote("q0", 0), no_ts]})
+    assert resp.status_code == 400
+    detail = resp.json()["detail"]
+    assert detail["code"] == "MISSING_EVENT_TS"
+    assert detail["details"]["index"] == 1
+
+
+def test_batch_unknown_session_is_404():
+    resp = client.post("/api/v2/sessions/nope/events:batch", json={"events": [quote("q0", 0)]})
+    assert resp.status_code == 404
+
+
+def test_first_batch_into_new_session_takes_a_snapshot_and_writes_once(tmp_path):
+    from datetime import datetime
+
+    from api.v2.service_sqlite import V2ServiceSqlite
+
+    svc = V2ServiceSqlite(str(tmp_path / "batch.db"))
+    sid = svc.create_session()
+    writes = []
+    append_many = svc.event_store.append_many
+    svc.event_store.append_many = lambda events: writes.append(len(events)) or append_many(events)
+
+    items = [{"event_id": f"q{i}", "ts": datetime.fromisoformat(TS), "type": "QUOTE_INGESTED", "payload": {"v": i}} for i in range(7)]
+    version, applied = svc.ingest_events(sid, items + items[:1])
+
+    assert (version, applied) == (7, [True] * 7 + [False])
+    assert writes == [8]
+    # EveryNSnapshotPolicy(3): the first batch crosses cadence points, so it must persist a snapshot
+    assert svc.snapshot_store.latest(sid).version == 7
+    svc.close()
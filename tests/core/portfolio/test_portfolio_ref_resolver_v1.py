@@ -46,3 +46,22 @@ def test_artifact_ref_success_roundtrip_from_ssot_store() -> None:
 def test_invalid_portfolio_ref_raises() -> None:
     with pytest.raises(PortfolioResolutionError, match="invalid_portfolio_ref"):
         resolve_portfolio_ref_to_advisory_payload_v1("   ")
+
+
+@pytest.mark.parametrize("encoding", ["json", "chunked"])
+def test_portfolio_ref_resolves_snapshot_payload_for_every_encoding(tmp_path, monkeypatch, encoding) -> None:
+    from datetime import datetime
+
+    from core.v2.models import Snapshot
+    from core.v2.snapshot_store_sqlite import SqliteSnapshotStore
+
+    monkeypatch.setenv("DEMOBOT_V2_SQLITE_PATH", str(tmp_path / "resolver.sqlite"))
+    monkeypatch.setenv("DEMOBOT_V2_SNAPSHOT_ENCODING", encoding)
+    SqliteSnapshotStore().put(
+        Snapshot(session_id="pf-1", version=1, created_at=datetime(2026, 3, 4), state_hash="h", data=_payload())
+    )
+
+    out = resolve_portfolio_ref_to_advisory_payload_v1("portfolio:pf-1")
+
+    assert type(out) is dict
+    assert out == _payload()
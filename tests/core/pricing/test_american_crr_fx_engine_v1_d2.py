@@ -38,6 +38,7 @@ from core.pricing.american_crr_fx_engine_v1 import THETA_MEASURE_POLICY_ID_V1
 from core.pricing.american_crr_fx_engine_v1 import VEGA_MEASURE_POLICY_ID_V1
 from core.pricing.black_scholes_fx_kernel_v1 import black_scholes_fx_measures_v1
 from core.pricing.crr_american_fx_kernel_v1 import CrrAmericanKernelResultV1
+from core.pricing.crr_american_fx_kernel_v1 import crr_american_fx_kernel_v1
 
 
 def _fx_contract() -> FxOptionRuntimeContractV1:
@@ -211,9 +212,10 @@ def test_repeated_calls_are_deterministic() -> None:
 def test_theta_uses_governed_boundary_only(monkeypatch: pytest.MonkeyPatch) -> None:
     captured: dict[str, object] = {}
 
-    def _fake_present_value(rolled_inputs, lattice_policy):
+    def _fake_present_value(rolled_inputs, lattice_policy, kernel):
         captured["rolled_basis_hash"] = rolled_inputs.resolved_basis_hash
         captured["policy_step_count"] = lattice_policy.step_count
+        captured["kernel"] = kernel
         return Decimal("11.5")
 
     monkeypatch.setattr("core.pricing.american_crr_fx_engine_v1._present_value_from_inputs_v1", _fake_present_value)
@@ -227,6 +229,7 @@ def test_theta_uses_governed_boundary_only(monkeypatch: pytest.MonkeyPatch) -> N
 
     assert captured["rolled_basis_hash"] == boundary.theta_rolled_resolved_inputs.resolved_basis_hash
     assert captured["policy_step_count"] == policy.step_count
+    assert captured["kernel"] is crr_american_fx_kernel_v1
     assert measures[ValuationMeasureNameV1.THETA_1D_CALENDAR].method_kind == ValuationMeasureMethodKindV2.NUMERICAL_BUMP_REPRICE
 
 
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from core.contracts.theta_rolled_fx_inputs_boundary_v1 import THETA_ROLLED_INPUT_POLICY_ID_V1
+from core.contracts.theta_rolled_fx_inputs_boundary_v1 import ThetaRolledFxInputsBoundaryV1
+from core.contracts.valuation_measure_name_v1 import ValuationMeasureNameV1
+from core.contracts.valuation_measure_result_v2 import ValuationMeasureMethodKindV2
+from core.contracts.valuation_measure_set_v1 import PHASE_C_CANONICAL_VALUATION_MEASURE_ORDER_V1
+from core.pricing.american_crr_fx_engine_v1 import AmericanCrrFxEngineV1
+from core.pricing.american_crr_fx_engine_v1 import DELTA_MEASURE_POLICY_ID_V1
+from core.pricing.american_crr_fx_engine_v1 import GREEKS_MODE_LATTICE_V1
+from core.pricing.american_crr_fx_engine_v1 import LATTICE_DELTA_MEASURE_POLICY_ID_V1
+from core.pricing.american_crr_fx_engine_v1 import LATTICE_GAMMA_MEASURE_POLICY_ID_V1
+from core.pricing.american_crr_fx_engine_v1 import american_crr_greeks_divergence_report_v1
+from core.pricing.black_scholes_fx_kernel_v1 import black_scholes_fx_measures_v1
+from tests.core.pricing.test_american_crr_fx_engine_v1_d2 import _measure_map
+from tests.core.pricing.test_american_crr_fx_engine_v1_d2 import _policy
+from tests.core.pricing.test_american_crr_fx_engine_v1_d2 import _resolved_fx_inputs
+from tests.core.pricing.test_american_crr_fx_engine_v1_d2 import _theta_boundary
+
+
+_LATTICE_ENGINE = AmericanCrrFxEngineV1(greeks_mode=GREEKS_MODE_LATTICE_V1)
+
+
+def test_lattice_mode_emits_full_measure_set_with_lattice_provenance() -> None:
+    inputs = _resolved_fx_inputs()
+    result = _LATTICE_ENGINE.value_with_theta_rolled_inputs_boundary(inputs, _policy(), _theta_boundary(inputs))
+
+    assert tuple(m.measure_name for m in result.valuation_measures) == PHASE_C_CANONICAL_VALUATION_MEASURE_ORDER_V1
+    measures = _measure_map(result)
+    delta = measures[ValuationMeasureNameV1.DELTA_SPOT_NON_PREMIUM_ADJUSTED]
+    gamma = measures[ValuationMeasureNameV1.GAMMA_SPOT]
+    assert delta.method_kind == ValuationMeasureMethodKindV2.MODEL_DIRECT
+    assert delta.measure_policy_id == LATTICE_DELTA_MEASURE_POLICY_ID_V1
+    assert gamma.method_kind == ValuationMeasureMethodKindV2.MODEL_DIRECT
+    assert gamma.measure_policy_id == LATTICE_GAMMA_MEASURE_POLICY_ID_V1
+    for name in (
+        ValuationMeasureNameV1.VEGA_1VOL_ABS,
+        ValuationMeasureNameV1.THETA_1D_CALENDAR,
+        ValuationMeasureNameV1.RHO_DOMESTIC_1PCT,
+        ValuationMeasureNameV1.RHO_FOREIGN_1PCT,
+    ):
+        assert measures[name].method_kind == ValuationMeasureMethodKindV2.NUMERICAL_BUMP_REPRICE
+    assert result.theta_roll_boundary_reference is not None
+
+
+def test_lattice_mode_runs_one_induction_and_never_the_reference_kernel(monkeypatch: pytest.MonkeyPatch) -> None:
+    import core.pricing.american_crr_fx_engine_v1 as engine_module
+
+    calls: list[int] = []
+    real = engine_module.crr_american_spot_greeks_batch_v1
+
+    def _counting(*args, **kwargs):
+        calls.append(len(args[0]))
+        return real(*args, **kwargs)
+
+    def _forbidden(**kwargs):
+        raise AssertionError("reference kernel must not run in lattice greeks mode")
+
+    monkeypatch.setattr(engine_module, "crr_american_spot_greeks_batch_v1", _counting)
+    monkeypatch.setattr(engine_module, "crr_american_fx_kernel_v1", _forbidden)
+
+    inputs = _resolved_fx_inputs()
+    _LATTICE_ENGINE.value_with_theta_rolled_inputs_boundary(inputs, _policy(), _theta_boundary(inputs))
+
+    # base, vol up, rd up, rf up, theta roll
+    assert calls == [5]
+
+
+def test_lattice_gamma_tracks_analytic_gamma() -> None:
+    inputs = _resolved_fx_inputs()
+    result = _LATTICE_ENGINE.value_with_theta_rolled_inputs_boundary(inputs, _policy(), _theta_boundary(inputs))
+    scalars = inputs.resolved_kernel_scalars
+    analytic = {
+        m.measure_name: m.value
+        for m in black_scholes_fx_measures_v1(
+            option_type=inputs.fx_option_contract.option_type,
+            spot=inputs.spot.spot,
+            strike=inputs.fx_option_contract.strike,
+            domestic_rate=scalars.domestic_rate,
+            foreign_rate=scalars.foreign_rate,
+            volatility=scalars.volatility,
+            time_to_expiry_years=scalars.time_to_expiry_years,
+        )
+    }
+    measures = _measure_map(result)
+
+    lattice_gamma = measures[ValuationMeasureNameV1.GAMMA_SPOT].value
+    assert abs(lattice_gamma - analytic[ValuationMeasureNameV1.GAMMA_SPOT]) / analytic[ValuationMeasureNameV1.GAMMA_SPOT] < Decimal("0.05")
+
+
+def test_divergence_report_pins_shared_measures_and_flags_spot_greeks() -> None:
+    inputs = _resolved_fx_inputs()
+    report = american_crr_greeks_divergence_report_v1(inputs, _policy(), _theta_boundary(inputs))
+
+    assert tuple(row.measure_name for row in report.rows) == PHASE_C_CANONICAL_VALUATION_MEASURE_ORDER_V1
+    assert report.delta_gamma_from_lattice is True
+    assert report.resolved_input_reference == inputs.resolved_basis_hash
+    # pv, vega, theta and rho are the same bumps priced in float64: only numeric noise remains
+    assert set(report.diverging_measures) <= {
+        ValuationMeasureNameV1.DELTA_SPOT_NON_PREMIUM_ADJUSTED,
+        ValuationMeasureNameV1.GAMMA_SPOT,
+    }
+    delta_row = report.rows[PHASE_C_CANONICAL_VALUATION_MEASURE_ORDER_V1.index(ValuationMeasureNameV1.DELTA_SPOT_NON_PREMIUM_ADJUSTED)]
+    assert delta_row.abs_diff < Decimal("0.01")
+    assert report.max_abs_diff >= delta_row.abs_diff
+
+
+def test_theta_roll_reuses_base_row_when_rolled_inputs_match() -> None:
+    inputs = _resolved_fx_inputs()
+    boundary = ThetaRolledFxInputsBoundaryV1(
+        current_resolved_inputs=inputs,
+        theta_rolled_resolved_inputs=_resolved_fx_inputs(basis_hash="sha256:d2-rolled-same-scalars"),
+        theta_roll_policy_id=THETA_ROLLED_INPUT_POLICY_ID_V1,
+    )
+
+    result = _LATTICE_ENGINE.value_with_theta_rolled_inputs_boundary(inputs, _policy(), boundary)
+
+    assert _measure_map(result)[ValuationMeasureNameV1.THETA_1D_CALENDAR].value == Decimal("0")
+
+
+def test_single_step_tree_falls_back_to_spot_bumps() -> None:
+    inputs = _resolved_fx_inputs()
+    policy = _policy(step_count=1)
+
+    lattice = _measure_map(_LATTICE_ENGINE.value_with_theta_rolled_inputs_boundary(inputs, policy, _theta_boundary(inputs)))
+    bump = _measure_map(AmericanCrrFxEngineV1().value_with_theta_rolled_inputs_boundary(inputs, policy, _theta_boundary(inputs)))
+
+    delta = lattice[ValuationMeasureNameV1.DELTA_SPOT_NON_PREMIUM_ADJUSTED]
+    assert delta.method_kind == ValuationMeasureMethodKindV2.NUMERICAL_BUMP_REPRICE
+    assert delta.measure_policy_id == DELTA_MEASURE_POLICY_ID_V1
+    assert abs(delta.value - bump[ValuationMeasureNameV1.DELTA_SPOT_NON_PREMIUM_ADJUSTED].value) < Decimal("1e-9")
+
+
+def test_rejects_unknown_greeks_mode() -> None:
+    inputs = _resolved_fx_inputs()
+    with pytest.raises(ValueError, match="greeks_mode"):
+        AmericanCrrFxEngineV1(greeks_mode="adjoint").value_with_theta_rolled_inputs_boundary(
+            inputs, _policy(), _theta_boundary(inputs)
+        )
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import dataclasses
+import itertools
+import math
+import random
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from core.contracts.valuation_measure_name_v1 import ValuationMeasureNameV1
+from core.numeric_policy import DEFAULT_TOLERANCES
+from core.numeric_policy import MetricClass
+from core.pricing.black_scholes_european_fx_engine_v1 import BlackScholesEuropeanFxEngineV1
+from core.pricing.black_scholes_fx_batch_kernel_v1 import BATCH_DETERMINISM_POLICY_V1
+from core.pricing.black_scholes_fx_batch_kernel_v1 import batch_measure_results_v1
+from core.pricing.black_scholes_fx_batch_kernel_v1 import black_scholes_fx_measures_batch_v1
+from core.pricing.black_scholes_fx_kernel_v1 import black_scholes_fx_measures_v1
+from core.pricing.bs_ssot_v1 import TIME_FRACTION_POLICY_ACT_365F
+from core.pricing.bs_ssot_v1 import price_european_option_bs_v1
+from core.pricing.bs_ssot_v1 import price_european_options_bs_batch_v1
+from tests.core.pricing.test_black_scholes_european_fx_engine_v1 import _resolved_fx_inputs
+
+
+_METRIC_BY_MEASURE = {
+    ValuationMeasureNameV1.PRESENT_VALUE: MetricClass.PRICE,
+    ValuationMeasureNameV1.INTRINSIC_VALUE: MetricClass.PRICE,
+    ValuationMeasureNameV1.TIME_VALUE: MetricClass.PRICE,
+    ValuationMeasureNameV1.DELTA_SPOT_NON_PREMIUM_ADJUSTED: MetricClass.DELTA,
+    ValuationMeasureNameV1.GAMMA_SPOT: MetricClass.GAMMA,
+    ValuationMeasureNameV1.VEGA_1VOL_ABS: MetricClass.VEGA,
+    ValuationMeasureNameV1.THETA_1D_CALENDAR: MetricClass.THETA,
+    ValuationMeasureNameV1.RHO_DOMESTIC_1PCT: MetricClass.RHO,
+    ValuationMeasureNameV1.RHO_FOREIGN_1PCT: MetricClass.RHO,
+}
+
+
+def _close(a: float, b: float, metric: MetricClass) -> bool:
+    tol = DEFAULT_TOLERANCES[metric]
+    return math.isclose(a, b, rel_tol=tol.rel or 0.0, abs_tol=tol.abs or 0.0)
+
+
+def _grid() -> list[tuple[str, Decimal, Decimal, Decimal, Decimal, Decimal, Decimal]]:
+    rows = list(
+        itertools.product(
+            ("call", "put"),
+            (Decimal("3.2"), Decimal("3.65"), Decimal("4.1")),
+            (Decimal("3.65"),),
+            (Decimal("-0.005"), Decimal("0.04")),
+            (Decimal("0.05"),),
+            (Decimal("0"), Decimal("1e-13"), Decimal("0.11"), Decimal("0.6")),
+            (Decimal("0"), Decimal("1e-13"), Decimal("0.0833"), Decimal("2.5")),
+        )
+    )
+    rng = random.Random(11)
+    for _ in range(150):
+        rows.append(
+            (
+                rng.choice(("call", "put")),
+                Decimal(str(round(rng.uniform(0.5, 2.0), 6))),
+                Decimal(str(round(rng.uniform(0.5, 2.0), 6))),
+                Decimal(str(round(rng.uniform(-0.02, 0.1), 6))),
+                Decimal(str(round(rng.uniform(-0.02, 0.1), 6))),
+                Decimal(str(round(rng.uniform(0.01, 0.8), 6))),
+                Decimal(str(round(rng.uniform(0.001, 5.0), 6))),
+            )
+        )
+    return rows
+
+
+def _batch(rows):
+    return black_scholes_fx_measures_batch_v1(
+        option_type=[r[0] for r in rows],
+        spot=[float(r[1]) for r in rows],
+        strike=[float(r[2]) for r in rows],
+        domestic_rate=[float(r[3]) for r in rows],
+        foreign_rate=[float(r[4]) for r in rows],
+        volatility=[float(r[5]) for r in rows],
+        time_to_expiry_years=[float(r[6]) for r in rows],
+    )
+
+
+def test_batch_measures_match_scalar_ssot_kernel_within_policy_tolerance() -> None:
+    rows = _grid()
+    batch = _batch(rows)
+    assert len(batch) == len(rows)
+    for i, (option_type, spot, strike, rd, rf, vol, t) in enumerate(rows):
+        scalar = black_scholes_fx_measures_v1(
+            option_type=option_type,
+            spot=spot,
+            strike=strike,
+            domestic_rate=rd,
+            foreign_rate=rf,
+            volatility=vol,
+            time_to_expiry_years=t,
+        )
+        boundary = batch_measure_results_v1(
+            batch, i, option_type=option_type, spot=spot, strike=strike, time_to_expiry_years=t
+        )
+        assert tuple(m.measure_name for m in boundary) == tuple(m.measure_name for m in scalar)
+        for expected, got in zip(scalar, boundary):
+            metric = _METRIC_BY_MEASURE[expected.measure_name]
+            assert _close(float(got.value), float(expected.value), metric), (i, expected.measure_name)
+            assert _close(float(batch.as_dict()[expected.measure_name][i]), float(expected.value), metric)
+
+
+def test_batch_results_are_independent_of_batch_composition() -> None:
+    assert BATCH_DETERMINISM_POLICY_V1 == "float64_elementwise_numpy_math_erf_cdf"
+    rows = _grid()
+    full = _batch(rows)
+    order = list(range(len(rows)))
+    random.Random(3).shuffle(order)
+    shuffled = _batch([rows[i] for i in order])
+    for name, values in full.as_dict().items():
+        assert np.array_equal(shuffled.as_dict()[name], values[order])
+    single = _batch(rows[17:18])
+    for name, values in full.as_dict().items():
+        assert single.as_dict()[name][0] == values[17]
+
+
+def test_batch_broadcasts_scalars_and_validates_per_element() -> None:
+    batch = black_scholes_fx_measures_batch_v1(
+        option_type="call",
+        spot=[90.0, 100.0, 110.0],
+        strike=100.0,
+        domestic_rate=0.05,
+        foreign_rate=0.02,
+        volatility=0.2,
+        time_to_expiry_years=1.0,
+    )
+    assert len(batch) == 3
+    assert np.all(np.diff(batch.present_value) > 0)
+
+    with pytest.raises(ValueError, match=r"spot must be > 0 \(index 1\)"):
+        black_scholes_fx_measures_batch_v1(
+            option_type="put", spot=[1.0, 0.0], strike=1.0, domestic_rate=0.0,
+            foreign_rate=0.0, volatility=0.1, time_to_expiry_years=1.0,
+        )
+    with pytest.raises(ValueError, match="volatility must be finite"):
+        black_scholes_fx_measures_batch_v1(
+            option_type="put", spot=1.0, strike=1.0, domestic_rate=0.0,
+            foreign_rate=0.0, volatility=float("nan"), time_to_expiry_years=1.0,
+        )
+    with pytest.raises(ValueError, match="option_type"):
+        black_scholes_fx_measures_batch_v1(
+            option_type=["call", "straddle"], spot=[1.0, 1.0], strike=1.0, domestic_rate=0.0,
+            foreign_rate=0.0, volatility=0.1, time_to_expiry_years=1.0,
+        )
+    with pytest.raises(ValueError, match="one length"):
+        black_scholes_fx_measures_batch_v1(
+            option_type="call", spot=[1.0, 1.0], strike=[1.0, 1.0, 1.0], domestic_rate=0.0,
+            foreign_rate=0.0, volatility=0.1, time_to_expiry_years=1.0,
+        )
+
+
+def test_bs_ssot_batch_matches_scalar_entrypoint() -> None:
+    rng = random.Random(5)
+    rows = [
+        (
+            rng.choice(("call", "put")),
+            rng.uniform(50, 150),
+            rng.uniform(50, 150),
+            math.exp(-rng.uniform(-0.01, 0.08) * 1.5),
+            math.exp(-rng.uniform(-0.01, 0.08) * 1.5),
+            rng.choice((0.0, 1e-11, rng.uniform(0.05, 0.6))),
+            rng.choice((0.0, 1e-7, rng.uniform(0.01, 3.0))),
+            rng.uniform(1, 1e6),
+        )
+        for _ in range(200)
+    ]
+    batch = price_european_options_bs_batch_v1(
+        option_type=[r[0] for r in rows],
+        spot=[r[1] for r in rows],
+        strike=[r[2] for r in rows],
+        domestic_df=[r[3] for r in rows],
+        foreign_df=[r[4] for r in rows],
+        vol=[r[5] for r in rows],
+        ttm_years=[r[6] for r in rows],
+        notional=[r[7] for r in rows],
+        time_fraction_policy_id=TIME_FRACTION_POLICY_ACT_365F,
+    )
+    for i, (option_type, s, k, df_d, df_f, vol, t, notional) in enumerate(rows):
+        scalar = price_european_option_bs_v1(
+            spot=s, strike=k, domestic_df=df_d, foreign_df=df_f, vol=vol, ttm_years=t,
+            option_type=option_type, notional=notional, time_fraction_policy_id=TIME_FRACTION_POLICY_ACT_365F,
+        )
+        assert _close(float(batch.price_per_unit[i]), scalar.price_per_unit, MetricClass.PRICE)
+        assert _close(float(batch.pv_domestic[i]), scalar.pv_domestic, MetricClass.PNL)
+
+    with pytest.raises(ValueError, match="time_fraction_policy_id"):
+        price_european_options_bs_batch_v1(
+            option_type="call", spot=1.0, strike=1.0, domestic_df=1.0, foreign_df=1.0, vol=0.1,
+            ttm_years=1.0, notional=1.0, time_fraction_policy_id="ACT_360",
+        )
+
+
+def test_engine_value_many_matches_value() -> None:
+    engine = BlackScholesEuropeanFxEngineV1()
+    base = _resolved_fx_inputs()
+    inputs = []
+    for i, (option_type, vol) in enumerate(itertools.product(("call", "put"), ("0.05", "0.11", "0.3"))):
+        contract = dataclasses.replace(base.fx_option_contract, option_type=option_type)
+        scalars = dataclasses.replace(base.resolved_kernel_scalars, volatility=Decimal(vol))
+        inputs.append(
+            dataclasses.replace(
+                base,
+                fx_option_contract=contract,
+                resolved_kernel_scalars=scalars,
+                resolved_basis_hash=f"sha256:{i:04d}",
+            )
+        )
+
+    many = engine.value_many(inputs)
+    assert engine.value_many([]) == ()
+    assert len(many) == len(inputs)
+    for item, bulk in zip(inputs, many):
+        single = engine.value(item)
+        assert bulk.resolved_input_reference == single.resolved_input_reference
+        assert bulk.engine_name == single.engine_name
+        for expected, got in zip(single.valuation_measures, bulk.valuation_measures):
+            assert got.measure_name == expected.measure_name
+            assert _close(float(got.value), float(expected.value), _METRIC_BY_MEASURE[expected.measure_name])
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import dataclasses
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from core.numeric_policy import DEFAULT_TOLERANCES
+from core.numeric_policy import EXERCISE_EPSILON_ABS_V1
+from core.numeric_policy import MetricClass
+from core.numeric_policy import TIME_EPSILON_YEARS_V1
+from core.numeric_policy import VOL_EPSILON_ABS_V1
+from core.pricing.american_crr_fx_engine_v1 import AmericanCrrFxEngineV1
+from core.pricing.american_crr_fx_engine_v1 import LATTICE_BACKEND_FLOAT_V1
+from core.pricing.crr_american_fx_kernel_v1 import crr_american_fx_kernel_v1
+from core.pricing.crr_american_fx_lattice_v1 import crr_american_fx_lattice_v1
+from core.pricing.crr_american_fx_lattice_v1 import crr_american_pv_batch_v1
+from tests.core.pricing.test_american_crr_fx_engine_v1 import _policy
+from tests.core.pricing.test_american_crr_fx_engine_v1 import _resolved_fx_inputs
+
+
+_PRICE_TOL = DEFAULT_TOLERANCES[MetricClass.PRICE]
+_PRICE_ABS = Decimal(str(_PRICE_TOL.abs))
+_PRICE_REL = Decimal(str(_PRICE_TOL.rel))
+
+
+def _kwargs(**overrides: object) -> dict[str, object]:
+    kwargs: dict[str, object] = {
+        "option_type": "put",
+        "spot": Decimal("95"),
+        "strike": Decimal("100"),
+        "domestic_rate": Decimal("0.05"),
+        "foreign_rate": Decimal("0.01"),
+        "volatility": Decimal("0.20"),
+        "time_to_expiry_years": Decimal("1"),
+        "step_count": 120,
+    }
+    kwargs.update(overrides)
+    return kwargs
+
+
+def _assert_parity(kwargs: dict[str, object]) -> None:
+    reference = crr_american_fx_kernel_v1(**kwargs)
+    lattice = crr_american_fx_lattice_v1(**kwargs)
+
+    bound = _PRICE_ABS + _PRICE_REL * abs(reference.present_value)
+    assert abs(lattice.present_value - reference.present_value) <= bound
+    assert lattice.intrinsic_value == reference.intrinsic_value
+    assert lattice.time_value == lattice.present_value - lattice.intrinsic_value
+
+
+# Parity harness: the frozen kernel is the oracle, cases straddle every numeric-policy epsilon.
+PARITY_CASES = [
+    pytest.param(_kwargs(), id="atm_put"),
+    pytest.param(_kwargs(option_type="call", spot=Decimal("3.70"), strike=Decimal("3.65"),
+                         domestic_rate=Decimal("0.04"), foreign_rate=Decimal("0.05"),
+                         volatility=Decimal("0.11"), time_to_expiry_years=Decimal("0.0833333333"),
+                         step_count=250), id="usdils_call"),
+    pytest.param(_kwargs(spot=Decimal("60")), id="deep_itm_put_immediate_exercise"),
+    pytest.param(_kwargs(option_type="call", foreign_rate=Decimal("0.12"), spot=Decimal("130")),
+                 id="high_carry_call_early_exercise"),
+    pytest.param(_kwargs(step_count=1), id="single_step"),
+    pytest.param(_kwargs(step_count=500), id="500_steps"),
+    pytest.param(_kwargs(time_to_expiry_years=TIME_EPSILON_YEARS_V1), id="time_at_epsilon"),
+    pytest.param(_kwargs(time_to_expiry_years=TIME_EPSILON_YEARS_V1 * 2), id="time_above_epsilon"),
+    pytest.param(_kwargs(volatility=Decimal("0")), id="zero_vol"),
+    pytest.param(_kwargs(volatility=VOL_EPSILON_ABS_V1), id="vol_at_epsilon"),
+    pytest.param(_kwargs(volatility=Decimal("1e-6"), foreign_rate=Decimal("0.05")), id="vol_above_epsilon"),
+    pytest.param(_kwargs(spot=Decimal("100"), strike=Decimal("105"), foreign_rate=Decimal("0.05"),
+                         volatility=Decimal("0")), id="zero_vol_flat_carry_tie"),
+    pytest.param(_kwargs(strike=Decimal("95") + EXERCISE_EPSILON_ABS_V1, spot=Decimal("95"),
+                         domestic_rate=Decimal("0"), foreign_rate=Decimal("0"), volatility=Decimal("0")),
+                 id="exercise_within_epsilon_ties_to_continuation"),
+]
+
+
+@pytest.mark.parametrize("kwargs", PARITY_CASES)
+def test_parity_with_frozen_kernel_across_numeric_policy_epsilons(kwargs: dict[str, object]) -> None:
+    _assert_parity(kwargs)
+
+
+def test_immediate_exercise_returns_exact_intrinsic() -> None:
+    result = crr_american_fx_lattice_v1(**_kwargs(spot=Decimal("60")))
+
+    assert result.present_value == Decimal("40")
+    assert result.time_value == Decimal("0")
+
+
+def test_validation_messages_match_frozen_kernel() -> None:
+    for overrides, match in (
+        ({"step_count": 0}, "step_count"),
+        ({"step_count": True}, "step_count"),
+        ({"spot": Decimal("0")}, "spot must be > 0"),
+        ({"volatility": Decimal("-0.1")}, "volatility must be >= 0"),
+        ({"option_type": "straddle"}, "option_type"),
+        ({"domestic_rate": Decimal("NaN")}, "domestic_rate must be finite"),
+        ({"foreign_rate": Decimal("5"), "volatility": Decimal("0.01"), "step_count": 2}, "^invalid CRR risk-neutral probability$"),
+    ):
+        kwargs = _kwargs(**overrides)
+        with pytest.raises(ValueError, match=match):
+            crr_american_fx_kernel_v1(**kwargs)
+        with pytest.raises(ValueError, match=match):
+            crr_american_fx_lattice_v1(**kwargs)
+
+
+def test_batch_rows_match_single_trade_calls_and_report_batch_index() -> None:
+    rows = [
+        _kwargs(),
+        _kwargs(option_type="call", spot=Decimal("105")),
+        _kwargs(volatility=Decimal("0")),
+        _kwargs(time_to_expiry_years=Decimal("0")),
+    ]
+    pv = crr_american_pv_batch_v1(
+        np.array([r["option_type"] == "call" for r in rows]),
+        np.array([float(r["spot"]) for r in rows]),
+        np.array([float(r["strike"]) for r in rows]),
+        np.array([float(r["domestic_rate"]) for r in rows]),
+        np.array([float(r["foreign_rate"]) for r in rows]),
+        np.array([float(r["volatility"]) for r in rows]),
+        np.array([float(r["time_to_expiry_years"]) for r in rows]),
+        120,
+    )
+    for i, row in enumerate(rows):
+        assert pv[i] == float(crr_american_fx_lattice_v1(**row).present_value)
+
+    with pytest.raises(ValueError, match=r"invalid CRR risk-neutral probability \(index 1\)"):
+        crr_american_pv_batch_v1(
+            np.array([False, False]),
+            np.array([100.0, 100.0]),
+            np.array([100.0, 100.0]),
+            np.array([0.05, 0.05]),
+            np.array([0.01, 5.0]),
+            np.array([0.2, 0.01]),
+            np.array([1.0, 1.0]),
+            2,
+        )
+
+
+def test_engine_float_backend_matches_reference_backend() -> None:
+    inputs = _resolved_fx_inputs()
+    policy = _policy(step_count=250)
+
+    reference = AmericanCrrFxEngineV1().value(inputs, policy)
+    lattice = AmericanCrrFxEngineV1(lattice_backend=LATTICE_BACKEND_FLOAT_V1).value(inputs, policy)
+
+    assert lattice.engine_name == reference.engine_name
+    assert lattice.resolved_lattice_policy_reference == reference.resolved_lattice_policy_reference
+    for ref_measure, lat_measure in zip(reference.valuation_measures, lattice.valuation_measures):
+        assert lat_measure.measure_name == ref_measure.measure_name
+        assert abs(lat_measure.value - ref_measure.value) <= _PRICE_ABS
+
+
+def test_engine_rejects_unknown_lattice_backend() -> None:
+    with pytest.raises(ValueError, match="lattice_backend"):
+        AmericanCrrFxEngineV1(lattice_backend="gpu").value(_resolved_fx_inputs(), _policy())
+
+
+def _book() -> list:
+    base = _resolved_fx_inputs()
+    book = []
+    for strike, option_type in (("3.55", "put"), ("3.65", "call"), ("3.80", "put"), ("3.70", "call")):
+        for volatility, time_to_expiry_years in (("0.11", "0.25"), ("0.15", "0.5"), ("0", "0.25"), ("0.11", "0")):
+            contract = dataclasses.replace(base.fx_option_contract, strike=strike, option_type=option_type)
+            scalars = dataclasses.replace(
+                base.resolved_kernel_scalars,
+                volatility=volatility,
+                time_to_expiry_years=time_to_expiry_years,
+            )
+            book.append(dataclasses.replace(base, fx_option_contract=contract, resolved_kernel_scalars=scalars))
+    return book
+
+
+def test_value_many_matches_float_backend_value_per_trade_in_input_order() -> None:
+    book = _book()
+    policy = _policy(step_count=120)
+    engine = AmericanCrrFxEngineV1(lattice_backend=LATTICE_BACKEND_FLOAT_V1)
+
+    assert engine.value_many(book, policy) == tuple(engine.value(item, policy) for item in book)
+    assert engine.value_many([], policy) == ()
+
+
+def test_value_many_honours_the_reference_backend() -> None:
+    book = _book()[:3]
+    policy = _policy(step_count=40)
+    engine = AmericanCrrFxEngineV1()
+
+    assert engine.value_many(book, policy) == tuple(engine.value(item, policy) for item in book)
+
+
+def test_value_many_runs_one_induction_per_step_count_for_heterogeneous_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    import core.pricing.american_crr_fx_engine_v1 as engine_module
+
+    batch_calls: list[tuple[int, int]] = []
+    real = engine_module.crr_american_pv_batch_v1
+
+    def _counting(*args):
+        batch_calls.append((len(args[0]), args[-1]))
+        return real(*args)
+
+    monkeypatch.setattr(engine_module, "crr_american_pv_batch_v1", _counting)
+
+    # per-strike vols: no two trades share a market state
+    book = [
+        dataclasses.replace(
+            item,
+            resolved_kernel_scalars=dataclasses.replace(item.resolved_kernel_scalars, volatility=f"0.{10 + i}"),
+        )
+        for i, item in enumerate(_book())
+    ]
+    policies = [_policy(step_count=120)] * 12 + [_policy(step_count=60)] * 4
+    engine = AmericanCrrFxEngineV1(lattice_backend=LATTICE_BACKEND_FLOAT_V1)
+
+    many = engine.value_many(book, policies)
+
+    assert sorted(batch_calls) == [(4, 60), (12, 120)]
+    assert many == tuple(engine.value(item, policy) for item, policy in zip(book, policies))
+
+
+def test_value_many_accepts_per_trade_policies() -> None:
+    book = _book()[:2]
+    policies = [_policy(step_count=50), _policy(step_count=80)]
+    engine = AmericanCrrFxEngineV1(lattice_backend=LATTICE_BACKEND_FLOAT_V1)
+
+    assert engine.value_many(book, policies) == (engine.value(book[0], policies[0]), engine.value(book[1], policies[1]))
+    with pytest.raises(ValueError, match="length"):
+        engine.value_many(book, policies[:1])
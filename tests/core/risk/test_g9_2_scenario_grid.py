@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import pickle
 from decimal import Decimal
 
 import pytest
 
 from core.risk.risk_request import RiskValidationError
+from core.risk.scenario_grid import CANONICALIZATION_RULE
+from core.risk.scenario_grid import SCENARIO_GRID_CACHE_MAX_SIZE
 from core.risk.scenario_grid import ScenarioGrid
 from core.risk.scenario_grid import ScenarioKey
 from core.risk.scenario_grid import SUPPORTED_SCHEMA_VERSION
+from core.risk.scenario_grid import _scenario_id_from_key
+from core.risk.scenario_grid import clear_scenario_grid_cache
 from core.risk.scenario_set import ScenarioSet
 from core.risk.scenario_spec import ScenarioSpec
 
@@ -171,3 +176,89 @@ def test_grid_is_frozen_immutable() -> None:
     grid = ScenarioGrid.from_scenario_set(_scenario_set(spec))
     with pytest.raises((AttributeError, TypeError)):
         grid.schema_version = SUPPORTED_SCHEMA_VERSION + 1  # type: ignore[misc]
+
+
+def _wide_spec() -> ScenarioSpec:
+    return _spec(
+        spot=tuple(Decimal(i) / Decimal(100) for i in range(-10, 11)),
+        dfd=tuple(Decimal(i) / Decimal(1000) for i in range(-5, 6)),
+        dff=tuple(Decimal(i) / Decimal(1000) for i in range(-5, 6)),
+    )
+
+
+def test_bulk_ids_and_lazy_keys_match_per_key_expansion() -> None:
+    clear_scenario_grid_cache()
+    grid = ScenarioGrid.from_scenario_set(_scenario_set(_wide_spec()))
+
+    assert len(grid) == grid.shape[0] * grid.shape[1] * grid.shape[2] == 21 * 11 * 11
+    assert list(grid.scenarios) == sorted(grid.scenarios)
+    assert grid.scenario_ids == tuple(_scenario_id_from_key(grid.scenario_set_id, key) for key in grid.scenarios)
+
+    spot_idx, dfd_idx, dff_idx = grid.axis_indices
+    for i in (0, 17, len(grid) - 1):
+        key = grid.scenarios[i]
+        assert (grid.spot_axis[spot_idx[i]], grid.df_domestic_axis[dfd_idx[i]], grid.df_foreign_axis[dff_idx[i]]) == (
+            key.spot_shock,
+            key.df_domestic_shock,
+            key.df_foreign_shock,
+        )
+        assert grid.index_of(key) == i
+
+
+def test_single_ids_resolve_without_materialising_the_grid() -> None:
+    clear_scenario_grid_cache()
+    grid = ScenarioGrid.from_scenario_set(_scenario_set(_wide_spec()))
+    key = ScenarioKey(spot_shock=Decimal("0.03"), df_domestic_shock=Decimal("0"), df_foreign_shock=Decimal("-0.002"))
+
+    scenario_id = grid.scenario_id_at(grid.index_of(key))
+
+    assert "scenario_ids" not in grid.__dict__
+    assert "scenarios" not in grid.__dict__
+    assert scenario_id == _scenario_id_from_key(grid.scenario_set_id, grid.scenarios[grid.index_of(key)])
+    assert grid.scenario_id_at(-1) == grid.scenario_ids[-1]
+    with pytest.raises(KeyError):
+        grid.index_of(ScenarioKey(spot_shock=Decimal("0.5"), df_domestic_shock=Decimal("0"), df_foreign_shock=Decimal("0")))
+
+
+def test_grids_are_cached_per_scenario_set_id() -> None:
+    clear_scenario_grid_cache()
+    grid = ScenarioGrid.from_scenario_set(_scenario_set(_wide_spec()))
+    reordered = _spec(
+        spot=tuple(reversed(_wide_spec().spot_shocks)),
+        dfd=_wide_spec().df_domestic_shocks,
+        dff=_wide_spec().df_foreign_shocks,
+    )
+
+    assert ScenarioGrid.from_scenario_set(_scenario_set(reordered)) is grid
+    assert ScenarioGrid.from_scenario_set(_scenario_set(_spec(spot=(Decimal("0"),), dfd=(Decimal("0"),), dff=(Decimal("0"),)))) is not grid
+
+    for i in range(SCENARIO_GRID_CACHE_MAX_SIZE):
+        ScenarioGrid.from_scenario_set(_scenario_set(_spec(spot=(Decimal(i),), dfd=(Decimal("0"),), dff=(Decimal("0"),))))
+    rebuilt = ScenarioGrid.from_scenario_set(_scenario_set(_wide_spec()))
+    assert rebuilt is not grid
+    assert rebuilt == grid
+    clear_scenario_grid_cache()
+
+
+def test_grid_round_trips_through_pickle() -> None:
+    grid = ScenarioGrid.from_scenario_set(_scenario_set(_wide_spec()))
+    _ = grid.scenario_ids
+
+    restored = pickle.loads(pickle.dumps(grid))
+
+    assert restored == grid
+    assert restored.scenario_ids == grid.scenario_ids
+
+
+def test_rejects_unsorted_or_duplicate_axes() -> None:
+    for axis in ((Decimal("0.01"), Decimal("-0.01")), (Decimal("0"), Decimal("0.00"))):
+        with pytest.raises(RiskValidationError) as exc_info:
+            ScenarioGrid(
+                schema_version=SUPPORTED_SCHEMA_VERSION,
+                scenario_set_id="set",
+                canonicalization=CANONICALIZATION_RULE,
+                spot_axis=axis,
+                df_domestic_axis=(Decimal("0"),),
+                df_foreign_axis=(Decimal("0"),),
+            )
+        assert exc_info.value.envelope.details["field"] == "spot_axis"
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from core.risk.reprice_harness import RISK_EXECUTOR_PROCESS
+from core.risk.reprice_harness import RISK_EXECUTOR_THREAD
+from core.risk.reprice_harness import RISK_EXECUTORS
+from core.risk.reprice_harness import reprice_fx_forward_risk
+from core.risk.risk_artifact import build_risk_artifact_v1
+from core.risk.risk_request import RiskValidationError
+from tests.core.risk import test_g10_4_options_harness_flow as g10
+from tests.core.risk.test_g9_3_reprice_harness import _base_snapshot
+from tests.core.risk.test_g9_3_reprice_harness import _contract
+from tests.core.risk.test_g9_3_reprice_harness import _grid
+from tests.core.risk.test_g9_3_reprice_harness import _request
+from tests.core.risk.test_g9_3_reprice_harness import _spec
+
+
+def _forward_book(count: int = 9) -> tuple[tuple[str, ...], dict]:
+    contracts = {
+        f"fwd_{i:02d}": _contract(
+            forward_rate=3.55 + 0.02 * i,
+            direction="receive_foreign_pay_domestic" if i % 2 else "pay_foreign_receive_domestic",
+        )
+        for i in range(count)
+    }
+    return tuple(contracts), contracts
+
+
+def _forward_spec():
+    return _spec(
+        spot=(Decimal("-0.05"), Decimal("0.00"), Decimal("0.05")),
+        dfd=(Decimal("-0.01"), Decimal("0.01")),
+        dff=(Decimal("0.00"), Decimal("0.02")),
+    )
+
+
+@pytest.mark.parametrize("executor", RISK_EXECUTORS)
+@pytest.mark.parametrize("chunk_size", [None, 1, 4])
+def test_forward_book_is_identical_to_serial_for_every_executor(executor: str, chunk_size: int | None) -> None:
+    instrument_ids, contracts = _forward_book()
+    spec = _forward_spec()
+    request = _request(instrument_ids=instrument_ids, spec=spec)
+    grid = _grid(spec)
+
+    serial = reprice_fx_forward_risk(request, _base_snapshot(), grid, contracts)
+    parallel = reprice_fx_forward_risk(
+        request, _base_snapshot(), grid, contracts, executor=executor, max_workers=3, chunk_size=chunk_size
+    )
+
+    assert parallel == serial
+    assert tuple(cube.instrument_id for cube in parallel.results) == request.instrument_ids
+    assert build_risk_artifact_v1(request, grid, parallel) == build_risk_artifact_v1(request, grid, serial)
+
+
+@pytest.mark.parametrize("executor", [RISK_EXECUTOR_THREAD, RISK_EXECUTOR_PROCESS])
+def test_options_artifact_hash_stays_pinned_under_pool_executors(executor: str) -> None:
+    request = g10._request()
+    grid = g10._grid()
+    result = reprice_fx_forward_risk(
+        request,
+        g10._base_snapshot(),
+        grid,
+        g10._contracts(),
+        market_snapshot_payload=g10._market_payload(),
+        executor=executor,
+        max_workers=2,
+        chunk_size=1,
+    )
+
+    assert build_risk_artifact_v1(request, grid, result)["sha256"] == g10.PINNED_RISK_ARTIFACT_SHA
+
+
+@pytest.mark.parametrize("executor", RISK_EXECUTORS)
+def test_first_rejection_in_request_order_surfaces_from_workers(executor: str) -> None:
+    instrument_ids, contracts = _forward_book(6)
+    del contracts["fwd_02"]
+    del contracts["fwd_04"]
+    spec = _forward_spec()
+
+    with pytest.raises(RiskValidationError) as exc:
+        reprice_fx_forward_risk(
+            _request(instrument_ids=instrument_ids, spec=spec),
+            _base_snapshot(),
+            _grid(spec),
+            contracts,
+            executor=executor,
+            max_workers=2,
+            chunk_size=1,
+        )
+    assert exc.value.envelope.details["reason"] == "missing contract for instrument_id=fwd_02"
+
+
+def test_rejects_unknown_executor_and_non_positive_pool_sizes() -> None:
+    instrument_ids, contracts = _forward_book(2)
+    spec = _forward_spec()
+    args = (_request(instrument_ids=instrument_ids, spec=spec), _base_snapshot(), _grid(spec), contracts)
+
+    for kwargs, field in (
+        ({"executor": "gpu"}, "executor"),
+        ({"executor": RISK_EXECUTOR_THREAD, "max_workers": 0}, "max_workers"),
+        ({"executor": RISK_EXECUTOR_THREAD, "chunk_size": -1}, "chunk_size"),
+    ):
+        with pytest.raises(RiskValidationError) as exc:
+            reprice_fx_forward_risk(*args, **kwargs)
+        assert exc.value.envelope.details["field"] == field
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from core.numeric_policy import DEFAULT_TOLERANCES
+from core.numeric_policy import MetricClass
+from core.risk.reprice_harness import RISK_EXECUTOR_PROCESS
+from core.risk.reprice_harness import SCENARIO_CUBE_VECTORISED
+from core.risk.reprice_harness import _default_price_forward
+from core.risk.reprice_harness import reprice_fx_forward_risk
+from core.risk.risk_artifact import build_risk_artifact_v1
+from core.risk.risk_request import RiskValidationError
+from tests.core.risk import test_g10_4_options_harness_flow as g10
+from tests.core.risk.test_g9_3_reprice_harness import _base_snapshot
+from tests.core.risk.test_g9_3_reprice_harness import _contract
+from tests.core.risk.test_g9_3_reprice_harness import _grid
+from tests.core.risk.test_g9_3_reprice_harness import _request
+from tests.core.risk.test_g9_3_reprice_harness import _spec
+from tests.core.risk.test_reprice_harness_executors import _forward_book
+
+
+_PRICE_TOL = DEFAULT_TOLERANCES[MetricClass.PRICE]
+
+
+def _wide_spec():
+    return _spec(
+        spot=tuple(Decimal(i) / Decimal(100) for i in range(-10, 11, 2)),
+        dfd=(Decimal("-0.02"), Decimal("0.00"), Decimal("0.015")),
+        dff=(Decimal("-0.01"), Decimal("0.00"), Decimal("0.03")),
+    )
+
+
+def test_forward_cube_is_bit_identical_to_per_scenario_path() -> None:
+    instrument_ids, contracts = _forward_book()
+    spec = _wide_spec()
+    request = _request(instrument_ids=instrument_ids, spec=spec)
+    grid = _grid(spec)
+
+    reference = reprice_fx_forward_risk(request, _base_snapshot(), grid, contracts)
+    cube = reprice_fx_forward_risk(request, _base_snapshot(), grid, contracts, cube_path=SCENARIO_CUBE_VECTORISED)
+
+    assert cube == reference
+    assert build_risk_artifact_v1(request, grid, cube) == build_risk_artifact_v1(request, grid, reference)
+
+
+def test_option_cube_matches_per_scenario_path_within_price_tolerance() -> None:
+    request = g10._request()
+    grid = g10._grid()
+    args = (request, g10._base_snapshot(), grid, g10._contracts())
+
+    reference = reprice_fx_forward_risk(*args, market_snapshot_payload=g10._market_payload())
+    cube = reprice_fx_forward_risk(
+        *args, market_snapshot_payload=g10._market_payload(), cube_path=SCENARIO_CUBE_VECTORISED
+    )
+
+    for ref_cube, vec_cube in zip(reference.results, cube.results, strict=True):
+        assert vec_cube.instrument_id == ref_cube.instrument_id
+        assert vec_cube.base_pv == ref_cube.base_pv
+        for ref_pv, vec_pv in zip(ref_cube.scenario_pvs, vec_cube.scenario_pvs, strict=True):
+            assert (vec_pv.scenario_id, vec_pv.currency, vec_pv.metric_class) == (
+                ref_pv.scenario_id,
+                ref_pv.currency,
+                ref_pv.metric_class,
+            )
+            bound = _PRICE_TOL.abs + _PRICE_TOL.rel * abs(float(ref_pv.pv_domestic))
+            assert abs(float(vec_pv.pv_domestic) - float(ref_pv.pv_domestic)) <= bound
+
+
+def test_injected_pricer_keeps_per_scenario_path() -> None:
+    spec = _wide_spec()
+    calls: list[float] = []
+
+    def _counting(contract, valuation_context, market_snapshot):
+        calls.append(market_snapshot.spot_rate)
+        return _default_price_forward(contract, valuation_context, market_snapshot)
+
+    reprice_fx_forward_risk(
+        _request(instrument_ids=("fwd_a",), spec=spec),
+        _base_snapshot(),
+        _grid(spec),
+        {"fwd_a": _contract()},
+        price_forward=_counting,
+        cube_path=SCENARIO_CUBE_VECTORISED,
+    )
+
+    assert len(calls) == 1 + len(_grid(spec).scenarios)
+
+
+def test_non_positive_shock_factor_falls_back_and_rejects_like_per_scenario() -> None:
+    spec = _spec(spot=(Decimal("-1.00"), Decimal("0.00")), dfd=(Decimal("0.00"),), dff=(Decimal("0.00"),))
+    args = (_request(instrument_ids=("fwd_a",), spec=spec), _base_snapshot(), _grid(spec), {"fwd_a": _contract()})
+
+    with pytest.raises(RiskValidationError) as reference:
+        reprice_fx_forward_risk(*args)
+    with pytest.raises(RiskValidationError) as cube:
+        reprice_fx_forward_risk(*args, cube_path=SCENARIO_CUBE_VECTORISED)
+    assert cube.value.envelope == reference.value.envelope
+
+
+def test_cube_path_composes_with_process_executor_and_rejects_unknown_paths() -> None:
+    instrument_ids, contracts = _forward_book()
+    spec = _wide_spec()
+    request = _request(instrument_ids=instrument_ids, spec=spec)
+    grid = _grid(spec)
+
+    reference = reprice_fx_forward_risk(request, _base_snapshot(), grid, contracts)
+    parallel = reprice_fx_forward_risk(
+        request,
+        _base_snapshot(),
+        grid,
+        contracts,
+        executor=RISK_EXECUTOR_PROCESS,
+        max_workers=2,
+        cube_path=SCENARIO_CUBE_VECTORISED,
+    )
+    assert parallel == reference
+
+    with pytest.raises(RiskValidationError) as exc:
+        reprice_fx_forward_risk(request, _base_snapshot(), grid, contracts, cube_path="outer_product")
+    assert exc.value.envelope.details["field"] == "cube_path"
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import dataclasses
+import io
+import json
+
+import pytest
+
+from core.risk.canonical_stream import CanonicalJsonSink
+from core.risk.canonical_stream import canonical_sha256_stream
+from core.risk.canonical_stream import iter_canonical_json
+from core.risk.portfolio_surface import compute_portfolio_surface_v1
+from core.risk.reprice_harness import reprice_fx_forward_risk
+from core.risk.risk_artifact import build_risk_artifact_v1
+from core.risk.risk_artifact import stream_risk_artifact_v1
+from core.risk.risk_request import RiskValidationError
+from tests.core.risk import test_g10_4_options_harness_flow as g10
+from tests.core.risk import test_g9_4_risk_artifact_freeze as g9
+
+
+def _canonical_bytes(obj: object) -> bytes:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _g9_inputs():
+    request = g9._request(instrument_ids=("fwd_b", "fwd_a"))
+    grid = g9._grid()
+    result = reprice_fx_forward_risk(request, g9._snapshot(), grid, g9._contracts())
+    return request, grid, result
+
+
+def _g10_inputs():
+    request = g10._request()
+    grid = g10._grid()
+    result = reprice_fx_forward_risk(
+        request, g10._base_snapshot(), grid, g10._contracts(), market_snapshot_payload=g10._market_payload()
+    )
+    return request, grid, result
+
+
+@pytest.mark.parametrize("inputs", [_g9_inputs, _g10_inputs], ids=["g9_forwards", "g10_options"])
+def test_streamed_bytes_and_sha_equal_in_memory_artifact(inputs) -> None:
+    request, grid, result = inputs()
+    artifact = build_risk_artifact_v1(request, grid, result)
+    out = io.BytesIO()
+
+    header = stream_risk_artifact_v1(request, grid, result, out)
+
+    assert out.getvalue() == _canonical_bytes(artifact)
+    assert header["sha256"] == artifact["sha256"]
+    assert "results" not in header["outputs"]
+    assert header == {
+        **artifact,
+        "outputs": {"aggregates": artifact["outputs"]["aggregates"]},
+    }
+    assert compute_portfolio_surface_v1(header) == compute_portfolio_surface_v1(artifact)
+
+
+def test_streamed_sha_matches_pinned_g10_fixture_without_output_sink() -> None:
+    request, grid, result = _g10_inputs()
+
+    assert stream_risk_artifact_v1(request, grid, result)["sha256"] == g10.PINNED_RISK_ARTIFACT_SHA
+
+
+def test_validation_runs_before_any_byte_is_written() -> None:
+    request, grid, result = _g9_inputs()
+    bad_cube = dataclasses.replace(result.results[-1], scenario_pvs=result.results[-1].scenario_pvs[:-1])
+    bad = dataclasses.replace(result, results=result.results[:-1] + (bad_cube,))
+    out = io.BytesIO()
+
+    with pytest.raises(RiskValidationError):
+        stream_risk_artifact_v1(request, grid, bad, out)
+    assert out.getvalue() == b""
+
+
+def test_canonical_stream_matches_json_dumps_for_lazy_and_nested_values() -> None:
+    doc = {
+        "z": [1, 2.5, None, True, {"b": "ש", "a": [{"y": 1, "x": 2}]}],
+        "a": (row for row in ({"k": i, "j": str(i)} for i in range(3))),
+        "m": {"q": iter([]), "p": "tab\tquote\""},
+    }
+    expected = {
+        "z": doc["z"],
+        "a": [{"k": i, "j": str(i)} for i in range(3)],
+        "m": {"q": [], "p": "tab\tquote\""},
+    }
+
+    assert "".join(iter_canonical_json(doc)).encode("utf-8") == _canonical_bytes(expected)
+
+
+def test_sink_flush_boundaries_do_not_change_the_digest() -> None:
+    doc = {"rows": [{"id": f"r{i}", "pv": str(i * 1.5)} for i in range(200)]}
+    out = io.BytesIO()
+    sink = CanonicalJsonSink(out, flush_chars=7)
+
+    sink.write_json(doc)
+
+    assert sink.hexdigest() == canonical_sha256_stream(doc)
+    assert out.getvalue() == _canonical_bytes(doc)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import dataclasses
+import tracemalloc
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from core.risk.reprice_harness import SCENARIO_CUBE_VECTORISED
+from core.risk.reprice_harness import reprice_fx_forward_risk
+from core.risk.risk_artifact import build_risk_artifact_v1
+from core.risk.risk_cube import RiskCube
+from core.risk.risk_request import RiskValidationError
+from tests.core.risk import test_g10_4_options_harness_flow as g10
+from tests.core.risk.test_g9_3_reprice_harness import _base_snapshot
+from tests.core.risk.test_g9_3_reprice_harness import _grid
+from tests.core.risk.test_g9_3_reprice_harness import _request
+from tests.core.risk.test_g9_3_reprice_harness import _spec
+from tests.core.risk.test_reprice_harness_executors import _forward_book
+
+
+def _forward_run(count: int = 9, shocks: int = 5):
+    instrument_ids, contracts = _forward_book(count)
+    axis = tuple(Decimal(i - shocks // 2) / Decimal(100) for i in range(shocks))
+    spec = _spec(spot=axis, dfd=axis, dff=axis)
+    request = _request(instrument_ids=instrument_ids, spec=spec)
+    grid = _grid(spec)
+    result = reprice_fx_forward_risk(request, _base_snapshot(), grid, contracts, cube_path=SCENARIO_CUBE_VECTORISED)
+    return request, grid, result
+
+
+def test_round_trip_preserves_result_and_artifact_hash() -> None:
+    request, grid, result = _forward_run()
+    cube = RiskCube.from_risk_result(result)
+
+    assert cube.shape == (9, len(grid.scenario_ids))
+    assert cube.scenario_ids == grid.scenario_ids
+    assert cube.to_risk_result() == result
+    assert build_risk_artifact_v1(request, grid, cube.to_risk_result())["sha256"] == build_risk_artifact_v1(
+        request, grid, result
+    )["sha256"]
+
+    options = reprice_fx_forward_risk(
+        g10._request(),
+        g10._base_snapshot(),
+        g10._grid(),
+        g10._contracts(),
+        market_snapshot_payload=g10._market_payload(),
+    )
+    assert RiskCube.from_risk_result(options).to_risk_result() == options
+
+
+def test_slices_and_totals_match_per_cell_structure() -> None:
+    _, grid, result = _forward_run()
+    cube = RiskCube.from_risk_result(result)
+    by_cell = {
+        (item.instrument_id, item.scenario_id): float(item.pv_domestic)
+        for instrument in result.results
+        for item in instrument.scenario_pvs
+    }
+
+    scenario_id = grid.scenario_ids[7]
+    assert cube.instrument_row("fwd_03").tolist() == [by_cell[("fwd_03", sid)] for sid in grid.scenario_ids]
+    assert cube.scenario_column(scenario_id).tolist() == [by_cell[(iid, scenario_id)] for iid in cube.instrument_ids]
+
+    totals = cube.scenario_totals()
+    for j, sid in enumerate(grid.scenario_ids):
+        exact = sum(item.pv_domestic for instrument in result.results for item in instrument.scenario_pvs if item.scenario_id == sid)
+        assert totals[j] == pytest.approx(float(exact), rel=1e-12)
+    assert cube.base_total() == pytest.approx(float(sum(c.base_pv for c in result.results)), rel=1e-12)
+    assert np.array_equal(cube.pnl_vs_base()[2], cube.scenario_pv[2] - cube.base_pv[2])
+
+    sub = cube.select_instruments(["fwd_05", "fwd_01"]).select_scenarios(grid.scenario_ids[:3])
+    assert sub.instrument_ids == ("fwd_05", "fwd_01")
+    assert sub.to_risk_result().results[0].scenario_pvs == result.results[5].scenario_pvs[:3]
+
+
+def test_rejects_pvs_that_do_not_round_trip_through_float() -> None:
+    _, _, result = _forward_run(count=1)
+    cell = result.results[0].scenario_pvs[0]
+    padded = dataclasses.replace(cell, pv_domestic=Decimal("1.10"))
+    bad = dataclasses.replace(
+        result,
+        results=(dataclasses.replace(result.results[0], scenario_pvs=(padded,) + result.results[0].scenario_pvs[1:]),),
+    )
+
+    with pytest.raises(RiskValidationError) as exc:
+        RiskCube.from_risk_result(bad)
+    assert exc.value.envelope.details["field"] == "pv_domestic"
+
+
+def test_matrix_is_read_only_and_an_order_of_magnitude_smaller() -> None:
+    tracemalloc.start()
+    _, _, result = _forward_run(count=40, shocks=7)
+    per_cell_bytes = tracemalloc.get_traced_memory()[0]
+    cube = RiskCube.from_risk_result(result)
+    del result
+    tracemalloc.stop()
+
+    with pytest.raises(ValueError):
+        cube.scenario_pv[0, 0] = 0.0
+    assert cube.scenario_pv.nbytes * 10 < per_cell_bytes
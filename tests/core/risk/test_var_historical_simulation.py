@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import datetime
+import math
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from core.contracts.option_contract_v1 import OptionContractV1
+from core.market_data.market_snapshot_payload_v0 import Curve
+from core.market_data.market_snapshot_payload_v0 import FxRates
+from core.market_data.market_snapshot_payload_v0 import InterestRateCurves
+from core.market_data.market_snapshot_payload_v0 import MarketConventions
+from core.market_data.market_snapshot_payload_v0 import MarketSnapshotPayloadV0
+from core.market_data.market_snapshot_payload_v0 import SpotPrices
+from core.market_data.market_snapshot_payload_v0 import VolSurface
+from core.market_data.market_snapshot_payload_v0 import VolSurfaces
+from core.numeric_policy import DEFAULT_TOLERANCES
+from core.numeric_policy import MetricClass
+from core.pricing.bs_ssot_v1 import price_european_option_bs_v1
+from core.pricing.fx import forward_mtm
+from core.pricing.fx import types as fx_types
+from core.pricing.fx.valuation_context import ValuationContext
+from core.risk.risk_request import RiskValidationError
+from core.risk.var_historical import calc_historical_var_cvar
+from core.risk.var_historical_simulation import run_historical_simulation_var_v1
+
+
+AS_OF = datetime.datetime(2026, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+_PRICE_TOL = DEFAULT_TOLERANCES[MetricClass.PRICE]
+
+
+def _context() -> ValuationContext:
+    return ValuationContext(as_of_ts=AS_OF, domestic_currency="ILS", strict_mode=True)
+
+
+_TENORS = (("30D", 30), ("181D", 181), ("365D", 365))
+
+
+def _df(payload: MarketSnapshotPayloadV0, ccy: str, tenor: str, days: int) -> float:
+    return math.exp(-payload.curves.curves[ccy].zero_rates[tenor] * days / 365.0)
+
+
+def _window(days: int = 60, seed: int = 3) -> list[MarketSnapshotPayloadV0]:
+    rng = np.random.default_rng(seed)
+    usdils = 3.70 * np.cumprod(1.0 + rng.normal(0.0, 0.006, days))
+    eurils = 4.02 * np.cumprod(1.0 + rng.normal(0.0, 0.005, days))
+    spot_ta35 = 2100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, days))
+    rates = {
+        "ILS": 0.045 + np.cumsum(rng.normal(0.0, 0.0004, days)),
+        "USD": 0.043 + np.cumsum(rng.normal(0.0, 0.0004, days)),
+        "EUR": 0.025 + np.cumsum(rng.normal(0.0, 0.0003, days)),
+    }
+    return [
+        MarketSnapshotPayloadV0(
+            fx_rates=FxRates(base_ccy="ILS", quotes={"USD/ILS": float(usdils[d]), "EUR/ILS": float(eurils[d])}),
+            spots=SpotPrices(prices={"TA35": float(spot_ta35[d])}, currency={"TA35": "ILS"}),
+            curves=InterestRateCurves(
+                curves={
+                    ccy: Curve(
+                        day_count="ACT/365",
+                        compounding="continuous",
+                        # upward-sloping: a DF read at the wrong tenor is visibly wrong
+                        zero_rates={tenor: float(r[d]) - 0.004 * (1.0 - days_ / 365.0) for tenor, days_ in _TENORS},
+                    )
+                    for ccy, r in rates.items()
+                }
+            ),
+            vols=VolSurfaces(surfaces={"TA35": VolSurface(type="flat", data={"vol": 0.18})}),
+            conventions=MarketConventions(calendar="NONE", day_count_default="ACT/365", spot_lag=2),
+        )
+        for d in range(days)
+    ]
+
+
+def _forward(
+    pair: str,
+    notional: float,
+    forward_rate: float,
+    direction: str,
+    forward_date: datetime.date = datetime.date(2026, 7, 1),  # 181D from AS_OF
+) -> fx_types.FXForwardContract:
+    base, quote = pair.split("/")
+    return fx_types.FXForwardContract(
+        base_currency=base,
+        quote_currency=quote,
+        notional=notional,
+        forward_date=forward_date,
+        forward_rate=forward_rate,
+        direction=direction,
+    )
+
+
+def _option(instrument_id: str, option_type: str, strike: str) -> OptionContractV1:
+    return OptionContractV1(
+        instrument_id=instrument_id,
+        underlying="TA35",
+        option_type=option_type,
+        strike=Decimal(strike),
+        expiry=datetime.datetime(2027, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc),
+        notional=Decimal("50"),
+        domestic_ccy="ILS",
+        foreign_ccy="ILS",
+        time_fraction_policy_id="ACT_365F",
+        contract_version="v1",
+    )
+
+
+def _book() -> dict[str, object]:
+    return {
+        "fwd_usd_recv": _forward("USD/ILS", 1_000_000.0, 3.68, "receive_foreign_pay_domestic"),
+        "fwd_usd_pay": _forward("USD/ILS", 400_000.0, 3.75, "pay_foreign_receive_domestic"),
+        "fwd_eur_recv": _forward("EUR/ILS", 750_000.0, 4.00, "receive_foreign_pay_domestic"),
+        "opt_call": _option("opt_call", "call", "2150"),
+        "opt_put": _option("opt_put", "put", "2000"),
+    }
+
+
+def test_forward_scenarios_match_scalar_ssot_on_the_shocked_market() -> None:
+    window = _window()
+    result = run_historical_simulation_var_v1(
+        valuation_context=_context(), market_snapshots=window, contracts_by_instrument_id=_book()
+    )
+    cube = result.cube
+    row = cube.instrument_ids.index("fwd_eur_recv")
+    contract = _book()["fwd_eur_recv"]
+
+    def level(day: int, ccy: str | None = None) -> float:
+        if ccy is None:
+            return window[day].fx_rates.quotes["EUR/ILS"]
+        return _df(window[day], ccy, "365D", 365)
+
+    for j in (0, 17, len(window) - 2):
+        shocked = fx_types.FxMarketSnapshot(
+            as_of_ts=AS_OF,
+            spot_rate=level(-1) * (level(j + 1) / level(j)),
+            df_domestic=_df(window[-1], "ILS", "181D", 181) * (level(j + 1, "ILS") / level(j, "ILS")),
+            df_foreign=_df(window[-1], "EUR", "181D", 181) * (level(j + 1, "EUR") / level(j, "EUR")),
+        )
+        expected = forward_mtm.price_fx_forward_ctx(context=_context(), contract=contract, market_snapshot=shocked)
+        assert cube.scenario_pv[row, j] == expected.pv
+
+    assert cube.shape == (5, len(window) - 1)
+    assert cube.market_snapshot_id == result.market_snapshot_ids[-1]
+
+
+def test_short_dated_forward_is_discounted_at_its_own_tenor() -> None:
+    window = _window()
+    contract = _forward("USD/ILS", 1_000_000.0, 3.68, "receive_foreign_pay_domestic", datetime.date(2026, 1, 31))
+    result = run_historical_simulation_var_v1(
+        valuation_context=_context(), market_snapshots=window, contracts_by_instrument_id={"f1m": contract}
+    )
+
+    def market(j: int | None) -> fx_types.FxMarketSnapshot:
+        def move(ccy: str | None) -> float:
+            if j is None:
+                return 1.0
+            if ccy is None:
+                return window[j + 1].fx_rates.quotes["USD/ILS"] / window[j].fx_rates.quotes["USD/ILS"]
+            return _df(window[j + 1], ccy, "365D", 365) / _df(window[j], ccy, "365D", 365)
+
+        return fx_types.FxMarketSnapshot(
+            as_of_ts=AS_OF,
+            spot_rate=window[-1].fx_rates.quotes["USD/ILS"] * move(None),
+            df_domestic=_df(window[-1], "ILS", "30D", 30) * move("ILS"),
+            df_foreign=_df(window[-1], "USD", "30D", 30) * move("USD"),
+        )
+
+    def pv(j: int | None) -> float:
+        return forward_mtm.price_fx_forward_ctx(context=_context(), contract=contract, market_snapshot=market(j)).pv
+
+    assert result.cube.base_pv[0] == pv(None)
+    for j in (0, 29):
+        assert result.cube.scenario_pv[0, j] == pv(j)
+
+
+def test_option_scenarios_match_scalar_bs_ssot_within_price_tolerance() -> None:
+    window = _window()
+    result = run_historical_simulation_var_v1(
+        valuation_context=_context(), market_snapshots=window, contracts_by_instrument_id=_book()
+    )
+    row = result.cube.instrument_ids.index("opt_put")
+    df_ils = [_df(p, "ILS", "365D", 365) for p in window]
+    spots = [p.spots.prices["TA35"] for p in window]
+
+    for j in (0, 30):
+        expected = price_european_option_bs_v1(
+            spot=spots[-1] * (spots[j + 1] / spots[j]),
+            strike=2000.0,
+            domestic_df=df_ils[-1] * (df_ils[j + 1] / df_ils[j]),
+            foreign_df=df_ils[-1] * (df_ils[j + 1] / df_ils[j]),
+            vol=0.18,
+            ttm_years=1.0,
+            option_type="put",
+            notional=50.0,
+            time_fraction_policy_id="ACT_365F",
+        ).pv_domestic
+        got = result.cube.scenario_pv[row, j]
+        assert abs(got - expected) <= _PRICE_TOL.abs + _PRICE_TOL.rel * abs(expected)
+
+
+def test_var_es_and_contributions_are_consistent() -> None:
+    result = run_historical_simulation_var_v1(
+        valuation_context=_context(),
+        market_snapshots=_window(),
+        contracts_by_instrument_id=_book(),
+        confidences=(0.9, 0.95),
+    )
+    pnl = result.cube.pnl_vs_base()
+
+    var, es = calc_historical_var_cvar(pnl=result.portfolio_pnl, confidences=(0.9, 0.95))
+    assert np.array_equal(result.var, var)
+    assert np.array_equal(result.es, es)
+    assert result.component_var.shape == result.component_es.shape == (2, 5)
+
+    for c in range(2):
+        j = result.cube.scenario_ids.index(result.var_scenario_ids[c])
+        q = result.portfolio_pnl[j]
+        assert j == int(np.flatnonzero(result.portfolio_pnl == q)[0])
+        assert result.component_var[c].sum() == pytest.approx(-q, rel=1e-12)
+        tail = result.portfolio_pnl <= q
+        assert result.component_es[c].sum() == pytest.approx(-result.portfolio_pnl[tail].mean(), rel=1e-12)
+        assert np.array_equal(result.component_var[c], -pnl[:, j])
+
+    notionals = np.array([750_000.0, 400_000.0, 1_000_000.0, 50.0, 50.0])
+    assert result.cube.instrument_ids == ("fwd_eur_recv", "fwd_usd_pay", "fwd_usd_recv", "opt_call", "opt_put")
+    assert np.allclose(result.marginal_var * notionals, result.component_var, rtol=1e-12, atol=0.0)
+
+
+def test_marginal_contribution_is_invariant_to_position_size() -> None:
+    book = _book()
+    scaled = dict(book)
+    scaled["fwd_usd_recv"] = _forward("USD/ILS", 3_000_000.0, 3.68, "receive_foreign_pay_domestic")
+    window = _window()
+
+    base = run_historical_simulation_var_v1(
+        valuation_context=_context(), market_snapshots=window, contracts_by_instrument_id={"f": book["fwd_usd_recv"]}
+    )
+    tripled = run_historical_simulation_var_v1(
+        valuation_context=_context(), market_snapshots=window, contracts_by_instrument_id={"f": scaled["fwd_usd_recv"]}
+    )
+
+    assert tripled.var == pytest.approx(3.0 * base.var, rel=1e-12)
+    assert tripled.marginal_var == pytest.approx(base.marginal_var, rel=1e-12)
+
+
+def test_rejects_short_window_missing_factor_and_unsupported_contract() -> None:
+    window = _window()
+    cases = (
+        ({"market_snapshots": window[:20]}, "market_snapshots"),
+        ({"contracts_by_instrument_id": {"x": object()}}, "contracts_by_instrument_id"),
+        ({"contracts_by_instrument_id": {}}, "contracts_by_instrument_id"),
+        ({"df_tenor_days": 0}, "df_tenor_days"),
+        ({"df_tenor_days": 180}, "market_snapshots[0].curves.curves[ILS]"),
+        (
+            {"contracts_by_instrument_id": {"f": _forward("GBP/ILS", 1.0, 4.5, "receive_foreign_pay_domestic")}},
+            "market_snapshots[0].fx_rates.quotes[GBP/ILS]",
+        ),
+    )
+    zero_notional = _forward("USD/ILS", 1.0, 3.68, "receive_foreign_pay_domestic")
+    object.__setattr__(zero_notional, "notional", 0.0)  # bypasses the contract's own check
+    cases += (({"contracts_by_instrument_id": {"z": zero_notional}}, "contracts_by_instrument_id[z].notional"),)
+    for overrides, field in cases:
+        kwargs = {
+            "valuation_context": _context(),
+            "market_snapshots": window,
+            "contracts_by_instrument_id": _book(),
+        }
+        kwargs.update(overrides)
+        with pytest.raises(RiskValidationError) as exc:
+            run_historical_simulation_var_v1(**kwargs)
+        assert exc.value.envelope.details["field"] == field
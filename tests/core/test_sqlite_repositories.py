@@ -227,3 +227,67 @@ def test_invalid_lookup_guardrails_are_deterministic(tmp_path: Path) -> None:
         raise AssertionError("expected ValueError for invalid valuation_run_id")
 
     assert first_error == second_error
+
+
+def test_repository_reads_are_keyed_and_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    db_path = _db_path(tmp_path)
+    repo = SqliteValuationRunRepository(db_path=db_path)
+    valuation_run = _valuation_run()
+    repo.save(valuation_run)
+
+    store = repo._event_store
+    calls = {"get": 0, "list": 0}
+    real_get = store.get
+
+    def counting_get(session_id: str, event_id: str):
+        calls["get"] += 1
+        return real_get(session_id, event_id)
+
+    def forbidden_list(*args, **kwargs):
+        calls["list"] += 1
+        raise AssertionError("repository reads must not scan the pseudo-session")
+
+    monkeypatch.setattr(store, "get", counting_get)
+    monkeypatch.setattr(store, "list", forbidden_list)
+
+    first = repo.get_by_id(valuation_run.valuation_run_id)
+    second = repo.get_by_id(valuation_run.valuation_run_id)
+    assert first == valuation_run
+    assert second is first
+    assert repo.get_by_id("missing-vr") is None
+    assert repo.get_by_id("missing-vr") is None
+    assert calls == {"get": 3, "list": 0}
+
+
+def test_get_many_returns_stored_ids_only(tmp_path: Path) -> None:
+    db_path = _db_path(tmp_path)
+    repo = SqliteReferenceDataSetRepository(db_path=db_path)
+    base = _reference_data_set()
+    saved = {}
+    for i in range(3):
+        rds = ReferenceDataSet(**{**base.__dict__, "reference_data_version_id": f"rds-{i}"})
+        repo.save(rds.reference_data_version_id, rds)
+        saved[rds.reference_data_version_id] = rds
+
+    fresh = SqliteReferenceDataSetRepository(db_path=db_path)
+    got = fresh.get_many(["rds-2", "missing", "rds-0", "rds-2"])
+    assert got == {"rds-2": saved["rds-2"], "rds-0": saved["rds-0"]}
+    assert fresh.get_by_id("rds-0") is got["rds-0"]
+    assert fresh.get_many([]) == {}
+    with pytest.raises(ValueError, match="reference_data_set_id"):
+        fresh.get_many(["rds-0", " "])
+
+    models = SqliteModelRegistryRepository(db_path=db_path)
+    models.save(_model_registry_entry())
+    assert models.get_many(["model.fx.bs.v1"]) == {"model.fx.bs.v1": _model_registry_entry()}
+
+
+def test_object_cache_is_bounded(tmp_path: Path) -> None:
+    db_path = _db_path(tmp_path)
+    repo = SqliteValuationPolicySetRepository(db_path=db_path, cache_size=2)
+    base = _valuation_policy_set()
+    for i in range(3):
+        vps = ValuationPolicySet(**{**base.__dict__, "valuation_policy_id": f"vps-{i}"})
+        repo.save(vps.valuation_policy_id, vps)
+        assert repo.get_by_id(vps.valuation_policy_id) == vps
+    assert [key[1] for key in repo._cache] == ["vps-1", "vps-2"]
@@ -71,3 +71,54 @@ def test_get_payload_rehashes_to_same_market_snapshot_id(tmp_path, monkeypatch):
     fetched = artifact_store.get_market_snapshot(msid)
     rehashed = market_snapshot_id(fetched)
     assert rehashed == msid
+
+
+def test_get_uses_primary_key_and_caches_validated_payload(tmp_path, monkeypatch):
+    db_file = tmp_path / "v2.sqlite"
+    calls = {"get": 0, "list": 0}
+
+    class CountingStore(SqliteEventStore):
+        def get(self, session_id, event_id):
+            calls["get"] += 1
+            return super().get(session_id, event_id)
+
+        def list(self, *args, **kwargs):
+            calls["list"] += 1
+            return super().list(*args, **kwargs)
+
+    monkeypatch.setattr(artifact_store, "SqliteEventStore", lambda db_path=None: CountingStore(str(db_file)))
+    artifact_store.clear_market_snapshot_cache()
+
+    msid = artifact_store.put_market_snapshot(make_payload())
+    first = artifact_store.get_market_snapshot(msid)
+    second = artifact_store.get_market_snapshot(msid)
+    assert second == first and second is not first
+    assert calls == {"get": 1, "list": 0}
+
+    # A caller mutating its copy does not corrupt the cached, content-addressed entry
+    first.spots.prices["AAPL"] = -1.0
+    assert artifact_store.get_market_snapshot(msid) == second
+
+    # Cache entries are scoped to the database they were read from
+    other_db = tmp_path / "other.sqlite"
+    monkeypatch.setattr(artifact_store, "SqliteEventStore", lambda db_path=None: SqliteEventStore(str(other_db)))
+    from core.market_data.errors import MarketSnapshotNotFoundError
+
+    with pytest.raises(MarketSnapshotNotFoundError):
+        artifact_store.get_market_snapshot(msid)
+
+
+def test_cache_is_bounded(tmp_path, monkeypatch):
+    db_file = tmp_path / "v2.sqlite"
+    monkeypatch.setattr(artifact_store, "SqliteEventStore", lambda db_path=None: SqliteEventStore(str(db_file)))
+    monkeypatch.setattr(artifact_store, "MARKET_SNAPSHOT_CACHE_SIZE", 2)
+    artifact_store.clear_market_snapshot_cache()
+
+    ids = []
+    for spot in (1.0, 2.0, 3.0):
+        p = make_payload()
+        p.spots.prices["AAPL"] = spot
+        ids.append(artifact_store.put_market_snapshot(p))
+        artifact_store.get_market_snapshot(ids[-1])
+    assert [k[1] for k in artifact_store._snapshot_cache] == ids[1:]
+    artifact_store.clear_market_snapshot_cache()
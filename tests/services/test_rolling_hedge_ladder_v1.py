@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import dataclasses
 import datetime
 import math
+
+import pytest
 from decimal import Decimal
 from decimal import InvalidOperation
 from typing import Any
@@ -9,6 +12,7 @@ from typing import Any
 from core.numeric_policy import DEFAULT_TOLERANCES
 from core.numeric_policy import MetricClass
 from core.pricing.fx.types import FxMarketSnapshot
+from core.risk.risk_request import RiskValidationError
 from core.risk.scenario_spec import ScenarioSpec
 from core.services.advisory_read_model_v1 import run_treasury_advisory_v1
 from core.services.hedge_policy_constraints_v1 import apply_hedge_policy_v1
@@ -392,3 +396,112 @@ def test_exporter_bucket_recommendations_are_risk_driven_and_align_with_global_a
     lot = float(policy.rounding_lot_notional or 0.0)
     assert diff <= max(lot * 2.0, global_additional * 0.01)
     assert rel <= 0.02
+
+
+def _ladder_book(pairs: tuple[str, ...]) -> dict[str, Any]:
+    exposures = []
+    for i in range(24):
+        maturity = datetime.date(2026, 3, 10) + datetime.timedelta(days=11 * i)
+        exposures.append(
+            {
+                "currency_pair": pairs[i % len(pairs)],
+                "direction": "receivable" if i % 3 else "payable",
+                "notional": str(500000 + 125000 * (i % 5)),
+                "maturity_date": maturity.isoformat(),
+                "hedge_ratio": None if i % 4 == 0 else f"0.{i % 9 + 1}",
+            }
+        )
+    # an exact duplicate row collapses into the same instrument in both paths
+    exposures.append(dict(exposures[5]))
+    return {
+        "contract_version": "v1",
+        "company_id": "ladder-parity",
+        "snapshot_id": "snap-ladder-20260305",
+        "scenario_template_id": "spot_dfs_3x2x2",
+        "exposures": exposures,
+    }
+
+
+def _ladder_inputs() -> tuple[FxMarketSnapshot, ScenarioSpec, RollingHedgeLadderConfigV1]:
+    base_snapshot = FxMarketSnapshot(
+        as_of_ts=datetime.datetime(2026, 3, 5, 12, 0, 0, tzinfo=datetime.timezone(datetime.timedelta(hours=2))),
+        spot_rate=3.70,
+        df_domestic=0.997,
+        df_foreign=0.996,
+        domestic_currency="ILS",
+    )
+    scenario_spec = ScenarioSpec(
+        schema_version=1,
+        spot_shocks=(Decimal("-0.05"), Decimal("0.0"), Decimal("0.05")),
+        df_domestic_shocks=(Decimal("0.0"), Decimal("0.01")),
+        df_foreign_shocks=(Decimal("-0.01"), Decimal("0.0")),
+    )
+    config = RollingHedgeLadderConfigV1(
+        buckets_days=(30, 60, 90, 180),
+        roll_frequency_days=30,
+        target_worst_loss_total_domestic=150000.0,
+        as_of_date="2026-03-05",
+    )
+    return base_snapshot, scenario_spec, config
+
+
+def test_shared_pricing_ladder_is_identical_to_one_advisory_run_per_bucket(monkeypatch) -> None:
+    import core.services.rolling_hedge_ladder_v1 as ladder_module
+
+    payload = _ladder_book(("USD/ILS", "EUR/ILS"))
+    base_snapshot, scenario_spec, config = _ladder_inputs()
+    runs: list[int] = []
+    real_run = ladder_module.run_treasury_advisory_v1
+
+    def _counting_run(bucket_payload, **kwargs):
+        runs.append(len(bucket_payload["exposures"]))
+        return real_run(bucket_payload, **kwargs)
+
+    monkeypatch.setattr(ladder_module, "run_treasury_advisory_v1", _counting_run)
+    shared = compute_rolling_hedge_ladder_v1(payload, base_snapshot=base_snapshot, scenario_spec=scenario_spec, config=config)
+    assert runs == []
+
+    monkeypatch.setattr(ladder_module, "_shared_risk_summaries", lambda *args, **kwargs: None)
+    per_bucket = compute_rolling_hedge_ladder_v1(payload, base_snapshot=base_snapshot, scenario_spec=scenario_spec, config=config)
+
+    assert len(runs) == len(per_bucket.buckets) == 5
+    assert shared.to_dict() == per_bucket.to_dict()
+
+
+def test_ladder_spanning_several_quote_currencies_falls_back_to_per_bucket_runs(monkeypatch) -> None:
+    import core.services.rolling_hedge_ladder_v1 as ladder_module
+
+    payload = _ladder_book(("USD/ILS",))
+    for row in payload["exposures"]:
+        if row["maturity_date"] > "2026-09-01":
+            row["currency_pair"] = "EUR/USD"
+    base_snapshot, scenario_spec, config = _ladder_inputs()
+    runs: list[int] = []
+    real_run = ladder_module.run_treasury_advisory_v1
+
+    def _counting_run(bucket_payload, **kwargs):
+        runs.append(len(bucket_payload["exposures"]))
+        return real_run(bucket_payload, **kwargs)
+
+    monkeypatch.setattr(ladder_module, "run_treasury_advisory_v1", _counting_run)
+    out = compute_rolling_hedge_ladder_v1(payload, base_snapshot=base_snapshot, scenario_spec=scenario_spec, config=config)
+
+    assert len(runs) == len(out.buckets) == 5
+    assert out.buckets[-1].bucket_label == ">180"
+
+
+def test_shared_pricing_ladder_keeps_the_exposures_rejection_of_per_bucket_runs(monkeypatch) -> None:
+    import core.services.rolling_hedge_ladder_v1 as ladder_module
+
+    payload = _ladder_book(("USD/ILS",))
+    base_snapshot, scenario_spec, config = _ladder_inputs()
+    asymmetric = dataclasses.replace(scenario_spec, spot_shocks=(Decimal("-0.05"), Decimal("0.0"), Decimal("0.10")))
+
+    with pytest.raises(RiskValidationError) as shared_exc:
+        compute_rolling_hedge_ladder_v1(payload, base_snapshot=base_snapshot, scenario_spec=asymmetric, config=config)
+    monkeypatch.setattr(ladder_module, "_shared_risk_summaries", lambda *args, **kwargs: None)
+    with pytest.raises(RiskValidationError) as per_bucket_exc:
+        compute_rolling_hedge_ladder_v1(payload, base_snapshot=base_snapshot, scenario_spec=asymmetric, config=config)
+
+    assert shared_exc.value.envelope.details == per_bucket_exc.value.envelope.details
+    assert shared_exc.value.envelope.details["field"] == "inputs.scenario_spec.spot_shocks"
@@ -6,6 +6,7 @@ from core.arbitrage.execution.gate import (
     ExecutionConstraints,
     ExecutionDecisionReason,
     evaluate_execution_readiness,
+    evaluate_execution_readiness_many,
 )
 from core.arbitrage.models import ArbitrageLeg, ArbitrageOpportunity, VenueQuote
 
@@ -107,3 +108,28 @@ def test_deterministic_output():
     second = evaluate_execution_readiness(opportunity, quotes, constraints, NOW)
 
     assert first == second
+
+
+def test_batch_matches_scalar_decisions():
+    quotes = _quotes_with_spread(99.4, 99.5) + [VenueQuote(venue="Charlie", symbol="XYZ", bid=None, ask=None)]
+    opportunities = [
+        _build_opportunity(),
+        _build_opportunity(edge_bps=10),
+        _build_opportunity(as_of=NOW - timedelta(seconds=10)),
+        _build_opportunity(as_of=None),
+        _build_opportunity(size=20),
+        _build_opportunity(size=20, buy=ArbitrageLeg(action="buy", venue="Alpha", price=0.0, quantity=5)),
+        _build_opportunity(edge_bps=float("nan")),
+    ]
+    constraint_sets = [
+        ExecutionConstraints(),
+        ExecutionConstraints(min_edge_bps=50, max_quote_age_ms=2_000, max_spread_bps=20, max_notional=1_000),
+        ExecutionConstraints(min_edge_bps=50, max_quote_age_ms=2_000, max_spread_bps=5, max_notional=-1),
+    ]
+
+    for constraints in constraint_sets:
+        expected = [evaluate_execution_readiness(o, quotes, constraints, NOW) for o in opportunities]
+        batch = evaluate_execution_readiness_many(opportunities, quotes, constraints, NOW)
+        assert [d.reason for d in batch] == [d.reason for d in expected]
+        assert [repr(d) for d in batch] == [repr(d) for d in expected]
+    assert evaluate_execution_readiness_many([], quotes, constraint_sets[1], NOW) == []
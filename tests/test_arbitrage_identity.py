@@ -1,4 +1,4 @@
-from core.arbitrage.identity import opportunity_id
+from core.arbitrage.identity import opportunity_id, opportunity_ids
 
 
 def test_opportunity_id_stable_within_bucket() -> None:
@@ -56,3 +56,10 @@ def test_opportunity_id_changes_on_venue_order() -> None:
         sell_price_base=101.0,
     )
     assert id1 != id2
+
+
+def test_opportunity_ids_match_scalar_ids() -> None:
+    buys = [100.001, -0.0, -0.004, 99.999, 12345.675]
+    sells = [101.002, 0.0, 0.004, 100.0, 12345.68]
+    ids = opportunity_ids(["ES"] * 5, ["A"] * 5, ["B"] * 5, "USD", buys, sells)
+    assert ids == [opportunity_id("ES", "A", "B", "USD", b, s) for b, s in zip(buys, sells)]
@@ -1,9 +1,12 @@
+import sys
+import threading
 from datetime import datetime, timedelta
 
 import pytest
 
 from core.arbitrage.intelligence.lifecycle import LifecycleState
 from core.arbitrage.intelligence.limits import SessionLimits
+from core.arbitrage.intelligence.signals import compute_signals
 from core.arbitrage.orchestrator import ArbitrageOrchestrator
 from core.arbitrage.models import ArbitrageConfig, VenueQuote
 from core.arbitrage.feed import QuoteSnapshot
@@ -77,3 +80,155 @@ def test_window_pruning(orchestrator: ArbitrageOrchestrator) -> None:
     assert len(state.snapshots) <= orchestrator.limits.max_snapshots
     assert len(state.events) <= orchestrator.limits.max_events
     assert len(state.opportunities_history) <= orchestrator.limits.max_snapshots
+
+
+def _scan_many(orchestrator: ArbitrageOrchestrator, n_snapshots: int, n_symbols: int):
+    config = ArbitrageConfig(min_edge_bps=0.0, default_size=1.0)
+    state = orchestrator.create_session(base_currency="USD", config=config)
+    fx_converter = FxConverter(provider=FxRateProvider.from_usd_ils(3.5), base_ccy="USD")
+    now = datetime.utcnow()
+    for i in range(n_snapshots):
+        quotes = []
+        for k in range(n_symbols):
+            bump = ((i * 7 + k) % 5) * 0.01
+            quotes.append(VenueQuote(venue="A", symbol=f"S{k}", bid=100.5, ask=100.0, ccy="USD"))
+            quotes.append(VenueQuote(venue="B", symbol=f"S{k}", bid=101.0 + bump, ask=100.9, ccy="USD"))
+        orchestrator.ingest_snapshot(
+            session_id=state.session_id,
+            snapshot=QuoteSnapshot(as_of=now + timedelta(milliseconds=i), quotes=quotes),
+            fx_converter=fx_converter,
+        )
+    return state
+
+
+def test_opportunity_index_mirrors_pruned_history() -> None:
+    orchestrator = ArbitrageOrchestrator(limits=SessionLimits(ttl_seconds=60, max_snapshots=17))
+    state = _scan_many(orchestrator, n_snapshots=12, n_symbols=3)
+
+    assert len(state.opportunity_index) == len(state.opportunities_history) == 17
+    for opp_id in {r.opportunity.opportunity_id for r in state.opportunities_history}:
+        expected = [r for r in state.opportunities_history if r.opportunity.opportunity_id == opp_id]
+        assert list(state.opportunity_index.records(opp_id)) == expected
+        assert state.opportunity_index.latest(opp_id) is expected[-1]
+    assert state.opportunity_index.latest("missing") is None
+
+
+def test_indexed_signals_match_full_history_scan() -> None:
+    orchestrator = ArbitrageOrchestrator(limits=SessionLimits(ttl_seconds=60, max_snapshots=40))
+    state = _scan_many(orchestrator, n_snapshots=15, n_symbols=4)
+    now = datetime.utcnow()
+
+    for record in state.opportunities_history:
+        opp_state = state.opportunity_state[record.opportunity.opportunity_id]
+        indexed = compute_signals(
+            opportunity=record,
+            state=opp_state,
+            now=now,
+            history=state.opportunity_index.records(record.opportunity.opportunity_id),
+        )
+        full = compute_signals(opportunity=record, state=opp_state, now=now, history=state.opportunities_history)
+        assert indexed == full
+
+    recs = orchestrator.get_recommendations(state.session_id, limit=len(state.opportunities_history))
+    for opp_id in state.opportunity_state:
+        single = orchestrator.get_opportunity_recommendation(state.session_id, opp_id)
+        first = next(r for r in recs if r.opportunity_id == opp_id)
+        assert single is not None
+        assert single.economics == first.economics
+        for key in ("seen_count", "edge_bps_current", "edge_bps_stability", "net_edge_bps"):
+            assert single.signals[key] == first.signals[key]
+
+
+def test_ttl_pruning_pops_stale_entries_from_the_left() -> None:
+    orchestrator = ArbitrageOrchestrator(limits=SessionLimits(ttl_seconds=30, max_snapshots=100))
+    config = ArbitrageConfig(min_edge_bps=0.0, default_size=1.0)
+    state = orchestrator.create_session(base_currency="USD", config=config)
+    fx_converter = FxConverter(provider=FxRateProvider.from_usd_ils(3.5), base_ccy="USD")
+    now = datetime.utcnow()
+    quotes = [
+        VenueQuote(venue="A", symbol="ES", bid=101.0, ask=100.0, ccy="USD"),
+        VenueQuote(venue="B", symbol="ES", bid=102.0, ask=101.0, ccy="USD"),
+    ]
+    for age_seconds in (90, 60, 20, 10, 0):
+        orchestrator.ingest_snapshot(
+            session_id=state.session_id,
+            snapshot=QuoteSnapshot(as_of=now - timedelta(seconds=age_seconds), quotes=quotes),
+            fx_converter=fx_converter,
+        )
+
+    assert [s.as_of for s in state.snapshots] == [now - timedelta(seconds=a) for a in (20, 10, 0)]
+    assert [r.as_of for r in state.opportunities_history] == [s.as_of for s in state.snapshots]
+    assert len(state.opportunity_index) == 3
+    assert orchestrator.get_latest_opportunities(state.session_id, limit=2) == list(state.opportunities_history)[1:]
+
+
+def test_readers_and_an_ingesting_thread_share_a_session_safely() -> None:
+    orchestrator = ArbitrageOrchestrator(limits=SessionLimits(ttl_seconds=60, max_snapshots=30))
+    state = _scan_many(orchestrator, n_snapshots=5, n_symbols=6)
+    fx_converter = FxConverter(provider=FxRateProvider.from_usd_ils(3.5), base_ccy="USD")
+    errors: list[BaseException] = []
+    done = threading.Event()
+
+    def ingest() -> None:
+        try:
+            now = datetime.utcnow()
+            for i in range(300):
+                quotes = []
+                for k in range(6):
+                    quotes.append(VenueQuote(venue="A", symbol=f"S{k}", bid=100.5, ask=100.0, ccy="USD"))
+                    quotes.append(VenueQuote(venue="B", symbol=f"S{k}", bid=101.0 + (i % 5) * 0.01, ask=100.9, ccy="USD"))
+                orchestrator.ingest_snapshot(
+                    state.session_id, QuoteSnapshot(as_of=now + timedelta(milliseconds=i), quotes=quotes), fx_converter
+                )
+        except BaseException as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+        finally:
+            done.set()
+
+    def read() -> None:
+        try:
+            while not done.is_set():
+                orchestrator.get_recommendations(state.session_id, limit=1000)
+                orchestrator.get_opportunity_time_series(state.session_id, symbol="S1")
+                orchestrator.get_latest_opportunities(state.session_id)
+        except BaseException as exc:
+            errors.append(exc)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=ingest)] + [threading.Thread(target=read) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert errors == []
+    assert len(state.opportunities_history) == 30
+
+
+def test_as_of_going_backwards_leaves_stale_entries_until_max_snapshots() -> None:
+    orchestrator = ArbitrageOrchestrator(limits=SessionLimits(ttl_seconds=30, max_snapshots=3))
+    state = orchestrator.create_session(base_currency="USD", config=ArbitrageConfig(min_edge_bps=0.0))
+    fx_converter = FxConverter(provider=FxRateProvider.from_usd_ils(3.5), base_ccy="USD")
+    now = datetime.utcnow()
+    quotes = [
+        VenueQuote(venue="A", symbol="ES", bid=101.0, ask=100.0, ccy="USD"),
+        VenueQuote(venue="B", symbol="ES", bid=102.0, ask=101.0, ccy="USD"),
+    ]
+
+    def ingest(age_seconds: int) -> None:
+        orchestrator.ingest_snapshot(
+            state.session_id, QuoteSnapshot(as_of=now - timedelta(seconds=age_seconds), quotes=quotes), fx_converter
+        )
+
+    for age_seconds in (0, 90):
+        ingest(age_seconds)
+    # TTL pruning stops at the fresh head, so the stale entry behind it survives...
+    assert [s.as_of for s in state.snapshots] == [now, now - timedelta(seconds=90)]
+    for _ in range(2):
+        ingest(0)
+    # ...until max_snapshots evicts the head in front of it
+    assert [s.as_of for s in state.snapshots] == [now, now]
@@ -0,0 +1,251 @@
+import asyncio
+import json
+import threading
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.v1.arbitrage_orch import router as arbitrage_router
+from core.arbitrage.feed import QueueQuoteFeed, QuoteSnapshot, ReplayQuoteFeed
+from core.arbitrage.intelligence.limits import SessionLimits
+from core.arbitrage.models import ArbitrageConfig, VenueQuote
+from core.arbitrage.orchestrator import ArbitrageOrchestrator
+from core.arbitrage.scan_loop import ArbitrageScanLoop, CoalescingQuoteBuffer
+from core.fx.converter import FxConverter
+from core.fx.provider import FxRateProvider
+from core.services.arbitrage_orchestration import (
+    _orchestrator,
+    _quote_streams,
+    close_quote_stream,
+    create_arbitrage_session,
+    iter_quote_stream_events,
+    prune_idle_sessions,
+    push_stream_quotes,
+)
+
+
+def _recorded_bursts() -> list[QuoteSnapshot]:
+    now = datetime.utcnow()
+    bursts = [
+        [
+            VenueQuote(venue="A", symbol="ES", bid=100.5, ask=100.0),
+            VenueQuote(venue="B", symbol="ES", bid=101.0, ask=100.8),
+            VenueQuote(venue="A", symbol="NQ", bid=200.0, ask=199.0),
+        ],
+        [VenueQuote(venue="B", symbol="NQ", bid=201.0, ask=200.5)],
+        [
+            VenueQuote(venue="B", symbol="ES", bid=101.2, ask=100.9),
+            VenueQuote(venue="B", symbol="ES", bid=101.3, ask=100.9),
+        ],
+        [VenueQuote(venue="A", symbol="ES", bid=None, ask=None)],
+    ]
+    # the last burst lands after the 1s TTL, so earlier opportunities expire
+    offsets_ms = (0, 10, 20, 1500)
+    return [QuoteSnapshot(as_of=now + timedelta(milliseconds=ms), quotes=q) for ms, q in zip(offsets_ms, bursts)]
+
+
+def _session(orchestrator: ArbitrageOrchestrator):
+    return orchestrator.create_session(base_currency="USD", config=ArbitrageConfig(min_edge_bps=0.0))
+
+
+def test_replay_scans_once_per_recorded_burst_like_sequential_deltas() -> None:
+    fx_converter = FxConverter(provider=FxRateProvider.from_usd_ils(3.5), base_ccy="USD")
+    orchestrator = ArbitrageOrchestrator(limits=SessionLimits(ttl_seconds=1))
+    streamed = _session(orchestrator)
+    sequential = _session(orchestrator)
+    bursts = _recorded_bursts()
+
+    feed = ReplayQuoteFeed.from_snapshots(bursts)
+    scan_loop = ArbitrageScanLoop(orchestrator, streamed.session_id, fx_converter, debounce_ms=0, clock=feed.clock)
+    feed.pace = scan_loop.wait_idle  # scans run in a worker thread: hold each burst until the last is scanned
+
+    async def _run() -> list[dict[str, object]]:
+        events = scan_loop.subscribe()
+        await scan_loop.run(feed)
+        return [events.get_nowait() for _ in range(events.qsize())]
+
+    events = asyncio.run(_run())
+
+    expected = []
+    for burst in bursts:
+        deduped = {(q.symbol, q.venue): q for q in burst.quotes}
+        expected.extend(
+            orchestrator.ingest_quote_delta(sequential.session_id, burst.as_of, list(deduped.values()), fx_converter)
+        )
+
+    assert scan_loop.scans == len(bursts)
+    assert scan_loop.buffer.coalesced == 1
+    assert [r.to_summary() for r in streamed.opportunities_history] == [r.to_summary() for r in expected]
+    assert [e["data"] for e in events if e["event"] == "opportunity"] == [r.to_summary() for r in expected]
+
+    lifecycle = [(e["data"]["opportunity_id"], e["data"]["state"]) for e in events if e["event"] == "lifecycle"]
+    first_states = {}
+    for opp_id, state in lifecycle:
+        first_states.setdefault(opp_id, state)
+    assert set(first_states.values()) == {"NEW"}
+    assert "EXPIRED" in {state for _, state in lifecycle}
+    assert events[-1] == {"event": "closed", "data": {"scans": len(bursts)}}
+
+
+def test_buffer_coalesces_per_venue_and_applies_backpressure_on_new_keys() -> None:
+    async def _run() -> None:
+        buffer = CoalescingQuoteBuffer(max_pending=2)
+        await buffer.put(VenueQuote(venue="A", symbol="ES", bid=1.0, ask=2.0))
+        await buffer.put(VenueQuote(venue="B", symbol="ES", bid=1.0, ask=2.0))
+        await buffer.put(VenueQuote(venue="A", symbol="ES", bid=1.5, ask=2.0))
+
+        blocked = asyncio.create_task(buffer.put(VenueQuote(venue="C", symbol="ES", bid=1.0, ask=2.0)))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+        drained = buffer.drain()
+        assert [(q.venue, q.bid) for q in drained] == [("A", 1.5), ("B", 1.0)]
+        await blocked
+        assert [q.venue for q in buffer.drain()] == ["C"]
+        assert buffer.coalesced == 1
+
+    asyncio.run(_run())
+
+
+def test_stream_routes_push_quotes_and_serve_sse_events() -> None:
+    app = FastAPI()
+    app.include_router(arbitrage_router)
+    session_id = create_arbitrage_session(base_currency="USD", config=ArbitrageConfig(min_edge_bps=0.0))
+
+    with TestClient(app) as client:
+        pushed = client.post(
+            "/v1/arbitrage/stream/quotes",
+            json={
+                "session_id": str(session_id),
+                "quotes": [
+                    {"symbol": "ES", "venue": "EX_A", "bid": 99.0, "ask": 100.0},
+                    {"symbol": "ES", "venue": "EX_B", "bid": 101.0, "ask": 102.0},
+                ],
+            },
+        )
+        assert pushed.json()["accepted"] == 2
+        assert pushed.json()["quote_validation"]["valid"] == 2
+        closed = client.post("/v1/arbitrage/stream/close", json={"session_id": str(session_id)})
+        assert closed.json() == {"scans": 1}
+
+        response = client.get("/v1/arbitrage/stream/events", params={"session_id": str(session_id)})
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+    frames = [frame.split("\n") for frame in response.text.strip().split("\n\n")]
+    events = [(lines[0].removeprefix("event: "), json.loads(lines[1].removeprefix("data: "))) for lines in frames]
+    assert [name for name, _ in events] == ["opportunity", "lifecycle", "closed"]
+    assert events[0][1]["buy_venue"] == "EX_A" and events[0][1]["sell_venue"] == "EX_B"
+    assert events[1][1]["state"] == "NEW"
+
+
+def test_failed_scan_publishes_error_then_closed() -> None:
+    fx_converter = FxConverter(provider=FxRateProvider.from_usd_ils(3.5), base_ccy="USD")
+    orchestrator = ArbitrageOrchestrator()
+    session = _session(orchestrator)
+    scan_loop = ArbitrageScanLoop(orchestrator, session.session_id, fx_converter, debounce_ms=0)
+
+    async def _run() -> list[dict[str, object]]:
+        events = scan_loop.subscribe()
+        feed = QueueQuoteFeed()
+        task = asyncio.create_task(scan_loop.run(feed))
+        await feed.put(
+            [
+                VenueQuote(venue="A", symbol="ES", bid=100.5, ask=100.0, ccy="JPY"),
+                VenueQuote(venue="B", symbol="ES", bid=101.0, ask=100.8, ccy="JPY"),
+            ]
+        )
+        await asyncio.wait_for(task, timeout=5)
+        return [events.get_nowait() for _ in range(events.qsize())]
+
+    events = asyncio.run(_run())
+
+    assert [e["event"] for e in events] == ["error", "closed"]
+    assert "JPY" in events[0]["data"]["error"]
+    assert events[1]["data"] == {"scans": 0}
+
+
+def test_stream_service_validates_quotes_and_prune_stops_the_stream() -> None:
+    session_id = create_arbitrage_session(base_currency="USD", config=ArbitrageConfig(min_edge_bps=0.0))
+
+    async def _run() -> tuple[dict[str, object], list[dict[str, object]]]:
+        pushed = await push_stream_quotes(
+            session_id,
+            [
+                {"symbol": "ES", "venue": "A", "ccy": "JPY", "bid": 99.0, "ask": 100.0, "fees_bps": 0.0},
+                {"symbol": "ES", "venue": "B", "ccy": "USD", "bid": None, "ask": None, "fees_bps": 0.0},
+                {"symbol": "ES", "venue": "C", "ccy": "USD", "bid": 101.0, "ask": 100.0, "fees_bps": 0.0},
+            ],
+        )
+        events = iter_quote_stream_events(session_id)
+        _orchestrator.sessions[session_id].last_accessed -= timedelta(days=1)
+        assert await prune_idle_sessions() == [session_id]
+        received = [event async for event in events]
+        return pushed, received
+
+    pushed, received = asyncio.run(_run())
+
+    # the JPY quote and the crossed C quote are dropped; B (no bid/ask) is a removal delta
+    assert pushed["accepted"] == 1
+    assert pushed["quote_validation"]["invalid"] == 2
+    assert [e["index"] for e in pushed["quote_validation"]["errors"]] == [0, 2]
+    assert received[-1]["event"] == "closed"
+    assert session_id not in _quote_streams
+    assert asyncio.run(close_quote_stream(session_id)) == 0
+
+
+def test_stream_events_route_is_read_only_and_404s_without_a_stream() -> None:
+    app = FastAPI()
+    app.include_router(arbitrage_router)
+    session_id = create_arbitrage_session(base_currency="USD", config=ArbitrageConfig(min_edge_bps=0.0))
+
+    with TestClient(app) as client:
+        for sid in (session_id, uuid4()):
+            response = client.get("/v1/arbitrage/stream/events", params={"session_id": str(sid)})
+            assert response.status_code == 404
+    assert session_id not in _quote_streams
+
+
+def test_scans_run_off_the_event_loop_thread() -> None:
+    fx_converter = FxConverter(provider=FxRateProvider.from_usd_ils(3.5), base_ccy="USD")
+    orchestrator = ArbitrageOrchestrator()
+    session = _session(orchestrator)
+    scan_loop = ArbitrageScanLoop(orchestrator, session.session_id, fx_converter, debounce_ms=0)
+    scan_threads: list[int] = []
+    ingest = orchestrator.ingest_quote_delta
+
+    def _recording_ingest(*args, **kwargs):
+        scan_threads.append(threading.get_ident())
+        return ingest(*args, **kwargs)
+
+    orchestrator.ingest_quote_delta = _recording_ingest
+
+    async def _run() -> tuple[list[dict[str, object]], bool]:
+        events = scan_loop.subscribe()
+        held = threading.Event()
+        release = threading.Event()
+
+        def _hold_session_lock() -> None:  # like a sync /top handler in the threadpool
+            with session.lock:
+                held.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=_hold_session_lock)
+        holder.start()
+        held.wait(5)
+        feed = ReplayQuoteFeed.from_snapshots(_recorded_bursts()[:1])
+        task = asyncio.create_task(scan_loop.run(feed))
+        await asyncio.sleep(0.05)
+        loop_responsive = not task.done()  # the loop ran this coroutine while the scan waits on the lock
+        release.set()
+        await asyncio.wait_for(task, timeout=5)
+        holder.join()
+        return [events.get_nowait() for _ in range(events.qsize())], loop_responsive
+
+    loop_thread = threading.get_ident()
+    events, loop_responsive = asyncio.run(_run())
+
+    assert loop_responsive
+    assert scan_threads and loop_thread not in scan_threads
+    assert events[0]["event"] == "opportunity" and events[-1]["event"] == "closed"
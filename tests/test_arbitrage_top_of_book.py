@@ -0,0 +1,87 @@
+import random
+from datetime import datetime, timedelta
+
+from core.arbitrage.engine import find_cross_venue_opportunities
+from core.arbitrage.feed import QuoteSnapshot
+from core.arbitrage.models import ArbitrageConfig, VenueQuote
+from core.arbitrage.opportunity_space.builder import build_opportunity_space
+from core.arbitrage.orchestrator import ArbitrageOrchestrator
+from core.arbitrage.top_of_book import TopOfBookIndex
+from core.fx.converter import FxConverter
+from core.fx.provider import FxRateProvider
+
+_PRICES = (None, 99.0, 99.5, 100.0, 100.5, 101.0)
+
+
+def _random_delta(rng: random.Random) -> VenueQuote:
+    return VenueQuote(
+        venue=rng.choice("uvwxyz"),
+        symbol=rng.choice("ABC"),
+        bid=rng.choice(_PRICES),
+        ask=rng.choice(_PRICES),
+        size=rng.choice((None, 1.0, 3.0)),
+        fees_bps=rng.choice((0.0, 2.0)),
+        latency_ms=rng.choice((None, 10.0)),
+    )
+
+
+def test_index_matches_full_scan_builders_after_every_delta() -> None:
+    rng = random.Random(11)
+    configs = (
+        ArbitrageConfig(),
+        ArbitrageConfig(allow_same_venue=True, min_edge_bps=1.0, min_size=2.0, max_latency_ms=5.0),
+    )
+    for config in configs:
+        index = TopOfBookIndex(config)
+        for _ in range(800):
+            index.apply([_random_delta(rng)])
+            book = index.quotes()
+            assert index.best_opportunities() == find_cross_venue_opportunities(book, config)
+            assert index.opportunity_space() == build_opportunity_space(book, config)
+            assert index.opportunity_space(limit=2) == build_opportunity_space(book, config)[:2]
+
+
+def test_updates_keep_venue_position_and_illiquid_quotes_remove_it() -> None:
+    index = TopOfBookIndex(ArbitrageConfig())
+    index.apply(
+        [
+            VenueQuote(venue="A", symbol="ES", bid=101.0, ask=100.0),
+            VenueQuote(venue="B", symbol="ES", bid=101.0, ask=100.0),
+            VenueQuote(venue="C", symbol="ES", bid=102.0, ask=101.5),
+        ]
+    )
+    # equal best bids after the update: A keeps its first position and wins the tie
+    index.apply([VenueQuote(venue="A", symbol="ES", bid=102.0, ask=101.8)])
+    assert [q.venue for q in index.quotes()] == ["A", "B", "C"]
+    assert index.best_opportunities() == find_cross_venue_opportunities(index.quotes())
+    assert index.best_opportunities()[0].sell.venue == "A"
+
+    index.apply([VenueQuote(venue="A", symbol="ES", bid=None, ask=None)])
+    assert [q.venue for q in index.quotes()] == ["B", "C"]
+    index.apply([VenueQuote(venue="A", symbol="ES", bid=101.0, ask=99.0)])
+    assert [q.venue for q in index.quotes()] == ["B", "C", "A"]
+    assert len(index) == 3
+
+
+def test_ingest_quote_delta_matches_snapshot_ingest_of_the_book() -> None:
+    config = ArbitrageConfig(min_edge_bps=0.0, default_size=1.0)
+    fx_converter = FxConverter(provider=FxRateProvider.from_usd_ils(3.5), base_ccy="ILS")
+    orchestrator = ArbitrageOrchestrator()
+    delta_session = orchestrator.create_session(base_currency="ILS", config=config)
+    snapshot_session = orchestrator.create_session(base_currency="ILS", config=config)
+    rng = random.Random(5)
+    now = datetime.utcnow()
+
+    for i in range(40):
+        as_of = now + timedelta(milliseconds=i)
+        deltas = [_random_delta(rng) for _ in range(3)]
+        via_delta = orchestrator.ingest_quote_delta(delta_session.session_id, as_of, deltas, fx_converter)
+        via_snapshot = orchestrator.ingest_snapshot(
+            snapshot_session.session_id,
+            QuoteSnapshot(as_of=as_of, quotes=delta_session.top_of_book.quotes()),
+            fx_converter,
+        )
+        assert [r.to_summary() for r in via_delta] == [r.to_summary() for r in via_snapshot]
+
+    assert delta_session.opportunity_state == snapshot_session.opportunity_state
+    assert delta_session.validation_summary == snapshot_session.validation_summary
@@ -41,3 +41,11 @@ def test_input_order_independent():
     c1 = FxConverter(fx_rates=[f1, f2])
     c2 = FxConverter(fx_rates=[f2, f1])
     assert c1.convert(2.0, "USD", "ILS") == c2.convert(2.0, "USD", "ILS")
+
+
+def test_to_base_many_matches_to_base():
+    c = FxConverter(fx_rates=[FxRateQuote(pair="USD/ILS", rate=3.7)], base_ccy="USD")
+    amounts = [1.0, 2.5, -0.3, 1234.5678, 0.1]
+    ccys = ["ILS", "USD", "ils", "ILS", "USD"]
+    assert c.to_base_many(amounts, ccys) == [c.to_base(a, ccy.upper()).amount for a, ccy in zip(amounts, ccys)]
+    assert c.to_base_many([], []) == []
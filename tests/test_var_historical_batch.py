@@ -0,0 +1,93 @@
+import math
+
+import numpy as np
+import pytest
+
+from core.risk.var_historical import build_historical_var_and_cvar_result
+from core.risk.var_historical import calc_cvar_expected_shortfall
+from core.risk.var_historical import calc_historical_var
+from core.risk.var_historical import calc_historical_var_cvar
+
+CONFIDENCES = (0.9, 0.95, 0.975, 0.99)
+
+
+def _sorted_reference(pnl_series, confidence):
+    n = len(pnl_series)
+    sorted_pnl = sorted(pnl_series)
+    q = sorted_pnl[max(0, min(n - 1, math.ceil((1.0 - confidence) * n) - 1))]
+    tail = [x for x in pnl_series if x <= q]
+    return max(0.0, -q), max(0.0, -sum(tail) / len(tail))
+
+
+def test_batch_matches_sorted_nearest_rank_for_every_confidence():
+    rng = np.random.default_rng(11)
+    pnl_series = (rng.standard_t(4, size=503) * 1000.0).tolist()
+
+    var, cvar = calc_historical_var_cvar(pnl=pnl_series, confidences=CONFIDENCES)
+
+    assert var.shape == cvar.shape == (len(CONFIDENCES),)
+    for i, confidence in enumerate(CONFIDENCES):
+        expected_var, expected_cvar = _sorted_reference(pnl_series, confidence)
+        assert var[i] == expected_var
+        assert cvar[i] == pytest.approx(expected_cvar, rel=1e-12)
+        assert calc_historical_var(pnl_series=pnl_series, confidence=confidence) == var[i]
+        assert calc_cvar_expected_shortfall(pnl_series=pnl_series, confidence=confidence) == cvar[i]
+
+
+def test_ties_at_the_quantile_enter_the_tail():
+    pnl_series = [-10, -5, -5, -5, -5, 0, 1, 5, 10, 12] * 3
+
+    var, cvar = calc_historical_var_cvar(pnl=pnl_series, confidences=(0.9, 0.8))
+
+    for i, confidence in enumerate((0.9, 0.8)):
+        expected_var, expected_cvar = _sorted_reference(pnl_series, confidence)
+        assert var[i] == expected_var
+        assert cvar[i] == expected_cvar
+
+
+def test_matrix_rows_are_independent_series():
+    rng = np.random.default_rng(5)
+    pnl = rng.normal(size=(6, 250)) * np.arange(1, 7)[:, None]
+    pnl[3] = np.abs(pnl[3])  # all gains
+
+    var, cvar = calc_historical_var_cvar(pnl=pnl, confidences=CONFIDENCES)
+
+    assert var.shape == cvar.shape == (6, len(CONFIDENCES))
+    for row in range(6):
+        row_var, row_cvar = calc_historical_var_cvar(pnl=pnl[row], confidences=CONFIDENCES)
+        assert np.array_equal(var[row], row_var)
+        assert np.array_equal(cvar[row], row_cvar)
+    assert not var[3].any() and not cvar[3].any()
+    assert (cvar >= var).all()
+
+
+def test_builder_uses_one_pass_for_var_and_cvar():
+    pnl_series = [-10, -5, -1, 0, 1, 5, 10] * 10
+
+    result = build_historical_var_and_cvar_result(
+        pnl_series=pnl_series, confidence=0.95, horizon_days=1, currency="USD"
+    )
+
+    expected_var, expected_cvar = _sorted_reference(pnl_series, 0.95)
+    assert result.var == expected_var
+    assert result.cvar == expected_cvar
+
+
+def test_validation():
+    with pytest.raises(ValueError, match="at least 20"):
+        calc_historical_var_cvar(pnl=np.zeros((3, 19)), confidences=(0.95,))
+    with pytest.raises(ValueError, match="confidence"):
+        calc_historical_var_cvar(pnl=[1.0] * 30, confidences=(0.95, 1.0))
+    with pytest.raises(ValueError, match="non-empty"):
+        calc_historical_var_cvar(pnl=[1.0] * 30, confidences=())
+    with pytest.raises(ValueError, match="finite"):
+        calc_historical_var_cvar(pnl=[1.0] * 29 + [float("nan")], confidences=(0.95,))
+    with pytest.raises(ValueError, match="1-D or 2-D"):
+        calc_historical_var_cvar(pnl=np.zeros((2, 2, 30)), confidences=(0.95,))
+
+
+def test_flat_series_reports_positive_zero():
+    var, cvar = calc_historical_var_cvar(pnl=[0.0] * 30, confidences=(0.95,))
+
+    assert math.copysign(1.0, var[0]) == 1.0
+    assert math.copysign(1.0, cvar[0]) == 1.0
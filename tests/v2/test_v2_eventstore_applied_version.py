@@ -0,0 +1,104 @@
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.v2.event_store_sqlite import SqliteEventStore
+from core.v2.sqlite_schema import LATEST_SCHEMA_VERSION, get_schema_version, run_migrations
+from core.v2.models import V2Event, hash_payload
+
+
+@pytest.fixture
+def temp_db_path(tmp_path):
+    return str(tmp_path / "applied_version.db")
+
+
+BASE_TS = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def make_event(session_id, event_id, seconds, payload):
+    return V2Event(
+        event_id=event_id,
+        session_id=session_id,
+        ts=BASE_TS + timedelta(seconds=seconds),
+        type="QUOTE_INGESTED",
+        payload=payload,
+        payload_hash=hash_payload(payload),
+    )
+
+
+def _versions(db_path, session_id):
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT event_id, applied_version FROM events WHERE session_id = ? ORDER BY applied_version",
+            (session_id,),
+        ).fetchall()
+    return rows
+
+
+def test_applied_version_assigned_at_append_per_session(temp_db_path):
+    store = SqliteEventStore(temp_db_path)
+    store.append(make_event("s1", "a", 0, {"v": 1}))
+    store.append(make_event("s2", "x", 0, {"v": 1}))
+    store.append(make_event("s1", "b", 1, {"v": 2}))
+    store.append(make_event("s1", "a", 0, {"v": 1}))  # idempotent duplicate consumes no version
+    store.append(make_event("s1", "c", 2, {"v": 3}))
+    assert _versions(temp_db_path, "s1") == [("a", 1), ("b", 2), ("c", 3)]
+    assert _versions(temp_db_path, "s2") == [("x", 1)]
+
+
+def test_tail_includes_late_arriving_earlier_ts_event(temp_db_path):
+    store = SqliteEventStore(temp_db_path)
+    for i, eid in enumerate(["e1", "e2", "e3"]):
+        store.append(make_event("s1", eid, i + 1, {"v": i}))
+    # arrives fourth but sorts first by ts: still belongs to the tail after version 3
+    store.append(make_event("s1", "e0", 0, {"v": -1}))
+    assert [e.event_id for e in store.list_after_version("s1", 3)] == ["e0"]
+    assert [e.event_id for e in store.list_after_version("s1", 2)] == ["e0", "e3"]
+
+
+def test_list_honours_after_version_and_limit(temp_db_path):
+    store = SqliteEventStore(temp_db_path)
+    for i in range(6):
+        store.append(make_event("s1", f"e{i}", i, {"v": i}))
+    assert [e.event_id for e in store.list("s1", limit=2)] == ["e0", "e1"]
+    assert [e.event_id for e in store.list("s1", after_version=4)] == ["e4", "e5"]
+    assert [e.event_id for e in store.list("s1", after_version=1, limit=3)] == ["e1", "e2", "e3"]
+    assert store.list("s1", after_version=6) == []
+
+
+def test_paged_tail_follows_append_order_and_resumes_without_gaps(temp_db_path):
+    store = SqliteEventStore(temp_db_path)
+    # append order differs from ts order
+    for i, eid in enumerate(["e3", "e0", "e4", "e1", "e2"]):
+        store.append(make_event("s1", eid, int(eid[1]), {"v": i}))
+    pages, after = [], 0
+    while page := store.list("s1", after_version=after, limit=2):
+        pages.append([e.event_id for e in page])
+        after += len(page)
+    assert pages == [["e3", "e0"], ["e4", "e1"], ["e2"]]
+
+
+def test_v1_database_is_upgraded_and_backfilled(temp_db_path):
+    with sqlite3.connect(temp_db_path) as conn:
+        conn.execute("""
+            CREATE TABLE events (
+                session_id TEXT NOT NULL, event_id TEXT NOT NULL, ts TEXT NOT NULL, type TEXT NOT NULL,
+                payload_json TEXT NOT NULL, payload_hash TEXT NOT NULL, inserted_at TEXT NOT NULL,
+                PRIMARY KEY (session_id, event_id)
+            )
+        """)
+        conn.execute("CREATE TABLE schema_version (version INTEGER NOT NULL, updated_at TEXT NOT NULL)")
+        conn.execute("INSERT INTO schema_version VALUES (1, '2025-01-01T00:00:00')")
+        for eid, sec in [("b", 1), ("a", 0), ("c", 2)]:
+            conn.execute(
+                "INSERT INTO events VALUES ('s1', ?, ?, 'QUOTE_INGESTED', '{}', 'h', 'x')",
+                (eid, (BASE_TS + timedelta(seconds=sec)).isoformat()),
+            )
+        run_migrations(conn)
+        assert get_schema_version(conn) == LATEST_SCHEMA_VERSION
+    assert _versions(temp_db_path, "s1") == [("a", 1), ("b", 2), ("c", 3)]
+
+    store = SqliteEventStore(temp_db_path)
+    store.append(make_event("s1", "d", 3, {"v": 4}))
+    assert [e.event_id for e in store.list_after_version("s1", 2)] == ["c", "d"]
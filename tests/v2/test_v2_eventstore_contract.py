@@ -35,3 +35,41 @@ def test_list_after_version_applied_version_contract():
         assert tail_ids == ["c", "d"], f"Expected ['c', 'd'], got {tail_ids}"
     finally:
         os.remove(db_path)
+
+
+def test_get_by_primary_key():
+    from core.v2.event_store import InMemoryEventStore
+
+    db_path = make_temp_db()
+    try:
+        ev = V2Event(event_id="a", session_id="s1", ts=datetime(2025,1,1,12,0,0), type="QUOTE_INGESTED", payload={"v":1}, payload_hash="1")
+        for store in (SqliteEventStore(db_path), InMemoryEventStore()):
+            store.append(ev)
+            assert store.get("s1", "a") == ev
+            assert store.get("s1", "missing") is None
+            assert store.get("other-session", "a") is None
+            assert store.get_many("s1", ["missing", "a", "a"]) == {"a": ev}
+            assert store.get_many("s1", []) == {}
+    finally:
+        os.remove(db_path)
+
+
+def test_list_after_version_uses_append_order_in_every_store():
+    from core.v2.event_store import InMemoryEventStore
+
+    def ev(event_id, hour):
+        return V2Event(event_id=event_id, session_id="s1", ts=datetime(2025,1,1,hour,0,0), type="QUOTE_INGESTED", payload={"v":hour}, payload_hash=str(hour))
+
+    db_path = make_temp_db()
+    try:
+        for store in (SqliteEventStore(db_path), InMemoryEventStore()):
+            store.append(ev("b", 12))
+            store.append(ev("a", 11))
+            store.append(ev("b", 12))  # duplicate consumes no version
+            store.append(ev("c", 13))
+            assert [e.event_id for e in store.list_after_version("s1", 0)] == ["a", "b", "c"]
+            assert [e.event_id for e in store.list_after_version("s1", 1)] == ["a", "c"]
+            assert [e.event_id for e in store.list_after_version("s1", 2)] == ["c"]
+            assert store.list_after_version("s1", 3) == []
+    finally:
+        os.remove(db_path)
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.v2.event_store import InMemoryEventStore
+from core.v2.event_store_sqlite import SqliteEventStore
+from core.v2.snapshot_store import InMemorySnapshotStore
+from core.v2.snapshot_store_sqlite import SqliteSnapshotStore
+from core.v2.orchestrator import V2RuntimeOrchestrator
+from core.v2.snapshot_policy import EveryNSnapshotPolicy
+from core.v2.errors import EventConflictError
+from core.v2.models import V2Event, hash_payload
+
+
+def make_event(session_id, event_id, i, payload=None):
+    payload = payload if payload is not None else {"val": i}
+    return V2Event(
+        event_id=event_id,
+        session_id=session_id,
+        ts=datetime(2025, 1, 1, 9, 0, 0) + timedelta(seconds=i),
+        type="QUOTE_INGESTED",
+        payload=payload,
+        payload_hash=hash_payload(payload),
+    )
+
+
+def test_batch_state_equals_sequential_ingest():
+    events = [make_event("s1", f"e{i}", i) for i in range(12)]
+    seq = V2RuntimeOrchestrator(InMemoryEventStore(), InMemorySnapshotStore(), EveryNSnapshotPolicy(5))
+    for e in events:
+        seq.ingest_event(e)
+    batch = V2RuntimeOrchestrator(InMemoryEventStore(), InMemorySnapshotStore(), EveryNSnapshotPolicy(5))
+    state = batch.ingest_events(events[:7])
+    state = batch.ingest_events(events[7:] + events[:2])
+    assert state == seq._session_states["s1"]
+    assert batch.build_snapshot("s1").state_hash == seq.build_snapshot("s1").state_hash
+
+
+def test_batch_builds_at_most_one_snapshot_at_final_version():
+    snaps = InMemorySnapshotStore()
+    orch = V2RuntimeOrchestrator(InMemoryEventStore(), snaps, EveryNSnapshotPolicy(5))
+    orch.ingest_events([make_event("s1", f"e{i}", i) for i in range(12)])
+    assert [s.version for s in snaps.list("s1")] == [12]
+    orch.ingest_events([make_event("s1", f"e{i}", i) for i in range(12, 15)])
+    assert [s.version for s in snaps.list("s1")] == [12]
+
+
+def test_sqlite_batch_conflict_aborts_whole_batch(tmp_path):
+    db = str(tmp_path / "batch.db")
+    store = SqliteEventStore(db)
+    orch = V2RuntimeOrchestrator(store, SqliteSnapshotStore(db), EveryNSnapshotPolicy(3))
+    orch.ingest_events([make_event("s1", "e0", 0)])
+    with pytest.raises(EventConflictError) as exc:
+        orch.ingest_events([make_event("s1", "e1", 1), make_event("s1", "e0", 0, {"val": 99})])
+    assert exc.value.event_id == "e0"
+    assert [e.event_id for e in store.list("s1")] == ["e0"]
+    assert orch._session_states["s1"].version == 1
+
+
+def test_sqlite_append_many_in_batch_duplicate_semantics(tmp_path):
+    store = SqliteEventStore(str(tmp_path / "dups.db"))
+    assert store.append_many([make_event("s1", "a", 0), make_event("s1", "a", 0), make_event("s1", "b", 1)]) == [
+        True,
+        False,
+        True,
+    ]
+    with pytest.raises(EventConflictError):
+        store.append_many([make_event("s1", "c", 2), make_event("s1", "c", 2, {"val": -1})])
+    assert [e.event_id for e in store.list("s1")] == ["a", "b"]
+    assert [e.event_id for e in store.list_after_version("s1", 1)] == ["b"]
@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta
+
+from api.v2.service_sqlite import V2ServiceSqlite
+from core.v2.event_store import InMemoryEventStore
+from core.v2.snapshot_store import InMemorySnapshotStore
+from core.v2.orchestrator import V2RuntimeOrchestrator
+from core.v2.snapshot_policy import EveryNSnapshotPolicy
+from core.v2.models import V2Event, hash_payload, hash_snapshot
+
+BASE_TS = datetime(2025, 1, 1, 9, 0, 0)
+
+
+def make_event(session_id, i):
+    payload = {"val": i}
+    return V2Event(
+        event_id=f"e{i}",
+        session_id=session_id,
+        ts=BASE_TS + timedelta(seconds=i),
+        type="QUOTE_INGESTED",
+        payload=payload,
+        payload_hash=hash_payload(payload),
+    )
+
+
+class CountingSnapshotStore(InMemorySnapshotStore):
+    def __init__(self):
+        super().__init__()
+        self.latest_calls = 0
+
+    def latest(self, session_id):
+        self.latest_calls += 1
+        return super().latest(session_id)
+
+
+class CountingEventStore(InMemoryEventStore):
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    def list(self, session_id):
+        self.reads += 1
+        return super().list(session_id)
+
+    def list_after_version(self, session_id, after_version):
+        self.reads += 1
+        return super().list_after_version(session_id, after_version)
+
+
+def test_warm_ingest_and_reads_do_not_touch_disk():
+    store = CountingEventStore()
+    snaps = CountingSnapshotStore()
+    orch = V2RuntimeOrchestrator(store, snaps, EveryNSnapshotPolicy(1000))
+    orch.ingest_event(make_event("s1", 0))  # cold: one recover
+    latest_calls, reads = snaps.latest_calls, store.reads
+    applied = orch.get_state("s1").applied
+    for i in range(1, 50):
+        orch.ingest_event(make_event("s1", i))
+    state = orch.get_state("s1")
+    assert state.version == 50
+    assert state.applied is applied  # updated in place, never copied
+    assert (snaps.latest_calls, store.reads) == (latest_calls, reads)
+
+
+def test_lru_evicts_least_recently_used_session_and_recovers_on_miss():
+    store = CountingEventStore()
+    orch = V2RuntimeOrchestrator(store, InMemorySnapshotStore(), EveryNSnapshotPolicy(3), max_cached_sessions=2)
+    for sid in ("a", "b"):
+        for i in range(4):
+            orch.ingest_event(make_event(sid, i))
+    orch.get_state("a")  # a becomes most recent
+    orch.ingest_event(make_event("c", 0))  # evicts b
+    assert set(orch._session_states) == {"a", "c"}
+    reads = store.reads
+    assert orch.get_state("b").version == 4
+    assert store.reads == reads + 1
+    assert set(orch._session_states) == {"b", "c"}
+
+
+def test_cached_snapshot_view_matches_cold_recovery_and_full_replay(tmp_path):
+    db = str(tmp_path / "cache.db")
+    svc = V2ServiceSqlite(db)
+    sid = svc.create_session()
+    for i in range(11):
+        svc.ingest_event(sid, event_id=f"e{i}", ts=BASE_TS + timedelta(seconds=i), type="QUOTE_INGESTED", payload={"v": i})
+    warm = svc.get_snapshot(sid)
+    assert svc.get_snapshot(sid).data is warm.data  # memoised while the version is unchanged
+
+    cold = V2ServiceSqlite(db).get_snapshot(sid)
+    replayed = {e.event_id: None for e in svc.event_store.list(sid)}
+    assert warm.version == cold.version == 11
+    assert warm.state_hash == cold.state_hash == hash_snapshot(dict(sorted(replayed.items())))
+
+    svc.ingest_event(sid, event_id="e11", ts=BASE_TS, type="QUOTE_INGESTED", payload={"v": 11})
+    after = svc.get_snapshot(sid)
+    assert after.version == 12
+    assert after.state_hash == V2ServiceSqlite(db).get_snapshot(sid).state_hash
+    svc.close()
+
+
+def test_cold_cache_single_ingest_keeps_snapshot_cadence(tmp_path):
+    db = str(tmp_path / "cold.db")
+    svc = V2ServiceSqlite(db)
+    sid = svc.create_session()
+    for i in range(2):
+        svc.ingest_event(sid, event_id=f"e{i}", ts=BASE_TS + timedelta(seconds=i), type="QUOTE_INGESTED", payload={"v": i})
+    svc.orchestrator.clear_cache()  # as after an LRU eviction or a restart
+
+    # EveryNSnapshotPolicy(3): version 3 is a cadence point
+    version, applied = svc.ingest_event(sid, event_id="e2", ts=BASE_TS, type="QUOTE_INGESTED", payload={"v": 2})
+    assert (version, applied) == (3, True)
+    assert svc.snapshot_store.latest(sid).version == 3
+    assert svc.ingest_event(sid, event_id="e2", ts=BASE_TS, type="QUOTE_INGESTED", payload={"v": 2}) == (3, False)
+    svc.close()
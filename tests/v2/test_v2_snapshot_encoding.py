@@ -0,0 +1,167 @@
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.v2.event_store_sqlite import SqliteEventStore
+from core.v2.models import Snapshot, V2Event, canonical_json, hash_payload, hash_snapshot
+from core.v2.orchestrator import V2RuntimeOrchestrator
+from core.v2.snapshot_codec import (
+    CHUNK_ENTRIES,
+    SNAPSHOT_ENCODING_CHUNKED,
+    SNAPSHOT_ENCODING_CHUNKED_ZLIB,
+    SNAPSHOT_ENCODING_JSON,
+    LazySnapshotData,
+    decode_snapshot_data,
+    encode_snapshot_data,
+)
+from core.v2.snapshot_store_sqlite import SqliteSnapshotStore
+from core.v2.sqlite_schema import LATEST_SCHEMA_VERSION, get_schema_version, run_migrations
+from core.v2.state_hash import STATE_HASH_V1, STATE_HASH_V2, compute_state_hash
+
+BINARY = (SNAPSHOT_ENCODING_CHUNKED, SNAPSHOT_ENCODING_CHUNKED_ZLIB)
+
+
+def make_data(n):
+    return {f"e{i:04d}": {"px": i * 0.25, "sym": "שקל" if i % 3 else "USD", "legs": [i, None, True]} for i in range(n)}
+
+
+def make_event(session_id, i):
+    payload = {"val": i, "nested": {"b": [i, str(i)], "a": i * 0.5}}
+    return V2Event(
+        event_id=f"e{i:04d}",
+        session_id=session_id,
+        ts=datetime(2025, 1, 1, 9, 0, 0) + timedelta(seconds=i),
+        type="QUOTE_INGESTED",
+        payload=payload,
+        payload_hash=hash_payload(payload),
+    )
+
+
+@pytest.mark.parametrize("encoding", BINARY)
+@pytest.mark.parametrize("n", [0, 1, CHUNK_ENTRIES + 3])
+def test_roundtrip_and_canonical_bytes(encoding, n):
+    data = make_data(n)
+    lazy = decode_snapshot_data(encode_snapshot_data(data, encoding))
+    assert len(lazy) == n
+    assert list(lazy) == sorted(data)
+    assert lazy == data
+    assert lazy.canonical_json_bytes() == canonical_json(data).encode("utf-8")
+    for algo in (STATE_HASH_V1, STATE_HASH_V2):
+        assert compute_state_hash(lazy, algo) == compute_state_hash(data, algo)
+
+
+def test_lazy_access_decodes_only_what_is_read():
+    data = make_data(3 * CHUNK_ENTRIES)
+    lazy = decode_snapshot_data(encode_snapshot_data(data, SNAPSHOT_ENCODING_CHUNKED_ZLIB))
+    assert "e0005" in lazy and "nope" not in lazy
+    assert lazy["e0700"] == data["e0700"]
+    assert list(lazy._decoded) == ["e0700"]
+    assert list(lazy._entries._chunks) == [700 // CHUNK_ENTRIES]
+
+
+def test_with_entries_reencodes_without_decoding_base():
+    data = make_data(10)
+    lazy = decode_snapshot_data(encode_snapshot_data(data, SNAPSHOT_ENCODING_CHUNKED))
+    merged = lazy.with_entries([("a-first", {"x": 1}), ("z-last", [1, 2])])
+    expected = {**data, "a-first": {"x": 1}, "z-last": [1, 2]}
+    assert list(merged) == sorted(expected)
+    assert merged.canonical_json_bytes() == canonical_json(expected).encode("utf-8")
+    again = decode_snapshot_data(encode_snapshot_data(merged, SNAPSHOT_ENCODING_CHUNKED_ZLIB))
+    assert again == expected
+    assert not lazy._decoded and not merged._decoded
+    assert len(lazy) == 10
+
+
+def test_rejects_garbage_blob():
+    with pytest.raises(ValueError):
+        decode_snapshot_data(b"not a snapshot")
+    blob = encode_snapshot_data(make_data(5), SNAPSHOT_ENCODING_CHUNKED)
+    with pytest.raises(ValueError):
+        decode_snapshot_data(blob[:-1])
+
+
+def test_unknown_encoding_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        SqliteSnapshotStore(str(tmp_path / "v2.sqlite"), encoding="msgpack")
+
+
+@pytest.mark.parametrize("encoding", BINARY)
+def test_sqlite_store_roundtrip_keeps_state_hash_authoritative(tmp_path, encoding):
+    db = str(tmp_path / "v2.sqlite")
+    store = SqliteSnapshotStore(db, encoding=encoding)
+    data = make_data(50)
+    snap = Snapshot("s1", 50, datetime(2025, 1, 1), hash_snapshot(data), data)
+    store.put(snap)
+    loaded = store.get_latest("s1")
+    assert isinstance(loaded.data, LazySnapshotData)
+    assert loaded.data == data
+    assert loaded.state_hash == hash_snapshot(data) == compute_state_hash(loaded.data)
+    assert store.get_at_or_before("s1", 50).data == data
+    store.close()
+
+
+def test_encodings_mix_within_one_database(tmp_path):
+    db = str(tmp_path / "v2.sqlite")
+    data = make_data(4)
+    SqliteSnapshotStore(db, encoding=SNAPSHOT_ENCODING_JSON).put(
+        Snapshot("s1", 4, datetime(2025, 1, 1), hash_snapshot(data), data)
+    )
+    store = SqliteSnapshotStore(db, encoding=SNAPSHOT_ENCODING_CHUNKED_ZLIB)
+    more = {**data, "e9999": {"px": 1}}
+    store.put(Snapshot("s1", 5, datetime(2025, 1, 1), hash_snapshot(more), more))
+    v4 = store.get_at_or_before("s1", 4)
+    assert type(v4.data) is dict and v4.data == data
+    assert store.get_latest("s1").data == more
+    store.close()
+
+
+@pytest.mark.parametrize("encoding", BINARY)
+def test_orchestrator_delta_over_encoded_base_matches_json(tmp_path, encoding):
+    hashes = {}
+    for enc in (SNAPSHOT_ENCODING_JSON, encoding):
+        db = str(tmp_path / f"{enc}.sqlite")
+        events = SqliteEventStore(db)
+        snaps = SqliteSnapshotStore(db, encoding=enc)
+        orch = V2RuntimeOrchestrator(events, snaps)
+        for i in range(30):
+            orch.ingest_event(make_event("s1", i))
+        orch.save_snapshot(orch.build_snapshot("s1"))
+        for i in range(30, 35):
+            orch.ingest_event(make_event("s1", i))
+        delta = orch.build_snapshot("s1")
+        if enc != SNAPSHOT_ENCODING_JSON:
+            assert isinstance(delta.data, LazySnapshotData)
+        orch.save_snapshot(delta)
+        latest = snaps.get_latest("s1")
+        assert latest.version == 35
+        assert dict(latest.data) == {f"e{i:04d}": make_event("s1", i).payload for i in range(35)}
+        assert V2RuntimeOrchestrator(events, snaps).recover("s1").version == 35
+        hashes[enc] = latest.state_hash
+        events.close()
+        snaps.close()
+    assert hashes[encoding] == hashes[SNAPSHOT_ENCODING_JSON]
+
+
+def test_v2_to_v3_migration_keeps_json_snapshots(tmp_path):
+    db = str(tmp_path / "old.sqlite")
+    conn = sqlite3.connect(db)
+    conn.execute("CREATE TABLE schema_version (version INTEGER NOT NULL, updated_at TEXT NOT NULL)")
+    conn.execute("INSERT INTO schema_version VALUES (2, '2025-01-01T00:00:00')")
+    conn.execute("""
+        CREATE TABLE snapshots (
+            session_id TEXT NOT NULL, version INTEGER NOT NULL, state_hash TEXT NOT NULL,
+            data_json TEXT NOT NULL, created_at TEXT NOT NULL, PRIMARY KEY (session_id, version)
+        )
+    """)
+    conn.execute(
+        "INSERT INTO snapshots VALUES ('s1', 1, ?, ?, '2025-01-01T00:00:00')",
+        (hash_snapshot({"e1": {"a": 1}}), canonical_json({"e1": {"a": 1}})),
+    )
+    conn.commit()
+    run_migrations(conn)
+    assert get_schema_version(conn) == LATEST_SCHEMA_VERSION
+    conn.close()
+    store = SqliteSnapshotStore(db, encoding=SNAPSHOT_ENCODING_CHUNKED)
+    assert store.get_latest("s1").data == {"e1": {"a": 1}}
+    store.close()
@@ -0,0 +1,121 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+import pytest
+
+import core.v2.sqlite_schema as sqlite_schema
+from core.v2.event_store_sqlite import SqliteEventStore
+from core.v2.session_store_sqlite import SqliteSessionStore
+from core.v2.snapshot_store_sqlite import SqliteSnapshotStore
+from core.v2.sqlite_pool import get_connection_pool
+from core.v2.models import V2Event, hash_payload
+from core.v2.errors import EventConflictError
+
+
+@pytest.fixture
+def temp_db_path(tmp_path):
+    return str(tmp_path / "pool.db")
+
+
+def make_event(session_id, event_id, payload):
+    return V2Event(
+        event_id=event_id,
+        session_id=session_id,
+        ts=datetime(2025, 1, 1, 10, 0, 0),
+        type="QUOTE_INGESTED",
+        payload=payload,
+        payload_hash=hash_payload(payload),
+    )
+
+
+def test_stores_on_same_path_share_one_pool(temp_db_path):
+    events = SqliteEventStore(temp_db_path)
+    snaps = SqliteSnapshotStore(temp_db_path)
+    sessions = SqliteSessionStore(temp_db_path)
+    assert events._pool is snaps._pool is sessions._pool
+    assert events._connect() is sessions._connect()
+
+
+def test_migrations_run_once_per_file(temp_db_path, monkeypatch):
+    calls = []
+    original = sqlite_schema.run_migrations
+
+    def counting(conn):
+        calls.append(1)
+        original(conn)
+
+    monkeypatch.setattr(sqlite_schema, "run_migrations", counting)
+    store = SqliteEventStore(temp_db_path)
+    for i in range(5):
+        store.append(make_event("s1", f"e{i}", {"i": i}))
+    assert len(store.list("s1")) == 5
+    assert len(calls) == 1
+
+
+def test_connections_are_per_thread(temp_db_path):
+    pool = get_connection_pool(temp_db_path)
+    main_conn = pool.acquire()
+    other = []
+    t = threading.Thread(target=lambda: other.append(pool.acquire()))
+    t.start()
+    t.join()
+    assert other[0] is not main_conn
+    assert pool.acquire() is main_conn
+
+
+def test_conflict_leaves_pooled_connection_clean(temp_db_path):
+    store = SqliteEventStore(temp_db_path)
+    store.append(make_event("s1", "e1", {"v": 1}))
+    with pytest.raises(EventConflictError):
+        store.append(make_event("s1", "e1", {"v": 2}))
+    assert store.append(make_event("s1", "e1", {"v": 1})) is False
+    assert not store._connect().in_transaction
+    assert [e.payload for e in store.list("s1")] == [{"v": 1}]
+
+
+def test_close_and_replaced_file_reconnect(temp_db_path):
+    store = SqliteEventStore(temp_db_path)
+    store.append(make_event("s1", "e1", {"v": 1}))
+    conn = store._connect()
+    store.close()
+    assert store._connect() is not conn
+    assert len(store.list("s1")) == 1
+
+    store.close()
+    os.remove(temp_db_path)
+    store.append(make_event("s1", "e2", {"v": 2}))
+    assert [e.event_id for e in store.list("s1")] == ["e2"]
+
+
+def test_close_releases_only_the_calling_threads_connection(temp_db_path):
+    store = SqliteEventStore(temp_db_path)
+    store.append(make_event("s1", "e1", {"v": 1}))
+    pool = store._pool
+    other = []
+    closed = threading.Event()
+
+    def worker():
+        conn = pool.acquire()
+        closed.wait()
+        other.append(conn.execute("SELECT COUNT(*) FROM events").fetchone()[0])
+        other.append(pool.acquire() is conn)
+
+    t = threading.Thread(target=worker)
+    t.start()
+    store.close()
+    closed.set()
+    t.join()
+    assert other == [1, True]
+
+
+def test_shutdown_evicts_pool_from_registry(temp_db_path):
+    pool = get_connection_pool(temp_db_path)
+    conn = pool.acquire()
+    pool.shutdown()
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    fresh = get_connection_pool(temp_db_path)
+    assert fresh is not pool
+    fresh.shutdown()
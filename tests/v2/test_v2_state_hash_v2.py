@@ -0,0 +1,133 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.v2.event_store import InMemoryEventStore
+from core.v2.event_store_sqlite import SqliteEventStore
+from core.v2.snapshot_store import InMemorySnapshotStore
+from core.v2.snapshot_store_sqlite import SqliteSnapshotStore
+from core.v2.orchestrator import V2RuntimeOrchestrator
+from core.v2.snapshot_policy import EveryNSnapshotPolicy
+from core.v2.models import V2Event, hash_payload, hash_snapshot
+from core.v2.state_hash import (
+    STATE_HASH_V1,
+    STATE_HASH_V2,
+    IncrementalStateHasher,
+    compute_state_hash,
+    extend_state_hash,
+    state_hash_algo_of,
+    verify_state_hash,
+)
+from scripts import check_state_hash_equivalence as checker
+
+
+def make_event(session_id, i):
+    payload = {"val": i, "nested": {"b": [i, str(i)], "a": i * 0.5}}
+    return V2Event(
+        event_id=f"e{i:03d}",
+        session_id=session_id,
+        ts=datetime(2025, 1, 1, 9, 0, 0) + timedelta(seconds=i),
+        type="QUOTE_INGESTED",
+        payload=payload,
+        payload_hash=hash_payload(payload),
+    )
+
+
+def test_v1_is_unchanged_hash_snapshot():
+    data = {"b": {"x": 1}, "a": None}
+    assert compute_state_hash(data) == hash_snapshot(data)
+    assert state_hash_algo_of(compute_state_hash(data)) == STATE_HASH_V1
+
+
+def test_v2_is_order_independent_and_incremental():
+    data = {f"e{i}": {"v": i} for i in range(40)}
+    items = list(data.items())
+    shuffled = items[:]
+    random.Random(7).shuffle(shuffled)
+    full = compute_state_hash(data, STATE_HASH_V2)
+    assert compute_state_hash(dict(shuffled), STATE_HASH_V2) == full
+    assert state_hash_algo_of(full) == STATE_HASH_V2
+
+    running, base = compute_state_hash({}, STATE_HASH_V2), {}
+    for i in range(0, 40, 7):
+        running = extend_state_hash(running, base, items[i:i + 7], STATE_HASH_V2)
+        base.update(items[i:i + 7])
+    assert running == full
+
+    hasher = IncrementalStateHasher.from_data(data)
+    hasher.remove("e3")
+    assert hasher.hexdigest() == compute_state_hash({k: v for k, v in data.items() if k != "e3"}, STATE_HASH_V2)
+    assert verify_state_hash(data, full) and not verify_state_hash({**data, "e3": {"v": 4}}, full)
+
+
+def test_v2_tree_matches_full_rebuild_under_random_inserts_and_removals():
+    rng = random.Random(11)
+    data: dict = {}
+    hasher = IncrementalStateHasher()
+    for step in range(60):
+        batch = {f"id{rng.randrange(5000):04d}": {"v": step, "k": i} for i in range(rng.randrange(1, 40))}
+        hasher.update(batch.items())
+        data.update(batch)
+        for eid in rng.sample(sorted(data), min(3, len(data))):
+            hasher.remove(eid)
+            del data[eid]
+        assert hasher.hexdigest() == IncrementalStateHasher.from_data(data).hexdigest()
+    assert len(hasher._chunks) > 10  # the test exercises many chunk boundaries
+
+
+def test_v2_extend_rehashes_only_the_tail_and_its_chunks(monkeypatch):
+    from core.v2 import state_hash
+
+    data = {f"e{i:05d}": {"v": i} for i in range(5000)}
+    base = compute_state_hash(data, STATE_HASH_V2)
+    leaves = []
+    real_leaf = state_hash._leaf
+    monkeypatch.setattr(state_hash, "_leaf", lambda eid, payload: leaves.append(eid) or real_leaf(eid, payload))
+    tail = [("e02500x", {"v": -1}), ("e99999", {"v": -2})]
+    extended = extend_state_hash(base, data, tail, STATE_HASH_V2)
+    assert leaves == ["e02500x", "e99999"]  # the base tree is reused, untouched chunks are not re-hashed
+    monkeypatch.undo()
+    assert extended == compute_state_hash({**data, **dict(tail)}, STATE_HASH_V2)
+
+
+@pytest.mark.parametrize("algo", [STATE_HASH_V1, STATE_HASH_V2])
+def test_delta_snapshots_match_full_replay(algo):
+    store = InMemoryEventStore()
+    orch = V2RuntimeOrchestrator(store, InMemorySnapshotStore(), EveryNSnapshotPolicy(4), state_hash_algo=algo)
+    for i in range(23):
+        orch.ingest_event(make_event("s1", i))
+    cached = orch.build_snapshot("s1")
+    full = V2RuntimeOrchestrator(store, state_hash_algo=algo).build_snapshot("s1")
+    assert (cached.version, cached.state_hash) == (full.version, full.state_hash)
+
+
+def test_equivalence_tool_passes_on_v2_db(tmp_path, capsys):
+    db = str(tmp_path / "hashes.db")
+    orch = V2RuntimeOrchestrator(
+        SqliteEventStore(db), SqliteSnapshotStore(db), EveryNSnapshotPolicy(5), state_hash_algo=STATE_HASH_V2
+    )
+    for i in range(17):
+        orch.ingest_event(make_event("s1", i))
+    assert checker.main(["--db", db, "--chunk", "3"]) == 0
+    out = capsys.readouterr().out
+    assert out.startswith("OK s1 events=17")
+    assert compute_state_hash(orch.build_snapshot("s1").data, STATE_HASH_V2) in out
+
+
+def test_service_snapshot_view_extends_incrementally_under_v2(tmp_path):
+    from api.v2.service_sqlite import V2ServiceSqlite
+
+    db = str(tmp_path / "svc.db")
+    svc = V2ServiceSqlite(db, state_hash_algo=STATE_HASH_V2)
+    sid = svc.create_session()
+    ts = datetime(2025, 1, 1, 9, 0, 0)
+    for eid in ["m", "c", "x"]:
+        svc.ingest_event(sid, event_id=eid, ts=ts, type="QUOTE_INGESTED", payload={"id": eid})
+        svc.get_snapshot(sid)
+    for eid in ["a", "z"]:
+        svc.ingest_event(sid, event_id=eid, ts=ts, type="QUOTE_INGESTED", payload={"id": eid})
+    warm = svc.get_snapshot(sid)
+    cold = V2ServiceSqlite(db, state_hash_algo=STATE_HASH_V2).get_snapshot(sid)
+    assert list(warm.data) == sorted(warm.data) == list(cold.data)
+    assert warm.state_hash == cold.state_hash == compute_state_hash(cold.data, STATE_HASH_V2)